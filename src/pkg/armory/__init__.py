@@ -14,6 +14,7 @@
 
 """Armory registry and supply-chain control services."""
 
+from .digest import ToolDigestCache, default_digest_cache
 from .service import (
     ArmoryIngestResult,
     ArmoryService,
@@ -28,4 +29,6 @@ __all__ = [
     "LocalScanner",
     "DefaultToolSigner",
     "ArmoryService",
+    "ToolDigestCache",
+    "default_digest_cache",
 ]
@@ -0,0 +1,174 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Content-addressed SHA-256 digest cache for tool binaries and artifacts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+
+_CACHE_FORMAT_VERSION = 1
+_DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+@dataclass(slots=True, frozen=True)
+class _FileIdentity:
+    """Stat fields that must all match for a cached digest to be reused."""
+
+    inode: int
+    size: int
+    mtime_ns: int
+    ctime_ns: int
+
+    @classmethod
+    def from_stat(cls, stat: os.stat_result) -> _FileIdentity:
+        return cls(
+            inode=stat.st_ino,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            ctime_ns=stat.st_ctime_ns,
+        )
+
+
+def sha256_chunks(chunks: Iterable[bytes]) -> str:
+    """Return the hex SHA-256 digest of a stream of byte chunks."""
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_file_chunks(path: str | Path, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> Iterable[bytes]:
+    """Yield a file's bytes in fixed-size chunks."""
+    with open(path, "rb") as handle:
+        while chunk := handle.read(chunk_size):
+            yield chunk
+
+
+class ToolDigestCache:
+    """Process-wide SHA-256 cache keyed on path and stat identity.
+
+    A digest is reused only while the file's inode, size, mtime and ctime are
+    unchanged; any difference triggers a chunked rehash. When ``cache_path``
+    is set, entries are persisted so restarted processes skip rehashing
+    unchanged binaries.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_path: str | Path | None = None,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than zero")
+        self._cache_path = Path(cache_path).expanduser() if cache_path else None
+        self._chunk_size = chunk_size
+        self._entries: dict[str, tuple[_FileIdentity, str]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        if self._cache_path is not None:
+            self._load()
+
+    def sha256_file(self, path: str | Path) -> str:
+        """Return the hex SHA-256 of ``path``, hashing only on cache miss."""
+        key = os.path.realpath(path)
+        identity = _FileIdentity.from_stat(os.stat(key))
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == identity:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        digest = sha256_chunks(iter_file_chunks(key, self._chunk_size))
+        # Only cache when the file did not change while it was being read.
+        if _FileIdentity.from_stat(os.stat(key)) == identity:
+            with self._lock:
+                self._entries[key] = (identity, digest)
+                self._persist_unlocked()
+        return digest
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """Drop one cached path, or every entry when ``path`` is omitted."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.realpath(path), None)
+            self._persist_unlocked()
+
+    def _load(self) -> None:
+        assert self._cache_path is not None
+        try:
+            payload = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _CACHE_FORMAT_VERSION:
+            return
+        entries = payload.get("entries", {})
+        if not isinstance(entries, dict):
+            return
+        for key, value in entries.items():
+            try:
+                inode, size, mtime_ns, ctime_ns, digest = value
+                self._entries[str(key)] = (
+                    _FileIdentity(int(inode), int(size), int(mtime_ns), int(ctime_ns)),
+                    str(digest),
+                )
+            except (TypeError, ValueError):
+                continue
+
+    def _persist_unlocked(self) -> None:
+        if self._cache_path is None:
+            return
+        payload = {
+            "version": _CACHE_FORMAT_VERSION,
+            "entries": {
+                key: [
+                    identity.inode,
+                    identity.size,
+                    identity.mtime_ns,
+                    identity.ctime_ns,
+                    digest,
+                ]
+                for key, (identity, digest) in self._entries.items()
+            },
+        }
+        self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = self._cache_path.with_name(f"{self._cache_path.name}.{os.getpid()}.tmp")
+        staging.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(staging, self._cache_path)
+
+
+_default_cache: ToolDigestCache | None = None
+_default_cache_lock = Lock()
+
+
+def default_digest_cache() -> ToolDigestCache:
+    """Return the process-wide cache, persisted when configured by env."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ToolDigestCache(
+                cache_path=os.getenv("SPECTRASTRIKE_TOOL_DIGEST_CACHE_PATH") or None
+            )
+        return _default_cache
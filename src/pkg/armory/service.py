@@ -23,7 +23,9 @@ from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from threading import Lock
-from typing import Protocol
+from typing import Protocol, runtime_checkable
+
+from pkg.armory.digest import _FileIdentity, default_digest_cache, iter_file_chunks
 
 
 @dataclass(slots=True)
@@ -73,6 +75,16 @@ class ToolSigner(Protocol):
         """Return signature and signing identity metadata."""
 
 
+@runtime_checkable
+class FileToolScanner(ToolScanner, Protocol):
+    """Scanner that can read large artifacts from disk instead of memory."""
+
+    def generate_sbom_from_file(
+        self, *, image_ref: str, artifact_path: Path
+    ) -> tuple[str, str]:
+        """Return (sbom_format, sbom_digest) for an on-disk artifact."""
+
+
 class LocalScanner:
     """Deterministic local scanner used in CI/dev until external scanners are wired."""
 
@@ -81,6 +93,16 @@ class LocalScanner:
         digest = hashlib.sha256(sbom_material).hexdigest()
         return ("spdx-json", f"sha256:{digest}")
 
+    def generate_sbom_from_file(
+        self, *, image_ref: str, artifact_path: Path
+    ) -> tuple[str, str]:
+        digest = hashlib.sha256(
+            f"{image_ref}:{artifact_path.stat().st_size}".encode("utf-8")
+        )
+        for chunk in iter_file_chunks(artifact_path):
+            digest.update(chunk)
+        return ("spdx-json", f"sha256:{digest.hexdigest()}")
+
     def scan_vulnerabilities(self, *, sbom_digest: str) -> dict[str, int]:
         # Stable pseudo-risk profile derived from SBOM digest to keep
         # tests deterministic.
@@ -138,18 +160,54 @@ class ArmoryService:
         self._approval_quorum = approval_quorum
 
     def ingest_tool(
-        self, *, tool_name: str, image_ref: str, artifact: bytes
+        self,
+        *,
+        tool_name: str,
+        image_ref: str,
+        artifact: bytes | None = None,
+        artifact_path: str | Path | None = None,
     ) -> ArmoryIngestResult:
-        """Run upload -> SBOM -> vulnerability scan -> signing workflow."""
-        self._validate_inputs(
-            tool_name=tool_name, image_ref=image_ref, artifact=artifact
-        )
-        tool_sha256 = f"sha256:{hashlib.sha256(artifact).hexdigest()}"
-
-        sbom_format, sbom_digest = self._scanner.generate_sbom(
-            image_ref=image_ref,
-            artifact=artifact,
-        )
+        """Run upload -> SBOM -> vulnerability scan -> signing workflow.
+
+        Large artifacts can be passed as ``artifact_path``; they are digested
+        in chunks through the shared tool digest cache rather than loaded into
+        memory. The file's stat identity is re-checked after scanning so the
+        signed digest and the SBOM always describe the same bytes.
+        """
+        if artifact is not None and artifact_path is None:
+            self._validate_inputs(
+                tool_name=tool_name, image_ref=image_ref, artifact_size=len(artifact)
+            )
+            tool_sha256 = f"sha256:{hashlib.sha256(artifact).hexdigest()}"
+            sbom_format, sbom_digest = self._scanner.generate_sbom(
+                image_ref=image_ref,
+                artifact=artifact,
+            )
+        elif artifact_path is not None and artifact is None:
+            path = Path(artifact_path).expanduser()
+            if not path.is_file():
+                raise ValueError(f"artifact_path is not a file: {path}")
+            identity = _FileIdentity.from_stat(path.stat())
+            self._validate_inputs(
+                tool_name=tool_name,
+                image_ref=image_ref,
+                artifact_size=identity.size,
+            )
+            tool_sha256 = f"sha256:{default_digest_cache().sha256_file(path)}"
+            if isinstance(self._scanner, FileToolScanner):
+                sbom_format, sbom_digest = self._scanner.generate_sbom_from_file(
+                    image_ref=image_ref,
+                    artifact_path=path,
+                )
+            else:
+                sbom_format, sbom_digest = self._scanner.generate_sbom(
+                    image_ref=image_ref,
+                    artifact=path.read_bytes(),
+                )
+            if _FileIdentity.from_stat(path.stat()) != identity:
+                raise ValueError(f"artifact_path changed during ingest: {path}")
+        else:
+            raise ValueError("exactly one of artifact or artifact_path is required")
         vuln_summary = self._scanner.scan_vulnerabilities(sbom_digest=sbom_digest)
         signature_bundle = self._signer.sign(
             image_ref=image_ref, tool_sha256=tool_sha256
@@ -244,10 +302,10 @@ class ArmoryService:
         )
 
     @staticmethod
-    def _validate_inputs(*, tool_name: str, image_ref: str, artifact: bytes) -> None:
+    def _validate_inputs(*, tool_name: str, image_ref: str, artifact_size: int) -> None:
         if len(tool_name.strip()) < 3:
             raise ValueError("tool_name must be at least 3 chars")
         if "/" not in image_ref or ":" not in image_ref:
             raise ValueError("image_ref must look like <registry>/<repo>:<tag>")
-        if not artifact:
+        if artifact_size <= 0:
             raise ValueError("artifact must not be empty")
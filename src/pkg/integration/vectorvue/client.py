@@ -41,6 +41,16 @@ from pkg.integration.vectorvue.exceptions import (
 )
 from pkg.integration.vectorvue.models import ResponseEnvelope
 from pkg.logging.framework import emit_audit_event, get_logger
+from pkg.security.ed25519_keys import (
+    Ed25519KeyError,
+    Ed25519KeyReadError,
+    default_key_manager,
+)
+from pkg.security.nonce_store import (
+    InMemoryNonceStore,
+    NonceStore,
+    NonceStoreCapacityError,
+)
 
 _RETRYABLE_STATUSES = {429, 502, 503, 504}
 _NON_RETRYABLE_ERROR_STATUSES = {400, 401, 403, 404, 409, 422}
@@ -51,11 +61,17 @@ logger = get_logger("spectrastrike.integration.vectorvue")
 class VectorVueClient:
     """Synchronous client for VectorVue client and integration APIs."""
 
-    def __init__(self, config: VectorVueConfig, session: Session | None = None) -> None:
+    def __init__(
+        self,
+        config: VectorVueConfig,
+        session: Session | None = None,
+        *,
+        nonce_store: NonceStore | None = None,
+    ) -> None:
         self._config = config
         self._session = session or requests.Session()
         self._token = config.token
-        self._seen_feedback_nonces: dict[str, int] = {}
+        self._feedback_nonces = InMemoryNonceStore() if nonce_store is None else nonce_store
 
     def login(self) -> str:
         """Authenticate with VectorVue and cache bearer token."""
@@ -222,84 +238,22 @@ class VectorVueClient:
             raise VectorVueSerializationError(
                 "VECTORVUE_FEDERATION_SIGNING_KEY_PATH is required"
             )
+        message = f"{timestamp}.{nonce}.".encode("utf-8") + raw_body
         try:
-            key_bytes = open(key_path, "rb").read()
-        except OSError as exc:
+            signature = default_key_manager().sign(
+                key_path,
+                message,
+                allow_openssl_fallback=True,
+            )
+        except Ed25519KeyReadError as exc:
             raise VectorVueSerializationError(
                 f"unable to read federation signing key: {key_path}"
             ) from exc
-
-        try:
-            from cryptography.hazmat.primitives import serialization
-            from cryptography.hazmat.primitives.asymmetric.ed25519 import (
-                Ed25519PrivateKey,
-            )
-        except ImportError:
-            serialization = None
-            Ed25519PrivateKey = None  # type: ignore[assignment]
-
-        message = f"{timestamp}.{nonce}.".encode("utf-8") + raw_body
-        if serialization is not None and Ed25519PrivateKey is not None:
-            private_key: Any
-            if len(key_bytes) == 32:
-                private_key = Ed25519PrivateKey.from_private_bytes(key_bytes)
-            else:
-                try:
-                    private_key = serialization.load_pem_private_key(
-                        key_bytes,
-                        password=None,
-                    )
-                except ValueError:
-                    private_key = serialization.load_ssh_private_key(
-                        key_bytes,
-                        password=None,
-                    )
-            signature = private_key.sign(message)
-            return base64.b64encode(signature).decode("utf-8")
-
-        return self._sign_with_openssl(key_path=key_path, message=message)
-
-    def _sign_with_openssl(self, *, key_path: str, message: bytes) -> str:
-        with tempfile.NamedTemporaryFile(delete=False) as msg_file:
-            msg_file.write(message)
-            msg_file.flush()
-            msg_path = msg_file.name
-        with tempfile.NamedTemporaryFile(delete=False) as sig_file:
-            sig_path = sig_file.name
-        try:
-            completed = subprocess.run(
-                [
-                    "openssl",
-                    "pkeyutl",
-                    "-sign",
-                    "-inkey",
-                    key_path,
-                    "-rawin",
-                    "-in",
-                    msg_path,
-                    "-out",
-                    sig_path,
-                ],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-            if completed.returncode != 0:
-                detail = (completed.stderr or completed.stdout or "").strip()
-                raise VectorVueSerializationError(
-                    f"openssl federation signing failed: {detail or 'unknown error'}"
-                )
-            signature = open(sig_path, "rb").read()
-            return base64.b64encode(signature).decode("utf-8")
-        finally:
-            try:
-                os.remove(msg_path)
-            except OSError:
-                pass
-            try:
-                os.remove(sig_path)
-            except OSError:
-                pass
+        except Ed25519KeyError as exc:
+            raise VectorVueSerializationError(
+                f"federation signing failed: {exc}"
+            ) from exc
+        return base64.b64encode(signature).decode("utf-8")
 
     def send_events_batch(self, events: list[dict[str, Any]]) -> ResponseEnvelope:
         """Send a batch of telemetry events."""
@@ -648,7 +602,6 @@ class VectorVueClient:
             raise VectorVueSerializationError("signed feedback response is required")
         if algorithm and algorithm != "Ed25519":
             raise VectorVueSerializationError("unsupported feedback signature algorithm")
-        self._enforce_feedback_replay(nonce=nonce, signed_at=signed_at)
         key = self._load_feedback_verify_key(kid)
         canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
         signing_input = (
@@ -673,6 +626,9 @@ class VectorVueClient:
                 raise VectorVueSerializationError(
                     "feedback response signature verification failed"
                 ) from exc
+        # Only a verified response may consume its nonce; otherwise a forged
+        # response could burn a nonce and block the genuine one.
+        self._enforce_feedback_replay(nonce=nonce, signed_at=signed_at)
         envelope.verified = True
 
     def _verify_feedback_signature_with_openssl(
@@ -794,18 +750,23 @@ class VectorVueClient:
     def _enforce_feedback_replay(self, *, nonce: str, signed_at: int) -> None:
         now = int(time.time())
         ttl = 300
-        self._seen_feedback_nonces = {
-            key: ts for key, ts in self._seen_feedback_nonces.items() if ts >= now - ttl
-        }
-        if nonce in self._seen_feedback_nonces:
-            raise VectorVueSerializationError(
-                "feedback replay detected: nonce already used"
-            )
         if abs(now - signed_at) > ttl:
             raise VectorVueSerializationError(
                 "feedback signature timestamp out of allowed window"
             )
-        self._seen_feedback_nonces[nonce] = signed_at
+        try:
+            stored = self._feedback_nonces.check_and_store(
+                f"feedback:{nonce}",
+                # Keep the nonce until its signature can no longer pass the window check.
+                ttl_seconds=signed_at + ttl - now + 1,
+                now=now,
+            )
+        except NonceStoreCapacityError as exc:
+            raise VectorVueSerializationError("feedback nonce store capacity exceeded") from exc
+        if not stored:
+            raise VectorVueSerializationError(
+                "feedback replay detected: nonce already used"
+            )
 
     def _coerce_errors(self, errors: Any) -> list[dict[str, Any]]:
         if not isinstance(errors, list):
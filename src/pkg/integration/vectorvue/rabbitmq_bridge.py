@@ -43,6 +43,7 @@ from pkg.orchestrator.messaging import (
     RabbitMQConnectionConfig,
     RabbitRoutingModel,
 )
+from pkg.security.nonce_store import InMemoryNonceStore, NonceStore
 
 try:
     import pika
@@ -87,13 +88,14 @@ class InMemoryVectorVueBridge:
         emit_findings_for_all: bool = False,
         replay_nonce_ttl_seconds: int = 120,
         intent_ledger: ExecutionIntentLedger | None = None,
+        nonce_store: NonceStore | None = None,
     ) -> None:
         self._broker = broker
         self._client = client
         self._queue = queue
         self._emit_findings_for_all = emit_findings_for_all
         self._replay_nonce_ttl_seconds = replay_nonce_ttl_seconds
-        self._seen_nonces: dict[str, datetime] = {}
+        self._nonce_store = InMemoryNonceStore() if nonce_store is None else nonce_store
         self._intent_ledger = intent_ledger or ExecutionIntentLedger()
 
     def drain(self, limit: int | None = None) -> BridgeDrainResult:
@@ -129,15 +131,11 @@ class InMemoryVectorVueBridge:
             result.failure_retry_counts.append(detail.retry_count)
 
     def _validate_replay_nonce(self, payload: dict[str, Any]) -> None:
-        nonce = str(payload["nonce"])
-        now = datetime.now(UTC)
-        expired_before = now.timestamp() - self._replay_nonce_ttl_seconds
-        self._seen_nonces = {
-            key: ts for key, ts in self._seen_nonces.items() if ts.timestamp() >= expired_before
-        }
-        if nonce in self._seen_nonces:
-            raise RuntimeError("producer replay detected: nonce already used")
-        self._seen_nonces[nonce] = now
+        _check_replay_nonce(
+            self._nonce_store,
+            payload,
+            ttl_seconds=self._replay_nonce_ttl_seconds,
+        )
 
     def _record_pre_dispatch_intent(self, payload: dict[str, Any]) -> None:
         attributes = payload["payload"]["attributes"]
@@ -168,6 +166,7 @@ class PikaVectorVueBridge:
         emit_findings_for_all: bool = False,
         replay_nonce_ttl_seconds: int = 120,
         intent_ledger: ExecutionIntentLedger | None = None,
+        nonce_store: NonceStore | None = None,
     ) -> None:
         if pika is None:
             raise RuntimeError("pika package is required for PikaVectorVueBridge")
@@ -176,7 +175,7 @@ class PikaVectorVueBridge:
         self._routing = routing or RabbitRoutingModel()
         self._emit_findings_for_all = emit_findings_for_all
         self._replay_nonce_ttl_seconds = replay_nonce_ttl_seconds
-        self._seen_nonces: dict[str, datetime] = {}
+        self._nonce_store = InMemoryNonceStore() if nonce_store is None else nonce_store
         self._intent_ledger = intent_ledger or ExecutionIntentLedger()
 
     def drain(self, limit: int = 100) -> BridgeDrainResult:
@@ -260,15 +259,11 @@ class PikaVectorVueBridge:
         return pika.BlockingConnection(parameters)
 
     def _validate_replay_nonce(self, payload: dict[str, Any]) -> None:
-        nonce = str(payload["nonce"])
-        now = datetime.now(UTC)
-        expired_before = now.timestamp() - self._replay_nonce_ttl_seconds
-        self._seen_nonces = {
-            key: ts for key, ts in self._seen_nonces.items() if ts.timestamp() >= expired_before
-        }
-        if nonce in self._seen_nonces:
-            raise RuntimeError("producer replay detected: nonce already used")
-        self._seen_nonces[nonce] = now
+        _check_replay_nonce(
+            self._nonce_store,
+            payload,
+            ttl_seconds=self._replay_nonce_ttl_seconds,
+        )
 
     def _record_pre_dispatch_intent(self, payload: dict[str, Any]) -> None:
         attributes = payload["payload"]["attributes"]
@@ -302,6 +297,20 @@ def _decode_envelope(body: bytes) -> BrokerEnvelope:
     )
 
 
+def _check_replay_nonce(
+    nonce_store: NonceStore,
+    payload: dict[str, Any],
+    *,
+    ttl_seconds: int,
+) -> None:
+    stored = nonce_store.check_and_store(
+        f"bridge:{payload['nonce']}",
+        ttl_seconds=ttl_seconds,
+    )
+    if not stored:
+        raise RuntimeError("producer replay detected: nonce already used")
+
+
 def _parse_timestamp_epoch(timestamp_raw: str) -> int:
     if timestamp_raw.isdigit():
         return int(timestamp_raw)
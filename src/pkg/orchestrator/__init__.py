@@ -30,12 +30,14 @@ from .adversary_graph import (
     IdentityCompromiseChain,
     TechniqueLinkRecord,
 )
+from .attack_paths import AttackPathQueryError, CSRGraph, GraphPath, LateralGraphIndex
 from .control_plane_integrity import (
     ConfigurationSignatureMismatchError,
     ControlPlaneIntegrityEnforcer,
     ControlPlaneIntegrityError,
     ImmutableConfigurationHistory,
     ImmutableConfigurationHistoryError,
+    PolicyChangeListenerError,
     PolicyHashMismatchError,
     RuntimeBinaryHashMismatchError,
     SignedConfigurationEnvelope,
@@ -47,6 +49,7 @@ from .cognitive_feedback import (
     CognitiveFeedbackLoopService,
     CognitiveLoopRunResult,
     DefensiveEffectivenessMetrics,
+    DefensiveEventColumns,
     FeedbackAdjustment,
     FeedbackPolicyEngine,
 )
@@ -54,6 +57,8 @@ from .campaign_engine import (
     ALLOWED_CAMPAIGN_STATUS_TRANSITIONS,
     CredentialMaterialRecord,
     CredentialMaterialType,
+    CampaignChange,
+    CampaignChangeSet,
     CampaignConfiguration,
     CampaignEngine,
     CampaignEngineError,
@@ -71,13 +76,25 @@ from .campaign_engine import (
     TechniqueExecutionRecord,
     validate_lifecycle_transition,
 )
+from .engine_store import (
+    EngineStore,
+    EngineStoreError,
+    PostgresConnectionConfig,
+    PostgresEngineStore,
+    SQLiteEngineStore,
+    StoredRow,
+)
 from .playbook_engine import (
+    PlaybookCampaignBinding,
     PlaybookEngine,
     PlaybookEngineError,
+    PlaybookExecutionResult,
     PlaybookRecord,
+    PlaybookScenario,
     PlaybookSimulationResult,
     PlaybookStatus,
     PlaybookStepRecord,
+    StepExecutionRecord,
     StepExecutionStatus,
     StepSimulationRecord,
     TechniqueModuleRecord,
@@ -98,10 +115,11 @@ from .dual_signature import (
     HighRiskManifestDualSigner,
     ManifestSignatureBundle,
 )
-from .event_loop import AsyncEventLoop
+from .event_loop import AsyncEventLoop, AsyncEventLoopMetrics, AsyncTaskLatency
 from .jws import CompactJWSGenerator, JWSConfig, JWSPayloadError
 from .ledger_model import (
     AppendOnlyInsertionOrder,
+    ConsistencyProofStructure,
     DeterministicTreeGrowthRules,
     InclusionProofNode,
     InclusionProofStructure,
@@ -126,9 +144,12 @@ from .merkle_ledger import (
     HMACRootSigningAuthority,
     ImmutableExecutionLeafRecord,
     ImmutableExecutionLeafStore,
+    IncrementalMerkleFrontier,
     MerkleLedgerError,
+    MerkleLevelIndex,
     ReadOnlyMerkleVerifierNode,
     RootSigningAuthority,
+    SegmentedLeafLog,
     SignedMerkleRoot,
 )
 from .messaging import (
@@ -137,6 +158,7 @@ from .messaging import (
     KafkaTelemetryPublisher,
     InMemoryKafkaBroker,
     InMemoryRabbitBroker,
+    PikaChannelPool,
     PikaRabbitMQTelemetryPublisher,
     PublishAttemptResult,
     PublishStatus,
@@ -151,16 +173,24 @@ from .opa import (
     OPAConfig,
     OPAAAAPolicyAdapter,
     OPAAuthorizationError,
+    OPADecision,
+    OPADecisionMetrics,
     OPAExecutionAuthorizer,
 )
+from .opa_local import LocalPolicyError, LocalPolicyEvaluator, policy_bundle_sha256
 from .signing import (
     ManifestSigner,
     VaultTransitConfig,
     VaultTransitError,
+    VaultTransitMetrics,
     VaultTransitSigner,
 )
 from .task_scheduler import OrchestratorTask, TaskScheduler
-from .telemetry_ingestion import TelemetryEvent, TelemetryIngestionPipeline
+from .telemetry_ingestion import (
+    TelemetryBackpressureError,
+    TelemetryEvent,
+    TelemetryIngestionPipeline,
+)
 from .telemetry_schema import (
     ParsedTelemetryEvent,
     TelemetrySchemaError,
@@ -176,10 +206,13 @@ from .vault_hardening import (
 
 __all__ = [
     "AsyncEventLoop",
+    "AsyncEventLoopMetrics",
+    "AsyncTaskLatency",
     "OrchestratorTask",
     "TaskScheduler",
     "TelemetryEvent",
     "TelemetryIngestionPipeline",
+    "TelemetryBackpressureError",
     "ParsedTelemetryEvent",
     "TelemetrySchemaError",
     "TelemetrySchemaParser",
@@ -198,6 +231,10 @@ __all__ = [
     "IdentityCompromiseChain",
     "CampaignGraphReconstruction",
     "AdversaryGraphEngine",
+    "AttackPathQueryError",
+    "GraphPath",
+    "CSRGraph",
+    "LateralGraphIndex",
     "DualSignatureError",
     "ManifestSignatureBundle",
     "HighRiskManifestDualSigner",
@@ -207,6 +244,7 @@ __all__ = [
     "PolicyHashMismatchError",
     "RuntimeBinaryHashMismatchError",
     "ImmutableConfigurationHistoryError",
+    "PolicyChangeListenerError",
     "SignedConfigurationEnvelope",
     "StartupIntegrityConfig",
     "StartupIntegrityResult",
@@ -215,9 +253,16 @@ __all__ = [
     "FeedbackAdjustment",
     "CognitiveLoopRunResult",
     "DefensiveEffectivenessMetrics",
+    "DefensiveEventColumns",
     "FeedbackPolicyEngine",
     "CognitiveFeedbackLoopService",
     "CampaignEngineError",
+    "EngineStore",
+    "EngineStoreError",
+    "StoredRow",
+    "SQLiteEngineStore",
+    "PostgresConnectionConfig",
+    "PostgresEngineStore",
     "PrivilegeLevel",
     "CredentialMaterialType",
     "CampaignStatus",
@@ -233,6 +278,8 @@ __all__ = [
     "PrivilegeEscalationRecord",
     "LateralMovementEdge",
     "PivotChain",
+    "CampaignChange",
+    "CampaignChangeSet",
     "ALLOWED_CAMPAIGN_STATUS_TRANSITIONS",
     "validate_lifecycle_transition",
     "CampaignEngine",
@@ -245,6 +292,10 @@ __all__ = [
     "PlaybookStepRecord",
     "StepSimulationRecord",
     "PlaybookSimulationResult",
+    "PlaybookScenario",
+    "StepExecutionRecord",
+    "PlaybookExecutionResult",
+    "PlaybookCampaignBinding",
     "PlaybookEngine",
     "OrchestratorEngine",
     "TaskSubmissionRequest",
@@ -266,6 +317,7 @@ __all__ = [
     "RootSigningProcedure",
     "InclusionProofNode",
     "InclusionProofStructure",
+    "ConsistencyProofStructure",
     "ExecutionTaskContext",
     "ExecutionManifest",
     "ExecutionManifestValidationError",
@@ -276,13 +328,16 @@ __all__ = [
     "deterministic_manifest_hash",
     "parse_and_validate_manifest_submission",
     "MerkleLedgerError",
+    "MerkleLevelIndex",
     "RootSigningAuthority",
     "ImmutableExecutionLeafRecord",
     "SignedMerkleRoot",
     "HMACRootSigningAuthority",
     "ImmutableExecutionLeafStore",
+    "IncrementalMerkleFrontier",
     "AppendOnlyMerkleLedger",
     "ReadOnlyMerkleVerifierNode",
+    "SegmentedLeafLog",
     "TelemetryPublisher",
     "TelemetryPublishResult",
     "PublishAttemptResult",
@@ -296,15 +351,22 @@ __all__ = [
     "KafkaTelemetryPublisher",
     "RabbitMQTelemetryPublisher",
     "PikaRabbitMQTelemetryPublisher",
+    "PikaChannelPool",
     "OPAConfig",
     "OPAClientError",
     "OPAAuthorizationError",
     "OPAExecutionAuthorizer",
+    "OPADecision",
+    "OPADecisionMetrics",
     "OPAAAAPolicyAdapter",
+    "LocalPolicyError",
+    "LocalPolicyEvaluator",
+    "policy_bundle_sha256",
     "ManifestSigner",
     "VaultTransitConfig",
     "VaultTransitSigner",
     "VaultTransitError",
+    "VaultTransitMetrics",
     "VaultUnsealPolicy",
     "VaultRotationResult",
     "VaultHardeningError",
@@ -16,14 +16,27 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
 from threading import Lock
 from typing import Any
 from uuid import uuid4
 
-from .campaign_engine import CampaignEngine
+from .attack_paths import CSRGraph, GraphPath, LateralGraphIndex
+from .campaign_engine import (
+    CampaignChangeSet,
+    CampaignEngine,
+    IdentityRecord,
+    LateralMovementEdge,
+)
+from .engine_store import (
+    EngineStore,
+    ResidentPartitions,
+    StoredRow,
+    decode_record,
+    encode_record,
+)
 
 
 class AdversaryGraphError(ValueError):
@@ -87,13 +100,75 @@ class CampaignGraphReconstruction:
     generated_at: datetime
 
 
+@dataclass(slots=True, frozen=True)
+class _IndexedLateralEdge:
+    """Persisted lateral index edge, replayed when a campaign is reloaded."""
+
+    campaign_id: str
+    edge_id: str
+    source_asset_id: str
+    target_asset_id: str
+
+
+@dataclass(slots=True)
+class _CampaignGraphView:
+    """Materialised reconstruction state for one campaign and its cursor."""
+
+    lock: Lock = field(default_factory=Lock)
+    cursor: int = -1
+    execution_ids: set[str] = field(default_factory=set)
+    execution_started: list[datetime] = field(default_factory=list)
+    execution_techniques: list[str] = field(default_factory=list)
+    identities: dict[str, IdentityRecord] = field(default_factory=dict)
+    identity_chains: dict[str, IdentityCompromiseChain] = field(default_factory=dict)
+    dirty_identities: set[str] = field(default_factory=set)
+    edge_ids: set[str] = field(default_factory=set)
+    first_edge: LateralMovementEdge | None = None
+    last_edge: LateralMovementEdge | None = None
+    lateral_dirty: bool = False
+    emitted_paths: set[tuple[str, tuple[str, ...], tuple[str, ...]]] = field(default_factory=set)
+
+
+_STORE_NAMESPACE = "adversary_graph"
+_PATH_ORDERS = frozenset({"shortest", "risk"})
+
+
+def _lateral_risk(hops: int) -> float:
+    return _clamp(hops * 0.18, 0.05, 1.0)
+
+
 class AdversaryGraphEngine:
-    """Thread-safe graph engine for campaign reconstruction and traversal."""
+    """Thread-safe graph engine for campaign reconstruction and traversal.
+
+    With a ``store`` attack paths and technique links are written through to
+    durable storage and a campaign's graph is loaded on first access;
+    ``max_resident_campaigns`` evicts the least recently used campaign graphs.
+    Lateral movement edges are kept in a per-campaign ``LateralGraphIndex``
+    that grows as edges arrive; with a store the edges are written through,
+    so an evicted or restarted campaign rebuilds its index on reload.
 
-    def __init__(self) -> None:
+    ``reconstruct_campaign_graph`` keeps a materialised graph per campaign
+    and applies only the ``CampaignEngine`` changes since its last cursor.
+    """
+
+    def __init__(
+        self,
+        store: EngineStore | None = None,
+        *,
+        max_resident_campaigns: int | None = None,
+    ) -> None:
+        if max_resident_campaigns is not None and store is None:
+            raise AdversaryGraphError("max_resident_campaigns requires a store")
         self._attack_path_table: dict[str, AttackPathRecord] = {}
         self._technique_link_table: dict[str, TechniqueLinkRecord] = {}
+        self._campaign_attack_paths: dict[str, list[str]] = {}
+        self._campaign_technique_links: dict[str, list[str]] = {}
+        self._lateral_indexes: dict[str, LateralGraphIndex] = {}
+        self._graph_views: dict[str, _CampaignGraphView] = {}
         self._lock = Lock()
+        self._store = store
+        self._bounded = max_resident_campaigns is not None
+        self._resident = ResidentPartitions(max_resident_campaigns)
 
     def add_technique_link(
         self,
@@ -116,11 +191,14 @@ class AdversaryGraphEngine:
             created_at=datetime.now(UTC),
         )
         with self._lock:
+            self._load_campaign(campaign_id)
             key = f"{campaign_id}|{row.source_technique_id}|{row.target_technique_id}|{row.relation}"
             existing = self._technique_link_table.get(key)
             if existing is not None:
                 return existing
             self._technique_link_table[key] = row
+            self._campaign_technique_links[campaign_id].append(key)
+            self._persist("technique_link", key, row)
         return row
 
     def add_attack_path(
@@ -133,22 +211,87 @@ class AdversaryGraphEngine:
         risk_score: float,
         metadata: dict[str, Any] | None = None,
     ) -> AttackPathRecord:
-        if not node_path:
-            raise AdversaryGraphError("node_path is required")
-        row = AttackPathRecord(
-            attack_path_id=f"apth-{uuid4()}",
+        row = self._attack_path_row(
             campaign_id=campaign_id,
-            path_type=path_type.strip() or "generic",
+            path_type=path_type,
             node_path=node_path,
             edge_path=edge_path,
-            risk_score=_clamp(float(risk_score), 0.0, 1.0),
-            created_at=datetime.now(UTC),
-            metadata=dict(metadata or {}),
+            risk_score=risk_score,
+            metadata=metadata,
         )
-        with self._lock:
-            self._attack_path_table[row.attack_path_id] = row
+        self._record_attack_paths(campaign_id, [row])
         return row
 
+    def index_lateral_edges(
+        self,
+        *,
+        campaign_id: str,
+        lateral_edges: list[tuple[str, str, str]],
+    ) -> int:
+        """Add ``(edge_id, source, target)`` edges to the campaign index; returns new edges."""
+        index = self._lateral_index(campaign_id)
+        added = [edge for edge in lateral_edges if index.add_edges([edge])]
+        if added and self._store is not None:
+            self._store.write(
+                _STORE_NAMESPACE,
+                [
+                    StoredRow(
+                        "lateral_edge",
+                        f"{campaign_id}|{edge_id}",
+                        campaign_id,
+                        encode_record(
+                            _IndexedLateralEdge(campaign_id, edge_id, source, target)
+                        ),
+                    )
+                    for edge_id, source, target in added
+                ],
+            )
+        return len(added)
+
+    def query_lateral_paths(
+        self,
+        *,
+        campaign_id: str,
+        start_asset_id: str,
+        target_asset_id: str,
+        max_depth: int = 6,
+        max_paths: int = 64,
+        order: str = "shortest",
+    ) -> list[GraphPath]:
+        """Query indexed lateral paths without recording them.
+
+        ``order="shortest"`` returns the ``max_paths`` shortest loop-free
+        paths; ``order="risk"`` returns the ``max_paths`` highest-risk ones.
+        """
+        if max_depth < 1:
+            raise AdversaryGraphError("max_depth must be >= 1")
+        if max_paths < 1:
+            raise AdversaryGraphError("max_paths must be >= 1")
+        if order not in _PATH_ORDERS:
+            raise AdversaryGraphError(f"unsupported path order: {order}")
+        index = self._lateral_index(campaign_id)
+        if order == "risk":
+            return [
+                path
+                for _, path in index.top_paths_by_risk(
+                    start_asset_id,
+                    target_asset_id,
+                    k=max_paths,
+                    max_depth=max_depth,
+                    risk=_lateral_risk,
+                )
+            ]
+        return index.k_shortest_paths(
+            start_asset_id,
+            target_asset_id,
+            k=max_paths,
+            max_depth=max_depth,
+        )
+
+    def lateral_graph_csr(self, *, campaign_id: str) -> CSRGraph:
+        """Export the campaign's indexed lateral graph in CSR form."""
+        return self._lateral_index(campaign_id).to_csr()
+
     def traverse_lateral_paths(
         self,
         *,
@@ -157,39 +300,28 @@ class AdversaryGraphEngine:
         start_asset_id: str,
         target_asset_id: str,
         max_depth: int = 6,
+        max_paths: int = 64,
+        order: str = "shortest",
     ) -> list[AttackPathRecord]:
+        """Index ``lateral_edges`` and record up to ``max_paths`` attack paths.
+
+        Paths are searched over every edge indexed for the campaign so far,
+        not only the edges passed in this call.
+        """
         if max_depth < 1:
             raise AdversaryGraphError("max_depth must be >= 1")
-        adjacency: dict[str, list[tuple[str, str]]] = defaultdict(list)
-        for edge_id, src, dst in lateral_edges:
-            adjacency[src].append((edge_id, dst))
-
-        queue: deque[tuple[str, tuple[str, ...], tuple[str, ...]]] = deque(
-            [(start_asset_id, (start_asset_id,), tuple())]
+        self.index_lateral_edges(campaign_id=campaign_id, lateral_edges=lateral_edges)
+        paths = self.query_lateral_paths(
+            campaign_id=campaign_id,
+            start_asset_id=start_asset_id,
+            target_asset_id=target_asset_id,
+            max_depth=max_depth,
+            max_paths=max_paths,
+            order=order,
         )
-        found: list[AttackPathRecord] = []
-        while queue:
-            current, nodes, edges = queue.popleft()
-            if len(nodes) > max_depth + 1:
-                continue
-            if current == target_asset_id:
-                risk = _clamp((len(nodes) - 1) * 0.18, 0.05, 1.0)
-                found.append(
-                    self.add_attack_path(
-                        campaign_id=campaign_id,
-                        path_type="lateral_movement",
-                        node_path=nodes,
-                        edge_path=edges,
-                        risk_score=risk,
-                        metadata={"start_asset_id": start_asset_id, "target_asset_id": target_asset_id},
-                    )
-                )
-                continue
-            for edge_id, nxt in adjacency.get(current, []):
-                if nxt in nodes:
-                    continue
-                queue.append((nxt, nodes + (nxt,), edges + (edge_id,)))
-        return found
+        rows = self._lateral_path_rows(campaign_id, paths, start_asset_id, target_asset_id)
+        self._record_attack_paths(campaign_id, rows)
+        return rows
 
     def model_privilege_escalation_paths(
         self,
@@ -199,22 +331,14 @@ class AdversaryGraphEngine:
         escalation_levels: list[str],
         escalation_execution_ids: list[str],
     ) -> AttackPathRecord:
-        if not escalation_levels:
-            raise AdversaryGraphError("escalation_levels cannot be empty")
-        unique_levels: list[str] = []
-        for level in escalation_levels:
-            token = level.strip().lower()
-            if token and (not unique_levels or unique_levels[-1] != token):
-                unique_levels.append(token)
-        risk = _clamp(0.15 + len(unique_levels) * 0.2, 0.0, 1.0)
-        return self.add_attack_path(
+        row = self._privilege_escalation_row(
             campaign_id=campaign_id,
-            path_type="privilege_escalation",
-            node_path=tuple(unique_levels),
-            edge_path=tuple(escalation_execution_ids),
-            risk_score=risk,
-            metadata={"identity_id": identity_id},
+            identity_id=identity_id,
+            escalation_levels=escalation_levels,
+            escalation_execution_ids=escalation_execution_ids,
         )
+        self._record_attack_paths(campaign_id, [row])
+        return row
 
     def model_identity_compromise_chain(
         self,
@@ -246,117 +370,376 @@ class AdversaryGraphEngine:
         *,
         campaign_engine: CampaignEngine,
         campaign_id: str,
+        full_rebuild: bool = False,
     ) -> CampaignGraphReconstruction:
-        steps = campaign_engine.list_campaign_steps(campaign_id=campaign_id)
-        executions = campaign_engine.list_campaign_executions(campaign_id=campaign_id)
-        identities = campaign_engine.list_campaign_identities(campaign_id=campaign_id)
-        lateral = campaign_engine.list_lateral_movement_edges(campaign_id=campaign_id)
-        escalations = campaign_engine.list_campaign_escalations(campaign_id=campaign_id)
-
-        step_technique: dict[str, str] = {step.step_id: step.technique_id for step in steps}
-        ordered_exec = sorted(executions, key=lambda row: row.started_at)
-        for prev, nxt in zip(ordered_exec, ordered_exec[1:]):
-            src = step_technique.get(prev.step_id, prev.technique_id)
-            dst = step_technique.get(nxt.step_id, nxt.technique_id)
+        """Return the campaign graph, applying only changes since the last call.
+
+        The first call for a campaign, ``full_rebuild=True`` and a truncated
+        change log rebuild the materialised graph from every campaign row.
+        Technique links and attack paths already recorded for the campaign
+        are not recorded again, so a full rebuild can verify incremental
+        results.
+        """
+        with self._lock:
+            self._load_campaign(campaign_id)
+            view = self._graph_views.get(campaign_id)
+            if view is None:
+                view = self._graph_views[campaign_id] = _CampaignGraphView()
+        with view.lock:
+            change_set = None
+            if not full_rebuild and view.cursor >= 0:
+                change_set = campaign_engine.list_campaign_changes(
+                    campaign_id=campaign_id, since=view.cursor
+                )
+            if change_set is None or change_set.truncated:
+                self._rebuild_view(view, campaign_engine, campaign_id)
+            else:
+                self._apply_changes(view, change_set, campaign_id)
+            self._refresh_view(view, campaign_engine, campaign_id)
+            identity_chains = tuple(
+                view.identity_chains[identity_id]
+                for identity_id in sorted(
+                    view.identity_chains, key=lambda item: view.identities[item].principal
+                )
+            )
+
+        with self._lock:
+            self._load_campaign(campaign_id)
+            attack_paths = tuple(
+                sorted(
+                    [
+                        self._attack_path_table[row_id]
+                        for row_id in self._campaign_attack_paths[campaign_id]
+                    ],
+                    key=lambda row: row.created_at,
+                )
+            )
+            technique_links = tuple(
+                sorted(
+                    [
+                        self._technique_link_table[key]
+                        for key in self._campaign_technique_links[campaign_id]
+                    ],
+                    key=lambda row: row.created_at,
+                )
+            )
+        return CampaignGraphReconstruction(
+            campaign_id=campaign_id,
+            attack_paths=attack_paths,
+            technique_links=technique_links,
+            identity_chains=identity_chains,
+            generated_at=datetime.now(UTC),
+        )
+
+    def flush(self) -> None:
+        """Persist buffered writes to the configured store."""
+        if self._store is not None:
+            self._store.flush()
+
+    def _persist(self, table: str, row_id: str, record: Any) -> None:
+        if self._store is not None:
+            self._store.write(
+                _STORE_NAMESPACE,
+                [StoredRow(table, row_id, record.campaign_id, encode_record(record))],
+            )
+
+    def _rebuild_view(
+        self, view: _CampaignGraphView, campaign_engine: CampaignEngine, campaign_id: str
+    ) -> None:
+        """Reset ``view`` from every campaign row (view lock held)."""
+        # Read the cursor first: rows written meanwhile are replayed as
+        # changes next time, and applying a change twice is harmless.
+        cursor = campaign_engine.campaign_change_sequence(campaign_id=campaign_id)
+        with self._lock:
+            self._load_campaign(campaign_id)
+            emitted = {
+                (row.path_type, row.node_path, row.edge_path)
+                for row in (
+                    self._attack_path_table[row_id]
+                    for row_id in self._campaign_attack_paths[campaign_id]
+                )
+            }
+        fresh = _CampaignGraphView(lock=view.lock, cursor=cursor, emitted_paths=emitted)
+        for item in fields(_CampaignGraphView):
+            setattr(view, item.name, getattr(fresh, item.name))
+        for execution in campaign_engine.list_campaign_executions(campaign_id=campaign_id):
+            self._apply_execution(
+                view, campaign_id, execution.execution_id, execution.started_at, execution.technique_id
+            )
+        for identity in campaign_engine.list_campaign_identities(campaign_id=campaign_id):
+            view.identities[identity.identity_id] = identity
+            view.dirty_identities.add(identity.identity_id)
+        for edge in campaign_engine.list_lateral_movement_edges(campaign_id=campaign_id):
+            self._apply_edge(view, campaign_id, edge)
+
+    def _apply_changes(
+        self, view: _CampaignGraphView, change_set: CampaignChangeSet, campaign_id: str
+    ) -> None:
+        """Fold campaign changes after the view's cursor into ``view`` (view lock held)."""
+        for change in change_set.changes:
+            record = change.record
+            if change.table == "execution":
+                self._apply_execution(
+                    view, campaign_id, record.execution_id, record.started_at, record.technique_id
+                )
+            elif change.table == "identity":
+                view.identities[record.identity_id] = record
+                view.dirty_identities.add(record.identity_id)
+            elif change.table in {"credential", "escalation"}:
+                view.dirty_identities.add(record.identity_id)
+            elif change.table == "lateral_edge":
+                view.dirty_identities.add(record.identity_id)
+                self._apply_edge(view, campaign_id, record)
+        view.cursor = change_set.sequence
+
+    def _apply_execution(
+        self,
+        view: _CampaignGraphView,
+        campaign_id: str,
+        execution_id: str,
+        started_at: datetime,
+        technique_id: str,
+    ) -> None:
+        if execution_id in view.execution_ids:
+            return
+        view.execution_ids.add(execution_id)
+        position = bisect_right(view.execution_started, started_at)
+        view.execution_started.insert(position, started_at)
+        view.execution_techniques.insert(position, technique_id)
+        neighbours = view.execution_techniques[max(0, position - 1) : position + 2]
+        for source, target in zip(neighbours, neighbours[1:]):
             self.add_technique_link(
                 campaign_id=campaign_id,
-                source_technique_id=src,
-                target_technique_id=dst,
+                source_technique_id=source,
+                target_technique_id=target,
                 relation="sequence",
                 weight=0.8,
             )
 
-        identity_chains: list[IdentityCompromiseChain] = []
-        for identity in identities:
+    def _apply_edge(
+        self, view: _CampaignGraphView, campaign_id: str, edge: LateralMovementEdge
+    ) -> None:
+        if edge.edge_id in view.edge_ids:
+            return
+        view.edge_ids.add(edge.edge_id)
+        self.index_lateral_edges(
+            campaign_id=campaign_id,
+            lateral_edges=[(edge.edge_id, edge.source_asset_id, edge.target_asset_id)],
+        )
+        if view.first_edge is None or edge.occurred_at < view.first_edge.occurred_at:
+            view.first_edge = edge
+        if view.last_edge is None or edge.occurred_at >= view.last_edge.occurred_at:
+            view.last_edge = edge
+        view.lateral_dirty = True
+
+    def _refresh_view(
+        self, view: _CampaignGraphView, campaign_engine: CampaignEngine, campaign_id: str
+    ) -> None:
+        """Recompute dirty identity chains and record new paths (view lock held)."""
+        rows: list[AttackPathRecord] = []
+        for identity_id in sorted(
+            view.dirty_identities, key=lambda item: view.identities[item].principal
+        ):
+            identity = view.identities[identity_id]
             creds = campaign_engine.list_identity_credentials(
-                campaign_id=campaign_id,
-                identity_id=identity.identity_id,
+                campaign_id=campaign_id, identity_id=identity_id
+            )
+            escalations = campaign_engine.list_identity_escalations(
+                campaign_id=campaign_id, identity_id=identity_id
             )
-            id_escalations = [
-                row for row in escalations if row.identity_id == identity.identity_id
-            ]
-            id_edges = [
-                row for row in lateral if row.identity_id == identity.identity_id
-            ]
             pivot = campaign_engine.reconstruct_pivot_chain(
-                campaign_id=campaign_id,
-                identity_id=identity.identity_id,
+                campaign_id=campaign_id, identity_id=identity_id
             )
             levels = [identity.privilege_level.value]
-            levels.extend(row.to_level.value for row in id_escalations)
-            if id_escalations:
-                self.model_privilege_escalation_paths(
-                    campaign_id=campaign_id,
-                    identity_id=identity.identity_id,
-                    escalation_levels=levels,
-                    escalation_execution_ids=[row.execution_id for row in id_escalations],
-                )
-
-            for edge in id_edges:
-                self.add_technique_link(
-                    campaign_id=campaign_id,
-                    source_technique_id="T1021",
-                    target_technique_id="T1021",
-                    relation="lateral_transition",
-                    weight=0.7,
+            levels.extend(row.to_level.value for row in escalations)
+            escalation_execution_ids = [row.execution_id for row in escalations]
+            if escalations:
+                rows.append(
+                    self._privilege_escalation_row(
+                        campaign_id=campaign_id,
+                        identity_id=identity_id,
+                        escalation_levels=levels,
+                        escalation_execution_ids=escalation_execution_ids,
+                    )
                 )
-
-            chain = self.model_identity_compromise_chain(
+            view.identity_chains[identity_id] = self.model_identity_compromise_chain(
                 campaign_id=campaign_id,
-                identity_id=identity.identity_id,
+                identity_id=identity_id,
                 principal=identity.principal,
                 source_asset_id=identity.source_asset_id,
                 compromised=identity.compromised,
                 credential_material_refs=[row.material_ref for row in creds],
                 privilege_levels=levels,
                 pivot_assets=list(pivot.asset_path),
-                escalation_execution_ids=[row.execution_id for row in id_escalations],
+                escalation_execution_ids=escalation_execution_ids,
             )
-            identity_chains.append(chain)
-
             if len(pivot.asset_path) > 1:
-                self.add_attack_path(
-                    campaign_id=campaign_id,
-                    path_type="identity_pivot",
-                    node_path=pivot.asset_path,
-                    edge_path=pivot.edge_ids,
-                    risk_score=_clamp(0.20 + (len(pivot.asset_path) - 1) * 0.16, 0.0, 1.0),
-                    metadata={"identity_id": identity.identity_id},
+                rows.append(
+                    self._attack_path_row(
+                        campaign_id=campaign_id,
+                        path_type="identity_pivot",
+                        node_path=pivot.asset_path,
+                        edge_path=pivot.edge_ids,
+                        risk_score=_clamp(0.20 + (len(pivot.asset_path) - 1) * 0.16, 0.0, 1.0),
+                        metadata={"identity_id": identity_id},
+                    )
                 )
+        view.dirty_identities.clear()
 
-        # Build lateral paths across all edges from first to last known node.
-        if lateral:
-            edges_simple = [
-                (row.edge_id, row.source_asset_id, row.target_asset_id)
-                for row in lateral
-            ]
-            first = edges_simple[0][1]
-            last = edges_simple[-1][2]
-            self.traverse_lateral_paths(
+        # Lateral paths span the first to the last known node.
+        if view.lateral_dirty and view.first_edge is not None and view.last_edge is not None:
+            self.add_technique_link(
                 campaign_id=campaign_id,
-                lateral_edges=edges_simple,
-                start_asset_id=first,
-                target_asset_id=last,
-                max_depth=8,
+                source_technique_id="T1021",
+                target_technique_id="T1021",
+                relation="lateral_transition",
+                weight=0.7,
             )
-
-        attack_paths = tuple(
-            sorted(
-                [row for row in self._attack_path_table.values() if row.campaign_id == campaign_id],
-                key=lambda row: row.created_at,
-            )
-        )
-        technique_links = tuple(
-            sorted(
-                [row for row in self._technique_link_table.values() if row.campaign_id == campaign_id],
-                key=lambda row: row.created_at,
+            start = view.first_edge.source_asset_id
+            target = view.last_edge.target_asset_id
+            paths = self.query_lateral_paths(
+                campaign_id=campaign_id,
+                start_asset_id=start,
+                target_asset_id=target,
+                max_depth=8,
             )
+            rows.extend(self._lateral_path_rows(campaign_id, paths, start, target))
+            view.lateral_dirty = False
+
+        fresh: list[AttackPathRecord] = []
+        for row in rows:
+            key = (row.path_type, row.node_path, row.edge_path)
+            if key not in view.emitted_paths:
+                view.emitted_paths.add(key)
+                fresh.append(row)
+        self._record_attack_paths(campaign_id, fresh)
+
+    @staticmethod
+    def _attack_path_row(
+        *,
+        campaign_id: str,
+        path_type: str,
+        node_path: tuple[str, ...],
+        edge_path: tuple[str, ...],
+        risk_score: float,
+        metadata: dict[str, Any] | None,
+        created_at: datetime | None = None,
+    ) -> AttackPathRecord:
+        if not node_path:
+            raise AdversaryGraphError("node_path is required")
+        return AttackPathRecord(
+            attack_path_id=f"apth-{uuid4()}",
+            campaign_id=campaign_id,
+            path_type=path_type.strip() or "generic",
+            node_path=node_path,
+            edge_path=edge_path,
+            risk_score=_clamp(float(risk_score), 0.0, 1.0),
+            created_at=created_at or datetime.now(UTC),
+            metadata=dict(metadata or {}),
         )
-        return CampaignGraphReconstruction(
+
+    def _privilege_escalation_row(
+        self,
+        *,
+        campaign_id: str,
+        identity_id: str,
+        escalation_levels: list[str],
+        escalation_execution_ids: list[str],
+    ) -> AttackPathRecord:
+        if not escalation_levels:
+            raise AdversaryGraphError("escalation_levels cannot be empty")
+        unique_levels: list[str] = []
+        for level in escalation_levels:
+            token = level.strip().lower()
+            if token and (not unique_levels or unique_levels[-1] != token):
+                unique_levels.append(token)
+        return self._attack_path_row(
             campaign_id=campaign_id,
-            attack_paths=attack_paths,
-            technique_links=technique_links,
-            identity_chains=tuple(identity_chains),
-            generated_at=datetime.now(UTC),
+            path_type="privilege_escalation",
+            node_path=tuple(unique_levels),
+            edge_path=tuple(escalation_execution_ids),
+            risk_score=_clamp(0.15 + len(unique_levels) * 0.2, 0.0, 1.0),
+            metadata={"identity_id": identity_id},
         )
 
+    def _lateral_path_rows(
+        self,
+        campaign_id: str,
+        paths: list[GraphPath],
+        start_asset_id: str,
+        target_asset_id: str,
+    ) -> list[AttackPathRecord]:
+        created_at = datetime.now(UTC)
+        return [
+            self._attack_path_row(
+                campaign_id=campaign_id,
+                path_type="lateral_movement",
+                node_path=path.node_path,
+                edge_path=path.edge_path,
+                risk_score=_lateral_risk(path.hops),
+                metadata={"start_asset_id": start_asset_id, "target_asset_id": target_asset_id},
+                created_at=created_at,
+            )
+            for path in paths
+        ]
+
+    def _record_attack_paths(self, campaign_id: str, rows: list[AttackPathRecord]) -> None:
+        """Insert attack paths under one lock hold and one store write."""
+        if not rows:
+            return
+        with self._lock:
+            self._load_campaign(campaign_id)
+            for row in rows:
+                self._attack_path_table[row.attack_path_id] = row
+                self._campaign_attack_paths[campaign_id].append(row.attack_path_id)
+            if self._store is not None:
+                self._store.write(
+                    _STORE_NAMESPACE,
+                    [
+                        StoredRow("attack_path", row.attack_path_id, campaign_id, encode_record(row))
+                        for row in rows
+                    ],
+                )
+
+    def _lateral_index(self, campaign_id: str) -> LateralGraphIndex:
+        with self._lock:
+            self._load_campaign(campaign_id)
+            index = self._lateral_indexes.get(campaign_id)
+            if index is None:
+                index = self._lateral_indexes[campaign_id] = LateralGraphIndex()
+            return index
+
+    def _load_campaign(self, campaign_id: str) -> None:
+        """Make one campaign's graph resident, loading it if cold (lock held)."""
+        if campaign_id not in self._campaign_attack_paths:
+            self._campaign_attack_paths[campaign_id] = []
+            self._campaign_technique_links[campaign_id] = []
+            if self._store is not None:
+                for row in self._store.load_partition(_STORE_NAMESPACE, campaign_id):
+                    if row.table == "attack_path":
+                        path = decode_record(AttackPathRecord, row.payload)
+                        self._attack_path_table[path.attack_path_id] = path
+                        self._campaign_attack_paths[campaign_id].append(path.attack_path_id)
+                    elif row.table == "technique_link":
+                        link = decode_record(TechniqueLinkRecord, row.payload)
+                        self._technique_link_table[row.row_id] = link
+                        self._campaign_technique_links[campaign_id].append(row.row_id)
+                    elif row.table == "lateral_edge":
+                        edge = decode_record(_IndexedLateralEdge, row.payload)
+                        index = self._lateral_indexes.get(campaign_id)
+                        if index is None:
+                            index = self._lateral_indexes[campaign_id] = LateralGraphIndex()
+                        index.add_edges(
+                            [(edge.edge_id, edge.source_asset_id, edge.target_asset_id)]
+                        )
+        if self._store is None or not self._bounded:
+            return
+        for cold_id in self._resident.touch(campaign_id):
+            self._store.flush()
+            self._resident.discard(cold_id)
+            self._lateral_indexes.pop(cold_id, None)
+            self._graph_views.pop(cold_id, None)
+            for row_id in self._campaign_attack_paths.pop(cold_id, []):
+                self._attack_path_table.pop(row_id, None)
+            for key in self._campaign_technique_links.pop(cold_id, []):
+                self._technique_link_table.pop(key, None)
@@ -18,9 +18,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from threading import Lock
 
 from pkg.orchestrator.manifest import ExecutionManifest
+from pkg.security.nonce_store import (
+    InMemoryNonceStore,
+    NonceStore,
+    NonceStoreCapacityError,
+)
 
 
 class AntiReplayValidationError(ValueError):
@@ -45,12 +49,20 @@ class AntiReplayConfig:
 
 
 class AntiReplayGuard:
-    """In-memory replay guard using tenant-scoped nonce tracking."""
+    """Replay guard using tenant-scoped nonce tracking.
 
-    def __init__(self, config: AntiReplayConfig | None = None) -> None:
+    Nonces live in a private in-memory store unless ``nonce_store`` is given,
+    which lets several guards or orchestrator replicas share replay state.
+    """
+
+    def __init__(
+        self,
+        config: AntiReplayConfig | None = None,
+        *,
+        nonce_store: NonceStore | None = None,
+    ) -> None:
         self._config = config or AntiReplayConfig()
-        self._seen_nonces: dict[str, datetime] = {}
-        self._lock = Lock()
+        self._nonce_store = InMemoryNonceStore() if nonce_store is None else nonce_store
 
     def validate_manifest(
         self,
@@ -81,19 +93,17 @@ class AntiReplayGuard:
     def _check_and_store_nonce(
         self, *, tenant_id: str, nonce: str, now: datetime
     ) -> None:
-        key = f"{tenant_id}:{nonce}"
-        expiry = now + timedelta(seconds=self._config.nonce_retention_seconds)
-
-        with self._lock:
-            self._evict_expired(now)
-            if key in self._seen_nonces:
-                raise AntiReplayValidationError("replayed nonce detected")
-            self._seen_nonces[key] = expiry
-
-    def _evict_expired(self, now: datetime) -> None:
-        expired = [key for key, expiry in self._seen_nonces.items() if expiry <= now]
-        for key in expired:
-            del self._seen_nonces[key]
+        try:
+            stored = self._nonce_store.check_and_store(
+                f"manifest:{tenant_id}:{nonce}",
+                ttl_seconds=self._config.nonce_retention_seconds,
+                now=now.timestamp(),
+                shard_hint=tenant_id,
+            )
+        except NonceStoreCapacityError as exc:
+            raise AntiReplayValidationError("nonce store capacity exceeded") from exc
+        if not stored:
+            raise AntiReplayValidationError("replayed nonce detected")
 
     @staticmethod
     def _parse_timestamp(raw: str) -> datetime:
@@ -0,0 +1,358 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: Jose Maria Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Incremental lateral-movement graph index with bounded path queries."""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency for CSR export
+    np = None
+
+
+class AttackPathQueryError(ValueError):
+    """Raised when an attack-path query is malformed."""
+
+
+@dataclass(slots=True, frozen=True)
+class GraphPath:
+    """One simple path through the lateral graph."""
+
+    node_path: tuple[str, ...]
+    edge_path: tuple[str, ...]
+
+    @property
+    def hops(self) -> int:
+        return len(self.edge_path)
+
+
+@dataclass(slots=True, frozen=True)
+class CSRGraph:
+    """Compressed sparse row view of the lateral graph.
+
+    Arrays are numpy ``int64`` arrays when numpy is installed, otherwise
+    ``array('q')``. Node ``i``'s outgoing edges are
+    ``indices[indptr[i]:indptr[i + 1]]`` with matching ``edge_ids``.
+    """
+
+    node_ids: tuple[str, ...]
+    indptr: Any
+    indices: Any
+    edge_ids: tuple[str, ...]
+
+
+class LateralGraphIndex:
+    """Directed multigraph of lateral movement edges, updated in place.
+
+    Nodes and edges are interned to integers on arrival so queries run on
+    plain adjacency lists. Queries never enumerate every simple path:
+    ``k_shortest_paths`` uses Yen's algorithm and ``top_paths_by_risk`` a
+    pruned depth-first search with an expansion cap.
+    """
+
+    def __init__(self) -> None:
+        self._node_ids: dict[str, int] = {}
+        self._node_names: list[str] = []
+        self._edge_index: dict[str, int] = {}
+        self._edge_names: list[str] = []
+        self._edge_targets: list[int] = []
+        self._outgoing: list[list[int]] = []
+        self._incoming: list[list[int]] = []
+        self._edge_sources: list[int] = []
+        self._lock = Lock()
+
+    @property
+    def node_count(self) -> int:
+        return len(self._node_names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edge_names)
+
+    def add_edge(self, edge_id: str, source: str, target: str) -> bool:
+        """Index one edge; returns ``False`` if the edge id is already known."""
+        with self._lock:
+            return self._add_edge(edge_id, source, target)
+
+    def add_edges(self, edges: Iterable[tuple[str, str, str]]) -> int:
+        """Index ``(edge_id, source, target)`` tuples; returns how many were new."""
+        with self._lock:
+            return sum(1 for edge_id, source, target in edges if self._add_edge(edge_id, source, target))
+
+    def k_shortest_paths(
+        self,
+        start: str,
+        target: str,
+        *,
+        k: int,
+        max_depth: int,
+    ) -> list[GraphPath]:
+        """Return up to ``k`` loop-free paths in increasing hop count (Yen's algorithm)."""
+        self._validate_query(k=k, max_depth=max_depth)
+        if start == target:
+            return [GraphPath(node_path=(start,), edge_path=tuple())]
+        with self._lock:
+            source_id = self._node_ids.get(start)
+            target_id = self._node_ids.get(target)
+            if source_id is None or target_id is None:
+                return []
+            first = self._shortest(source_id, target_id, set(), set(), max_depth)
+            if first is None:
+                return []
+            accepted: list[tuple[tuple[int, ...], tuple[int, ...]]] = [first]
+            seen = {first[1]}
+            candidates: list[tuple[int, int, tuple[int, ...], tuple[int, ...]]] = []
+            tie_breaker = count()
+            while len(accepted) < k:
+                nodes, edges = accepted[-1]
+                for spur_index in range(len(edges)):
+                    root_nodes = nodes[: spur_index + 1]
+                    root_edges = edges[:spur_index]
+                    # Roots are compared by edge so parallel edges between
+                    # the same hosts stay distinct roots.
+                    banned_edges = {
+                        path_edges[spur_index]
+                        for _, path_edges in accepted
+                        if len(path_edges) > spur_index and path_edges[:spur_index] == root_edges
+                    }
+                    spur = self._shortest(
+                        root_nodes[-1],
+                        target_id,
+                        set(root_nodes[:-1]),
+                        banned_edges,
+                        max_depth - spur_index,
+                    )
+                    if spur is None:
+                        continue
+                    candidate_edges = root_edges + spur[1]
+                    if candidate_edges in seen:
+                        continue
+                    seen.add(candidate_edges)
+                    heapq.heappush(
+                        candidates,
+                        (
+                            len(candidate_edges),
+                            next(tie_breaker),
+                            root_nodes[:-1] + spur[0],
+                            candidate_edges,
+                        ),
+                    )
+                if not candidates:
+                    break
+                _, _, best_nodes, best_edges = heapq.heappop(candidates)
+                accepted.append((best_nodes, best_edges))
+            return [self._path(nodes, edges) for nodes, edges in accepted]
+
+    def top_paths_by_risk(
+        self,
+        start: str,
+        target: str,
+        *,
+        k: int,
+        max_depth: int,
+        risk: Callable[[int], float],
+        max_expansions: int = 200_000,
+    ) -> list[tuple[float, GraphPath]]:
+        """Return up to ``k`` highest-risk paths, best first.
+
+        ``risk`` maps a hop count to a score and must be non-decreasing.
+        Branches that cannot reach ``target`` within the remaining depth
+        are pruned, the search stops once no deeper path can beat the
+        current k-th result, and at most ``max_expansions`` nodes are
+        expanded.
+        """
+        self._validate_query(k=k, max_depth=max_depth)
+        if max_expansions < 1:
+            raise AttackPathQueryError("max_expansions must be >= 1")
+        if start == target:
+            return [(risk(0), GraphPath(node_path=(start,), edge_path=tuple()))]
+        with self._lock:
+            source_id = self._node_ids.get(start)
+            target_id = self._node_ids.get(target)
+            if source_id is None or target_id is None:
+                return []
+            distance = self._distances_to(target_id, max_depth)
+            if source_id not in distance:
+                return []
+            ceiling = risk(max_depth)
+            best: list[tuple[float, int, tuple[int, ...], tuple[int, ...]]] = []
+            tie_breaker = count()
+            expansions = 0
+            path_nodes = [source_id]
+            path_edges: list[int] = []
+            on_path = {source_id}
+            stack = [iter(self._outgoing[source_id])]
+            while stack and expansions < max_expansions:
+                edge_index = next(stack[-1], None)
+                if edge_index is None:
+                    stack.pop()
+                    on_path.discard(path_nodes.pop())
+                    if path_edges:
+                        path_edges.pop()
+                    continue
+                successor = self._edge_targets[edge_index]
+                successor_distance = distance.get(successor)
+                hops_left = max_depth - len(path_edges) - 1
+                if (
+                    successor_distance is None
+                    or successor_distance > hops_left
+                    or successor in on_path
+                ):
+                    continue
+                expansions += 1
+                if successor == target_id:
+                    hops = len(path_edges) + 1
+                    score = risk(hops)
+                    if len(best) < k or score > best[0][0]:
+                        entry = (
+                            score,
+                            -next(tie_breaker),
+                            (*path_nodes, successor),
+                            (*path_edges, edge_index),
+                        )
+                        if len(best) < k:
+                            heapq.heappush(best, entry)
+                        else:
+                            heapq.heapreplace(best, entry)
+                    if len(best) == k and best[0][0] >= ceiling:
+                        break
+                    continue
+                path_nodes.append(successor)
+                path_edges.append(edge_index)
+                on_path.add(successor)
+                stack.append(iter(self._outgoing[successor]))
+            ranked = sorted(best, key=lambda item: (-item[0], -item[1]))
+            return [(score, self._path(nodes, edges)) for score, _, nodes, edges in ranked]
+
+    def to_csr(self) -> CSRGraph:
+        """Export the graph in CSR form (numpy arrays when available)."""
+        with self._lock:
+            indptr = [0]
+            indices: list[int] = []
+            edge_ids: list[str] = []
+            for outgoing in self._outgoing:
+                for edge_index in outgoing:
+                    indices.append(self._edge_targets[edge_index])
+                    edge_ids.append(self._edge_names[edge_index])
+                indptr.append(len(indices))
+            node_ids = tuple(self._node_names)
+        if np is not None:
+            return CSRGraph(
+                node_ids=node_ids,
+                indptr=np.asarray(indptr, dtype=np.int64),
+                indices=np.asarray(indices, dtype=np.int64),
+                edge_ids=tuple(edge_ids),
+            )
+        return CSRGraph(
+            node_ids=node_ids,
+            indptr=array("q", indptr),
+            indices=array("q", indices),
+            edge_ids=tuple(edge_ids),
+        )
+
+    def _add_edge(self, edge_id: str, source: str, target: str) -> bool:
+        if edge_id in self._edge_index:
+            return False
+        source_id = self._intern(source)
+        target_id = self._intern(target)
+        edge_index = len(self._edge_names)
+        self._edge_index[edge_id] = edge_index
+        self._edge_names.append(edge_id)
+        self._edge_sources.append(source_id)
+        self._edge_targets.append(target_id)
+        self._outgoing[source_id].append(edge_index)
+        self._incoming[target_id].append(edge_index)
+        return True
+
+    def _intern(self, node: str) -> int:
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            node_id = len(self._node_names)
+            self._node_ids[node] = node_id
+            self._node_names.append(node)
+            self._outgoing.append([])
+            self._incoming.append([])
+        return node_id
+
+    def _shortest(
+        self,
+        source_id: int,
+        target_id: int,
+        banned_nodes: set[int],
+        banned_edges: set[int],
+        max_hops: int,
+    ) -> tuple[tuple[int, ...], tuple[int, ...]] | None:
+        if max_hops < 1:
+            return None
+        parent: dict[int, tuple[int, int]] = {source_id: (-1, -1)}
+        frontier = deque([(source_id, 0)])
+        while frontier:
+            current, depth = frontier.popleft()
+            if depth >= max_hops:
+                continue
+            for edge_index in self._outgoing[current]:
+                if edge_index in banned_edges:
+                    continue
+                successor = self._edge_targets[edge_index]
+                if successor in parent or successor in banned_nodes:
+                    continue
+                parent[successor] = (current, edge_index)
+                if successor == target_id:
+                    nodes = [successor]
+                    edges: list[int] = []
+                    while parent[nodes[-1]][0] != -1:
+                        previous, via = parent[nodes[-1]]
+                        edges.append(via)
+                        nodes.append(previous)
+                    return tuple(reversed(nodes)), tuple(reversed(edges))
+                frontier.append((successor, depth + 1))
+        return None
+
+    def _distances_to(self, target_id: int, max_depth: int) -> dict[int, int]:
+        distance = {target_id: 0}
+        frontier = deque([target_id])
+        while frontier:
+            current = frontier.popleft()
+            depth = distance[current]
+            if depth >= max_depth:
+                continue
+            for edge_index in self._incoming[current]:
+                predecessor = self._edge_sources[edge_index]
+                if predecessor not in distance:
+                    distance[predecessor] = depth + 1
+                    frontier.append(predecessor)
+        return distance
+
+    def _path(self, nodes: tuple[int, ...], edges: tuple[int, ...]) -> GraphPath:
+        return GraphPath(
+            node_path=tuple(self._node_names[node] for node in nodes),
+            edge_path=tuple(self._edge_names[edge] for edge in edges),
+        )
+
+    @staticmethod
+    def _validate_query(*, k: int, max_depth: int) -> None:
+        if k < 1:
+            raise AttackPathQueryError("k must be >= 1")
+        if max_depth < 1:
+            raise AttackPathQueryError("max_depth must be >= 1")
@@ -16,13 +16,26 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum
+from itertools import islice
 from threading import Lock
 from typing import Any
 from uuid import uuid4
 
+from .engine_store import (
+    EngineStore,
+    ResidentPartitions,
+    StoredRow,
+    decode_record,
+    encode_record,
+)
+
 
 class CampaignEngineError(ValueError):
     """Raised when campaign lifecycle rules are violated."""
@@ -257,10 +270,125 @@ class PivotChain:
     edge_ids: tuple[str, ...]
 
 
-class CampaignEngine:
-    """Thread-safe stateful campaign manager with lifecycle guarantees."""
+@dataclass(slots=True, frozen=True)
+class CampaignChange:
+    """One row written to a campaign, tagged with its change sequence."""
+
+    sequence: int
+    table: str
+    record: Any
+
+
+@dataclass(slots=True, frozen=True)
+class CampaignChangeSet:
+    """Changes to one campaign after a cursor.
+
+    ``truncated`` means changes after ``since`` are no longer retained (the
+    change log rolled over or the campaign was reloaded from the store);
+    consumers must then rebuild from the full campaign state.
+    """
+
+    campaign_id: str
+    since: int
+    sequence: int
+    changes: tuple[CampaignChange, ...]
+    truncated: bool = False
+
+
+class _OrderedIndex:
+    """Row ids kept sorted by a key at insertion time, ties in insertion order."""
+
+    __slots__ = ("_keys", "_ids")
 
     def __init__(self) -> None:
+        self._keys: list[Any] = []
+        self._ids: list[str] = []
+
+    def insert(self, key: Any, row_id: str) -> None:
+        if not self._keys or key >= self._keys[-1]:
+            self._keys.append(key)
+            self._ids.append(row_id)
+            return
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._ids.insert(position, row_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+
+@dataclass(slots=True)
+class _CampaignPartition:
+    """Secondary indexes for one campaign, guarded by that campaign's lock."""
+
+    lock: Lock = field(default_factory=Lock)
+    step_orders: set[int] = field(default_factory=set)
+    steps: _OrderedIndex = field(default_factory=_OrderedIndex)
+    executions: _OrderedIndex = field(default_factory=_OrderedIndex)
+    principals: set[str] = field(default_factory=set)
+    identities: _OrderedIndex = field(default_factory=_OrderedIndex)
+    escalations: _OrderedIndex = field(default_factory=_OrderedIndex)
+    lateral_edges: _OrderedIndex = field(default_factory=_OrderedIndex)
+    identity_credentials: dict[str, _OrderedIndex] = field(default_factory=dict)
+    identity_escalations: dict[str, _OrderedIndex] = field(default_factory=dict)
+    identity_edges: dict[str, _OrderedIndex] = field(default_factory=dict)
+    sequence: int = 0
+    change_base: int = 0
+    changes: deque[CampaignChange] = field(default_factory=deque)
+    evicted: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class _ChangeSequenceRecord:
+    """Last change sequence issued for a campaign, persisted across reloads."""
+
+    campaign_id: str
+    sequence: int
+
+
+_STORE_NAMESPACE = "campaign"
+_STORED_TABLES: dict[str, tuple[type[Any], str]] = {
+    "campaign": (CampaignRecord, "campaign_id"),
+    "step": (CampaignStepRecord, "step_id"),
+    "execution": (TechniqueExecutionRecord, "execution_id"),
+    "identity": (IdentityRecord, "identity_id"),
+    "credential": (CredentialMaterialRecord, "credential_id"),
+    "escalation": (PrivilegeEscalationRecord, "escalation_id"),
+    "lateral_edge": (LateralMovementEdge, "edge_id"),
+    "change_sequence": (_ChangeSequenceRecord, "campaign_id"),
+}
+
+
+class CampaignEngine:
+    """Thread-safe stateful campaign manager with lifecycle guarantees.
+
+    Rows live in id-keyed tables; each campaign owns a partition of
+    secondary indexes (kept in list order on insert) and a lock, so
+    campaigns do not serialise each other and list queries cost the size
+    of the campaign rather than of the whole engine.
+
+    With a ``store`` every change is written through to durable storage and
+    campaigns not yet in memory are loaded on first access. Setting
+    ``max_resident_campaigns`` additionally evicts the least recently used
+    campaigns once the limit is exceeded.
+
+    Every write bumps a per-campaign change sequence; the last
+    ``change_log_limit`` changes are kept so consumers can read deltas
+    since a cursor with ``list_campaign_changes``.
+    """
+
+    def __init__(
+        self,
+        store: EngineStore | None = None,
+        *,
+        max_resident_campaigns: int | None = None,
+        change_log_limit: int = 4096,
+    ) -> None:
+        if max_resident_campaigns is not None and store is None:
+            raise CampaignEngineError("max_resident_campaigns requires a store")
+        if change_log_limit < 1:
+            raise CampaignEngineError("change_log_limit must be >= 1")
+        self._change_log_limit = change_log_limit
         self._campaign_table: dict[str, CampaignRecord] = {}
         self._campaign_steps_table: dict[str, CampaignStepRecord] = {}
         self._technique_execution_table: dict[str, TechniqueExecutionRecord] = {}
@@ -269,7 +397,18 @@ class CampaignEngine:
         self._credential_material_table: dict[str, CredentialMaterialRecord] = {}
         self._escalation_table: dict[str, PrivilegeEscalationRecord] = {}
         self._lateral_edges_table: dict[str, LateralMovementEdge] = {}
+        self._campaign_name_index: dict[str, str] = {}
+        self._partitions: dict[str, _CampaignPartition] = {}
+        # Guards campaign registration, loading, eviction and the name index.
         self._lock = Lock()
+        self._correlation_lock = Lock()
+        self._store = store
+        self._bounded = max_resident_campaigns is not None
+        self._resident = ResidentPartitions(max_resident_campaigns)
+        if store is not None:
+            for row in store.load_table(_STORE_NAMESPACE, "campaign"):
+                stored = decode_record(CampaignRecord, row.payload)
+                self._campaign_name_index[stored.name] = stored.campaign_id
 
     def create_campaign(
         self,
@@ -293,9 +432,16 @@ class CampaignEngine:
             status=CampaignStatus.DRAFT,
         )
         with self._lock:
-            if any(existing.name == campaign.name for existing in self._campaign_table.values()):
+            if campaign.name in self._campaign_name_index:
                 raise CampaignEngineError("campaign name already exists")
+            self._campaign_name_index[campaign.name] = campaign.campaign_id
             self._campaign_table[campaign.campaign_id] = campaign
+            partition = self._partitions[campaign.campaign_id] = _CampaignPartition(
+                changes=deque(maxlen=self._change_log_limit)
+            )
+            self._persist(partition, campaign.campaign_id, ("campaign", campaign))
+            if self._bounded:
+                self._evict_cold(self._resident.touch(campaign.campaign_id))
         return campaign
 
     def update_campaign_configuration(
@@ -305,12 +451,11 @@ class CampaignEngine:
         configuration: CampaignConfiguration,
     ) -> CampaignRecord:
         """Update campaign configuration model."""
-        with self._lock:
-            campaign = self._campaign_table.get(campaign_id)
-            if campaign is None:
-                raise CampaignEngineError("campaign not found")
+        with self._locked_partition(campaign_id) as partition:
+            campaign = self._campaign_table[campaign_id]
             updated = replace(campaign, configuration=configuration)
             self._campaign_table[campaign_id] = updated
+            self._persist(partition, campaign_id, ("campaign", updated))
             return updated
 
     def schedule_campaign(self, *, campaign_id: str, scheduled_for: datetime) -> CampaignRecord:
@@ -318,16 +463,14 @@ class CampaignEngine:
         now = datetime.now(UTC)
         if scheduled_for < now:
             raise CampaignEngineError("scheduled_for cannot be in the past")
-        with self._lock:
-            campaign = self._campaign_table.get(campaign_id)
-            if campaign is None:
-                raise CampaignEngineError("campaign not found")
+        with self._locked_partition(campaign_id) as partition:
             updated = self._transition_campaign_status(
-                campaign,
+                self._campaign_table[campaign_id],
                 CampaignStatus.SCHEDULED,
                 scheduled_for=scheduled_for,
             )
             self._campaign_table[campaign_id] = updated
+            self._persist(partition, campaign_id, ("campaign", updated))
             return updated
 
     def set_campaign_status(
@@ -338,16 +481,14 @@ class CampaignEngine:
         failure_reason: str | None = None,
     ) -> CampaignRecord:
         """Track campaign status changes with lifecycle constraints."""
-        with self._lock:
-            campaign = self._campaign_table.get(campaign_id)
-            if campaign is None:
-                raise CampaignEngineError("campaign not found")
+        with self._locked_partition(campaign_id) as partition:
             updated = self._transition_campaign_status(
-                campaign,
+                self._campaign_table[campaign_id],
                 status,
                 failure_reason=failure_reason,
             )
             self._campaign_table[campaign_id] = updated
+            self._persist(partition, campaign_id, ("campaign", updated))
             return updated
 
     def add_campaign_step(
@@ -367,12 +508,9 @@ class CampaignEngine:
             raise CampaignEngineError("step name and technique_id are required")
         if not asset_selector:
             raise CampaignEngineError("asset_selector requires at least one asset")
-        with self._lock:
-            if campaign_id not in self._campaign_table:
-                raise CampaignEngineError("campaign not found")
-            for step in self._campaign_steps_table.values():
-                if step.campaign_id == campaign_id and step.step_order == step_order:
-                    raise CampaignEngineError("campaign step_order must be unique per campaign")
+        with self._locked_partition(campaign_id) as partition:
+            if step_order in partition.step_orders:
+                raise CampaignEngineError("campaign step_order must be unique per campaign")
             step = CampaignStepRecord(
                 step_id=f"stp-{uuid4()}",
                 campaign_id=campaign_id,
@@ -383,6 +521,9 @@ class CampaignEngine:
                 correlation_key=correlation_key.strip(),
             )
             self._campaign_steps_table[step.step_id] = step
+            partition.step_orders.add(step_order)
+            partition.steps.insert(step_order, step.step_id)
+            self._persist(partition, campaign_id, ("step", step))
             return step
 
     def start_technique_execution(
@@ -400,11 +541,9 @@ class CampaignEngine:
         if not correlation_value:
             raise CampaignEngineError("correlation_group_id is required")
         now = datetime.now(UTC)
-        with self._lock:
-            campaign = self._campaign_table.get(campaign_id)
+        with self._locked_partition(campaign_id) as partition:
+            campaign = self._campaign_table[campaign_id]
             step = self._campaign_steps_table.get(step_id)
-            if campaign is None:
-                raise CampaignEngineError("campaign not found")
             if step is None or step.campaign_id != campaign_id:
                 raise CampaignEngineError("campaign step not found")
             if campaign.status not in {CampaignStatus.RUNNING, CampaignStatus.SCHEDULED}:
@@ -421,8 +560,14 @@ class CampaignEngine:
                 started_at=now,
             )
             self._technique_execution_table[execution.execution_id] = execution
-            self._correlation_index.setdefault(correlation_value, set()).add(execution.execution_id)
-            self._campaign_steps_table[step_id] = replace(step, status=StepStatus.RUNNING)
+            partition.executions.insert(now, execution.execution_id)
+            with self._correlation_lock:
+                self._correlation_index.setdefault(correlation_value, set()).add(
+                    execution.execution_id
+                )
+            running_step = replace(step, status=StepStatus.RUNNING)
+            self._campaign_steps_table[step_id] = running_step
+            self._persist(partition, campaign_id, ("execution", execution), ("step", running_step))
             return execution
 
     def stop_technique_execution(
@@ -435,7 +580,15 @@ class CampaignEngine:
         """Stop technique execution with completion timestamps and failure reason."""
         if status not in {ExecutionStatus.SUCCEEDED, ExecutionStatus.FAILED, ExecutionStatus.CANCELED}:
             raise CampaignEngineError("final execution status must be succeeded|failed|canceled")
-        with self._lock:
+        execution = self._technique_execution_table.get(execution_id)
+        campaign_id = (
+            execution.campaign_id
+            if execution is not None
+            else self._stored_partition_id("execution", execution_id)
+        )
+        if campaign_id is None:
+            raise CampaignEngineError("execution not found")
+        with self._locked_partition(campaign_id, missing_error="execution not found") as partition:
             execution = self._technique_execution_table.get(execution_id)
             if execution is None:
                 raise CampaignEngineError("execution not found")
@@ -453,26 +606,33 @@ class CampaignEngine:
             self._technique_execution_table[execution_id] = updated
             step = self._campaign_steps_table[execution.step_id]
             step_status = StepStatus.SUCCEEDED if status == ExecutionStatus.SUCCEEDED else StepStatus.FAILED
-            self._campaign_steps_table[step.step_id] = replace(step, status=step_status)
+            stopped_step = replace(step, status=step_status)
+            self._campaign_steps_table[step.step_id] = stopped_step
+            self._persist(partition, campaign_id, ("execution", updated), ("step", stopped_step))
             return updated
 
     def correlate_executions(self, *, correlation_group_id: str) -> CrossAssetCorrelation:
         """Return cross-asset execution correlation group."""
-        with self._lock:
+        if self._store is not None:
+            for campaign_id in self._store.find_partitions_by_lookup(
+                _STORE_NAMESPACE, "execution", correlation_group_id
+            ):
+                self._find_partition(campaign_id)
+        with self._correlation_lock:
             execution_ids = sorted(self._correlation_index.get(correlation_group_id, set()))
-            if not execution_ids:
-                raise CampaignEngineError("correlation group not found")
-            executions = [self._technique_execution_table[eid] for eid in execution_ids]
-            campaign_id = executions[0].campaign_id
-            step_id = executions[0].step_id
-            asset_ids = tuple(sorted({execution.asset_id for execution in executions}))
-            return CrossAssetCorrelation(
-                correlation_group_id=correlation_group_id,
-                campaign_id=campaign_id,
-                step_id=step_id,
-                asset_ids=asset_ids,
-                execution_ids=tuple(execution_ids),
-            )
+        if not execution_ids:
+            raise CampaignEngineError("correlation group not found")
+        executions = [self._execution_row(eid) for eid in execution_ids]
+        campaign_id = executions[0].campaign_id
+        step_id = executions[0].step_id
+        asset_ids = tuple(sorted({execution.asset_id for execution in executions}))
+        return CrossAssetCorrelation(
+            correlation_group_id=correlation_group_id,
+            campaign_id=campaign_id,
+            step_id=step_id,
+            asset_ids=asset_ids,
+            execution_ids=tuple(execution_ids),
+        )
 
     def add_identity(
         self,
@@ -485,13 +645,10 @@ class CampaignEngine:
         """Create identity entity model record."""
         if not principal.strip() or not source_asset_id.strip():
             raise CampaignEngineError("principal and source_asset_id are required")
-        with self._lock:
-            if campaign_id not in self._campaign_table:
-                raise CampaignEngineError("campaign not found")
+        with self._locked_partition(campaign_id) as partition:
             normalized = principal.strip().lower()
-            for identity in self._identity_table.values():
-                if identity.campaign_id == campaign_id and identity.principal.lower() == normalized:
-                    raise CampaignEngineError("identity principal already exists in campaign")
+            if normalized in partition.principals:
+                raise CampaignEngineError("identity principal already exists in campaign")
             record = IdentityRecord(
                 identity_id=f"idn-{uuid4()}",
                 campaign_id=campaign_id,
@@ -500,6 +657,9 @@ class CampaignEngine:
                 privilege_level=privilege_level,
             )
             self._identity_table[record.identity_id] = record
+            partition.principals.add(normalized)
+            partition.identities.insert(record.principal, record.identity_id)
+            self._persist(partition, campaign_id, ("identity", record))
             return record
 
     def record_credential_material(
@@ -514,10 +674,7 @@ class CampaignEngine:
         """Track credential material associated with identity."""
         if not material_ref.strip():
             raise CampaignEngineError("material_ref is required")
-        with self._lock:
-            identity = self._identity_table.get(identity_id)
-            if identity is None or identity.campaign_id != campaign_id:
-                raise CampaignEngineError("identity not found")
+        with self._locked_identity_partition(campaign_id, identity_id) as partition:
             record = CredentialMaterialRecord(
                 credential_id=f"cred-{uuid4()}",
                 campaign_id=campaign_id,
@@ -528,6 +685,10 @@ class CampaignEngine:
                 source_execution_id=source_execution_id,
             )
             self._credential_material_table[record.credential_id] = record
+            partition.identity_credentials.setdefault(identity_id, _OrderedIndex()).insert(
+                record.captured_at, record.credential_id
+            )
+            self._persist(partition, campaign_id, ("credential", record))
             return record
 
     def record_privilege_escalation(
@@ -540,11 +701,9 @@ class CampaignEngine:
         asset_id: str,
     ) -> PrivilegeEscalationRecord:
         """Record privilege escalation event and update identity privilege state."""
-        with self._lock:
-            identity = self._identity_table.get(identity_id)
-            if identity is None or identity.campaign_id != campaign_id:
-                raise CampaignEngineError("identity not found")
-            if execution_id not in self._technique_execution_table:
+        with self._locked_identity_partition(campaign_id, identity_id) as partition:
+            identity = self._identity_table[identity_id]
+            if not self._execution_exists(execution_id):
                 raise CampaignEngineError("execution not found")
             record = PrivilegeEscalationRecord(
                 escalation_id=f"esc-{uuid4()}",
@@ -557,13 +716,19 @@ class CampaignEngine:
                 occurred_at=datetime.now(UTC),
             )
             self._escalation_table[record.escalation_id] = record
-            self._identity_table[identity_id] = replace(
+            partition.escalations.insert(record.occurred_at, record.escalation_id)
+            partition.identity_escalations.setdefault(identity_id, _OrderedIndex()).insert(
+                record.occurred_at, record.escalation_id
+            )
+            escalated = replace(
                 identity,
                 privilege_level=to_level,
                 compromised=True,
                 compromised_at=record.occurred_at,
                 compromised_by_execution_id=execution_id,
             )
+            self._identity_table[identity_id] = escalated
+            self._persist(partition, campaign_id, ("escalation", record), ("identity", escalated))
             return record
 
     def add_lateral_movement_edge(
@@ -578,11 +743,8 @@ class CampaignEngine:
         """Create lateral movement graph edge."""
         if not source_asset_id.strip() or not target_asset_id.strip():
             raise CampaignEngineError("source_asset_id and target_asset_id are required")
-        with self._lock:
-            identity = self._identity_table.get(identity_id)
-            if identity is None or identity.campaign_id != campaign_id:
-                raise CampaignEngineError("identity not found")
-            if execution_id not in self._technique_execution_table:
+        with self._locked_identity_partition(campaign_id, identity_id) as partition:
+            if not self._execution_exists(execution_id):
                 raise CampaignEngineError("execution not found")
             edge = LateralMovementEdge(
                 edge_id=f"lme-{uuid4()}",
@@ -594,6 +756,11 @@ class CampaignEngine:
                 occurred_at=datetime.now(UTC),
             )
             self._lateral_edges_table[edge.edge_id] = edge
+            partition.lateral_edges.insert(edge.occurred_at, edge.edge_id)
+            partition.identity_edges.setdefault(identity_id, _OrderedIndex()).insert(
+                edge.occurred_at, edge.edge_id
+            )
+            self._persist(partition, campaign_id, ("lateral_edge", edge))
             return edge
 
     def reconstruct_pivot_chain(
@@ -603,69 +770,55 @@ class CampaignEngine:
         identity_id: str,
     ) -> PivotChain:
         """Rebuild ordered pivot chain for an identity."""
-        with self._lock:
-            identity = self._identity_table.get(identity_id)
-            if identity is None or identity.campaign_id != campaign_id:
-                raise CampaignEngineError("identity not found")
-            edges = [
-                edge
-                for edge in self._lateral_edges_table.values()
-                if edge.campaign_id == campaign_id and edge.identity_id == identity_id
-            ]
-            if not edges:
-                return PivotChain(
-                    campaign_id=campaign_id,
-                    identity_id=identity_id,
-                    asset_path=(identity.source_asset_id,),
-                    edge_ids=tuple(),
-                )
-            edges_sorted = sorted(edges, key=lambda row: row.occurred_at)
-            asset_path: list[str] = [identity.source_asset_id]
-            for edge in edges_sorted:
-                if asset_path[-1] != edge.source_asset_id and edge.source_asset_id not in asset_path:
-                    asset_path.append(edge.source_asset_id)
-                if edge.target_asset_id not in asset_path:
-                    asset_path.append(edge.target_asset_id)
+        with self._locked_identity_partition(campaign_id, identity_id) as partition:
+            identity = self._identity_table[identity_id]
+            edges_sorted = self._rows(
+                self._lateral_edges_table, partition.identity_edges.get(identity_id)
+            )
+        if not edges_sorted:
             return PivotChain(
                 campaign_id=campaign_id,
                 identity_id=identity_id,
-                asset_path=tuple(asset_path),
-                edge_ids=tuple(edge.edge_id for edge in edges_sorted),
+                asset_path=(identity.source_asset_id,),
+                edge_ids=tuple(),
             )
+        asset_path: list[str] = [identity.source_asset_id]
+        for edge in edges_sorted:
+            if asset_path[-1] != edge.source_asset_id and edge.source_asset_id not in asset_path:
+                asset_path.append(edge.source_asset_id)
+            if edge.target_asset_id not in asset_path:
+                asset_path.append(edge.target_asset_id)
+        return PivotChain(
+            campaign_id=campaign_id,
+            identity_id=identity_id,
+            asset_path=tuple(asset_path),
+            edge_ids=tuple(edge.edge_id for edge in edges_sorted),
+        )
 
     def list_identity_credentials(self, *, campaign_id: str, identity_id: str) -> list[CredentialMaterialRecord]:
         """List credential material for one identity."""
-        with self._lock:
-            return sorted(
-                [
-                    item
-                    for item in self._credential_material_table.values()
-                    if item.campaign_id == campaign_id and item.identity_id == identity_id
-                ],
-                key=lambda row: row.captured_at,
+        with self._locked_partition(campaign_id, required=False) as partition:
+            if partition is None:
+                return []
+            return self._rows(
+                self._credential_material_table, partition.identity_credentials.get(identity_id)
             )
 
     def list_identity_escalations(self, *, campaign_id: str, identity_id: str) -> list[PrivilegeEscalationRecord]:
         """List privilege escalation events for one identity."""
-        with self._lock:
-            return sorted(
-                [
-                    item
-                    for item in self._escalation_table.values()
-                    if item.campaign_id == campaign_id and item.identity_id == identity_id
-                ],
-                key=lambda row: row.occurred_at,
+        with self._locked_partition(campaign_id, required=False) as partition:
+            if partition is None:
+                return []
+            return self._rows(
+                self._escalation_table, partition.identity_escalations.get(identity_id)
             )
 
     def list_campaign_identities(self, *, campaign_id: str) -> list[IdentityRecord]:
         """List identities tracked for one campaign."""
-        with self._lock:
-            rows = [
-                item
-                for item in self._identity_table.values()
-                if item.campaign_id == campaign_id
-            ]
-        return sorted(rows, key=lambda row: row.principal)
+        with self._locked_partition(campaign_id, required=False) as partition:
+            if partition is None:
+                return []
+            return self._rows(self._identity_table, partition.identities)
 
     def list_lateral_movement_edges(
         self,
@@ -674,52 +827,261 @@ class CampaignEngine:
         identity_id: str | None = None,
     ) -> list[LateralMovementEdge]:
         """List lateral movement edges for a campaign, optionally filtered by identity."""
-        with self._lock:
-            rows = [
-                item
-                for item in self._lateral_edges_table.values()
-                if item.campaign_id == campaign_id
-                and (identity_id is None or item.identity_id == identity_id)
-            ]
-        return sorted(rows, key=lambda row: row.occurred_at)
+        with self._locked_partition(campaign_id, required=False) as partition:
+            if partition is None:
+                return []
+            index = (
+                partition.lateral_edges
+                if identity_id is None
+                else partition.identity_edges.get(identity_id)
+            )
+            return self._rows(self._lateral_edges_table, index)
 
     def list_campaign_escalations(self, *, campaign_id: str) -> list[PrivilegeEscalationRecord]:
         """List all privilege escalation records for a campaign."""
-        with self._lock:
-            rows = [
-                item
-                for item in self._escalation_table.values()
-                if item.campaign_id == campaign_id
-            ]
-        return sorted(rows, key=lambda row: row.occurred_at)
+        with self._locked_partition(campaign_id, required=False) as partition:
+            if partition is None:
+                return []
+            return self._rows(self._escalation_table, partition.escalations)
 
     def list_campaign_steps(self, *, campaign_id: str) -> list[CampaignStepRecord]:
         """List campaign steps in execution order."""
-        with self._lock:
-            steps = [
-                step
-                for step in self._campaign_steps_table.values()
-                if step.campaign_id == campaign_id
-            ]
-        return sorted(steps, key=lambda item: item.step_order)
+        with self._locked_partition(campaign_id, required=False) as partition:
+            if partition is None:
+                return []
+            return self._rows(self._campaign_steps_table, partition.steps)
 
     def list_campaign_executions(self, *, campaign_id: str) -> list[TechniqueExecutionRecord]:
         """List technique execution records for a campaign."""
-        with self._lock:
-            rows = [
-                execution
-                for execution in self._technique_execution_table.values()
-                if execution.campaign_id == campaign_id
-            ]
-        return sorted(rows, key=lambda item: item.started_at)
+        with self._locked_partition(campaign_id, required=False) as partition:
+            if partition is None:
+                return []
+            return self._rows(self._technique_execution_table, partition.executions)
+
+    def campaign_change_sequence(self, *, campaign_id: str) -> int:
+        """Return the campaign's latest change sequence."""
+        with self._locked_partition(campaign_id) as partition:
+            return partition.sequence
+
+    def list_campaign_changes(self, *, campaign_id: str, since: int = 0) -> CampaignChangeSet:
+        """Return changes with a sequence greater than ``since``, oldest first."""
+        with self._locked_partition(campaign_id) as partition:
+            if since < partition.change_base or since > partition.sequence:
+                return CampaignChangeSet(
+                    campaign_id=campaign_id,
+                    since=since,
+                    sequence=partition.sequence,
+                    changes=tuple(),
+                    truncated=True,
+                )
+            return CampaignChangeSet(
+                campaign_id=campaign_id,
+                since=since,
+                sequence=partition.sequence,
+                changes=tuple(islice(partition.changes, since - partition.change_base, None)),
+            )
 
     def get_campaign(self, *, campaign_id: str) -> CampaignRecord:
         """Return campaign record by id."""
+        with self._locked_partition(campaign_id):
+            return self._campaign_table[campaign_id]
+
+    def flush(self) -> None:
+        """Persist buffered writes to the configured store."""
+        if self._store is not None:
+            self._store.flush()
+
+    def _find_partition(self, campaign_id: str) -> _CampaignPartition | None:
+        partition = self._partitions.get(campaign_id)
+        if self._store is None or (partition is not None and not self._bounded):
+            return partition
         with self._lock:
-            campaign = self._campaign_table.get(campaign_id)
-            if campaign is None:
-                raise CampaignEngineError("campaign not found")
-            return campaign
+            partition = self._partitions.get(campaign_id)
+            if partition is None:
+                partition = self._load_partition(campaign_id)
+                if partition is None:
+                    return None
+            if self._bounded:
+                self._evict_cold(self._resident.touch(campaign_id))
+            return partition
+
+    @contextmanager
+    def _locked_partition(
+        self,
+        campaign_id: str,
+        *,
+        required: bool = True,
+        missing_error: str = "campaign not found",
+    ) -> Iterator[_CampaignPartition | None]:
+        while True:
+            partition = self._find_partition(campaign_id)
+            if partition is None:
+                if required:
+                    raise CampaignEngineError(missing_error)
+                yield None
+                return
+            with partition.lock:
+                # Evicted between lookup and lock: load it again.
+                if partition.evicted:
+                    continue
+                yield partition
+                return
+
+    @contextmanager
+    def _locked_identity_partition(
+        self, campaign_id: str, identity_id: str
+    ) -> Iterator[_CampaignPartition]:
+        with self._locked_partition(campaign_id, missing_error="identity not found") as partition:
+            identity = self._identity_table.get(identity_id)
+            if identity is None or identity.campaign_id != campaign_id:
+                raise CampaignEngineError("identity not found")
+            yield partition
+
+    def _stored_partition_id(self, table: str, row_id: str) -> str | None:
+        if self._store is None:
+            return None
+        return self._store.find_partition(_STORE_NAMESPACE, table, row_id)
+
+    def _execution_exists(self, execution_id: str) -> bool:
+        return (
+            execution_id in self._technique_execution_table
+            or self._stored_partition_id("execution", execution_id) is not None
+        )
+
+    def _execution_row(self, execution_id: str) -> TechniqueExecutionRecord:
+        execution = self._technique_execution_table.get(execution_id)
+        if execution is not None:
+            return execution
+        campaign_id = self._stored_partition_id("execution", execution_id)
+        if campaign_id is None:
+            raise CampaignEngineError("execution not found")
+        with self._locked_partition(campaign_id, missing_error="execution not found"):
+            return self._technique_execution_table[execution_id]
+
+    def _persist(
+        self, partition: _CampaignPartition, campaign_id: str, *records: tuple[str, Any]
+    ) -> None:
+        """Log ``records`` as changes and write them through (partition lock held)."""
+        for table, record in records:
+            partition.sequence += 1
+            if len(partition.changes) == partition.changes.maxlen:
+                partition.change_base = partition.changes[0].sequence
+            partition.changes.append(CampaignChange(partition.sequence, table, record))
+        if self._store is None:
+            return
+        records += (("change_sequence", _ChangeSequenceRecord(campaign_id, partition.sequence)),)
+        self._store.write(
+            _STORE_NAMESPACE,
+            [
+                StoredRow(
+                    table=table,
+                    row_id=getattr(record, _STORED_TABLES[table][1]),
+                    partition_id=campaign_id,
+                    payload=encode_record(record),
+                    lookup_key=record.correlation_group_id if table == "execution" else "",
+                )
+                for table, record in records
+            ],
+        )
+
+    def _load_partition(self, campaign_id: str) -> _CampaignPartition | None:
+        """Rebuild one campaign's rows and indexes from the store (registry lock held)."""
+        assert self._store is not None
+        rows: dict[str, list[Any]] = {table: [] for table in _STORED_TABLES}
+        for row in self._store.load_partition(_STORE_NAMESPACE, campaign_id):
+            if row.table in _STORED_TABLES:
+                rows[row.table].append(decode_record(_STORED_TABLES[row.table][0], row.payload))
+        if not rows["campaign"]:
+            return None
+        # Changes made before the reload are gone; start the log at the
+        # persisted sequence so older cursors are reported as truncated.
+        sequence = max((item.sequence for item in rows["change_sequence"]), default=0)
+        partition = _CampaignPartition(
+            sequence=sequence,
+            change_base=sequence,
+            changes=deque(maxlen=self._change_log_limit),
+        )
+        self._campaign_table[campaign_id] = rows["campaign"][0]
+        for step in sorted(rows["step"], key=lambda item: item.step_order):
+            self._campaign_steps_table[step.step_id] = step
+            partition.step_orders.add(step.step_order)
+            partition.steps.insert(step.step_order, step.step_id)
+        for execution in sorted(rows["execution"], key=lambda item: item.started_at):
+            self._technique_execution_table[execution.execution_id] = execution
+            partition.executions.insert(execution.started_at, execution.execution_id)
+            with self._correlation_lock:
+                self._correlation_index.setdefault(execution.correlation_group_id, set()).add(
+                    execution.execution_id
+                )
+        for identity in sorted(rows["identity"], key=lambda item: item.principal):
+            self._identity_table[identity.identity_id] = identity
+            partition.principals.add(identity.principal.lower())
+            partition.identities.insert(identity.principal, identity.identity_id)
+        for credential in sorted(rows["credential"], key=lambda item: item.captured_at):
+            self._credential_material_table[credential.credential_id] = credential
+            partition.identity_credentials.setdefault(credential.identity_id, _OrderedIndex()).insert(
+                credential.captured_at, credential.credential_id
+            )
+        for escalation in sorted(rows["escalation"], key=lambda item: item.occurred_at):
+            self._escalation_table[escalation.escalation_id] = escalation
+            partition.escalations.insert(escalation.occurred_at, escalation.escalation_id)
+            partition.identity_escalations.setdefault(escalation.identity_id, _OrderedIndex()).insert(
+                escalation.occurred_at, escalation.escalation_id
+            )
+        for edge in sorted(rows["lateral_edge"], key=lambda item: item.occurred_at):
+            self._lateral_edges_table[edge.edge_id] = edge
+            partition.lateral_edges.insert(edge.occurred_at, edge.edge_id)
+            partition.identity_edges.setdefault(edge.identity_id, _OrderedIndex()).insert(
+                edge.occurred_at, edge.edge_id
+            )
+        self._partitions[campaign_id] = partition
+        return partition
+
+    def _evict_cold(self, campaign_ids: list[str]) -> None:
+        """Drop cold campaigns from memory (registry lock held); busy ones stay."""
+        assert self._store is not None
+        for campaign_id in campaign_ids:
+            partition = self._partitions.get(campaign_id)
+            if partition is None:
+                self._resident.discard(campaign_id)
+                continue
+            if not partition.lock.acquire(blocking=False):
+                continue
+            try:
+                self._store.flush()
+                partition.evicted = True
+                del self._partitions[campaign_id]
+                self._resident.discard(campaign_id)
+                self._campaign_table.pop(campaign_id, None)
+                for step_id in partition.steps:
+                    self._campaign_steps_table.pop(step_id, None)
+                for execution_id in partition.executions:
+                    execution = self._technique_execution_table.pop(execution_id, None)
+                    if execution is None:
+                        continue
+                    with self._correlation_lock:
+                        group = self._correlation_index.get(execution.correlation_group_id)
+                        if group is not None:
+                            group.discard(execution_id)
+                            if not group:
+                                del self._correlation_index[execution.correlation_group_id]
+                for identity_id in partition.identities:
+                    self._identity_table.pop(identity_id, None)
+                for index in partition.identity_credentials.values():
+                    for credential_id in index:
+                        self._credential_material_table.pop(credential_id, None)
+                for escalation_id in partition.escalations:
+                    self._escalation_table.pop(escalation_id, None)
+                for edge_id in partition.lateral_edges:
+                    self._lateral_edges_table.pop(edge_id, None)
+            finally:
+                partition.lock.release()
+
+    @staticmethod
+    def _rows(table: dict[str, Any], index: _OrderedIndex | None) -> list[Any]:
+        if index is None:
+            return []
+        return [table[row_id] for row_id in index]
 
     @staticmethod
     def _transition_campaign_status(
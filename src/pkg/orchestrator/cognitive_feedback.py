@@ -16,12 +16,22 @@
 
 from __future__ import annotations
 
+import heapq
 import re
-from dataclasses import dataclass, field
+import time
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from threading import Lock
 from typing import Any, Protocol
 
 from pkg.integration.vectorvue.models import ResponseEnvelope
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency for columnar metrics
+    np = None
+
 
 @dataclass(slots=True, frozen=True)
 class FeedbackAdjustment:
@@ -60,6 +70,61 @@ class DefensiveEffectivenessMetrics:
     applied_adjustments: int
 
 
+@dataclass(slots=True, frozen=True)
+class DefensiveEventColumns:
+    """Column-oriented event batch for effectiveness metrics.
+
+    Columns may be plain sequences or, when numpy is installed, numpy
+    arrays; arrays are counted without a Python-level pass.
+    """
+
+    statuses: Any
+    threat_detected: Any
+
+    def __post_init__(self) -> None:
+        if len(self.statuses) != len(self.threat_detected):
+            raise ValueError("event columns must have the same length")
+
+    @classmethod
+    def from_events(cls, events: Sequence[dict[str, Any]]) -> DefensiveEventColumns:
+        return cls(
+            statuses=[str(event.get("status")) for event in events],
+            threat_detected=[bool(event.get("threat_detected", False)) for event in events],
+        )
+
+    def __len__(self) -> int:
+        return len(self.statuses)
+
+    def counts(self) -> tuple[int, int, int]:
+        """Return (blocked, success, threat_detected) counts for the batch."""
+        if np is not None and isinstance(self.statuses, np.ndarray):
+            blocked = int(np.count_nonzero(self.statuses == "blocked"))
+            success = int(np.count_nonzero(self.statuses == "success"))
+        else:
+            counts = Counter(self.statuses)
+            blocked = counts["blocked"]
+            success = counts["success"]
+        if np is not None and isinstance(self.threat_detected, np.ndarray):
+            detected = int(np.count_nonzero(self.threat_detected))
+        else:
+            detected = sum(map(bool, self.threat_detected))
+        return blocked, success, detected
+
+
+def _count_events(events: Sequence[dict[str, Any]]) -> tuple[int, int, int]:
+    """Count (blocked, success, threat_detected) over event dicts in one pass."""
+    blocked = success = detected = 0
+    for event in events:
+        status = str(event.get("status"))
+        if status == "blocked":
+            blocked += 1
+        elif status == "success":
+            success += 1
+        if event.get("threat_detected", False):
+            detected += 1
+    return blocked, success, detected
+
+
 class VectorVueCognitiveClient(Protocol):
     """VectorVue client capability surface required by cognitive loop sync."""
 
@@ -74,45 +139,201 @@ class VectorVueCognitiveClient(Protocol):
         """Fetch cognitive feedback adjustments from VectorVue."""
 
 
-class FeedbackPolicyEngine:
-    """In-memory policy binding for cognitive feedback adjustments."""
+@dataclass(slots=True, frozen=True)
+class _BoundAdjustment:
+    adjustment: FeedbackAdjustment
+    expires_at: float
+    denies: bool
+
+
+class _TargetTrie:
+    """Character trie of target_urn prefixes for one tenant."""
+
+    __slots__ = ("children", "bound")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TargetTrie] = {}
+        self.bound: _BoundAdjustment | None = None
+
+    def insert(self, prefix: str, bound: _BoundAdjustment) -> None:
+        node = self
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                node.children[char] = child = _TargetTrie()
+            node = child
+        node.bound = bound
+
+    def get(self, prefix: str) -> _BoundAdjustment | None:
+        node: _TargetTrie | None = self
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node.bound
+
+    def remove(self, prefix: str) -> None:
+        path = [self]
+        for char in prefix:
+            child = path[-1].children.get(char)
+            if child is None:
+                return
+            path.append(child)
+        path[-1].bound = None
+        for depth in range(len(prefix), 0, -1):
+            node = path[depth]
+            if node.bound is not None or node.children:
+                break
+            del path[depth - 1].children[prefix[depth - 1]]
+
+    def longest_match(self, target_urn: str) -> _BoundAdjustment | None:
+        node = self
+        match = node.bound
+        for char in target_urn:
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+            if node.bound is not None:
+                match = node.bound
+        return match
+
+    def __bool__(self) -> bool:
+        return self.bound is not None or bool(self.children)
+
+
+class _TenantAdjustments:
+    __slots__ = ("exact", "prefixes")
 
     def __init__(self) -> None:
-        self._adjustments: dict[tuple[str, str], FeedbackAdjustment] = {}
+        self.exact: dict[str, _BoundAdjustment] = {}
+        self.prefixes = _TargetTrie()
 
-    def apply_adjustments(self, adjustments: list[FeedbackAdjustment]) -> int:
+
+class FeedbackPolicyEngine:
+    """In-memory policy binding for cognitive feedback adjustments.
+
+    Adjustments expire ``ttl_seconds`` after they are applied; expiry
+    deadlines sit in a heap that is drained lazily on each call, so lookups
+    never scan live entries. A ``target_urn`` ending in ``*`` binds every
+    target with that prefix (``*`` alone binds the whole tenant); exact
+    targets win over prefixes and longer prefixes over shorter ones.
+    ``now`` arguments are ``time.monotonic()`` seconds.
+    """
+
+    def __init__(self) -> None:
+        self._tenants: dict[str, _TenantAdjustments] = {}
+        self._expiries: list[tuple[float, str, str]] = []
+        self._lock = Lock()
+
+    def apply_adjustments(
+        self, adjustments: Iterable[FeedbackAdjustment], *, now: float | None = None
+    ) -> int:
+        current = time.monotonic() if now is None else now
         applied = 0
-        for adjustment in adjustments:
-            key = (adjustment.tenant_id, adjustment.target_urn)
-            self._adjustments[key] = adjustment
-            applied += 1
+        with self._lock:
+            self._expire(current)
+            for adjustment in adjustments:
+                if adjustment.ttl_seconds <= 0:
+                    continue
+                action = adjustment.action.strip().lower()
+                bound = _BoundAdjustment(
+                    adjustment=adjustment,
+                    expires_at=current + adjustment.ttl_seconds,
+                    denies=action == "deny"
+                    or (action == "tighten" and adjustment.confidence >= 0.8),
+                )
+                tenant = self._tenants.get(adjustment.tenant_id)
+                if tenant is None:
+                    self._tenants[adjustment.tenant_id] = tenant = _TenantAdjustments()
+                target_urn = adjustment.target_urn
+                if target_urn.endswith("*"):
+                    tenant.prefixes.insert(target_urn[:-1], bound)
+                else:
+                    tenant.exact[target_urn] = bound
+                heapq.heappush(self._expiries, (bound.expires_at, adjustment.tenant_id, target_urn))
+                applied += 1
         return applied
 
-    def policy_context(self, tenant_id: str, target_urn: str) -> dict[str, Any]:
-        adjustment = self._adjustments.get((tenant_id, target_urn))
-        if adjustment is None:
+    def policy_context(
+        self, tenant_id: str, target_urn: str, *, now: float | None = None
+    ) -> dict[str, Any]:
+        bound = self._lookup(tenant_id, target_urn, now)
+        if bound is None:
             return {"feedback_bound": False}
+        adjustment = bound.adjustment
         return {
             "feedback_bound": True,
             "feedback_action": adjustment.action,
             "feedback_confidence": adjustment.confidence,
             "feedback_control": adjustment.control,
             "feedback_rationale": adjustment.rationale,
+            "feedback_target_urn": adjustment.target_urn,
             "feedback_ttl_seconds": adjustment.ttl_seconds,
             "feedback_attestation_measurement_hash": adjustment.attestation_measurement_hash,
         }
 
-    def evaluate_allow(self, tenant_id: str, target_urn: str, base_allow: bool) -> bool:
+    def evaluate_allow(
+        self, tenant_id: str, target_urn: str, base_allow: bool, *, now: float | None = None
+    ) -> bool:
         """Evaluate allow decision with feedback-bound policy adjustments."""
-        adjustment = self._adjustments.get((tenant_id, target_urn))
-        if adjustment is None:
-            return base_allow
-        action = adjustment.action.strip().lower()
-        if action == "deny":
+        if not base_allow:
             return False
-        if action == "tighten" and adjustment.confidence >= 0.8:
-            return False
-        return base_allow
+        bound = self._lookup(tenant_id, target_urn, now)
+        return bound is None or not bound.denies
+
+    def active_adjustments(
+        self, tenant_id: str, *, now: float | None = None
+    ) -> list[FeedbackAdjustment]:
+        """Return the tenant's unexpired adjustments, exact targets first."""
+        with self._lock:
+            self._expire(time.monotonic() if now is None else now)
+            tenant = self._tenants.get(tenant_id)
+            if tenant is None:
+                return []
+            active = [bound.adjustment for bound in tenant.exact.values()]
+            stack = [tenant.prefixes]
+            while stack:
+                node = stack.pop()
+                if node.bound is not None:
+                    active.append(node.bound.adjustment)
+                stack.extend(node.children.values())
+            return active
+
+    def _lookup(
+        self, tenant_id: str, target_urn: str, now: float | None
+    ) -> _BoundAdjustment | None:
+        current = time.monotonic() if now is None else now
+        with self._lock:
+            if self._expiries and self._expiries[0][0] <= current:
+                self._expire(current)
+            tenant = self._tenants.get(tenant_id)
+            if tenant is None:
+                return None
+            bound = tenant.exact.get(target_urn)
+            if bound is None and tenant.prefixes:
+                bound = tenant.prefixes.longest_match(target_urn)
+            return bound
+
+    def _expire(self, now: float) -> None:
+        """Drop lapsed adjustments (lock held)."""
+        expiries = self._expiries
+        while expiries and expiries[0][0] <= now:
+            expires_at, tenant_id, target_urn = heapq.heappop(expiries)
+            tenant = self._tenants.get(tenant_id)
+            if tenant is None:
+                continue
+            # A re-applied target carries a later deadline; keep it.
+            if target_urn.endswith("*"):
+                bound = tenant.prefixes.get(target_urn[:-1])
+                if bound is not None and bound.expires_at == expires_at:
+                    tenant.prefixes.remove(target_urn[:-1])
+            else:
+                bound = tenant.exact.get(target_urn)
+                if bound is not None and bound.expires_at == expires_at:
+                    del tenant.exact[target_urn]
+            if not tenant.exact and not tenant.prefixes:
+                del self._tenants[tenant_id]
 
 
 @dataclass(slots=True)
@@ -217,17 +438,15 @@ class CognitiveFeedbackLoopService:
         adjustments = self.sync_feedback_adjustments(tenant_id, limit=feedback_limit)
         anchors = self._extract_execution_fingerprints(execution_graph)
         attestation_anchors = self._extract_attestation_hashes(execution_graph)
-        if anchors:
-            adjustments = [
-                item
-                for item in adjustments
-                if item.execution_fingerprint in anchors
-            ]
-        if attestation_anchors:
+        if anchors or attestation_anchors:
             adjustments = [
                 item
                 for item in adjustments
-                if item.attestation_measurement_hash in attestation_anchors
+                if (not anchors or item.execution_fingerprint in anchors)
+                and (
+                    not attestation_anchors
+                    or item.attestation_measurement_hash in attestation_anchors
+                )
             ]
         applied = self.policy_engine.apply_adjustments(adjustments)
         return CognitiveLoopRunResult(
@@ -238,15 +457,15 @@ class CognitiveFeedbackLoopService:
 
     @staticmethod
     def compute_defensive_effectiveness_metrics(
-        events: list[dict[str, Any]],
-        adjustments: list[FeedbackAdjustment],
+        events: Sequence[dict[str, Any]] | DefensiveEventColumns,
+        adjustments: Sequence[FeedbackAdjustment],
     ) -> DefensiveEffectivenessMetrics:
+        """Aggregate KPIs from event dicts or, for large reports, event columns."""
+        if isinstance(events, DefensiveEventColumns):
+            blocked, success, detected = events.counts()
+        else:
+            blocked, success, detected = _count_events(events)
         total = len(events)
-        blocked = sum(1 for event in events if str(event.get("status")) == "blocked")
-        success = sum(1 for event in events if str(event.get("status")) == "success")
-        detected = sum(
-            1 for event in events if bool(event.get("threat_detected", False))
-        )
         detection_rate = detected / total if total else 0.0
         prevention_rate = blocked / total if total else 0.0
         feedback_coverage = (
@@ -19,6 +19,7 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -59,6 +60,10 @@ class ImmutableConfigurationHistoryError(ControlPlaneIntegrityError):
     """Raised when immutable config history constraints are violated."""
 
 
+class PolicyChangeListenerError(ControlPlaneIntegrityError):
+    """Raised when a policy change listener fails to bind a new policy hash."""
+
+
 @dataclass(slots=True, frozen=True)
 class SignedConfigurationEnvelope:
     """Signed startup configuration container."""
@@ -177,10 +182,26 @@ class ControlPlaneIntegrityEnforcer:
         *,
         verifier: RunnerJWSVerifier | None = None,
         history: ImmutableConfigurationHistory | None = None,
+        policy_change_listeners: Sequence[Callable[[str], None]] | None = None,
     ) -> None:
         self._integrity_config = integrity_config
         self._verifier = verifier or RunnerJWSVerifier()
         self._history = history or ImmutableConfigurationHistory()
+        self._policy_change_listeners = list(policy_change_listeners or [])
+        self._active_policy_sha256: str | None = None
+
+    @property
+    def active_policy_sha256(self) -> str | None:
+        """Return the policy hash of the last configuration that passed startup."""
+        return self._active_policy_sha256
+
+    def add_policy_change_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener`` with the new policy hash whenever it changes.
+
+        ``OPAExecutionAuthorizer.on_policy_change`` is the intended listener,
+        so cached OPA decisions never outlive the policy that produced them.
+        """
+        self._policy_change_listeners.append(listener)
 
     def enforce_startup(
         self,
@@ -246,6 +267,9 @@ class ControlPlaneIntegrityEnforcer:
                     "runtime binary hash does not match signed baseline"
                 )
 
+        if envelope.policy_sha256 != self._active_policy_sha256:
+            self._notify_policy_change(envelope.policy_sha256)
+            self._active_policy_sha256 = envelope.policy_sha256
         history_record = self._history.append(envelope)
         emit_integrity_audit_event(
             action="startup_integrity",
@@ -266,6 +290,33 @@ class ControlPlaneIntegrityEnforcer:
             history_record_hash=history_record["record_hash"],
         )
 
+    def _notify_policy_change(self, policy_sha256: str) -> None:
+        """Call every listener, failing startup if any of them raised.
+
+        Listeners are isolated so one failure cannot skip the rest; the active
+        hash and history are left untouched so a retry notifies them again.
+        """
+        failures: list[str] = []
+        for listener in self._policy_change_listeners:
+            try:
+                listener(policy_sha256)
+            except Exception as exc:
+                name = getattr(listener, "__qualname__", type(listener).__qualname__)
+                failures.append(name)
+                emit_integrity_audit_event(
+                    action="policy_change_listener",
+                    actor="orchestrator",
+                    target="control-plane",
+                    status="failed",
+                    reason=str(exc),
+                    listener=name,
+                    policy_sha256=policy_sha256,
+                )
+        if failures:
+            raise PolicyChangeListenerError(
+                f"policy change listeners failed: {', '.join(failures)}"
+            )
+
     def _verify_signed_claims(
         self,
         *,
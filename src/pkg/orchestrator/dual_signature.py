@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -81,3 +82,39 @@ class HighRiskManifestDualSigner:
             secondary_jws=secondary_jws,
             dual_signature_required=True,
         )
+
+    def sign_many(
+        self, manifests: Sequence[tuple[dict[str, Any], str]]
+    ) -> list[ManifestSignatureBundle]:
+        """Sign ``(payload, risk_level)`` pairs with one batch per signer."""
+        required = [
+            risk_level.strip().lower() in self._high_risk_levels
+            for _, risk_level in manifests
+        ]
+        if any(required):
+            self._require_secondary()
+
+        primary_jws = self._primary.generate_many([payload for payload, _ in manifests])
+        high_risk = [payload for (payload, _), flag in zip(manifests, required) if flag]
+        secondary_jws = iter(
+            self._secondary.generate_many(high_risk)
+            if high_risk and self._secondary is not None
+            else []
+        )
+        return [
+            ManifestSignatureBundle(
+                risk_level=risk_level,
+                primary_jws=primary,
+                secondary_jws=next(secondary_jws) if flag else None,
+                dual_signature_required=flag,
+            )
+            for (_, risk_level), primary, flag in zip(manifests, primary_jws, required)
+        ]
+
+    def _require_secondary(self) -> None:
+        if self._secondary is None:
+            raise DualSignatureError("secondary signer is required for high-risk manifest")
+        if not self._secondary_signer_id:
+            raise DualSignatureError("secondary_signer_id is required for high-risk")
+        if self._primary_signer_id == self._secondary_signer_id:
+            raise DualSignatureError("primary and secondary signer identities must differ")
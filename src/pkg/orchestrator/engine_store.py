@@ -0,0 +1,492 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: Jose Maria Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Durable row storage for the campaign, playbook and adversary-graph engines.
+
+Engines keep their hot state in memory and write every changed row through an
+``EngineStore``. Rows are grouped into partitions (one campaign or playbook) so
+cold partitions can be dropped from memory and loaded again on access.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+import types
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock, Timer
+from typing import Any, Protocol, Union, get_args, get_origin, get_type_hints
+
+from pkg.logging.framework import get_logger
+
+try:
+    import psycopg
+except ImportError:  # pragma: no cover - optional dependency for postgres storage
+    psycopg = None
+
+logger = get_logger("spectrastrike.orchestrator.engine_store")
+
+
+class EngineStoreError(RuntimeError):
+    """Raised when engine state cannot be persisted or loaded."""
+
+
+@dataclass(slots=True, frozen=True)
+class StoredRow:
+    """One persisted engine table row."""
+
+    table: str
+    row_id: str
+    partition_id: str
+    payload: str
+    lookup_key: str = ""
+
+
+class EngineStore(Protocol):
+    """Partitioned row storage used by the orchestrator engines."""
+
+    def write(self, namespace: str, rows: Sequence[StoredRow]) -> None:
+        """Upsert rows; implementations may buffer until ``flush``."""
+
+    def flush(self) -> None:
+        """Persist buffered rows."""
+
+    def load_partition(self, namespace: str, partition_id: str) -> list[StoredRow]:
+        """Return every row stored for one partition."""
+
+    def load_table(self, namespace: str, table: str) -> list[StoredRow]:
+        """Return every row of one table across partitions."""
+
+    def find_partition(self, namespace: str, table: str, row_id: str) -> str | None:
+        """Return the partition holding a row, if stored."""
+
+    def find_partitions_by_lookup(
+        self, namespace: str, table: str, lookup_key: str
+    ) -> list[str]:
+        """Return partitions holding rows with the given lookup key."""
+
+    def close(self) -> None:
+        """Flush and release the backend connection."""
+
+
+def encode_record(record: Any) -> str:
+    """Serialise a record dataclass to canonical JSON."""
+    return json.dumps(_encode_value(record), sort_keys=True, separators=(",", ":"))
+
+
+def decode_record(record_type: type[Any], payload: str) -> Any:
+    """Rebuild a record dataclass from ``encode_record`` output."""
+    try:
+        return _decode_value(record_type, json.loads(payload))
+    except (TypeError, ValueError, KeyError) as exc:
+        raise EngineStoreError(
+            f"stored {record_type.__name__} row cannot be decoded"
+        ) from exc
+
+
+def _encode_value(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return {item.name: _encode_value(getattr(value, item.name)) for item in fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _encode_value(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(_encode_value(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _record_type_hints(record_type: type[Any]) -> dict[str, Any]:
+    return get_type_hints(record_type)
+
+
+def _decode_value(annotation: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        members = [item for item in get_args(annotation) if item is not type(None)]
+        return _decode_value(members[0], value) if len(members) == 1 else value
+    if isinstance(annotation, type) and is_dataclass(annotation):
+        hints = _record_type_hints(annotation)
+        return annotation(
+            **{name: _decode_value(hints[name], item) for name, item in value.items() if name in hints}
+        )
+    if annotation is datetime:
+        return datetime.fromisoformat(value)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation(value)
+    if origin is tuple:
+        args = get_args(annotation)
+        item_type = args[0] if args else Any
+        return tuple(_decode_value(item_type, item) for item in value)
+    if origin in (set, frozenset):
+        args = get_args(annotation)
+        return origin(_decode_value(args[0] if args else Any, item) for item in value)
+    if annotation is float:
+        return float(value)
+    return value
+
+
+class ResidentPartitions:
+    """Least-recently-used bookkeeping for partitions held in memory."""
+
+    def __init__(self, max_resident: int | None) -> None:
+        if max_resident is not None and max_resident < 1:
+            raise ValueError("max_resident must be >= 1")
+        self._max_resident = max_resident
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    def touch(self, partition_id: str) -> list[str]:
+        """Mark a partition as used; return eviction candidates, oldest first."""
+        self._order[partition_id] = None
+        self._order.move_to_end(partition_id)
+        if self._max_resident is None or len(self._order) <= self._max_resident:
+            return []
+        overflow = len(self._order) - self._max_resident
+        return [item for item in self._order if item != partition_id][:overflow]
+
+    def discard(self, partition_id: str) -> None:
+        self._order.pop(partition_id, None)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+_MIGRATIONS: tuple[tuple[str, ...], ...] = (
+    (
+        "CREATE TABLE IF NOT EXISTS engine_rows ("
+        "namespace TEXT NOT NULL, "
+        "table_name TEXT NOT NULL, "
+        "row_id TEXT NOT NULL, "
+        "partition_id TEXT NOT NULL, "
+        "lookup_key TEXT NOT NULL DEFAULT '', "
+        "payload TEXT NOT NULL, "
+        "PRIMARY KEY (namespace, table_name, row_id))",
+        "CREATE INDEX IF NOT EXISTS engine_rows_partition "
+        "ON engine_rows (namespace, partition_id)",
+        "CREATE INDEX IF NOT EXISTS engine_rows_lookup "
+        "ON engine_rows (namespace, table_name, lookup_key)",
+    ),
+)
+
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+
+class _SQLEngineStore:
+    """DB-API engine store shared by the SQLite and PostgreSQL backends.
+
+    Writes are coalesced per row and flushed in one transaction once
+    ``batch_size`` rows are pending or ``flush_interval_seconds`` has passed.
+    A timer enforces the interval when no further writes arrive, and reads
+    flush first so callers always observe their own writes.
+    """
+
+    _placeholder = "?"
+
+    def __init__(
+        self,
+        connection: Any,
+        *,
+        batch_size: int,
+        flush_interval_seconds: float,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if flush_interval_seconds < 0:
+            raise ValueError("flush_interval_seconds must be >= 0")
+        self._connection = connection
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._pending: OrderedDict[tuple[str, str, str], tuple[str, StoredRow]] = OrderedDict()
+        self._last_flush = time.monotonic()
+        self._flush_timer: Timer | None = None
+        self._closed = False
+        self._lock = Lock()
+        with self._lock:
+            self._migrate()
+
+    @property
+    def schema_version(self) -> int:
+        with self._lock:
+            return self._current_version()
+
+    def write(self, namespace: str, rows: Sequence[StoredRow]) -> None:
+        with self._lock:
+            for row in rows:
+                key = (namespace, row.table, row.row_id)
+                self._pending.pop(key, None)
+                self._pending[key] = (namespace, row)
+            if (
+                len(self._pending) >= self._batch_size
+                or time.monotonic() - self._last_flush >= self._flush_interval_seconds
+            ):
+                self._flush_locked()
+            else:
+                self._schedule_flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def load_partition(self, namespace: str, partition_id: str) -> list[StoredRow]:
+        return self._select(
+            "namespace = {p} AND partition_id = {p}", (namespace, partition_id)
+        )
+
+    def load_table(self, namespace: str, table: str) -> list[StoredRow]:
+        return self._select("namespace = {p} AND table_name = {p}", (namespace, table))
+
+    def find_partition(self, namespace: str, table: str, row_id: str) -> str | None:
+        rows = self._select(
+            "namespace = {p} AND table_name = {p} AND row_id = {p}",
+            (namespace, table, row_id),
+        )
+        return rows[0].partition_id if rows else None
+
+    def find_partitions_by_lookup(
+        self, namespace: str, table: str, lookup_key: str
+    ) -> list[str]:
+        rows = self._select(
+            "namespace = {p} AND table_name = {p} AND lookup_key = {p}",
+            (namespace, table, lookup_key),
+        )
+        return sorted({row.partition_id for row in rows})
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._closed = True
+            self._connection.close()
+
+    def _select(self, where: str, params: tuple[str, ...]) -> list[StoredRow]:
+        sql = (
+            "SELECT table_name, row_id, partition_id, payload, lookup_key "
+            f"FROM engine_rows WHERE {where.format(p=self._placeholder)}"
+        )
+        with self._lock:
+            self._flush_locked()
+            cursor = self._connection.cursor()
+            try:
+                cursor.execute(sql, params)
+                return [StoredRow(*row) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+
+    def _schedule_flush_locked(self) -> None:
+        if self._flush_timer is not None or self._closed or not self._pending:
+            return
+        delay = self._last_flush + self._flush_interval_seconds - time.monotonic()
+        timer = Timer(max(delay, 0.0), self._flush_on_timer)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            if self._closed:
+                return
+            try:
+                self._flush_locked()
+            except EngineStoreError:
+                logger.exception("Engine store timed flush failed; retrying")
+                self._schedule_flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        p = self._placeholder
+        sql = (
+            "INSERT INTO engine_rows "
+            "(namespace, table_name, row_id, partition_id, lookup_key, payload) "
+            f"VALUES ({p}, {p}, {p}, {p}, {p}, {p}) "
+            "ON CONFLICT (namespace, table_name, row_id) DO UPDATE SET "
+            "partition_id = excluded.partition_id, "
+            "lookup_key = excluded.lookup_key, "
+            "payload = excluded.payload"
+        )
+        params = [
+            (namespace, row.table, row.row_id, row.partition_id, row.lookup_key, row.payload)
+            for namespace, row in self._pending.values()
+        ]
+        cursor = self._connection.cursor()
+        try:
+            cursor.executemany(sql, params)
+            self._connection.commit()
+        except Exception as exc:
+            self._connection.rollback()
+            raise EngineStoreError("engine state flush failed") from exc
+        finally:
+            cursor.close()
+        self._pending.clear()
+
+    def _current_version(self) -> int:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute("SELECT MAX(version) FROM engine_store_schema")
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+        return int(row[0] or 0)
+
+    def _migrate(self) -> None:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS engine_store_schema (version INTEGER NOT NULL)"
+            )
+            self._connection.commit()
+            current = self._current_version()
+            if current > SCHEMA_VERSION:
+                raise EngineStoreError(
+                    f"engine store schema v{current} is newer than supported v{SCHEMA_VERSION}"
+                )
+            for version in range(current + 1, SCHEMA_VERSION + 1):
+                for statement in _MIGRATIONS[version - 1]:
+                    cursor.execute(statement)
+                cursor.execute(
+                    f"INSERT INTO engine_store_schema (version) VALUES ({self._placeholder})",
+                    (version,),
+                )
+                self._connection.commit()
+        except EngineStoreError:
+            raise
+        except Exception as exc:
+            self._connection.rollback()
+            raise EngineStoreError("engine store migration failed") from exc
+        finally:
+            cursor.close()
+
+
+class SQLiteEngineStore(_SQLEngineStore):
+    """Embedded reference backend: one SQLite file in WAL mode."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        batch_size: int = 128,
+        flush_interval_seconds: float = 0.5,
+        busy_timeout_seconds: float = 5.0,
+    ) -> None:
+        connection = sqlite3.connect(
+            str(path),
+            timeout=busy_timeout_seconds,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        super().__init__(
+            connection,
+            batch_size=batch_size,
+            flush_interval_seconds=flush_interval_seconds,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class PostgresConnectionConfig:
+    """Connection config for the dockerized PostgreSQL service."""
+
+    host: str = "postgres"
+    port: int = 5432
+    dbname: str = "spectrastrike"
+    user: str = "spectra"
+    password: str = ""
+    sslmode: str = "verify-full"
+    ssl_root_cert: str | None = "/app/docker/pki/ca.crt"
+    ssl_cert_file: str | None = "/app/docker/pki/app/client.crt"
+    ssl_key_file: str | None = "/app/docker/pki/app/client.key"
+
+    @classmethod
+    def from_env(cls, prefix: str = "POSTGRES_") -> PostgresConnectionConfig:
+        """Build connection config from environment variables and secret files."""
+
+        def secret(name: str, default: str) -> str:
+            path = os.getenv(f"{prefix}{name}_FILE", "").strip()
+            if path:
+                return Path(path).read_text(encoding="utf-8").strip()
+            return os.getenv(f"{prefix}{name}", default)
+
+        ssl_raw = os.getenv(f"{prefix}SSL", "true").strip().lower()
+        return cls(
+            host=os.getenv(f"{prefix}HOST", "postgres"),
+            port=int(os.getenv(f"{prefix}PORT", "5432")),
+            dbname=os.getenv(f"{prefix}DB", "spectrastrike"),
+            user=secret("USER", "spectra"),
+            password=secret("PASSWORD", ""),
+            sslmode=os.getenv(f"{prefix}SSLMODE", "verify-full")
+            if ssl_raw in {"1", "true", "yes", "on"}
+            else "disable",
+            ssl_root_cert=os.getenv(f"{prefix}SSL_ROOT_CERT", "/app/docker/pki/ca.crt"),
+            ssl_cert_file=os.getenv(f"{prefix}SSL_CERT_FILE", "/app/docker/pki/app/client.crt"),
+            ssl_key_file=os.getenv(f"{prefix}SSL_KEY_FILE", "/app/docker/pki/app/client.key"),
+        )
+
+
+class PostgresEngineStore(_SQLEngineStore):
+    """Optional backend for the ``postgres`` compose service (needs psycopg)."""
+
+    _placeholder = "%s"
+
+    def __init__(
+        self,
+        config: PostgresConnectionConfig | None = None,
+        *,
+        batch_size: int = 128,
+        flush_interval_seconds: float = 0.5,
+    ) -> None:
+        if psycopg is None:
+            raise EngineStoreError("psycopg package is required for PostgresEngineStore")
+        settings = config or PostgresConnectionConfig.from_env()
+        options: dict[str, Any] = {
+            "host": settings.host,
+            "port": settings.port,
+            "dbname": settings.dbname,
+            "user": settings.user,
+            "password": settings.password,
+            "sslmode": settings.sslmode,
+        }
+        if settings.sslmode != "disable":
+            options.update(
+                sslrootcert=settings.ssl_root_cert,
+                sslcert=settings.ssl_cert_file,
+                sslkey=settings.ssl_key_file,
+            )
+        try:
+            connection = psycopg.connect(**options)
+        except Exception as exc:
+            raise EngineStoreError("postgres engine store connection failed") from exc
+        super().__init__(
+            connection,
+            batch_size=batch_size,
+            flush_interval_seconds=flush_interval_seconds,
+        )
@@ -18,55 +18,269 @@ from __future__ import annotations
 
 import asyncio
 import threading
-from concurrent.futures import Future, ThreadPoolExecutor
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass
 from typing import Any, Coroutine
 
 
+@dataclass(slots=True, frozen=True)
+class AsyncTaskLatency:
+    """Latency sample for one coroutine submitted to the runtime."""
+
+    name: str
+    queue_delay_seconds: float
+    run_seconds: float
+    outcome: str
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncEventLoopMetrics:
+    """Point-in-time counters and latency aggregates for the runtime."""
+
+    submitted: int
+    completed: int
+    failed: int
+    cancelled: int
+    in_flight: int
+    waiting: int
+    mean_queue_delay_seconds: float
+    max_queue_delay_seconds: float
+    mean_run_seconds: float
+    max_run_seconds: float
+
+
 class AsyncEventLoop:
-    """Run submitted coroutines on a dedicated single-worker async runtime."""
+    """Run submitted coroutines on a dedicated long-lived asyncio loop thread.
+
+    Coroutines share one loop for the lifetime of the runtime, so connections,
+    sessions and async publishers opened by one submission stay usable by the
+    next. ``max_concurrency`` bounds how many submissions run at once; the rest
+    wait on the loop and their waiting time is reported as queue delay.
+    """
 
-    def __init__(self) -> None:
-        self._executor: ThreadPoolExecutor | None = None
+    def __init__(
+        self,
+        *,
+        max_concurrency: int | None = None,
+        latency_history: int = 1024,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than zero")
+        if latency_history <= 0:
+            raise ValueError("latency_history must be greater than zero")
+        self._max_concurrency = max_concurrency
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._pending: set[Future[Any]] = set()
         self._lock = threading.Lock()
+        self._latencies: deque[AsyncTaskLatency] = deque(maxlen=latency_history)
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._running_tasks = 0
+        self._queue_delay_total = 0.0
+        self._queue_delay_max = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
+        self._started_tasks = 0
+        self._finished_tasks = 0
 
     @property
     def is_running(self) -> bool:
         """Return whether the async runtime is active."""
-        return self._executor is not None
+        return self._loop is not None
 
     def start(self) -> None:
         """Start the async runtime if it is not already active."""
         with self._lock:
-            if self._executor is not None:
+            if self._loop is not None:
                 return
-            self._executor = ThreadPoolExecutor(
-                max_workers=1,
-                thread_name_prefix="spectrastrike-async-runtime",
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_loop,
+                args=(loop, ready),
+                name="spectrastrike-async-runtime",
+                daemon=True,
             )
+            thread.start()
+            ready.wait()
+            self._semaphore = (
+                None
+                if self._max_concurrency is None
+                else asyncio.Semaphore(self._max_concurrency)
+            )
+            self._loop = loop
+            self._thread = thread
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            stragglers = asyncio.all_tasks(loop)
+            for task in stragglers:
+                task.cancel()
+            loop.run_until_complete(
+                asyncio.gather(*stragglers, return_exceptions=True)
+            )
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
 
-    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future[Any]:
+    def submit(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        *,
+        name: str | None = None,
+    ) -> Future[Any]:
         """Submit a coroutine for asynchronous execution."""
-        executor = self._executor
-        if executor is None:
-            coro.close()
-            raise RuntimeError("Async event loop is not running")
+        with self._lock:
+            loop = self._loop
+            if loop is None:
+                coro.close()
+                raise RuntimeError("Async event loop is not running")
+            self._submitted += 1
+            task_name = name or getattr(coro, "__qualname__", type(coro).__name__)
+            future = asyncio.run_coroutine_threadsafe(
+                self._run_tracked(coro, task_name, time.monotonic()),
+                loop,
+            )
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+        return future
 
-        return executor.submit(self._run_coroutine, coro)
+    def _discard_pending(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._pending.discard(future)
 
-    @staticmethod
-    def _run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
-        return asyncio.run(coro)
+    async def _run_tracked(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        name: str,
+        submitted_at: float,
+    ) -> Any:
+        started_at: float | None = None
+        outcome = "cancelled"
+        try:
+            if self._semaphore is None:
+                started_at = self._mark_started(submitted_at)
+                result = await coro
+            else:
+                async with self._semaphore:
+                    started_at = self._mark_started(submitted_at)
+                    result = await coro
+            outcome = "completed"
+            return result
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            outcome = "failed"
+            raise
+        finally:
+            if started_at is None:
+                coro.close()
+            self._mark_finished(name, submitted_at, started_at, outcome)
+
+    def _mark_started(self, submitted_at: float) -> float:
+        started_at = time.monotonic()
+        delay = started_at - submitted_at
+        with self._lock:
+            self._running_tasks += 1
+            self._started_tasks += 1
+            self._queue_delay_total += delay
+            self._queue_delay_max = max(self._queue_delay_max, delay)
+        return started_at
+
+    def _mark_finished(
+        self,
+        name: str,
+        submitted_at: float,
+        started_at: float | None,
+        outcome: str,
+    ) -> None:
+        finished_at = time.monotonic()
+        run_seconds = 0.0 if started_at is None else finished_at - started_at
+        queue_delay = (started_at if started_at is not None else finished_at) - submitted_at
+        with self._lock:
+            if started_at is not None:
+                self._running_tasks -= 1
+                self._finished_tasks += 1
+                self._run_total += run_seconds
+                self._run_max = max(self._run_max, run_seconds)
+            if outcome == "completed":
+                self._completed += 1
+            elif outcome == "failed":
+                self._failed += 1
+            else:
+                self._cancelled += 1
+            self._latencies.append(
+                AsyncTaskLatency(
+                    name=name,
+                    queue_delay_seconds=queue_delay,
+                    run_seconds=run_seconds,
+                    outcome=outcome,
+                )
+            )
+
+    def metrics(self) -> AsyncEventLoopMetrics:
+        """Return runtime counters and queueing/run latency aggregates."""
+        with self._lock:
+            finished = self._completed + self._failed + self._cancelled
+            in_flight = self._submitted - finished
+            return AsyncEventLoopMetrics(
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                cancelled=self._cancelled,
+                in_flight=in_flight,
+                waiting=in_flight - self._running_tasks,
+                mean_queue_delay_seconds=(
+                    self._queue_delay_total / self._started_tasks
+                    if self._started_tasks
+                    else 0.0
+                ),
+                max_queue_delay_seconds=self._queue_delay_max,
+                mean_run_seconds=(
+                    self._run_total / self._finished_tasks
+                    if self._finished_tasks
+                    else 0.0
+                ),
+                max_run_seconds=self._run_max,
+            )
+
+    def latency_samples(self) -> tuple[AsyncTaskLatency, ...]:
+        """Return the most recent per-task latency samples, oldest first."""
+        with self._lock:
+            return tuple(self._latencies)
 
-    def stop(self, timeout: float = 5.0) -> None:
-        """Stop the async runtime and wait for worker shutdown."""
-        del timeout  # Preserved for API compatibility with future runtime upgrades.
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop accepting work, drain in-flight coroutines, then stop the loop.
 
+        Submissions still running after ``timeout`` seconds are cancelled.
+        """
         with self._lock:
-            executor = self._executor
-            self._executor = None
+            loop = self._loop
+            thread = self._thread
+            self._loop = None
+            self._thread = None
+            pending = set(self._pending)
 
-        if executor is not None:
-            executor.shutdown(wait=True, cancel_futures=False)
+        if loop is None or thread is None:
+            return
+        if pending:
+            _, not_done = wait_futures(pending, timeout=timeout)
+            for future in not_done:
+                future.cancel()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        self._semaphore = None
 
     def __enter__(self) -> AsyncEventLoop:
         """Start runtime on context entry."""
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import base64
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Protocol
 
@@ -100,6 +101,27 @@ class CompactJWSGenerator:
 
     def generate(self, payload: dict[str, Any]) -> str:
         """Build, sign, and return compact JWS: header.payload.signature."""
+        signing_input = self._signing_input(payload)
+        signer_value = self._signer.sign_payload(signing_input.encode("ascii"))
+        return self._compact(signing_input, signer_value)
+
+    def generate_many(self, payloads: Sequence[dict[str, Any]]) -> list[str]:
+        """Build compact JWS for each payload, batching signer calls when supported."""
+        signing_inputs = [self._signing_input(payload) for payload in payloads]
+        encoded = [item.encode("ascii") for item in signing_inputs]
+        sign_payloads = getattr(self._signer, "sign_payloads", None)
+        if callable(sign_payloads):
+            signer_values = list(sign_payloads(encoded))
+        else:
+            signer_values = [self._signer.sign_payload(item) for item in encoded]
+        if len(signer_values) != len(signing_inputs):
+            raise JWSPayloadError("signer returned a mismatched signature count")
+        return [
+            self._compact(signing_input, signer_value)
+            for signing_input, signer_value in zip(signing_inputs, signer_values)
+        ]
+
+    def _signing_input(self, payload: dict[str, Any]) -> str:
         if not payload:
             raise JWSPayloadError("payload must not be empty")
         if self._pre_execution_authorizer is not None:
@@ -113,8 +135,9 @@ class CompactJWSGenerator:
 
         header_segment = _b64url_encode(_json_compact(header))
         payload_segment = _b64url_encode(_json_compact(payload))
-        signing_input = f"{header_segment}.{payload_segment}"
+        return f"{header_segment}.{payload_segment}"
 
-        signer_value = self._signer.sign_payload(signing_input.encode("ascii"))
+    @staticmethod
+    def _compact(signing_input: str, signer_value: str) -> str:
         signature_segment = _b64url_encode(_decode_signer_signature(signer_value))
         return f"{signing_input}.{signature_segment}"
@@ -222,3 +222,30 @@ class InclusionProofStructure:
             raise LedgerModelError("signature_format must be jws")
         if not self.audit_path:
             raise LedgerModelError("audit_path must contain at least one sibling node")
+
+
+@dataclass(slots=True, frozen=True)
+class ConsistencyProofStructure:
+    """Formal consistency proof contract between two ledger roots."""
+
+    old_leaf_count: int
+    new_leaf_count: int
+    old_root: str
+    new_root: str
+    old_frontier: tuple[str, ...]
+    proof_hashes: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        if self.old_leaf_count < 1:
+            raise LedgerModelError("old_leaf_count must be >= 1")
+        if self.new_leaf_count < self.old_leaf_count:
+            raise LedgerModelError("new_leaf_count must be >= old_leaf_count")
+        required = {
+            "old_root": self.old_root,
+            "new_root": self.new_root,
+        }
+        for name, value in required.items():
+            if not str(value).strip():
+                raise LedgerModelError(f"{name} is required")
+        if len(self.old_frontier) != bin(self.old_leaf_count).count("1"):
+            raise LedgerModelError("old_frontier must hold one hash per perfect subtree")
@@ -19,15 +19,23 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
+import mmap
+import os
+import struct
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from threading import RLock
-from typing import Protocol
+from threading import RLock, Thread
+from typing import BinaryIO, Protocol, TextIO
 
 from pkg.logging.framework import emit_integrity_audit_event
 from .ledger_model import (
     AppendOnlyInsertionOrder,
+    ConsistencyProofStructure,
     DeterministicTreeGrowthRules,
     InclusionProofNode,
     InclusionProofStructure,
@@ -93,15 +101,792 @@ class HMACRootSigningAuthority:
         return hmac.compare_digest(expected, signature)
 
 
+def _hash_pair(left: str, right: str) -> str:
+    return hashlib.sha256(f"{left}:{right}".encode("utf-8")).hexdigest()
+
+
+class IncrementalMerkleFrontier:
+    """Right-edge frontier of perfect subtrees for O(log n) root generation.
+
+    Produces the same roots as the level-by-level duplicate-last rebuild while
+    only retaining one subtree hash per set bit of the leaf count.
+    """
+
+    def __init__(self) -> None:
+        self._size = 0
+        self._nodes: list[str | None] = []
+
+    @classmethod
+    def restore(cls, *, size: int, nodes: list[str | None]) -> IncrementalMerkleFrontier:
+        """Restore frontier from persisted right-edge subtree hashes."""
+        for level, node in enumerate(nodes):
+            if ((size >> level) & 1) != (node is not None):
+                raise MerkleLedgerError("merkle frontier nodes do not match leaf count")
+        if size >> len(nodes):
+            raise MerkleLedgerError("merkle frontier nodes do not match leaf count")
+        frontier = cls()
+        frontier._size = size
+        frontier._nodes = list(nodes)
+        return frontier
+
+    @property
+    def size(self) -> int:
+        """Return number of leaves absorbed into the frontier."""
+        return self._size
+
+    def append(self, leaf_hash: str) -> None:
+        """Absorb leaf hash, merging completed perfect subtrees upward."""
+        node = leaf_hash
+        level = 0
+        carry = self._size
+        while carry & 1:
+            left = self._nodes[level]
+            assert left is not None
+            node = _hash_pair(left, node)
+            self._nodes[level] = None
+            carry >>= 1
+            level += 1
+        if level == len(self._nodes):
+            self._nodes.append(node)
+        else:
+            self._nodes[level] = node
+        self._size += 1
+
+    def root(self) -> str:
+        """Return duplicate-last Merkle root over all absorbed leaves."""
+        if self._size == 0:
+            raise MerkleLedgerError("cannot compute merkle_root without leaves")
+        tail: str | None = None
+        remaining = self._size
+        level = 0
+        while True:
+            perfect = self._nodes[level] if remaining & 1 else None
+            width = remaining + (1 if tail is not None else 0)
+            if width == 1:
+                root = tail if tail is not None else perfect
+                assert root is not None
+                return root
+            if tail is not None:
+                tail = _hash_pair(perfect, tail) if perfect is not None else _hash_pair(tail, tail)
+            elif perfect is not None:
+                tail = _hash_pair(perfect, perfect)
+            remaining >>= 1
+            level += 1
+
+
+def _consistency_root(
+    *,
+    old_leaf_count: int,
+    new_leaf_count: int,
+    old_frontier: tuple[str, ...],
+    new_node: Callable[[int, int], str],
+) -> str:
+    """Recompute the new root from the old frontier plus nodes covering new leaves.
+
+    Nodes wholly inside the old tree are old frontier subtrees, nodes wholly
+    past it are resolved through ``new_node`` and straddling nodes recurse, so
+    producer and verifier walk the same O(log n) node sequence.
+    """
+    known: dict[tuple[int, int], str] = {}
+    remaining = iter(old_frontier)
+    for height in range(old_leaf_count.bit_length()):
+        if (old_leaf_count >> height) & 1:
+            known[(height, (old_leaf_count >> height) - 1)] = next(remaining)
+
+    def walk(height: int, index: int) -> str:
+        start = index << height
+        end = (index + 1) << height
+        if start >= old_leaf_count:
+            return new_node(height, index)
+        if end <= old_leaf_count:
+            node = known.get((height, index))
+            if node is None:
+                raise MerkleLedgerError("consistency proof frontier mismatch detected")
+            return node
+        child_height = height - 1
+        left = walk(child_height, 2 * index)
+        child_width = (new_leaf_count + (1 << child_height) - 1) >> child_height
+        if 2 * index + 1 >= child_width:
+            return _hash_pair(left, left)
+        return _hash_pair(left, walk(child_height, 2 * index + 1))
+
+    return walk((new_leaf_count - 1).bit_length(), 0)
+
+
+def _frontier_nodes(leaf_count: int, old_frontier: tuple[str, ...]) -> list[str | None]:
+    """Expand set-bit frontier hashes into per-level frontier slots."""
+    remaining = iter(old_frontier)
+    return [
+        next(remaining, None) if (leaf_count >> height) & 1 else None
+        for height in range(leaf_count.bit_length())
+    ]
+
+
+_DIGEST_SIZE = 32
+
+
+class _DigestLevel:
+    """Append-only array of raw sha256 digests, optionally mmap-backed."""
+
+    def __init__(self, *, path: Path | None) -> None:
+        self._path = path
+        self._memory = bytearray()
+        self._handle: BinaryIO | None = None
+        self._map: mmap.mmap | None = None
+        self._mapped_count = 0
+        self._count = 0
+        self.last: bytes | None = None
+        if path is not None:
+            self._handle = path.open("a+b")
+            size = path.stat().st_size
+            usable = size - (size % _DIGEST_SIZE)
+            if usable != size:
+                self._handle.truncate(usable)
+            self._count = usable // _DIGEST_SIZE
+            if self._count:
+                self.last = self.get(self._count - 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, digest: bytes) -> None:
+        if self._handle is None:
+            self._memory += digest
+        else:
+            self._handle.write(digest)
+        self._count += 1
+        self.last = digest
+
+    def truncate(self, count: int) -> None:
+        if count >= self._count:
+            return
+        if self._handle is None:
+            del self._memory[count * _DIGEST_SIZE :]
+        else:
+            self._release_map()
+            self._handle.flush()
+            self._handle.truncate(count * _DIGEST_SIZE)
+        self._count = count
+        self.last = self.get(count - 1) if count else None
+
+    def get(self, index: int) -> bytes:
+        if index < 0 or index >= self._count:
+            raise MerkleLedgerError("merkle level index out of range")
+        offset = index * _DIGEST_SIZE
+        if self._handle is None:
+            return bytes(self._memory[offset : offset + _DIGEST_SIZE])
+        if index >= self._mapped_count:
+            self._remap()
+        assert self._map is not None
+        return self._map[offset : offset + _DIGEST_SIZE]
+
+    def _remap(self) -> None:
+        assert self._handle is not None
+        self._release_map()
+        self._handle.flush()
+        self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped_count = self._count
+
+    def _release_map(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._mapped_count = 0
+
+    def flush(self) -> None:
+        if self._handle is not None:
+            self._handle.flush()
+
+    def close(self) -> None:
+        self._release_map()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def _hash_pair_digest(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(f"{left.hex()}:{right.hex()}".encode("utf-8")).digest()
+
+
+class MerkleLevelIndex:
+    """Persistent per-level store of perfect subtree hashes.
+
+    Every completed node of the duplicate-last tree is kept once, so roots and
+    audit paths for any prefix ``leaf_count`` resolve in O(log n) reads instead
+    of rebuilding every level. When ``storage_dir`` is provided each level is an
+    append-only file of raw digests read through ``mmap``.
+    """
+
+    def __init__(self, *, storage_dir: Path | None = None) -> None:
+        self._storage_dir = storage_dir
+        self._levels: list[_DigestLevel] = []
+        self._lock = RLock()
+        if storage_dir is not None:
+            storage_dir.mkdir(parents=True, exist_ok=True)
+            height = 0
+            while (storage_dir / f"level-{height:02d}.bin").exists():
+                self._levels.append(_DigestLevel(path=storage_dir / f"level-{height:02d}.bin"))
+                height += 1
+            self._repair()
+
+    def _level(self, height: int) -> _DigestLevel:
+        while height >= len(self._levels):
+            path = (
+                self._storage_dir / f"level-{len(self._levels):02d}.bin"
+                if self._storage_dir is not None
+                else None
+            )
+            self._levels.append(_DigestLevel(path=path))
+        return self._levels[height]
+
+    def _repair(self) -> None:
+        """Re-derive upper levels left short or long by an interrupted write."""
+        for height in range(len(self._levels) - 1):
+            lower = self._levels[height]
+            upper = self._levels[height + 1]
+            expected = len(lower) // 2
+            upper.truncate(expected)
+            for index in range(len(upper), expected):
+                upper.append(_hash_pair_digest(lower.get(2 * index), lower.get(2 * index + 1)))
+
+    @property
+    def size(self) -> int:
+        """Return number of leaves indexed."""
+        with self._lock:
+            return len(self._levels[0]) if self._levels else 0
+
+    def leaf_hash(self, leaf_index: int) -> str:
+        """Return indexed leaf hash for a 1-based leaf index."""
+        with self._lock:
+            return self._level(0).get(leaf_index - 1).hex()
+
+    def append(self, leaf_hash: str) -> None:
+        """Index leaf hash and every perfect subtree it completes."""
+        with self._lock:
+            digest = bytes.fromhex(leaf_hash)
+            height = 0
+            while True:
+                level = self._level(height)
+                left = level.last
+                level.append(digest)
+                if len(level) % 2 == 1:
+                    return
+                assert left is not None
+                digest = _hash_pair_digest(left, digest)
+                height += 1
+
+    def truncate(self, leaf_count: int) -> None:
+        """Drop indexed leaves beyond ``leaf_count`` after an unsynced store tail."""
+        with self._lock:
+            for height, level in enumerate(self._levels):
+                level.truncate(leaf_count >> height)
+
+    def frontier(self) -> IncrementalMerkleFrontier:
+        """Return right-edge frontier equivalent to the indexed leaves."""
+        with self._lock:
+            nodes = [
+                level.last.hex() if len(level) % 2 == 1 and level.last is not None else None
+                for level in self._levels
+            ]
+            return IncrementalMerkleFrontier.restore(size=self.size, nodes=nodes)
+
+    def flush(self) -> None:
+        """Flush buffered level writes to disk."""
+        with self._lock:
+            for level in self._levels:
+                level.flush()
+
+    def close(self) -> None:
+        """Release file handles and memory maps."""
+        with self._lock:
+            for level in self._levels:
+                level.close()
+
+    def _tails(self, leaf_count: int) -> list[bytes | None]:
+        """Return the partial right-edge node per level for a tree prefix."""
+        if leaf_count < 1 or leaf_count > self.size:
+            raise MerkleLedgerError("leaf_count out of range for merkle level index")
+        tails: list[bytes | None] = [None]
+        tail: bytes | None = None
+        height = 0
+        while True:
+            perfect_count = leaf_count >> height
+            width = perfect_count + (1 if tail is not None else 0)
+            if width == 1:
+                return tails
+            last_perfect = (
+                self._levels[height].get(perfect_count - 1) if perfect_count & 1 else None
+            )
+            if tail is not None:
+                tail = (
+                    _hash_pair_digest(last_perfect, tail)
+                    if last_perfect is not None
+                    else _hash_pair_digest(tail, tail)
+                )
+            elif last_perfect is not None:
+                tail = _hash_pair_digest(last_perfect, last_perfect)
+            tails.append(tail)
+            height += 1
+
+    def _node(
+        self,
+        *,
+        height: int,
+        index: int,
+        leaf_count: int,
+        tails: list[bytes | None],
+    ) -> bytes:
+        perfect_count = leaf_count >> height
+        tail = tails[height]
+        width = perfect_count + (1 if tail is not None else 0)
+        if index >= width:
+            index = width - 1
+        if index < perfect_count:
+            return self._levels[height].get(index)
+        assert tail is not None
+        return tail
+
+    def prefix_root(self, leaf_count: int) -> str:
+        """Return duplicate-last Merkle root over the first ``leaf_count`` leaves."""
+        with self._lock:
+            tails = self._tails(leaf_count)
+            height = len(tails) - 1
+            return self._node(height=height, index=0, leaf_count=leaf_count, tails=tails).hex()
+
+    def consistency_proof(
+        self,
+        *,
+        old_leaf_count: int,
+        new_leaf_count: int,
+    ) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return (old frontier, proof hashes) showing the new prefix extends the old."""
+        with self._lock:
+            if old_leaf_count < 1 or old_leaf_count > new_leaf_count:
+                raise MerkleLedgerError("old_leaf_count out of range for consistency proof")
+            old_frontier = tuple(
+                self._levels[height].get((old_leaf_count >> height) - 1).hex()
+                for height in range(old_leaf_count.bit_length())
+                if (old_leaf_count >> height) & 1
+            )
+            tails = self._tails(new_leaf_count)
+            proof_hashes: list[str] = []
+
+            def new_node(height: int, index: int) -> str:
+                node = self._node(
+                    height=height,
+                    index=index,
+                    leaf_count=new_leaf_count,
+                    tails=tails,
+                ).hex()
+                proof_hashes.append(node)
+                return node
+
+            _consistency_root(
+                old_leaf_count=old_leaf_count,
+                new_leaf_count=new_leaf_count,
+                old_frontier=old_frontier,
+                new_node=new_node,
+            )
+            return old_frontier, tuple(proof_hashes)
+
+    def audit_paths(
+        self,
+        *,
+        leaf_indices: list[int],
+        leaf_count: int,
+    ) -> list[tuple[InclusionProofNode, ...]]:
+        """Return audit paths for many 1-based leaf indices against one prefix."""
+        with self._lock:
+            tails = self._tails(leaf_count)
+            paths: list[tuple[InclusionProofNode, ...]] = []
+            for leaf_index in leaf_indices:
+                if leaf_index < 1 or leaf_index > leaf_count:
+                    raise MerkleLedgerError("leaf_index exceeds signed root leaf_count")
+                index = leaf_index - 1
+                path: list[InclusionProofNode] = []
+                for height in range(len(tails) - 1):
+                    if index % 2 == 0:
+                        sibling_idx = index + 1
+                        direction = "right"
+                    else:
+                        sibling_idx = index - 1
+                        direction = "left"
+                    sibling = self._node(
+                        height=height,
+                        index=sibling_idx,
+                        leaf_count=leaf_count,
+                        tails=tails,
+                    )
+                    path.append(
+                        InclusionProofNode(direction=direction, sibling_hash=sibling.hex())
+                    )
+                    index //= 2
+                paths.append(tuple(path))
+            return paths
+
+
+def _record_hash(*, leaf: MerkleLeafSchema, leaf_hash: str, prev_record_hash: str) -> str:
+    canonical = json.dumps(
+        {
+            "leaf": json.loads(leaf.canonical_json()),
+            "leaf_hash": leaf_hash,
+            "prev_record_hash": prev_record_hash,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+    )
+    return hashlib.sha256(f"{prev_record_hash}:{canonical}".encode("utf-8")).hexdigest()
+
+
+def _record_row(record: ImmutableExecutionLeafRecord) -> dict[str, object]:
+    return {
+        "leaf": asdict(record.leaf),
+        "leaf_hash": record.leaf_hash,
+        "prev_record_hash": record.prev_record_hash,
+        "record_hash": record.record_hash,
+    }
+
+
+def _record_from_row(payload: dict[str, object]) -> ImmutableExecutionLeafRecord:
+    leaf_payload = payload["leaf"]
+    assert isinstance(leaf_payload, dict)
+    return ImmutableExecutionLeafRecord(
+        leaf=MerkleLeafSchema(**leaf_payload),
+        leaf_hash=str(payload["leaf_hash"]),
+        prev_record_hash=str(payload["prev_record_hash"]),
+        record_hash=str(payload["record_hash"]),
+    )
+
+
+def _signed_root_row(root: SignedMerkleRoot) -> dict[str, object]:
+    return {
+        "root_hash": root.root_hash,
+        "leaf_count": root.leaf_count,
+        "generated_at": root.generated_at,
+        "signature": root.signature,
+        "authority": root.authority,
+        "signature_format": root.signature_format,
+    }
+
+
+def _signed_root_from_row(entry: dict[str, object]) -> SignedMerkleRoot:
+    return SignedMerkleRoot(
+        root_hash=str(entry["root_hash"]),
+        leaf_count=int(str(entry["leaf_count"])),
+        generated_at=str(entry["generated_at"]),
+        signature=str(entry["signature"]),
+        authority=str(entry["authority"]),
+        signature_format=str(entry["signature_format"]),
+    )
+
+
+def _verify_record_chain(
+    records: list[ImmutableExecutionLeafRecord],
+    *,
+    prev_hash: str = "GENESIS",
+) -> str:
+    """Verify leaf and record hash chain, returning the last record hash."""
+    for record in records:
+        if record.prev_record_hash != prev_hash:
+            raise MerkleLedgerError("immutable leaf chain mismatch detected")
+        if record.leaf.leaf_hash() != record.leaf_hash:
+            raise MerkleLedgerError("immutable leaf hash mismatch detected")
+        computed = _record_hash(
+            leaf=record.leaf,
+            leaf_hash=record.leaf_hash,
+            prev_record_hash=record.prev_record_hash,
+        )
+        if computed != record.record_hash:
+            raise MerkleLedgerError("immutable record hash mismatch detected")
+        prev_hash = record.record_hash
+    return prev_hash
+
+
+_FRAME_HEADER = struct.Struct(">4sBIII")
+_FRAME_HEADER_BODY = struct.Struct(">4sBII")
+_FRAME_MAGIC = b"SSLF"
+_FRAME_RECORD = 1
+_FRAME_FOOTER = 2
+
+
+def _encode_frame(kind: int, payload: bytes) -> bytes:
+    checksum = zlib.crc32(payload)
+    body = _FRAME_HEADER_BODY.pack(_FRAME_MAGIC, kind, len(payload), checksum)
+    return body + struct.pack(">I", zlib.crc32(body)) + payload
+
+
+def _decode_frames(data: bytes) -> tuple[list[tuple[int, bytes, int]], int]:
+    """Decode frames as (kind, payload, offset), stopping at a torn tail frame.
+
+    The header carries its own CRC, so a frame length is trusted only once the
+    header checks out. A crash can leave only a prefix of the last frame: a
+    partial header, zero-filled bytes, or a payload cut short by EOF. A final
+    frame ending exactly at EOF whose payload fails its CRC is also torn. Any
+    other bad frame is corruption and raises rather than dropping records.
+    """
+    frames: list[tuple[int, bytes, int]] = []
+    offset = 0
+    while offset < len(data):
+        if offset + _FRAME_HEADER.size > len(data):
+            tail = data[offset:]
+            if not _FRAME_MAGIC.startswith(tail[:4]) and tail.strip(b"\x00"):
+                raise MerkleLedgerError("ledger segment frame corrupted before tail")
+            break
+        magic, kind, length, checksum, header_checksum = _FRAME_HEADER.unpack_from(
+            data, offset
+        )
+        header_body = data[offset : offset + _FRAME_HEADER_BODY.size]
+        if magic != _FRAME_MAGIC or zlib.crc32(header_body) != header_checksum:
+            if data[offset:].strip(b"\x00"):
+                raise MerkleLedgerError("ledger segment frame corrupted before tail")
+            break
+        start = offset + _FRAME_HEADER.size
+        end = start + length
+        if end > len(data):
+            break
+        payload = data[start:end]
+        if zlib.crc32(payload) != checksum:
+            if end != len(data):
+                raise MerkleLedgerError("ledger segment frame corrupted before tail")
+            break
+        frames.append((kind, payload, offset))
+        offset = end
+    return frames, offset
+
+
+def _verify_segment_file(path: str) -> tuple[str, str, int]:
+    """Fully re-hash one segment, returning (first prev hash, last hash, count)."""
+    frames, _ = _decode_frames(Path(path).read_bytes())
+    records = [
+        _record_from_row(json.loads(payload))
+        for kind, payload, _ in frames
+        if kind == _FRAME_RECORD
+    ]
+    if not records:
+        return "", "", 0
+    first_prev = records[0].prev_record_hash
+    last_hash = _verify_record_chain(records, prev_hash=first_prev)
+    return first_prev, last_hash, len(records)
+
+
+class SegmentedLeafLog:
+    """Segmented append-only binary log for immutable execution leaves.
+
+    Records are written as CRC-checked frames with a fixed-size header through a
+    persistent handle with batched fsync. Full segments are sealed with a footer
+    carrying the last verified ``record_hash`` and a digest of the segment frames,
+    so cold start re-hashes only the unsealed tail segment.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: Path,
+        segment_max_records: int = 4096,
+        fsync_every: int = 64,
+    ) -> None:
+        if segment_max_records < 1:
+            raise MerkleLedgerError("segment_max_records must be >= 1")
+        if fsync_every < 1:
+            raise MerkleLedgerError("fsync_every must be >= 1")
+        self._directory = directory
+        self._segment_max_records = segment_max_records
+        self._fsync_every = fsync_every
+        self._handle: BinaryIO | None = None
+        self._next_sequence = 0
+        self._segment_records = 0
+        self._segment_first_leaf_index = 1
+        self._segment_first_prev_hash = "GENESIS"
+        self._segment_digest = hashlib.sha256()
+        self._unsynced = 0
+        self._record_count = 0
+        self._last_record_hash = "GENESIS"
+        self._lock = RLock()
+
+    @property
+    def directory(self) -> Path:
+        """Return segment directory."""
+        return self._directory
+
+    def _segment_paths(self) -> list[Path]:
+        return sorted(self._directory.glob("segment-*.log"))
+
+    def load(self) -> list[ImmutableExecutionLeafRecord]:
+        """Load all records, re-hashing only the unsealed tail segment."""
+        with self._lock:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            loaded: list[ImmutableExecutionLeafRecord] = []
+            prev_hash = "GENESIS"
+            paths = self._segment_paths()
+            for position, path in enumerate(paths):
+                data = path.read_bytes()
+                frames, good_end = _decode_frames(data)
+                sealed = bool(frames) and frames[-1][0] == _FRAME_FOOTER
+                rows = [payload for kind, payload, _ in frames if kind == _FRAME_RECORD]
+                if len(rows) != len(frames) - (1 if sealed else 0):
+                    raise MerkleLedgerError("ledger segment frame layout mismatch detected")
+                segment = [_record_from_row(json.loads(payload)) for payload in rows]
+                if sealed:
+                    if good_end != len(data):
+                        raise MerkleLedgerError("sealed ledger segment is corrupted")
+                    footer = json.loads(frames[-1][1])
+                    digest = hashlib.sha256(data[: frames[-1][2]]).hexdigest()
+                    if (
+                        footer.get("frames_sha256") != digest
+                        or footer.get("record_count") != len(segment)
+                        or footer.get("first_leaf_index") != len(loaded) + 1
+                        or footer.get("first_prev_record_hash") != prev_hash
+                        or not segment
+                        or segment[0].prev_record_hash != prev_hash
+                        or segment[-1].record_hash != footer.get("last_record_hash")
+                    ):
+                        raise MerkleLedgerError("sealed ledger segment footer mismatch detected")
+                    prev_hash = str(footer["last_record_hash"])
+                else:
+                    if position != len(paths) - 1:
+                        raise MerkleLedgerError("unsealed ledger segment found before tail")
+                    if good_end != len(data):
+                        with path.open("r+b") as handle:
+                            handle.truncate(good_end)
+                    prev_hash = _verify_record_chain(segment, prev_hash=prev_hash)
+                    self._handle = path.open("ab")
+                    self._segment_records = len(segment)
+                    self._segment_first_leaf_index = len(loaded) + 1
+                    self._segment_first_prev_hash = (
+                        segment[0].prev_record_hash if segment else prev_hash
+                    )
+                    self._segment_digest = hashlib.sha256(data[:good_end])
+                loaded.extend(segment)
+                self._next_sequence = position + 1
+            self._record_count = len(loaded)
+            self._last_record_hash = prev_hash
+            return loaded
+
+    def append(self, record: ImmutableExecutionLeafRecord) -> None:
+        """Append framed record, sealing the segment once it is full."""
+        with self._lock:
+            if record.prev_record_hash != self._last_record_hash:
+                raise MerkleLedgerError("immutable leaf chain mismatch detected")
+            if self._handle is None:
+                self._directory.mkdir(parents=True, exist_ok=True)
+                path = self._directory / f"segment-{self._next_sequence:08d}.log"
+                self._handle = path.open("ab")
+                self._next_sequence += 1
+                self._segment_records = 0
+                self._segment_first_leaf_index = self._record_count + 1
+                self._segment_first_prev_hash = record.prev_record_hash
+                self._segment_digest = hashlib.sha256()
+            payload = json.dumps(
+                _record_row(record),
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=True,
+            ).encode("utf-8")
+            frame = _encode_frame(_FRAME_RECORD, payload)
+            self._handle.write(frame)
+            self._segment_digest.update(frame)
+            self._segment_records += 1
+            self._record_count += 1
+            self._last_record_hash = record.record_hash
+            self._unsynced += 1
+            if self._segment_records >= self._segment_max_records:
+                self._seal()
+            elif self._unsynced >= self._fsync_every:
+                self.sync()
+
+    def _seal(self) -> None:
+        assert self._handle is not None
+        footer = json.dumps(
+            {
+                "first_leaf_index": self._segment_first_leaf_index,
+                "first_prev_record_hash": self._segment_first_prev_hash,
+                "frames_sha256": self._segment_digest.hexdigest(),
+                "last_record_hash": self._last_record_hash,
+                "record_count": self._segment_records,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=True,
+        ).encode("utf-8")
+        self._handle.write(_encode_frame(_FRAME_FOOTER, footer))
+        self.sync()
+        self._handle.close()
+        self._handle = None
+
+    def sync(self) -> None:
+        """Flush and fsync pending frames of the active segment."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+                os.fsync(self._handle.fileno())
+            self._unsynced = 0
+
+    def close(self) -> None:
+        """Sync and close the active segment handle."""
+        with self._lock:
+            if self._handle is not None:
+                self.sync()
+                self._handle.close()
+                self._handle = None
+
+    def verify_full_chain(self, *, max_workers: int | None = None) -> int:
+        """Re-hash every segment across a process pool and stitch the chain."""
+        with self._lock:
+            self.sync()
+            paths = [str(path) for path in self._segment_paths()]
+            expected = self._record_count
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_verify_segment_file, paths))
+        prev_hash = "GENESIS"
+        verified = 0
+        for first_prev, last_hash, count in results:
+            if count == 0:
+                continue
+            if first_prev != prev_hash:
+                raise MerkleLedgerError("immutable leaf chain mismatch detected")
+            prev_hash = last_hash
+            verified += count
+        if verified < expected:
+            raise MerkleLedgerError("immutable leaf store is missing persisted records")
+        return verified
+
+    def start_full_verification(self, *, max_workers: int | None = None) -> Future[int]:
+        """Run full re-verification as a background job."""
+        future: Future[int] = Future()
+
+        def _run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self.verify_full_chain(max_workers=max_workers))
+            except BaseException as exc:  # noqa: BLE001 - surfaced through future
+                future.set_exception(exc)
+
+        Thread(target=_run, name="spectrastrike-ledger-verify", daemon=True).start()
+        return future
+
+
 class ImmutableExecutionLeafStore:
     """Immutable append-only persistence for execution leaves."""
 
-    def __init__(self, *, storage_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        storage_path: Path | None = None,
+        segment_log: SegmentedLeafLog | None = None,
+    ) -> None:
+        if storage_path is not None and segment_log is not None:
+            raise MerkleLedgerError("storage_path and segment_log are mutually exclusive")
         self._storage_path = storage_path
+        self._segment_log = segment_log
+        self._handle: TextIO | None = None
         self._records: list[ImmutableExecutionLeafRecord] = []
         self._lock = RLock()
         if storage_path is not None and storage_path.exists():
             self._load_from_disk()
+        if segment_log is not None:
+            self._records = segment_log.load()
 
     def _load_from_disk(self) -> None:
         assert self._storage_path is not None
@@ -109,15 +894,7 @@ class ImmutableExecutionLeafStore:
         for line in self._storage_path.read_text(encoding="utf-8").splitlines():
             if not line.strip():
                 continue
-            payload = json.loads(line)
-            leaf = MerkleLeafSchema(**payload["leaf"])
-            record = ImmutableExecutionLeafRecord(
-                leaf=leaf,
-                leaf_hash=str(payload["leaf_hash"]),
-                prev_record_hash=str(payload["prev_record_hash"]),
-                record_hash=str(payload["record_hash"]),
-            )
-            loaded.append(record)
+            loaded.append(_record_from_row(json.loads(line)))
         self._records = loaded
         self.verify_immutable_chain()
 
@@ -126,65 +903,57 @@ class ImmutableExecutionLeafStore:
         with self._lock:
             prev_record_hash = self._records[-1].record_hash if self._records else "GENESIS"
             leaf_hash = leaf.leaf_hash()
-            canonical = json.dumps(
-                {
-                    "leaf": json.loads(leaf.canonical_json()),
-                    "leaf_hash": leaf_hash,
-                    "prev_record_hash": prev_record_hash,
-                },
-                sort_keys=True,
-                separators=(",", ":"),
-                ensure_ascii=True,
-            )
-            record_hash = hashlib.sha256(
-                f"{prev_record_hash}:{canonical}".encode("utf-8")
-            ).hexdigest()
             record = ImmutableExecutionLeafRecord(
                 leaf=leaf,
                 leaf_hash=leaf_hash,
                 prev_record_hash=prev_record_hash,
-                record_hash=record_hash,
+                record_hash=_record_hash(
+                    leaf=leaf,
+                    leaf_hash=leaf_hash,
+                    prev_record_hash=prev_record_hash,
+                ),
             )
-            self._records.append(record)
-            if self._storage_path is not None:
-                self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-                row = {
-                    "leaf": asdict(leaf),
-                    "leaf_hash": leaf_hash,
-                    "prev_record_hash": prev_record_hash,
-                    "record_hash": record_hash,
-                }
-                with self._storage_path.open("a", encoding="utf-8") as handle:
-                    handle.write(
-                        json.dumps(row, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-                        + "\n"
+            if self._segment_log is not None:
+                self._segment_log.append(record)
+            elif self._storage_path is not None:
+                if self._handle is None:
+                    self._storage_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._handle = self._storage_path.open("a", encoding="utf-8")
+                self._handle.write(
+                    json.dumps(
+                        _record_row(record),
+                        sort_keys=True,
+                        separators=(",", ":"),
+                        ensure_ascii=True,
                     )
+                    + "\n"
+                )
+                self._handle.flush()
+            self._records.append(record)
             return record
 
+    def flush(self) -> None:
+        """Force persisted records to durable storage."""
+        with self._lock:
+            if self._segment_log is not None:
+                self._segment_log.sync()
+            elif self._handle is not None:
+                self._handle.flush()
+                os.fsync(self._handle.fileno())
+
+    def close(self) -> None:
+        """Release persistent storage handles."""
+        with self._lock:
+            if self._segment_log is not None:
+                self._segment_log.close()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
     def verify_immutable_chain(self) -> None:
         """Fail when immutable record chain or leaf hash integrity is broken."""
-        prev_hash = "GENESIS"
-        for record in self._records:
-            if record.prev_record_hash != prev_hash:
-                raise MerkleLedgerError("immutable leaf chain mismatch detected")
-            if record.leaf.leaf_hash() != record.leaf_hash:
-                raise MerkleLedgerError("immutable leaf hash mismatch detected")
-            canonical = json.dumps(
-                {
-                    "leaf": json.loads(record.leaf.canonical_json()),
-                    "leaf_hash": record.leaf_hash,
-                    "prev_record_hash": record.prev_record_hash,
-                },
-                sort_keys=True,
-                separators=(",", ":"),
-                ensure_ascii=True,
-            )
-            computed = hashlib.sha256(
-                f"{record.prev_record_hash}:{canonical}".encode("utf-8")
-            ).hexdigest()
-            if computed != record.record_hash:
-                raise MerkleLedgerError("immutable record hash mismatch detected")
-            prev_hash = record.record_hash
+        with self._lock:
+            _verify_record_chain(self._records)
 
     @property
     def records(self) -> list[ImmutableExecutionLeafRecord]:
@@ -192,6 +961,46 @@ class ImmutableExecutionLeafStore:
         with self._lock:
             return list(self._records)
 
+    @property
+    def storage_path(self) -> Path | None:
+        """Return backing storage path when the store is persisted."""
+        return self._storage_path
+
+    @property
+    def segment_log(self) -> SegmentedLeafLog | None:
+        """Return segmented binary log backing the store, if configured."""
+        return self._segment_log
+
+    @property
+    def level_index_dir(self) -> Path | None:
+        """Return default Merkle level index directory beside persisted leaves."""
+        if self._segment_log is not None:
+            return self._segment_log.directory / "levels"
+        if self._storage_path is not None:
+            return self._storage_path.with_name(f"{self._storage_path.name}.levels")
+        return None
+
+    @property
+    def leaf_count(self) -> int:
+        """Return number of persisted records without copying them."""
+        with self._lock:
+            return len(self._records)
+
+    def record_slice(
+        self,
+        *,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> list[ImmutableExecutionLeafRecord]:
+        """Return a copy of a contiguous record range."""
+        with self._lock:
+            return self._records[start:stop]
+
+    def leaf_hashes(self, *, start: int = 0, stop: int | None = None) -> list[str]:
+        """Return leaf hashes for a record slice without copying full records."""
+        with self._lock:
+            return [record.leaf_hash for record in self._records[start:stop]]
+
 
 class AppendOnlyMerkleLedger:
     """Append-only Merkle tree runtime with periodic signed root generation."""
@@ -205,6 +1014,7 @@ class AppendOnlyMerkleLedger:
         growth_rules: DeterministicTreeGrowthRules | None = None,
         root_cadence: RootGenerationCadence | None = None,
         signing_procedure: RootSigningProcedure | None = None,
+        level_index: MerkleLevelIndex | None = None,
     ) -> None:
         self._store = store
         self._signer = signer
@@ -214,6 +1024,34 @@ class AppendOnlyMerkleLedger:
         self._signing_procedure = signing_procedure or RootSigningProcedure()
         self._signed_roots: list[SignedMerkleRoot] = []
         self._lock = RLock()
+        self._frontier = IncrementalMerkleFrontier()
+        if level_index is None:
+            level_index = MerkleLevelIndex(storage_dir=store.level_index_dir)
+        self._levels = level_index
+        if level_index.size > store.leaf_count:
+            level_index.truncate(store.leaf_count)
+        indexed = level_index.size
+        if indexed:
+            if level_index.leaf_hash(indexed) != store.leaf_hashes(
+                start=indexed - 1, stop=indexed
+            )[0]:
+                raise MerkleLedgerError("merkle level index mismatch detected")
+            self._frontier = level_index.frontier()
+        self._sync_frontier()
+
+    def _sync_frontier(self) -> None:
+        """Absorb leaves persisted since the last frontier and level index update."""
+        absorbed = self._frontier.size
+        leaf_count = self._store.leaf_count
+        if leaf_count < absorbed:
+            raise MerkleLedgerError("immutable leaf store shrank below merkle frontier")
+        indexed = self._levels.size
+        start = min(absorbed, indexed)
+        for position, leaf_hash in enumerate(self._store.leaf_hashes(start=start), start=start):
+            if position >= absorbed:
+                self._frontier.append(leaf_hash)
+            if position >= indexed:
+                self._levels.append(leaf_hash)
 
     def append_execution_leaf(
         self,
@@ -233,9 +1071,10 @@ class AppendOnlyMerkleLedger:
     ) -> ImmutableExecutionLeafRecord:
         """Append immutable leaf and trigger periodic root generation."""
         with self._lock:
-            next_index = len(self._store.records) + 1
+            existing_leaf_count = self._store.leaf_count
+            next_index = existing_leaf_count + 1
             self._insertion_order.validate_next_index(
-                existing_leaf_count=len(self._store.records),
+                existing_leaf_count=existing_leaf_count,
                 next_leaf_index=next_index,
             )
             leaf = MerkleLeafSchema(
@@ -254,7 +1093,8 @@ class AppendOnlyMerkleLedger:
                 c2_target=c2_target,
             )
             record = self._store.append(leaf)
-            if self._root_cadence.should_generate_root(leaf_count=len(self._store.records)):
+            self._sync_frontier()
+            if self._root_cadence.should_generate_root(leaf_count=self._frontier.size):
                 self.generate_and_sign_root(
                     generated_at=datetime.now(UTC).isoformat(),
                 )
@@ -262,14 +1102,19 @@ class AppendOnlyMerkleLedger:
 
     def merkle_root(self, *, leaf_count: int | None = None) -> str:
         """Compute deterministic Merkle root over persisted leaf hashes."""
-        leaf_hashes = [record.leaf_hash for record in self._store.records]
-        if leaf_count is not None:
-            if leaf_count < 1 or leaf_count > len(leaf_hashes):
-                raise MerkleLedgerError("leaf_count out of range for merkle_root")
-            leaf_hashes = leaf_hashes[:leaf_count]
-        if not leaf_hashes:
-            raise MerkleLedgerError("cannot compute merkle_root without leaves")
-        return self._compute_root_from_hashes(leaf_hashes)
+        with self._lock:
+            self._sync_frontier()
+            total = self._frontier.size
+            if leaf_count is not None:
+                if leaf_count < 1 or leaf_count > total:
+                    raise MerkleLedgerError("leaf_count out of range for merkle_root")
+                if leaf_count < total:
+                    return self._levels.prefix_root(leaf_count)
+            if total == 0:
+                raise MerkleLedgerError("cannot compute merkle_root without leaves")
+            if self._growth_rules.hash_algorithm != "sha256":
+                raise LedgerModelError("only sha256 tree growth is supported")
+            return self._frontier.root()
 
     def _compute_root_from_hashes(self, leaf_hashes: list[str]) -> str:
         if not leaf_hashes:
@@ -311,8 +1156,10 @@ class AppendOnlyMerkleLedger:
     def generate_and_sign_root(self, *, generated_at: str) -> SignedMerkleRoot:
         """Generate root checkpoint and sign with control-plane authority."""
         with self._lock:
-            leaf_count = len(self._store.records)
             root_hash = self.merkle_root()
+            leaf_count = self._frontier.size
+            self._store.flush()
+            self._levels.flush()
             payload = self._signing_procedure.payload(
                 merkle_root=root_hash,
                 leaf_count=leaf_count,
@@ -379,49 +1226,118 @@ class AppendOnlyMerkleLedger:
         root: SignedMerkleRoot | None = None,
     ) -> InclusionProofStructure:
         """Build inclusion proof for a leaf against a signed ledger root."""
-        records = self._store.records
-        if leaf_index < 1 or leaf_index > len(records):
-            raise MerkleLedgerError("leaf_index out of range for inclusion proof")
-
-        signed_root = root or self._latest_signed_root()
-        leaf_hashes = [record.leaf_hash for record in records[: signed_root.leaf_count]]
-        if leaf_index > len(leaf_hashes):
-            raise MerkleLedgerError("leaf_index exceeds signed root leaf_count")
-
-        levels = self._compute_levels_from_hashes(leaf_hashes)
-        index = leaf_index - 1
-        path: list[InclusionProofNode] = []
-        for level in levels[:-1]:
-            if len(level) % 2 == 1:
-                level = level + [level[-1]]
-            if index % 2 == 0:
-                sibling_idx = index + 1
-                direction = "right"
-            else:
-                sibling_idx = index - 1
-                direction = "left"
-            path.append(
-                InclusionProofNode(
-                    direction=direction,
-                    sibling_hash=level[sibling_idx],
-                )
-            )
-            index //= 2
+        return self.build_inclusion_proofs(leaf_indices=[leaf_index], root=root)[0]
 
-        return InclusionProofStructure(
-            leaf_index=leaf_index,
-            leaf_hash=leaf_hashes[leaf_index - 1],
-            merkle_root=signed_root.root_hash,
-            audit_path=tuple(path),
-            root_signature=signed_root.signature,
-            signature_format=signed_root.signature_format,
-        )
+    def build_inclusion_proofs(
+        self,
+        *,
+        leaf_indices: list[int],
+        root: SignedMerkleRoot | None = None,
+    ) -> list[InclusionProofStructure]:
+        """Build inclusion proofs for many leaves against one signed root in one pass."""
+        with self._lock:
+            self._sync_frontier()
+            leaf_count = self._frontier.size
+            for leaf_index in leaf_indices:
+                if leaf_index < 1 or leaf_index > leaf_count:
+                    raise MerkleLedgerError("leaf_index out of range for inclusion proof")
+
+            signed_root = root or self._latest_signed_root()
+            if signed_root.leaf_count < 1 or signed_root.leaf_count > leaf_count:
+                raise MerkleLedgerError("signed root leaf_count exceeds persisted leaves")
+            paths = self._levels.audit_paths(
+                leaf_indices=leaf_indices,
+                leaf_count=signed_root.leaf_count,
+            )
+            return [
+                InclusionProofStructure(
+                    leaf_index=leaf_index,
+                    leaf_hash=self._levels.leaf_hash(leaf_index),
+                    merkle_root=signed_root.root_hash,
+                    audit_path=path,
+                    root_signature=signed_root.signature,
+                    signature_format=signed_root.signature_format,
+                )
+                for leaf_index, path in zip(leaf_indices, paths)
+            ]
 
     def _latest_signed_root(self) -> SignedMerkleRoot:
         if not self._signed_roots:
             raise MerkleLedgerError("no signed root available for inclusion proof")
         return self._signed_roots[-1]
 
+    def build_consistency_proof(
+        self,
+        *,
+        old_root: SignedMerkleRoot,
+        new_root: SignedMerkleRoot | None = None,
+    ) -> ConsistencyProofStructure:
+        """Build proof that a later signed root extends an earlier signed root."""
+        with self._lock:
+            self._sync_frontier()
+            target = new_root or self._latest_signed_root()
+            if target.leaf_count > self._frontier.size:
+                raise MerkleLedgerError("signed root leaf_count exceeds persisted leaves")
+            old_frontier, proof_hashes = self._levels.consistency_proof(
+                old_leaf_count=old_root.leaf_count,
+                new_leaf_count=target.leaf_count,
+            )
+            return ConsistencyProofStructure(
+                old_leaf_count=old_root.leaf_count,
+                new_leaf_count=target.leaf_count,
+                old_root=old_root.root_hash,
+                new_root=target.root_hash,
+                old_frontier=old_frontier,
+                proof_hashes=proof_hashes,
+            )
+
+    def export_incremental_snapshot(
+        self,
+        *,
+        output_path: Path,
+        since_root: SignedMerkleRoot,
+        new_root: SignedMerkleRoot | None = None,
+    ) -> Path:
+        """Export only leaves appended after ``since_root`` plus a consistency proof."""
+        with self._lock:
+            target = new_root or self._latest_signed_root()
+            proof = self.build_consistency_proof(old_root=since_root, new_root=target)
+            base_record_hash = (
+                self._store.record_slice(
+                    start=since_root.leaf_count - 1,
+                    stop=since_root.leaf_count,
+                )[0].record_hash
+            )
+            snapshot = {
+                "schema": "spectrastrike.merkle-ledger.snapshot.incremental.v1",
+                "growth_rules": {
+                    "hash_algorithm": self._growth_rules.hash_algorithm,
+                    "pairing_order": self._growth_rules.pairing_order,
+                    "odd_leaf_strategy": self._growth_rules.odd_leaf_strategy,
+                },
+                "base_root": _signed_root_row(since_root),
+                "base_record_hash": base_record_hash,
+                "consistency_proof": asdict(proof),
+                "records": [
+                    _record_row(record)
+                    for record in self._store.record_slice(
+                        start=since_root.leaf_count,
+                        stop=target.leaf_count,
+                    )
+                ],
+                "signed_roots": [
+                    _signed_root_row(root)
+                    for root in self._signed_roots
+                    if since_root.leaf_count < root.leaf_count <= target.leaf_count
+                ],
+            }
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(
+            json.dumps(snapshot, sort_keys=True, separators=(",", ":"), ensure_ascii=True),
+            encoding="utf-8",
+        )
+        return output_path
+
     def export_snapshot(self, *, output_path: Path) -> Path:
         """Export deterministic ledger snapshot for verifier nodes."""
         snapshot = {
@@ -431,26 +1347,8 @@ class AppendOnlyMerkleLedger:
                 "pairing_order": self._growth_rules.pairing_order,
                 "odd_leaf_strategy": self._growth_rules.odd_leaf_strategy,
             },
-            "records": [
-                {
-                    "leaf": asdict(record.leaf),
-                    "leaf_hash": record.leaf_hash,
-                    "prev_record_hash": record.prev_record_hash,
-                    "record_hash": record.record_hash,
-                }
-                for record in self._store.records
-            ],
-            "signed_roots": [
-                {
-                    "root_hash": root.root_hash,
-                    "leaf_count": root.leaf_count,
-                    "generated_at": root.generated_at,
-                    "signature": root.signature,
-                    "authority": root.authority,
-                    "signature_format": root.signature_format,
-                }
-                for root in self._signed_roots
-            ],
+            "records": [_record_row(record) for record in self._store.records],
+            "signed_roots": [_signed_root_row(root) for root in self._signed_roots],
         }
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(
@@ -461,11 +1359,9 @@ class AppendOnlyMerkleLedger:
 
     def deterministic_rebuild_root(self, *, leaf_count: int) -> str:
         """Rebuild root deterministically from persisted immutable leaves."""
-        records = self._store.records
-        if leaf_count < 1 or leaf_count > len(records):
+        if leaf_count < 1 or leaf_count > self._store.leaf_count:
             raise MerkleLedgerError("leaf_count out of range for deterministic rebuild")
-        leaf_hashes = [record.leaf_hash for record in records[:leaf_count]]
-        return self._compute_root_from_hashes(leaf_hashes)
+        return self._compute_root_from_hashes(self._store.leaf_hashes(stop=leaf_count))
 
     @property
     def signed_roots(self) -> list[SignedMerkleRoot]:
@@ -474,8 +1370,119 @@ class AppendOnlyMerkleLedger:
             return list(self._signed_roots)
 
 
+_SNAPSHOT_CHUNK_RECORDS = 4096
+_SNAPSHOT_READ_SIZE = 1 << 16
+_STREAMED_SNAPSHOT_ARRAYS = frozenset({"records", "signed_roots"})
+
+
+def _verify_record_slice(
+    records: list[ImmutableExecutionLeafRecord],
+) -> tuple[bool, str, str, list[str]]:
+    """Verify a contiguous record slice as (valid, first prev, last hash, leaf hashes)."""
+    first_prev = records[0].prev_record_hash
+    leaf_hashes = [record.leaf_hash for record in records]
+    try:
+        last_hash = _verify_record_chain(records, prev_hash=first_prev)
+    except MerkleLedgerError:
+        return False, first_prev, records[-1].record_hash, leaf_hashes
+    return True, first_prev, last_hash, leaf_hashes
+
+
+def _verify_snapshot_chunk(rows: list[dict[str, object]]) -> tuple[bool, str, str, list[str]]:
+    return _verify_record_slice([_record_from_row(row) for row in rows])
+
+
+class _SnapshotStreamReader:
+    """Incremental reader yielding top-level snapshot entries without full load.
+
+    Entries of the ``records`` and ``signed_roots`` arrays are yielded one at a
+    time so only a bounded read buffer is held in memory.
+    """
+
+    def __init__(self, handle: TextIO, *, read_size: int = _SNAPSHOT_READ_SIZE) -> None:
+        self._handle = handle
+        self._read_size = read_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._handle.read(self._read_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise MerkleLedgerError("unexpected end of ledger snapshot")
+
+    def _expect(self, token: str) -> None:
+        if self._peek() != token:
+            raise MerkleLedgerError("malformed ledger snapshot")
+        self._pos += 1
+
+    def _consume_if(self, token: str) -> bool:
+        if self._peek() == token:
+            self._pos += 1
+            return True
+        return False
+
+    def _value(self) -> object:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if not self._fill():
+                    raise MerkleLedgerError("malformed ledger snapshot") from exc
+                continue
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def entries(self) -> Iterator[tuple[str, object]]:
+        """Yield (key, value) pairs, expanding streamed arrays element-wise."""
+        self._expect("{")
+        if self._consume_if("}"):
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise MerkleLedgerError("malformed ledger snapshot")
+            self._expect(":")
+            if key in _STREAMED_SNAPSHOT_ARRAYS:
+                self._expect("[")
+                if not self._consume_if("]"):
+                    while True:
+                        yield key, self._value()
+                        if self._consume_if("]"):
+                            break
+                        self._expect(",")
+            else:
+                yield key, self._value()
+            if self._consume_if("}"):
+                return
+            self._expect(",")
+
+
 class ReadOnlyMerkleVerifierNode:
-    """Read-only verifier node that validates exported ledger snapshots."""
+    """Read-only verifier node that validates exported ledger snapshots.
+
+    Records are verified in chunks and reduced to a Merkle level index, so every
+    signed root is checked against a prefix root in one pass over the leaves.
+    """
 
     def __init__(
         self,
@@ -483,12 +1490,28 @@ class ReadOnlyMerkleVerifierNode:
         records: list[ImmutableExecutionLeafRecord],
         signed_roots: list[SignedMerkleRoot],
         signer: RootSigningAuthority,
+        level_index: MerkleLevelIndex | None = None,
     ) -> None:
-        self._records = list(records)
         self._signed_roots = list(signed_roots)
         self._signer = signer
         self._growth_rules = DeterministicTreeGrowthRules()
         self._signing_procedure = RootSigningProcedure()
+        self._levels = level_index or MerkleLevelIndex()
+        self._chain_valid = True
+        self._last_record_hash = "GENESIS"
+        for start in range(0, len(records), _SNAPSHOT_CHUNK_RECORDS):
+            self._absorb_chunk(
+                _verify_record_slice(records[start : start + _SNAPSHOT_CHUNK_RECORDS])
+            )
+
+    def _absorb_chunk(self, result: tuple[bool, str, str, list[str]]) -> None:
+        """Stitch a verified chunk onto the chain and index its leaf hashes."""
+        valid, first_prev, last_hash, leaf_hashes = result
+        if not valid or first_prev != self._last_record_hash:
+            self._chain_valid = False
+        self._last_record_hash = last_hash
+        for leaf_hash in leaf_hashes:
+            self._levels.append(leaf_hash)
 
     @classmethod
     def from_snapshot_file(
@@ -496,53 +1519,207 @@ class ReadOnlyMerkleVerifierNode:
         *,
         snapshot_path: Path,
         signer: RootSigningAuthority,
+        max_workers: int | None = None,
+        index_dir: Path | None = None,
+        chunk_records: int = _SNAPSHOT_CHUNK_RECORDS,
     ) -> ReadOnlyMerkleVerifierNode:
-        payload = json.loads(snapshot_path.read_text(encoding="utf-8"))
-        records = [
-            ImmutableExecutionLeafRecord(
-                leaf=MerkleLeafSchema(**entry["leaf"]),
-                leaf_hash=str(entry["leaf_hash"]),
-                prev_record_hash=str(entry["prev_record_hash"]),
-                record_hash=str(entry["record_hash"]),
-            )
-            for entry in payload.get("records", [])
-        ]
-        roots = [
-            SignedMerkleRoot(
-                root_hash=str(entry["root_hash"]),
-                leaf_count=int(entry["leaf_count"]),
-                generated_at=str(entry["generated_at"]),
-                signature=str(entry["signature"]),
-                authority=str(entry["authority"]),
-                signature_format=str(entry["signature_format"]),
-            )
-            for entry in payload.get("signed_roots", [])
-        ]
-        return cls(records=records, signed_roots=roots, signer=signer)
+        """Stream snapshot records through a process pool in bounded chunks.
+
+        ``max_workers=1`` verifies in-process. ``index_dir`` spills the leaf
+        level index to mmap-backed files so memory stays bounded for large
+        snapshots; any index already present in ``index_dir`` is discarded
+        so every load rebuilds the levels from the snapshot alone.
+        """
+        if chunk_records < 1:
+            raise MerkleLedgerError("chunk_records must be >= 1")
+        level_index = MerkleLevelIndex(storage_dir=index_dir)
+        level_index.truncate(0)
+        node = cls(
+            records=[],
+            signed_roots=[],
+            signer=signer,
+            level_index=level_index,
+        )
+        workers = max_workers or os.cpu_count() or 1
+        pool: ProcessPoolExecutor | None = None
+        pending: deque[Future[tuple[bool, str, str, list[str]]]] = deque()
+        chunk: list[dict[str, object]] = []
+        try:
+            with snapshot_path.open("r", encoding="utf-8") as handle:
+                for key, value in _SnapshotStreamReader(handle).entries():
+                    if not isinstance(value, dict):
+                        continue
+                    if key == "signed_roots":
+                        node._signed_roots.append(_signed_root_from_row(value))
+                        continue
+                    if key != "records":
+                        continue
+                    chunk.append(value)
+                    if len(chunk) < chunk_records:
+                        continue
+                    if workers > 1:
+                        if pool is None:
+                            pool = ProcessPoolExecutor(max_workers=workers)
+                        pending.append(pool.submit(_verify_snapshot_chunk, chunk))
+                        while len(pending) > workers * 2:
+                            node._absorb_chunk(pending.popleft().result())
+                    else:
+                        node._absorb_chunk(_verify_snapshot_chunk(chunk))
+                    chunk = []
+            while pending:
+                node._absorb_chunk(pending.popleft().result())
+            if chunk:
+                node._absorb_chunk(_verify_snapshot_chunk(chunk))
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+        node._levels.flush()
+        return node
+
+    @property
+    def leaf_count(self) -> int:
+        """Return number of verified snapshot leaves."""
+        return self._levels.size
 
     def deterministic_rebuild_root(self, *, leaf_count: int) -> str:
-        if leaf_count < 1 or leaf_count > len(self._records):
+        if leaf_count < 1 or leaf_count > self._levels.size:
             raise MerkleLedgerError("leaf_count out of range for deterministic rebuild")
-        return self._compute_root([record.leaf_hash for record in self._records[:leaf_count]])
-
-    def _compute_root(self, leaf_hashes: list[str]) -> str:
-        if not leaf_hashes:
-            raise MerkleLedgerError("cannot compute merkle_root without leaves")
-        level = list(leaf_hashes)
-        while len(level) > 1:
-            if len(level) % 2 == 1:
-                level.append(level[-1])
-            next_level: list[str] = []
-            for i in range(0, len(level), 2):
-                next_level.append(hashlib.sha256(f"{level[i]}:{level[i+1]}".encode("utf-8")).hexdigest())
-            level = next_level
-        return level[0]
+        return self._levels.prefix_root(leaf_count)
 
     def verify_signed_root(self, root: SignedMerkleRoot) -> bool:
         if not self.verify_immutable_chain():
             return False
         rebuilt = self.deterministic_rebuild_root(leaf_count=root.leaf_count)
-        if rebuilt != root.root_hash:
+        return self._verify_root_signature(root, expected_root=rebuilt)
+
+    def verify_consistency_proof(
+        self,
+        *,
+        trusted_root: SignedMerkleRoot,
+        new_root: SignedMerkleRoot,
+        proof: ConsistencyProofStructure,
+    ) -> bool:
+        """Accept ``new_root`` as an extension of ``trusted_root`` in O(log n) hashes."""
+        if (
+            proof.old_leaf_count != trusted_root.leaf_count
+            or proof.old_root != trusted_root.root_hash
+            or proof.new_leaf_count != new_root.leaf_count
+            or proof.new_root != new_root.root_hash
+        ):
+            return False
+        payload = self._signing_procedure.payload(
+            merkle_root=new_root.root_hash,
+            leaf_count=new_root.leaf_count,
+            generated_at=new_root.generated_at,
+        )
+        if not self._signer.verify_payload(payload.encode("utf-8"), new_root.signature):
+            return False
+        proof_hashes = iter(proof.proof_hashes)
+
+        def new_node(height: int, index: int) -> str:
+            del height, index
+            node = next(proof_hashes, None)
+            if node is None:
+                raise MerkleLedgerError("consistency proof is truncated")
+            return node
+
+        try:
+            old_root = IncrementalMerkleFrontier.restore(
+                size=proof.old_leaf_count,
+                nodes=_frontier_nodes(proof.old_leaf_count, proof.old_frontier),
+            ).root()
+            rebuilt = _consistency_root(
+                old_leaf_count=proof.old_leaf_count,
+                new_leaf_count=proof.new_leaf_count,
+                old_frontier=proof.old_frontier,
+                new_node=new_node,
+            )
+        except MerkleLedgerError:
+            return False
+        if next(proof_hashes, None) is not None:
+            return False
+        return old_root == trusted_root.root_hash and rebuilt == new_root.root_hash
+
+    def apply_incremental_snapshot(self, *, snapshot_path: Path) -> bool:
+        """Verify and absorb an incremental snapshot extending the latest leaves.
+
+        New leaves are checked against every new signed root through the proof's
+        old frontier before any state changes, so a rejected snapshot leaves the
+        node untouched.
+        """
+        header: dict[str, object] = {}
+        roots: list[SignedMerkleRoot] = []
+        results: list[tuple[bool, str, str, list[str]]] = []
+        chunk: list[dict[str, object]] = []
+        with snapshot_path.open("r", encoding="utf-8") as handle:
+            for key, value in _SnapshotStreamReader(handle).entries():
+                if key == "records" and isinstance(value, dict):
+                    chunk.append(value)
+                    if len(chunk) >= _SNAPSHOT_CHUNK_RECORDS:
+                        results.append(_verify_snapshot_chunk(chunk))
+                        chunk = []
+                elif key == "signed_roots" and isinstance(value, dict):
+                    roots.append(_signed_root_from_row(value))
+                else:
+                    header[key] = value
+        if chunk:
+            results.append(_verify_snapshot_chunk(chunk))
+
+        base_row = header.get("base_root")
+        proof_row = header.get("consistency_proof")
+        if not isinstance(base_row, dict) or not isinstance(proof_row, dict):
+            raise MerkleLedgerError("incremental snapshot is missing base root or proof")
+        base = _signed_root_from_row(base_row)
+        proof = ConsistencyProofStructure(
+            old_leaf_count=int(proof_row["old_leaf_count"]),
+            new_leaf_count=int(proof_row["new_leaf_count"]),
+            old_root=str(proof_row["old_root"]),
+            new_root=str(proof_row["new_root"]),
+            old_frontier=tuple(str(node) for node in proof_row["old_frontier"]),
+            proof_hashes=tuple(str(node) for node in proof_row["proof_hashes"]),
+        )
+        if not self._chain_valid or base.leaf_count != self.leaf_count:
+            return False
+        if self.deterministic_rebuild_root(leaf_count=base.leaf_count) != base.root_hash:
+            return False
+        if header.get("base_record_hash") != self._last_record_hash:
+            return False
+        targets = [root for root in roots if root.leaf_count == proof.new_leaf_count]
+        if not targets or not self.verify_consistency_proof(
+            trusted_root=base,
+            new_root=targets[-1],
+            proof=proof,
+        ):
+            return False
+
+        prev_hash = self._last_record_hash
+        frontier = IncrementalMerkleFrontier.restore(
+            size=base.leaf_count,
+            nodes=_frontier_nodes(base.leaf_count, proof.old_frontier),
+        )
+        expected_roots = {root.leaf_count: root for root in roots}
+        for valid, first_prev, last_hash, leaf_hashes in results:
+            if not valid or first_prev != prev_hash:
+                return False
+            prev_hash = last_hash
+            for leaf_hash in leaf_hashes:
+                frontier.append(leaf_hash)
+                root = expected_roots.pop(frontier.size, None)
+                if root is not None and not self._verify_root_signature(
+                    root, expected_root=frontier.root()
+                ):
+                    return False
+        if frontier.size != proof.new_leaf_count or expected_roots:
+            return False
+
+        for result in results:
+            self._absorb_chunk(result)
+        self._signed_roots.extend(roots)
+        self._levels.flush()
+        return True
+
+    def _verify_root_signature(self, root: SignedMerkleRoot, *, expected_root: str) -> bool:
+        if expected_root != root.root_hash:
             return False
         payload = self._signing_procedure.payload(
             merkle_root=root.root_hash,
@@ -552,30 +1729,8 @@ class ReadOnlyMerkleVerifierNode:
         return self._signer.verify_payload(payload.encode("utf-8"), root.signature)
 
     def verify_immutable_chain(self) -> bool:
-        """Verify immutable leaf and record hash chain deterministically."""
-        prev_hash = "GENESIS"
-        for record in self._records:
-            if record.prev_record_hash != prev_hash:
-                return False
-            if record.leaf.leaf_hash() != record.leaf_hash:
-                return False
-            canonical = json.dumps(
-                {
-                    "leaf": json.loads(record.leaf.canonical_json()),
-                    "leaf_hash": record.leaf_hash,
-                    "prev_record_hash": record.prev_record_hash,
-                },
-                sort_keys=True,
-                separators=(",", ":"),
-                ensure_ascii=True,
-            )
-            computed = hashlib.sha256(
-                f"{record.prev_record_hash}:{canonical}".encode("utf-8")
-            ).hexdigest()
-            if computed != record.record_hash:
-                return False
-            prev_hash = record.record_hash
-        return True
+        """Return chain verdict computed while records were absorbed."""
+        return self._chain_valid
 
     def validate_db_tampering_detection(self) -> bool:
         """Return True when any signed root mismatches deterministic rebuild."""
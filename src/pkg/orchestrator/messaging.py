@@ -20,11 +20,14 @@ import asyncio
 import json
 import os
 import ssl
+from abc import ABC, abstractmethod
 from collections import defaultdict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, replace
 from enum import Enum
-from threading import Lock
-from typing import Protocol
+from threading import Condition, Lock
+from typing import Any, Protocol
 
 try:
     import pika
@@ -156,6 +159,11 @@ class TelemetryPublisher(Protocol):
     async def publish(self, envelope: BrokerEnvelope) -> PublishAttemptResult:
         """Publish one envelope using broker delivery policy."""
 
+    async def publish_many(
+        self, envelopes: list[BrokerEnvelope]
+    ) -> list[PublishAttemptResult]:
+        """Publish envelopes in order as one batch, returning per-envelope results."""
+
 
 class InMemoryRabbitBroker:
     """In-memory RabbitMQ-style broker for deterministic local/integration tests."""
@@ -183,10 +191,22 @@ class InMemoryRabbitBroker:
             for queue in queues:
                 self._queues[queue].append(envelope)
 
+    def publish_many(
+        self, exchange: str, routing_key: str, envelopes: list[BrokerEnvelope]
+    ) -> None:
+        with self._lock:
+            queues = self._bindings.get((exchange, routing_key), [])
+            for queue in queues:
+                self._queues[queue].extend(envelopes)
+
     def push(self, queue: str, envelope: BrokerEnvelope) -> None:
         with self._lock:
             self._queues[queue].append(envelope)
 
+    def push_many(self, queue: str, envelopes: list[BrokerEnvelope]) -> None:
+        with self._lock:
+            self._queues[queue].extend(envelopes)
+
     def consume(self, queue: str, limit: int | None = None) -> list[BrokerEnvelope]:
         with self._lock:
             out: list[BrokerEnvelope] = []
@@ -217,6 +237,10 @@ class InMemoryKafkaBroker:
         with self._lock:
             self._topics[topic].append(envelope)
 
+    def publish_many(self, topic: str, envelopes: list[BrokerEnvelope]) -> None:
+        with self._lock:
+            self._topics[topic].extend(envelopes)
+
     def consume(self, topic: str, limit: int | None = None) -> list[BrokerEnvelope]:
         with self._lock:
             out: list[BrokerEnvelope] = []
@@ -232,49 +256,80 @@ class InMemoryKafkaBroker:
             return len(self._topics[topic])
 
 
-class RabbitMQTelemetryPublisher:
-    """RabbitMQ-first telemetry publisher with retry, DLQ, and idempotency."""
+class _InMemoryBatchPublisher(ABC):
+    """Shared retry, DLQ, idempotency and ordering policy for in-memory adapters.
+
+    Idempotency keys and stream positions are committed only after the batch
+    has been delivered, so a batch retried after a broker failure is neither
+    deduplicated nor rejected as out of order.
+    """
 
     def __init__(
         self,
-        broker: InMemoryRabbitBroker,
-        routing: RabbitRoutingModel | None = None,
         max_retries: int = 3,
         transient_failures: dict[str, int] | None = None,
     ) -> None:
         if max_retries < 0:
             raise ValueError("max_retries must be greater than or equal to zero")
 
-        self._broker = broker
-        self._routing = routing or RabbitRoutingModel()
         self._max_retries = max_retries
         self._transient_failures = transient_failures or {}
         self._seen_keys: set[str] = set()
         self._last_stream_position: dict[str, int] = {}
 
-        self._broker.declare_queue(self._routing.queue)
-        self._broker.declare_queue(self._routing.dead_letter_queue)
-        self._broker.bind_queue(
-            exchange=self._routing.exchange,
-            routing_key=self._routing.routing_key,
-            queue=self._routing.queue,
-        )
-
     async def publish(self, envelope: BrokerEnvelope) -> PublishAttemptResult:
+        return self._publish_batch([envelope])[0]
+
+    async def publish_many(
+        self, envelopes: list[BrokerEnvelope]
+    ) -> list[PublishAttemptResult]:
+        return self._publish_batch(envelopes)
+
+    def _publish_batch(
+        self, envelopes: list[BrokerEnvelope]
+    ) -> list[PublishAttemptResult]:
+        results: list[PublishAttemptResult] = []
+        delivered: list[BrokerEnvelope] = []
+        dead_lettered: list[BrokerEnvelope] = []
+        published_keys: set[str] = set()
+        positions: dict[str, int] = {}
+        for envelope in envelopes:
+            result, attempt_envelope = self._resolve(envelope, published_keys, positions)
+            results.append(result)
+            if result.status is PublishStatus.PUBLISHED:
+                delivered.append(attempt_envelope)
+            elif result.status is PublishStatus.DEAD_LETTERED:
+                dead_lettered.append(attempt_envelope)
+        if delivered:
+            self._deliver(delivered)
+        self._seen_keys.update(published_keys)
+        self._last_stream_position.update(positions)
+        if dead_lettered:
+            self._dead_letter(dead_lettered)
+        return results
+
+    def _resolve(
+        self,
+        envelope: BrokerEnvelope,
+        published_keys: set[str],
+        positions: dict[str, int],
+    ) -> tuple[PublishAttemptResult, BrokerEnvelope]:
         key = envelope.idempotency_key
-        if key in self._seen_keys:
-            return PublishAttemptResult(status=PublishStatus.DEDUPLICATED, attempts=0)
-        order_violation = self._ordered_violation(envelope)
+        if key in self._seen_keys or key in published_keys:
+            return (
+                PublishAttemptResult(status=PublishStatus.DEDUPLICATED, attempts=0),
+                envelope,
+            )
+        order_violation = self._ordered_violation(envelope, positions)
         if order_violation is not None:
-            self._broker.push(
-                self._routing.dead_letter_queue,
+            return (
+                PublishAttemptResult(
+                    status=PublishStatus.DEAD_LETTERED,
+                    attempts=1,
+                    error=order_violation,
+                ),
                 replace(envelope, attempt=1),
             )
-            return PublishAttemptResult(
-                status=PublishStatus.DEAD_LETTERED,
-                attempts=1,
-                error=order_violation,
-            )
 
         attempts = 0
         while attempts <= self._max_retries:
@@ -284,38 +339,38 @@ class RabbitMQTelemetryPublisher:
                     self._transient_failures[key] -= 1
                     raise RuntimeError("simulated transient broker failure")
 
-                self._broker.publish(
-                    exchange=self._routing.exchange,
-                    routing_key=self._routing.routing_key,
-                    envelope=replace(envelope, attempt=attempts),
-                )
-                self._seen_keys.add(key)
+                published_keys.add(key)
                 if envelope.ordering_key:
-                    self._last_stream_position[envelope.ordering_key] = (
-                        envelope.stream_position
-                    )
-                return PublishAttemptResult(
-                    status=PublishStatus.PUBLISHED,
-                    attempts=attempts,
+                    positions[envelope.ordering_key] = envelope.stream_position
+                return (
+                    PublishAttemptResult(
+                        status=PublishStatus.PUBLISHED,
+                        attempts=attempts,
+                    ),
+                    replace(envelope, attempt=attempts),
                 )
             except RuntimeError as exc:
                 if attempts > self._max_retries:
-                    self._broker.push(
-                        self._routing.dead_letter_queue,
+                    return (
+                        PublishAttemptResult(
+                            status=PublishStatus.DEAD_LETTERED,
+                            attempts=attempts,
+                            error=str(exc),
+                        ),
                         replace(envelope, attempt=attempts),
                     )
-                    return PublishAttemptResult(
-                        status=PublishStatus.DEAD_LETTERED,
-                        attempts=attempts,
-                        error=str(exc),
-                    )
 
         raise RuntimeError("unreachable publish state")
 
-    def _ordered_violation(self, envelope: BrokerEnvelope) -> str | None:
+    def _ordered_violation(
+        self, envelope: BrokerEnvelope, positions: dict[str, int]
+    ) -> str | None:
         if not envelope.ordering_key or envelope.stream_position <= 0:
             return None
-        last_position = self._last_stream_position.get(envelope.ordering_key, 0)
+        last_position = positions.get(
+            envelope.ordering_key,
+            self._last_stream_position.get(envelope.ordering_key, 0),
+        )
         if envelope.stream_position <= last_position:
             return (
                 f"out-of-order stream_position for key={envelope.ordering_key} "
@@ -323,8 +378,49 @@ class RabbitMQTelemetryPublisher:
             )
         return None
 
+    @abstractmethod
+    def _deliver(self, envelopes: list[BrokerEnvelope]) -> None:
+        """Write published envelopes to the broker in one call."""
+
+    @abstractmethod
+    def _dead_letter(self, envelopes: list[BrokerEnvelope]) -> None:
+        """Write dead-lettered envelopes to the DLQ in one call."""
+
+
+class RabbitMQTelemetryPublisher(_InMemoryBatchPublisher):
+    """RabbitMQ-first telemetry publisher with retry, DLQ, and idempotency."""
+
+    def __init__(
+        self,
+        broker: InMemoryRabbitBroker,
+        routing: RabbitRoutingModel | None = None,
+        max_retries: int = 3,
+        transient_failures: dict[str, int] | None = None,
+    ) -> None:
+        super().__init__(max_retries=max_retries, transient_failures=transient_failures)
+        self._broker = broker
+        self._routing = routing or RabbitRoutingModel()
+
+        self._broker.declare_queue(self._routing.queue)
+        self._broker.declare_queue(self._routing.dead_letter_queue)
+        self._broker.bind_queue(
+            exchange=self._routing.exchange,
+            routing_key=self._routing.routing_key,
+            queue=self._routing.queue,
+        )
+
+    def _deliver(self, envelopes: list[BrokerEnvelope]) -> None:
+        self._broker.publish_many(
+            exchange=self._routing.exchange,
+            routing_key=self._routing.routing_key,
+            envelopes=envelopes,
+        )
+
+    def _dead_letter(self, envelopes: list[BrokerEnvelope]) -> None:
+        self._broker.push_many(self._routing.dead_letter_queue, envelopes)
+
 
-class KafkaTelemetryPublisher:
+class KafkaTelemetryPublisher(_InMemoryBatchPublisher):
     """Kafka-compatible telemetry publisher with retry, DLQ, and idempotency."""
 
     def __init__(
@@ -334,80 +430,114 @@ class KafkaTelemetryPublisher:
         max_retries: int = 3,
         transient_failures: dict[str, int] | None = None,
     ) -> None:
-        if max_retries < 0:
-            raise ValueError("max_retries must be greater than or equal to zero")
-
+        super().__init__(max_retries=max_retries, transient_failures=transient_failures)
         self._broker = broker
         self._routing = routing or KafkaRoutingModel()
-        self._max_retries = max_retries
-        self._transient_failures = transient_failures or {}
-        self._seen_keys: set[str] = set()
-        self._last_stream_position: dict[str, int] = {}
 
         self._broker.declare_topic(self._routing.topic)
         self._broker.declare_topic(self._routing.dead_letter_topic)
 
-    async def publish(self, envelope: BrokerEnvelope) -> PublishAttemptResult:
-        key = envelope.idempotency_key
-        if key in self._seen_keys:
-            return PublishAttemptResult(status=PublishStatus.DEDUPLICATED, attempts=0)
-        order_violation = self._ordered_violation(envelope)
-        if order_violation is not None:
-            self._broker.publish(
-                self._routing.dead_letter_topic,
-                replace(envelope, attempt=1),
-            )
-            return PublishAttemptResult(
-                status=PublishStatus.DEAD_LETTERED,
-                attempts=1,
-                error=order_violation,
-            )
+    def _deliver(self, envelopes: list[BrokerEnvelope]) -> None:
+        self._broker.publish_many(self._routing.topic, envelopes)
 
-        attempts = 0
-        while attempts <= self._max_retries:
-            attempts += 1
-            try:
-                if self._transient_failures.get(key, 0) > 0:
-                    self._transient_failures[key] -= 1
-                    raise RuntimeError("simulated transient broker failure")
+    def _dead_letter(self, envelopes: list[BrokerEnvelope]) -> None:
+        self._broker.publish_many(self._routing.dead_letter_topic, envelopes)
 
-                self._broker.publish(
-                    self._routing.topic,
-                    replace(envelope, attempt=attempts),
-                )
-                self._seen_keys.add(key)
-                if envelope.ordering_key:
-                    self._last_stream_position[envelope.ordering_key] = (
-                        envelope.stream_position
-                    )
-                return PublishAttemptResult(
-                    status=PublishStatus.PUBLISHED,
-                    attempts=attempts,
-                )
-            except RuntimeError as exc:
-                if attempts > self._max_retries:
-                    self._broker.publish(
-                        self._routing.dead_letter_topic,
-                        replace(envelope, attempt=attempts),
-                    )
-                    return PublishAttemptResult(
-                        status=PublishStatus.DEAD_LETTERED,
-                        attempts=attempts,
-                        error=str(exc),
-                    )
 
-        raise RuntimeError("unreachable publish state")
+class PikaChannelPool:
+    """Bounded pool of long-lived confirm-mode pika channels.
 
-    def _ordered_violation(self, envelope: BrokerEnvelope) -> str | None:
-        if not envelope.ordering_key or envelope.stream_position <= 0:
-            return None
-        last_position = self._last_stream_position.get(envelope.ordering_key, 0)
-        if envelope.stream_position <= last_position:
-            return (
-                f"out-of-order stream_position for key={envelope.ordering_key} "
-                f"(last={last_position}, received={envelope.stream_position})"
-            )
-        return None
+    Blocking pika connections are not thread-safe, so each pooled connection is
+    checked out by one worker thread at a time. Broken connections are dropped
+    and transparently replaced on the next checkout. At capacity, checkouts
+    wait on a condition that returning or discarding a connection notifies.
+    """
+
+    def __init__(
+        self,
+        connect: Any,
+        max_size: int = 4,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than zero")
+        self._connect = connect
+        self._max_size = max_size
+        self._idle: list[tuple[Any, Any]] = []
+        self._created = 0
+        self._available = Condition(Lock())
+        self.connections_opened = 0
+        self.checkouts = 0
+
+    @contextmanager
+    def channel(self) -> Iterator[Any]:
+        """Check out a confirm-mode channel, discarding it if the caller fails."""
+        connection, channel = self._checkout()
+        try:
+            yield channel
+        except BaseException:
+            self._discard(connection)
+            raise
+        else:
+            with self._available:
+                self._idle.append((connection, channel))
+                self._available.notify()
+
+    def _checkout(self) -> tuple[Any, Any]:
+        stale: list[Any] = []
+        try:
+            with self._available:
+                while True:
+                    while self._idle:
+                        connection, channel = self._idle.pop()
+                        if getattr(connection, "is_open", True) and getattr(
+                            channel, "is_open", True
+                        ):
+                            self.checkouts += 1
+                            return connection, channel
+                        self._created -= 1
+                        stale.append(connection)
+                    if self._created < self._max_size:
+                        self._created += 1
+                        break
+                    self._available.wait()
+        finally:
+            for connection in stale:
+                self._close(connection)
+        try:
+            connection = self._connect()
+            channel = connection.channel()
+            channel.confirm_delivery()
+        except BaseException:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self.connections_opened += 1
+            self.checkouts += 1
+        return connection, channel
+
+    def _discard(self, connection: Any) -> None:
+        with self._available:
+            self._created -= 1
+            self._available.notify()
+        self._close(connection)
+
+    @staticmethod
+    def _close(connection: Any) -> None:
+        try:
+            connection.close()
+        except Exception:  # pragma: no cover - best effort teardown
+            pass
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        with self._available:
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._available.notify_all()
+        for connection, _ in idle:
+            self._close(connection)
 
 
 class PikaRabbitMQTelemetryPublisher:
@@ -418,6 +548,7 @@ class PikaRabbitMQTelemetryPublisher:
         connection: RabbitMQConnectionConfig | None = None,
         routing: RabbitRoutingModel | None = None,
         max_retries: int = 3,
+        pool_size: int = 4,
     ) -> None:
         if pika is None:
             raise RuntimeError(
@@ -429,42 +560,82 @@ class PikaRabbitMQTelemetryPublisher:
         self._routing = routing or RabbitRoutingModel()
         self._max_retries = max_retries
         self._seen_keys: set[str] = set()
+        self._pool = PikaChannelPool(self._open_connection, max_size=pool_size)
         self._declare_topology()
 
+    @property
+    def pool(self) -> PikaChannelPool:
+        """Return long-lived channel pool used for publishing."""
+        return self._pool
+
     async def publish(self, envelope: BrokerEnvelope) -> PublishAttemptResult:
-        key = envelope.idempotency_key
-        if key in self._seen_keys:
-            return PublishAttemptResult(status=PublishStatus.DEDUPLICATED, attempts=0)
+        return (await self.publish_many([envelope]))[0]
+
+    async def publish_many(
+        self, envelopes: list[BrokerEnvelope]
+    ) -> list[PublishAttemptResult]:
+        results: list[PublishAttemptResult | None] = [None] * len(envelopes)
+        pending: list[int] = []
+        first_copy: dict[str, int] = {}
+        duplicates: list[tuple[int, int]] = []
+        for index, envelope in enumerate(envelopes):
+            key = envelope.idempotency_key
+            if key in self._seen_keys:
+                results[index] = PublishAttemptResult(
+                    status=PublishStatus.DEDUPLICATED, attempts=0
+                )
+            elif key in first_copy:
+                duplicates.append((index, first_copy[key]))
+            else:
+                first_copy[key] = index
+                pending.append(index)
 
         attempts = 0
-        while attempts <= self._max_retries:
+        error: str | None = None
+        while pending and attempts <= self._max_retries:
             attempts += 1
-            try:
-                await asyncio.to_thread(
-                    self._publish_once, replace(envelope, attempt=attempts)
-                )
-                self._seen_keys.add(key)
-                return PublishAttemptResult(
+            batch = [replace(envelopes[index], attempt=attempts) for index in pending]
+            confirmed, exc = await asyncio.to_thread(self._publish_confirmed, batch)
+            for index in pending[:confirmed]:
+                self._seen_keys.add(envelopes[index].idempotency_key)
+                results[index] = PublishAttemptResult(
                     status=PublishStatus.PUBLISHED, attempts=attempts
                 )
-            except (
-                Exception
-            ) as exc:  # pragma: no cover - requires live broker fault paths
-                if attempts > self._max_retries:
-                    await asyncio.to_thread(
-                        self._publish_dead_letter, replace(envelope, attempt=attempts)
-                    )
-                    return PublishAttemptResult(
-                        status=PublishStatus.DEAD_LETTERED,
-                        attempts=attempts,
-                        error=str(exc),
-                    )
-        raise RuntimeError("unreachable publish state")
+            pending = pending[confirmed:]
+            if exc is not None:  # pragma: no cover - requires live broker fault paths
+                error = str(exc)
+
+        if pending:  # pragma: no cover - requires live broker fault paths
+            await asyncio.to_thread(
+                self._publish_dead_letters,
+                [replace(envelopes[index], attempt=attempts) for index in pending],
+            )
+            for index in pending:
+                results[index] = PublishAttemptResult(
+                    status=PublishStatus.DEAD_LETTERED,
+                    attempts=attempts,
+                    error=error,
+                )
+        # In-batch duplicates share their first copy's fate: only a copy that
+        # was actually published makes them redundant.
+        for index, original in duplicates:
+            outcome = results[original]
+            assert outcome is not None
+            results[index] = (
+                PublishAttemptResult(status=PublishStatus.DEDUPLICATED, attempts=0)
+                if outcome.status is PublishStatus.PUBLISHED
+                else PublishAttemptResult(
+                    status=PublishStatus.DEAD_LETTERED, attempts=0, error=outcome.error
+                )
+            )
+        return [result for result in results if result is not None]
+
+    def close(self) -> None:
+        """Close pooled broker connections."""
+        self._pool.close()
 
     def _declare_topology(self) -> None:
-        conn = self._open_connection()
-        try:
-            channel = conn.channel()
+        with self._pool.channel() as channel:
             channel.exchange_declare(
                 exchange=self._routing.exchange, exchange_type="direct", durable=True
             )
@@ -475,36 +646,40 @@ class PikaRabbitMQTelemetryPublisher:
                 routing_key=self._routing.routing_key,
             )
             channel.queue_declare(queue=self._routing.dead_letter_queue, durable=True)
-        finally:
-            conn.close()
 
-    def _publish_once(self, envelope: BrokerEnvelope) -> None:
-        payload = json.dumps(asdict(envelope), sort_keys=True).encode("utf-8")
-        conn = self._open_connection()
+    def _publish_confirmed(
+        self, envelopes: list[BrokerEnvelope]
+    ) -> tuple[int, Exception | None]:
+        """Publish on one pooled confirm channel, returning the confirmed prefix."""
+        confirmed = 0
         try:
-            channel = conn.channel()
-            channel.basic_publish(
-                exchange=self._routing.exchange,
-                routing_key=self._routing.routing_key,
-                body=payload,
-                properties=pika.BasicProperties(delivery_mode=2),
-            )
-        finally:
-            conn.close()
+            with self._pool.channel() as channel:
+                for envelope in envelopes:
+                    channel.basic_publish(
+                        exchange=self._routing.exchange,
+                        routing_key=self._routing.routing_key,
+                        body=self._encode(envelope),
+                        properties=pika.BasicProperties(delivery_mode=2),
+                        mandatory=True,
+                    )
+                    confirmed += 1
+        except Exception as exc:  # pragma: no cover - requires live broker fault paths
+            return confirmed, exc
+        return confirmed, None
+
+    def _publish_dead_letters(self, envelopes: list[BrokerEnvelope]) -> None:
+        with self._pool.channel() as channel:
+            for envelope in envelopes:
+                channel.basic_publish(
+                    exchange="",
+                    routing_key=self._routing.dead_letter_queue,
+                    body=self._encode(envelope),
+                    properties=pika.BasicProperties(delivery_mode=2),
+                )
 
-    def _publish_dead_letter(self, envelope: BrokerEnvelope) -> None:
-        payload = json.dumps(asdict(envelope), sort_keys=True).encode("utf-8")
-        conn = self._open_connection()
-        try:
-            channel = conn.channel()
-            channel.basic_publish(
-                exchange="",
-                routing_key=self._routing.dead_letter_queue,
-                body=payload,
-                properties=pika.BasicProperties(delivery_mode=2),
-            )
-        finally:
-            conn.close()
+    @staticmethod
+    def _encode(envelope: BrokerEnvelope) -> bytes:
+        return json.dumps(asdict(envelope), sort_keys=True).encode("utf-8")
 
     def _open_connection(self) -> "pika.BlockingConnection":
         credentials = pika.PlainCredentials(
@@ -16,13 +16,21 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Protocol
 from urllib.parse import urlparse
 
 import requests
 
+from pkg.orchestrator.opa_local import LocalPolicyError, LocalPolicyEvaluator
 from pkg.security.aaa_framework import Principal
 
 
@@ -34,6 +42,22 @@ class OPAAuthorizationError(PermissionError):
     """Raised when OPA denies pre-sign execution authorization."""
 
 
+_QUERY_MODES = {"sequential", "combined"}
+_LATENCY_BUCKETS_SECONDS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+
 @dataclass(slots=True, frozen=True)
 class OPAConfig:
     """Runtime configuration for orchestrator OPA queries."""
@@ -44,6 +68,10 @@ class OPAConfig:
     input_contract_path: str = (
         "/v1/data/spectrastrike/capabilities/input_contract_valid"
     )
+    decision_path: str = "/v1/data/spectrastrike/capabilities"
+    query_mode: str = "sequential"
+    decision_cache_ttl_seconds: float = 0.0
+    decision_cache_size: int = 4096
 
     @classmethod
     def from_env(cls) -> OPAConfig:
@@ -58,6 +86,15 @@ class OPAConfig:
                 "OPA_INPUT_CONTRACT_PATH",
                 "/v1/data/spectrastrike/capabilities/input_contract_valid",
             ),
+            decision_path=os.getenv(
+                "OPA_DECISION_PATH",
+                "/v1/data/spectrastrike/capabilities",
+            ),
+            query_mode=os.getenv("OPA_QUERY_MODE", "sequential").strip().lower(),
+            decision_cache_ttl_seconds=float(
+                os.getenv("OPA_DECISION_CACHE_TTL_SECONDS", "0")
+            ),
+            decision_cache_size=int(os.getenv("OPA_DECISION_CACHE_SIZE", "4096")),
         )
 
     def __post_init__(self) -> None:
@@ -66,6 +103,46 @@ class OPAConfig:
             raise ValueError("OPA url must be an absolute URL")
         if self.timeout_seconds <= 0:
             raise ValueError("OPA timeout_seconds must be greater than zero")
+        if self.query_mode not in _QUERY_MODES:
+            raise ValueError("OPA query_mode must be 'sequential' or 'combined'")
+        if self.decision_cache_ttl_seconds < 0:
+            raise ValueError("OPA decision_cache_ttl_seconds must be non-negative")
+        if self.decision_cache_size <= 0:
+            raise ValueError("OPA decision_cache_size must be greater than zero")
+
+
+@dataclass(slots=True, frozen=True)
+class OPADecision:
+    """Outcome of evaluating the contract and allow rules for one input."""
+
+    input_contract_valid: bool
+    allowed: bool
+    cached: bool = False
+
+    @property
+    def authorized(self) -> bool:
+        """Return whether the input passed both policy rules."""
+        return self.input_contract_valid and self.allowed
+
+    def raise_for_denial(self) -> None:
+        """Raise the same denial ``OPAExecutionAuthorizer.authorize`` raises."""
+        if not self.input_contract_valid:
+            raise OPAAuthorizationError("OPA denied request: invalid input contract")
+        if not self.allowed:
+            raise OPAAuthorizationError("OPA denied request: execution not authorized")
+
+
+@dataclass(slots=True, frozen=True)
+class OPADecisionMetrics:
+    """Decision cache counters and a cumulative OPA round-trip latency histogram."""
+
+    cache_hits: int
+    cache_misses: int
+    cache_size: int
+    queries: int
+    latency_buckets: tuple[tuple[float, int], ...]
+    latency_count: int
+    latency_sum_seconds: float
 
 
 class OPAQuerySession(Protocol):
@@ -76,25 +153,169 @@ class OPAQuerySession(Protocol):
 
 
 class OPAExecutionAuthorizer:
-    """Performs policy checks before cryptographic manifest signing."""
+    """Performs policy checks before cryptographic manifest signing.
+
+    In ``sequential`` mode the contract and allow rules are separate queries;
+    ``combined`` mode reads both from the package document at
+    ``decision_path`` in one round trip. With a ``local_evaluator``, the same
+    package document is computed in-process and OPA is not contacted. With a
+    positive ``decision_cache_ttl_seconds``, decisions are kept in an LRU cache
+    keyed on the canonical input hash and the active policy revision.
+    """
 
     def __init__(
         self,
         config: OPAConfig | None = None,
         session: OPAQuerySession | None = None,
+        *,
+        policy_revision: str = "",
+        local_evaluator: LocalPolicyEvaluator | None = None,
     ) -> None:
         self._config = config or OPAConfig.from_env()
         self._session = session or requests.Session()
+        self._policy_revision = policy_revision
+        self._local_evaluator = local_evaluator
+        self._decisions: OrderedDict[str, tuple[float, OPADecision]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._queries = 0
+        self._latency_counts = [0] * (len(_LATENCY_BUCKETS_SECONDS) + 1)
+        self._latency_sum = 0.0
+
+    @property
+    def policy_revision(self) -> str:
+        """Return the policy revision that cached decisions are bound to."""
+        with self._lock:
+            return self._policy_revision
+
+    def on_policy_change(self, policy_revision: str) -> None:
+        """Bind to a new policy revision, dropping decisions made under the old one.
+
+        A local evaluator is hot-reloaded first and fails closed when its bundle
+        does not match ``policy_revision``.
+        """
+        try:
+            if self._local_evaluator is not None:
+                self._local_evaluator.on_policy_change(policy_revision)
+        finally:
+            self._rebind_revision(policy_revision)
+
+    def _rebind_revision(self, policy_revision: str) -> None:
+        with self._lock:
+            if policy_revision == self._policy_revision:
+                return
+            self._policy_revision = policy_revision
+            self._decisions.clear()
+
+    def clear_decision_cache(self) -> None:
+        """Drop every cached decision."""
+        with self._lock:
+            self._decisions.clear()
 
     def authorize(self, payload: dict[str, Any]) -> None:
         """Validate input contract and enforce allow decision from OPA."""
+        self.decide(payload).raise_for_denial()
+
+    def decide(self, payload: dict[str, Any]) -> OPADecision:
+        """Return the policy decision for ``payload`` without raising on denial."""
+        key = self._cache_key(payload)
+        cached = self._cached_decision(key)
+        if cached is not None:
+            return cached
+        decision = self._evaluate(payload)
+        self._store_decision(key, decision)
+        return decision
+
+    def authorize_many(
+        self,
+        payloads: Sequence[dict[str, Any]],
+        *,
+        max_workers: int = 8,
+    ) -> list[OPADecision]:
+        """Decide many inputs, querying OPA once per distinct uncached input."""
+        keys = [self._cache_key(payload) for payload in payloads]
+        decisions: dict[str, OPADecision] = {}
+        pending: dict[str, dict[str, Any]] = {}
+        for key, payload in zip(keys, payloads):
+            if key in decisions or key in pending:
+                continue
+            cached = self._cached_decision(key)
+            if cached is not None:
+                decisions[key] = cached
+            else:
+                pending[key] = payload
+
+        if pending:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(pending))),
+                thread_name_prefix="spectrastrike-opa",
+            ) as executor:
+                evaluated = list(executor.map(self._evaluate, pending.values()))
+            for key, decision in zip(pending, evaluated):
+                self._store_decision(key, decision)
+                decisions[key] = decision
+        return [decisions[key] for key in keys]
+
+    def metrics(self) -> OPADecisionMetrics:
+        """Return cache hit/miss counters and OPA query latency histogram."""
+        with self._lock:
+            cumulative = 0
+            buckets: list[tuple[float, int]] = []
+            for bound, count in zip(
+                (*_LATENCY_BUCKETS_SECONDS, float("inf")), self._latency_counts
+            ):
+                cumulative += count
+                buckets.append((bound, cumulative))
+            return OPADecisionMetrics(
+                cache_hits=self._cache_hits,
+                cache_misses=self._cache_misses,
+                cache_size=len(self._decisions),
+                queries=self._queries,
+                latency_buckets=tuple(buckets),
+                latency_count=cumulative,
+                latency_sum_seconds=self._latency_sum,
+            )
+
+    def _evaluate(self, payload: dict[str, Any]) -> OPADecision:
+        if self._local_evaluator is not None:
+            try:
+                document = self._local_evaluator.evaluate(payload)
+            except LocalPolicyError as exc:
+                raise OPAClientError(f"local policy evaluation failed: {exc}") from exc
+            return self._decision_from_document(document)
+        if self._config.query_mode == "combined":
+            return self._decision_from_document(
+                self._query(self._config.decision_path, payload)
+            )
         if not self._query_bool(self._config.input_contract_path, payload):
-            raise OPAAuthorizationError("OPA denied request: invalid input contract")
-        if not self._query_bool(self._config.allow_path, payload):
-            raise OPAAuthorizationError("OPA denied request: execution not authorized")
+            return OPADecision(input_contract_valid=False, allowed=False)
+        return OPADecision(
+            input_contract_valid=True,
+            allowed=self._query_bool(self._config.allow_path, payload),
+        )
+
+    def _decision_from_document(self, result: Any) -> OPADecision:
+        if not isinstance(result, dict):
+            raise OPAClientError("OPA response missing decision document")
+        values: list[bool] = []
+        for path in (self._config.input_contract_path, self._config.allow_path):
+            value = result.get(path.rstrip("/").rsplit("/", 1)[-1])
+            if not isinstance(value, bool):
+                raise OPAClientError("OPA response missing boolean result")
+            values.append(value)
+        contract_valid, allowed = values
+        return OPADecision(input_contract_valid=contract_valid, allowed=allowed)
 
     def _query_bool(self, path: str, payload: dict[str, Any]) -> bool:
+        result = self._query(path, payload)
+        if not isinstance(result, bool):
+            raise OPAClientError("OPA response missing boolean result")
+        return result
+
+    def _query(self, path: str, payload: dict[str, Any]) -> Any:
         url = self._join_url(path)
+        started = time.perf_counter()
         try:
             response = self._session.post(
                 url,
@@ -103,6 +324,8 @@ class OPAExecutionAuthorizer:
             )
         except requests.RequestException as exc:
             raise OPAClientError("OPA request failed") from exc
+        finally:
+            self._observe_latency(time.perf_counter() - started)
 
         if response.status_code >= 400:
             raise OPAClientError(f"OPA request failed with status {response.status_code}")
@@ -112,10 +335,56 @@ class OPAExecutionAuthorizer:
         except ValueError as exc:
             raise OPAClientError("OPA response is not valid JSON") from exc
 
-        result = body.get("result")
-        if not isinstance(result, bool):
-            raise OPAClientError("OPA response missing boolean result")
-        return result
+        return body.get("result")
+
+    def _observe_latency(self, seconds: float) -> None:
+        index = len(_LATENCY_BUCKETS_SECONDS)
+        for position, bound in enumerate(_LATENCY_BUCKETS_SECONDS):
+            if seconds <= bound:
+                index = position
+                break
+        with self._lock:
+            self._queries += 1
+            self._latency_counts[index] += 1
+            self._latency_sum += seconds
+
+    def _cache_key(self, payload: dict[str, Any]) -> str:
+        canonical = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=str
+        ).encode("utf-8")
+        with self._lock:
+            revision = self._policy_revision
+        return hashlib.sha256(f"{revision}\n".encode("utf-8") + canonical).hexdigest()
+
+    def _cached_decision(self, key: str) -> OPADecision | None:
+        if self._config.decision_cache_ttl_seconds <= 0:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._decisions.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._decisions[key]
+                self._cache_misses += 1
+                return None
+            self._decisions.move_to_end(key)
+            self._cache_hits += 1
+            decision = entry[1]
+        return OPADecision(
+            input_contract_valid=decision.input_contract_valid,
+            allowed=decision.allowed,
+            cached=True,
+        )
+
+    def _store_decision(self, key: str, decision: OPADecision) -> None:
+        if self._config.decision_cache_ttl_seconds <= 0:
+            return
+        expires_at = time.monotonic() + self._config.decision_cache_ttl_seconds
+        with self._lock:
+            self._decisions[key] = (expires_at, decision)
+            self._decisions.move_to_end(key)
+            while len(self._decisions) > self._config.decision_cache_size:
+                self._decisions.popitem(last=False)
 
     def _join_url(self, path: str) -> str:
         normalized = path if path.startswith("/") else f"/{path}"
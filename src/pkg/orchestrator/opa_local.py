@@ -0,0 +1,371 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: Jose Maria Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""In-process evaluator for the shipped capability policy bundle."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CAPABILITIES_POLICY_FILE = "capabilities.rego"
+SCHEMA_POLICY_FILE = "schema.rego"
+
+# SHA-256 of each file's rule text once comments, whitespace and the data
+# literals below are removed. The decision table models exactly these rule
+# bodies; a rego edit that changes rule logic must update the evaluator too.
+_SUPPORTED_RULE_SKELETONS = {
+    CAPABILITIES_POLICY_FILE: "653316527ed4fbe50e03bfee3bb41c57c751741a7ccbe88c8d9a58e20ee492e3",
+    SCHEMA_POLICY_FILE: "8e9bc90c24b1bd875a2e104ec10109b43284129883c6089979d31b16af8bbe22",
+}
+_DATA_LITERALS = {
+    CAPABILITIES_POLICY_FILE: ("capability_bindings",),
+    SCHEMA_POLICY_FILE: ("capability_request_schema",),
+}
+# Go's RE2 character classes are ASCII-only, unlike Python's str patterns.
+_GO_CLASS_ESCAPES = {
+    "s": "\\t\\n\\f\\r ",
+    "d": "0-9",
+    "w": "0-9A-Za-z_",
+}
+
+
+class LocalPolicyError(RuntimeError):
+    """Raised when the local policy bundle cannot be compiled or trusted."""
+
+
+def policy_bundle_sha256(policy_dir: str | Path) -> str:
+    """Return the bundle hash: SHA-256 over each ``*.rego`` name and content hash."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(policy_dir).glob("*.rego")):
+        digest.update(path.name.encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).hexdigest().encode("ascii"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _strip_comments(text: str) -> str:
+    lines: list[str] = []
+    for line in text.splitlines():
+        quote: str | None = None
+        escaped = False
+        for index, char in enumerate(line):
+            if quote is not None:
+                if escaped:
+                    escaped = False
+                elif char == "\\" and quote == '"':
+                    escaped = True
+                elif char == quote:
+                    quote = None
+            elif char in "\"`":
+                quote = char
+            elif char == "#":
+                line = line[:index]
+                break
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _literal_span(text: str, name: str) -> tuple[int, int]:
+    match = re.search(rf"^{re.escape(name)}\s*:=\s*", text, re.M)
+    if match is None or match.end() >= len(text) or text[match.end()] not in "[{":
+        raise LocalPolicyError(f"policy literal not found: {name}")
+    depth = 0
+    quote: str | None = None
+    escaped = False
+    for index in range(match.end(), len(text)):
+        char = text[index]
+        if quote is not None:
+            if escaped:
+                escaped = False
+            elif char == "\\" and quote == '"':
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"`":
+            quote = char
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if depth == 0:
+                return match.end(), index + 1
+    raise LocalPolicyError(f"policy literal is not terminated: {name}")
+
+
+def _literal_value(literal: str) -> Any:
+    """Decode a rego object/array literal of JSON scalars into Python values."""
+    out: list[str] = []
+    index = 0
+    while index < len(literal):
+        char = literal[index]
+        if char == '"':
+            end = index + 1
+            while literal[end] != '"':
+                end += 2 if literal[end] == "\\" else 1
+            out.append(literal[index : end + 1])
+            index = end + 1
+            continue
+        if char == "`":
+            end = literal.index("`", index + 1)
+            out.append(json.dumps(literal[index + 1 : end]))
+            index = end + 1
+            continue
+        if char == ",":
+            rest = literal[index + 1 :].lstrip()
+            if rest[:1] in {"]", "}"}:
+                index += 1
+                continue
+        out.append(char)
+        index += 1
+    try:
+        return json.loads("".join(out))
+    except ValueError as exc:
+        raise LocalPolicyError("policy literal is not plain data") from exc
+
+
+def _data_literal(text: str, name: str) -> Any:
+    start, end = _literal_span(text, name)
+    return _literal_value(text[start:end])
+
+
+def _rule_skeleton_sha256(text: str, literal_names: tuple[str, ...]) -> str:
+    for name in literal_names:
+        start, end = _literal_span(text, name)
+        text = f"{text[:start]}<data>{text[end:]}"
+    return hashlib.sha256(re.sub(r"\s+", "", text).encode("utf-8")).hexdigest()
+
+
+def _go_regex(pattern: str) -> re.Pattern[str]:
+    """Compile an RE2 pattern so Python matches exactly what Go would."""
+    out: list[str] = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern):
+            escape = pattern[index + 1]
+            members = _GO_CLASS_ESCAPES.get(escape.lower())
+            if members is None:
+                out.append(pattern[index : index + 2])
+            elif escape.islower():
+                out.append(members if in_class else f"[{members}]")
+            elif in_class:
+                raise LocalPolicyError(f"unsupported negated class escape in {pattern!r}")
+            else:
+                out.append(f"[^{members}]")
+            index += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            if pattern[index + 1 : index + 2] == "^":
+                out.append("[^")
+                index += 2
+                continue
+        elif char == "$":
+            # Go's "$" never matches before a trailing newline.
+            char = r"\Z"
+        out.append(char)
+        index += 1
+    return re.compile("".join(out))
+
+
+def _go_lower(value: str) -> str:
+    # Go's strings.ToLower maps rune by rune; Python expands U+0130 to two runes.
+    return "".join("i" if char == "İ" else char.lower() for char in value)
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledBinding:
+    actions: frozenset[str]
+    target_urn: Any
+    target_urn_prefix: str | None
+
+
+@dataclass(slots=True, frozen=True)
+class _DecisionTable:
+    policy_sha256: str
+    required_fields: tuple[Any, ...]
+    id_pattern: re.Pattern[str]
+    tool_sha256_pattern: re.Pattern[str]
+    target_urn_pattern: re.Pattern[str]
+    action_pattern: re.Pattern[str]
+    bindings: dict[tuple[Any, Any, Any], tuple[_CompiledBinding, ...]]
+
+
+def _compile_bundle(policy_dir: Path) -> _DecisionTable:
+    texts: dict[str, str] = {}
+    for filename, expected in _SUPPORTED_RULE_SKELETONS.items():
+        try:
+            text = _strip_comments((policy_dir / filename).read_text(encoding="utf-8"))
+        except OSError as exc:
+            raise LocalPolicyError(f"unable to read policy file: {filename}") from exc
+        if _rule_skeleton_sha256(text, _DATA_LITERALS[filename]) != expected:
+            raise LocalPolicyError(
+                f"{filename} rules differ from the rules the local evaluator models"
+            )
+        texts[filename] = text
+
+    schema = _data_literal(texts[SCHEMA_POLICY_FILE], "capability_request_schema")
+    bindings_literal = _data_literal(texts[CAPABILITIES_POLICY_FILE], "capability_bindings")
+    try:
+        patterns = schema["patterns"]
+        required_fields = tuple(schema["required"])
+        id_pattern = _go_regex(patterns["id"])
+        tool_sha256_pattern = _go_regex(patterns["tool_sha256"])
+        target_urn_pattern = _go_regex(patterns["target_urn"])
+        action_pattern = _go_regex(patterns["action"])
+    except (KeyError, TypeError, re.error) as exc:
+        raise LocalPolicyError("capability_request_schema is malformed") from exc
+
+    grouped: dict[tuple[Any, Any, Any], list[_CompiledBinding]] = {}
+    for binding in bindings_literal if isinstance(bindings_literal, list) else []:
+        if not isinstance(binding, dict):
+            continue
+        actions = binding.get("actions")
+        if isinstance(actions, dict):
+            actions = list(actions.values())
+        if not isinstance(actions, list):
+            continue
+        if not all(key in binding for key in ("operator_id", "tenant_id", "tool_sha256")):
+            continue
+        prefix = binding.get("target_urn_prefix")
+        key = (binding["operator_id"], binding["tenant_id"], binding["tool_sha256"])
+        try:
+            hash(key)
+        except TypeError:
+            continue
+        grouped.setdefault(key, []).append(
+            _CompiledBinding(
+                actions=frozenset(
+                    _go_lower(action)
+                    for action in actions
+                    if isinstance(action, str)
+                ),
+                target_urn=binding.get("target_urn"),
+                target_urn_prefix=prefix if isinstance(prefix, str) else None,
+            )
+        )
+    return _DecisionTable(
+        policy_sha256=policy_bundle_sha256(policy_dir),
+        required_fields=required_fields,
+        id_pattern=id_pattern,
+        tool_sha256_pattern=tool_sha256_pattern,
+        target_urn_pattern=target_urn_pattern,
+        action_pattern=action_pattern,
+        bindings={key: tuple(value) for key, value in grouped.items()},
+    )
+
+
+class LocalPolicyEvaluator:
+    """Evaluate ``spectrastrike.capabilities`` in-process from the shipped rego.
+
+    The bundle's data literals are compiled into a lookup table keyed on the
+    operator, tenant and tool tuple; the rule bodies are modelled in Python
+    and guarded by a fingerprint of the rego rule text. ``evaluate`` returns
+    the rule values OPA would return for the package document, including
+    leaving ``input_contract_valid`` undefined for invalid input.
+    """
+
+    def __init__(
+        self,
+        policy_dir: str | Path,
+        *,
+        expected_policy_sha256: str | None = None,
+    ) -> None:
+        self._policy_dir = Path(policy_dir)
+        self._lock = threading.Lock()
+        self._table: _DecisionTable | None = None
+        self._table = self._load(expected_policy_sha256)
+
+    @property
+    def policy_sha256(self) -> str | None:
+        """Return the bundle hash of the loaded table, or ``None`` if unloaded."""
+        table = self._table
+        return table.policy_sha256 if table is not None else None
+
+    def on_policy_change(self, policy_sha256: str) -> None:
+        """Hot-reload the bundle, failing closed unless it matches ``policy_sha256``."""
+        if policy_sha256 == self.policy_sha256:
+            return
+        try:
+            table = self._load(policy_sha256)
+        except LocalPolicyError:
+            with self._lock:
+                self._table = None
+            raise
+        with self._lock:
+            self._table = table
+
+    def evaluate(self, input_document: Mapping[str, Any]) -> dict[str, Any]:
+        """Return ``allow`` and, when defined, ``input_contract_valid``."""
+        table = self._table
+        if table is None:
+            raise LocalPolicyError("local policy bundle is not loaded")
+        if not self._contract_valid(table, input_document):
+            return {"allow": False}
+        return {"allow": self._allowed(table, input_document), "input_contract_valid": True}
+
+    def _load(self, expected_policy_sha256: str | None) -> _DecisionTable:
+        table = _compile_bundle(self._policy_dir)
+        if expected_policy_sha256 is not None and table.policy_sha256 != expected_policy_sha256:
+            raise LocalPolicyError("local policy bundle hash does not match signed policy hash")
+        return table
+
+    @staticmethod
+    def _contract_valid(table: _DecisionTable, document: Mapping[str, Any]) -> bool:
+        for field in table.required_fields:
+            if document.get(field, "") == "":
+                return False
+        operator_id = document.get("operator_id")
+        tenant_id = document.get("tenant_id")
+        tool_sha256 = document.get("tool_sha256")
+        target_urn = document.get("target_urn")
+        action = document.get("action")
+        return (
+            isinstance(operator_id, str)
+            and table.id_pattern.search(operator_id) is not None
+            and isinstance(tenant_id, str)
+            and table.id_pattern.search(tenant_id) is not None
+            and isinstance(tool_sha256, str)
+            and table.tool_sha256_pattern.search(tool_sha256) is not None
+            and isinstance(target_urn, str)
+            and table.target_urn_pattern.search(target_urn) is not None
+            and isinstance(action, str)
+            and table.action_pattern.search(_go_lower(action)) is not None
+        )
+
+    @staticmethod
+    def _allowed(table: _DecisionTable, document: Mapping[str, Any]) -> bool:
+        key = (document["operator_id"], document["tenant_id"], document["tool_sha256"])
+        action = _go_lower(document["action"])
+        target_urn = document["target_urn"]
+        for binding in table.bindings.get(key, ()):
+            if action not in binding.actions:
+                continue
+            if binding.target_urn == target_urn:
+                return True
+            if binding.target_urn_prefix is not None and target_urn.startswith(
+                binding.target_urn_prefix
+            ):
+                return True
+        return False
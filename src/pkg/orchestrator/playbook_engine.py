@@ -12,18 +12,42 @@
 # Offer as a commercial service
 # Sell derived competing products
 
-"""Playbook framework and simulation engine (Phase 5 Sprint 5.1)."""
+"""Playbook framework, simulation and execution engine (Phase 5 Sprint 5.1)."""
 
 from __future__ import annotations
 
 import ast
-from dataclasses import dataclass, field
+import operator
+import re
+import shlex
+import subprocess
+import time
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
+from string import Formatter
 from threading import Lock
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+from .campaign_engine import CampaignEngine, CampaignEngineError, ExecutionStatus
+from .engine_store import (
+    EngineStore,
+    ResidentPartitions,
+    StoredRow,
+    decode_record,
+    encode_record,
+)
+
+if TYPE_CHECKING:
+    from pkg.orchestrator.telemetry_ingestion import TelemetryIngestionPipeline
+    from pkg.wrappers.base import Runner, WrapperCommandResult
+
 
 class PlaybookEngineError(ValueError):
     """Raised when playbook modeling or execution simulation fails."""
@@ -95,6 +119,8 @@ class PlaybookStepRecord:
     condition_expression: str | None = None
     next_on_success: str | None = None
     next_on_failure: str | None = None
+    depends_on: tuple[str, ...] | None = None
+    timeout_seconds: float | None = None
 
 
 @dataclass(slots=True, frozen=True)
@@ -119,75 +145,705 @@ class PlaybookSimulationResult:
     variables_final: dict[str, Any]
 
 
-class _SafeConditionEvaluator(ast.NodeVisitor):
-    def __init__(self, variables: dict[str, Any]) -> None:
-        self._variables = variables
+@dataclass(slots=True, frozen=True)
+class StepExecutionRecord:
+    """Single step result from a real playbook execution."""
+
+    step_id: str
+    status: StepExecutionStatus
+    rendered_command: str | None = None
+    rendered_rollback: str | None = None
+    returncode: int | None = None
+    stdout: str = ""
+    stderr: str = ""
+    error: str | None = None
+    duration_seconds: float = 0.0
+    campaign_execution_id: str | None = None
+    reporting_error: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class PlaybookExecutionResult:
+    """Outcome of ``PlaybookEngine.execute_playbook``.
+
+    ``step_results`` are in completion order. ``critical_path_seconds`` is
+    the longest chain of observed step durations through the dependency
+    graph, the lower bound for ``elapsed_seconds``. Telemetry or campaign
+    bookkeeping failures never abort a run; they are kept in
+    ``reporting_error`` on the step or, for the final summary, here.
+    """
+
+    execution_id: str
+    playbook_id: str
+    status: StepExecutionStatus
+    step_results: tuple[StepExecutionRecord, ...]
+    rollback_results: tuple[StepExecutionRecord, ...]
+    variables_final: dict[str, Any]
+    elapsed_seconds: float
+    critical_path_seconds: float
+    reporting_error: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class PlaybookCampaignBinding:
+    """Records playbook steps as technique executions of a campaign.
+
+    ``step_ids`` maps playbook step ids to campaign step ids; unmapped
+    steps are not recorded. The asset of each execution is read from the
+    step's ``asset_variable``.
+    """
+
+    campaign_engine: CampaignEngine
+    campaign_id: str
+    step_ids: dict[str, str]
+    asset_variable: str = "target_host"
+    correlation_group_id: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class PlaybookScenario:
+    """One what-if input for ``PlaybookEngine.simulate_playbook_many``."""
 
-    def evaluate(self, expression: str) -> bool:
-        node = ast.parse(expression, mode="eval")
-        return bool(self.visit(node.body))
+    runtime_variables: dict[str, Any] = field(default_factory=dict)
+    fail_step_ids: frozenset[str] = frozenset()
 
-    def visit_Name(self, node: ast.Name) -> Any:  # noqa: N802
-        if node.id not in self._variables:
-            raise PlaybookEngineError(f"unknown variable in condition: {node.id}")
-        return self._variables[node.id]
 
-    def visit_Constant(self, node: ast.Constant) -> Any:  # noqa: N802
-        return node.value
+_Evaluator = Callable[[dict[str, Any]], Any]
 
-    def visit_Compare(self, node: ast.Compare) -> Any:  # noqa: N802
-        left = self.visit(node.left)
+_COMPARISONS: dict[type[ast.cmpop], Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledCondition:
+    """Condition expression compiled to a closure over the variable map."""
+
+    names: tuple[str, ...]
+    evaluate: _Evaluator
+
+    def __call__(self, variables: dict[str, Any]) -> bool:
+        for name in self.names:
+            if name not in variables:
+                raise PlaybookEngineError(f"unknown variable in condition: {name}")
+        return bool(self.evaluate(variables))
+
+
+def _compile_node(node: ast.AST, names: list[str]) -> _Evaluator:
+    if isinstance(node, ast.Name):
+        if node.id not in names:
+            names.append(node.id)
+        return operator.itemgetter(node.id)
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda variables: value
+    if isinstance(node, ast.Compare):
+        left = _compile_node(node.left, names)
+        pairs: list[tuple[Callable[[Any, Any], Any], _Evaluator]] = []
         for op, comparator in zip(node.ops, node.comparators):
-            right = self.visit(comparator)
-            if isinstance(op, ast.Eq):
-                ok = left == right
-            elif isinstance(op, ast.NotEq):
-                ok = left != right
-            elif isinstance(op, ast.Gt):
-                ok = left > right
-            elif isinstance(op, ast.GtE):
-                ok = left >= right
-            elif isinstance(op, ast.Lt):
-                ok = left < right
-            elif isinstance(op, ast.LtE):
-                ok = left <= right
-            elif isinstance(op, ast.In):
-                ok = left in right
-            elif isinstance(op, ast.NotIn):
-                ok = left not in right
-            else:
+            compare = _COMPARISONS.get(type(op))
+            if compare is None:
                 raise PlaybookEngineError("unsupported comparison operator")
-            if not ok:
-                return False
-            left = right
-        return True
+            pairs.append((compare, _compile_node(comparator, names)))
+
+        def evaluate_compare(variables: dict[str, Any]) -> bool:
+            current = left(variables)
+            for compare, operand in pairs:
+                right = operand(variables)
+                if not compare(current, right):
+                    return False
+                current = right
+            return True
 
-    def visit_BoolOp(self, node: ast.BoolOp) -> Any:  # noqa: N802
-        values = [bool(self.visit(item)) for item in node.values]
+        return evaluate_compare
+    if isinstance(node, ast.BoolOp):
+        operands = [_compile_node(item, names) for item in node.values]
         if isinstance(node.op, ast.And):
-            return all(values)
+            return lambda variables: all(operand(variables) for operand in operands)
         if isinstance(node.op, ast.Or):
-            return any(values)
+            return lambda variables: any(operand(variables) for operand in operands)
         raise PlaybookEngineError("unsupported boolean operator")
-
-    def visit_UnaryOp(self, node: ast.UnaryOp) -> Any:  # noqa: N802
+    if isinstance(node, ast.UnaryOp):
         if isinstance(node.op, ast.Not):
-            return not bool(self.visit(node.operand))
+            operand = _compile_node(node.operand, names)
+            return lambda variables: not operand(variables)
         raise PlaybookEngineError("unsupported unary operator")
+    raise PlaybookEngineError(f"unsupported expression node: {type(node).__name__}")
+
+
+@lru_cache(maxsize=1024)
+def _compile_condition(expression: str) -> _CompiledCondition:
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as exc:
+        raise PlaybookEngineError(f"invalid condition expression: {exc.msg}") from exc
+    names: list[str] = []
+    evaluate = _compile_node(tree.body, names)
+    return _CompiledCondition(names=tuple(names), evaluate=evaluate)
+
+
+_FORMATTER = Formatter()
+_FIELD_ROOT = re.compile(r"[.\[]")
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledTemplate:
+    """Format template with its variables in order of first use."""
+
+    source: str
+    names: tuple[str, ...]
+
+    def render(self, lookup: Callable[[str], Any]) -> str:
+        return self.source.format_map({name: lookup(name) for name in self.names})
+
+
+def _collect_template_names(source: str, names: list[str]) -> None:
+    for _, field_name, format_spec, _ in _FORMATTER.parse(source):
+        if field_name is None:
+            continue
+        root = _FIELD_ROOT.split(field_name, maxsplit=1)[0]
+        if not root or root.isdigit():
+            raise PlaybookEngineError("positional template fields are not supported")
+        if root not in names:
+            names.append(root)
+        if format_spec:
+            _collect_template_names(format_spec, names)
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(source: str) -> _CompiledTemplate:
+    names: list[str] = []
+    try:
+        _collect_template_names(source, names)
+    except ValueError as exc:
+        raise PlaybookEngineError(f"invalid template: {exc}") from exc
+    return _CompiledTemplate(source=source, names=tuple(names))
 
-    def generic_visit(self, node: ast.AST) -> Any:
-        raise PlaybookEngineError(f"unsupported expression node: {type(node).__name__}")
+
+@dataclass(slots=True, frozen=True)
+class _CompiledStep:
+    """A playbook step with its condition and templates compiled."""
+
+    step: PlaybookStepRecord
+    module_variables: dict[str, Any]
+    condition: _CompiledCondition | None
+    command: _CompiledTemplate
+    rollback: _CompiledTemplate | None
+    wrapper_command: _CompiledTemplate | None
+    wrapper_rollback: _CompiledTemplate | None
+    names: tuple[str, ...]
+    rollback_names: frozenset[str]
+
+    def render(self, variables: dict[str, Any]) -> tuple[str, str | None]:
+        """Render command and rollback; steps override runtime over module variables."""
+        lookup = self.lookup(variables)
+        command = self.command.render(lookup)
+        rollback = self.rollback.render(lookup) if self.rollback is not None else None
+        if self.wrapper_command is not None:
+            command = self.wrapper_command.render(_with_payload(lookup, command))
+            if rollback and self.wrapper_rollback is not None:
+                rollback = self.wrapper_rollback.render(_with_payload(lookup, rollback))
+        return command, rollback
+
+    def render_key(self, variables: dict[str, Any]) -> tuple[Any, ...]:
+        """Values that fully determine ``render``; raises if one is missing.
+
+        Each value is keyed with its type and ``repr`` as well, since equal
+        values such as ``1``, ``True`` and ``1.0`` format differently.
+        """
+        lookup = self.lookup(variables)
+        return tuple(_render_token(lookup(name)) for name in self.names)
+
+    def lookup(self, variables: dict[str, Any]) -> Callable[[str], Any]:
+        """Resolve names from step, then runtime, then module variables."""
+        step_variables = self.step.variables
+        module_variables = self.module_variables
+
+        def lookup(name: str) -> Any:
+            if name in step_variables:
+                return step_variables[name]
+            if name in variables:
+                return variables[name]
+            if name in module_variables:
+                return module_variables[name]
+            raise PlaybookEngineError(f"missing template variable: {name}")
+
+        return lookup
+
+
+def _render_token(value: Any) -> tuple[type, str, Any]:
+    return type(value), repr(value), value
+
+
+def _with_payload(lookup: Callable[[str], Any], payload: str) -> Callable[[str], Any]:
+    return lambda name: payload if name == "payload" else lookup(name)
+
+
+@dataclass(slots=True, frozen=True)
+class _PlaybookPlan:
+    """Immutable simulation snapshot of one playbook."""
+
+    playbook: PlaybookRecord
+    steps: tuple[_CompiledStep, ...]
+    positions: dict[str, int]
+
+
+@dataclass(slots=True, frozen=True)
+class _DependencyGraph:
+    """How ``execute_playbook`` schedules the steps of one plan.
+
+    ``dependencies`` are the positions a step waits for and ``dependents``
+    the reverse. ``requires`` are a step's ``depends_on`` positions (``None``
+    when it declares none). A step with ``branch_sources`` only runs if one
+    of them branches to it, following the same success/failure edges as
+    ``simulate_playbook``; ``unreachable`` steps are on no branch path.
+    """
+
+    dependencies: tuple[tuple[int, ...], ...]
+    dependents: tuple[tuple[int, ...], ...]
+    requires: tuple[tuple[int, ...] | None, ...]
+    branch_sources: tuple[frozenset[int], ...]
+    successors: tuple[int | None, ...]
+    handlers: tuple[int | None, ...]
+    unreachable: frozenset[int]
+
+
+def _branch_ids(step: PlaybookStepRecord) -> tuple[str | None, str | None]:
+    return step.next_on_success, step.next_on_failure
+
+
+@dataclass(slots=True)
+class _InFlightStep:
+    position: int
+    command: str
+    rollback: str | None
+    mark: int
+    campaign_execution_id: str | None
+
+
+_StepOutcome = tuple["WrapperCommandResult | None", str | None, float]
+
+
+class _PlaybookRun:
+    """Scheduler state for one ``PlaybookEngine.execute_playbook`` call.
+
+    Only the calling thread touches this state; worker threads run the
+    rendered commands and hand back ``(result, error, duration)``.
+    """
+
+    def __init__(
+        self,
+        plan: _PlaybookPlan,
+        graph: _DependencyGraph,
+        *,
+        runner: Runner,
+        actor: str,
+        tenant_id: str,
+        runtime_variables: dict[str, Any],
+        max_parallel: int,
+        step_timeout_seconds: float,
+        telemetry: TelemetryIngestionPipeline | None,
+        campaign: PlaybookCampaignBinding | None,
+    ) -> None:
+        self._plan = plan
+        self._graph = graph
+        self._runner = runner
+        self._actor = actor
+        self._tenant_id = tenant_id
+        self._max_parallel = max_parallel
+        self._step_timeout_seconds = step_timeout_seconds
+        self._telemetry = telemetry
+        self._campaign = campaign
+        self._execution_id = f"pbx-{uuid4()}"
+        self._variables: dict[str, Any] = {**plan.playbook.default_variables, **runtime_variables}
+        # Same rollback bookkeeping as ``PlaybookEngine._simulate``.
+        self._executed: list[tuple[_CompiledStep, str | None, int]] = []
+        self._assigned_at: dict[str, int] = {}
+        self._writes = 0
+        self._step_results: list[StepExecutionRecord] = []
+        self._waiting = [len(dependencies) for dependencies in graph.dependencies]
+        self._statuses: dict[int, StepExecutionStatus] = {}
+        # Skipped steps that never ran because of a branch or a dependency.
+        self._not_run: set[int] = set()
+        self._taken: set[int] = set()
+        self._path_seconds: dict[int, float] = {}
+        self._ready: deque[int] = deque()
+        self._terminal_failure = False
+
+    def run(self) -> PlaybookExecutionResult:
+        started = time.perf_counter()
+        for position in sorted(self._graph.unreachable):
+            self._resolve(position, self._not_run_record(position, "branch not taken"))
+        for position, count in enumerate(self._waiting):
+            if not count and position not in self._graph.unreachable:
+                self._release(position)
+        in_flight: dict[Future[_StepOutcome], _InFlightStep] = {}
+        with ThreadPoolExecutor(
+            max_workers=self._max_parallel, thread_name_prefix="playbook-step"
+        ) as pool:
+            while True:
+                while (
+                    self._ready
+                    and not self._terminal_failure
+                    and len(in_flight) < self._max_parallel
+                ):
+                    position = self._ready.popleft()
+                    dispatched = self._dispatch(position)
+                    if dispatched is not None:
+                        future = pool.submit(
+                            self._invoke,
+                            dispatched.command,
+                            self._timeout(self._plan.steps[position].step),
+                        )
+                        in_flight[future] = dispatched
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda item: in_flight[item].position):
+                    self._complete(in_flight.pop(future), *future.result())
+
+        rollback_results = self._rollback() if self._terminal_failure else []
+        status = StepExecutionStatus.FAILED if self._terminal_failure else StepExecutionStatus.SUCCEEDED
+        result = PlaybookExecutionResult(
+            execution_id=self._execution_id,
+            playbook_id=self._plan.playbook.playbook_id,
+            status=status,
+            step_results=tuple(self._step_results),
+            rollback_results=tuple(rollback_results),
+            variables_final=self._variables,
+            elapsed_seconds=time.perf_counter() - started,
+            critical_path_seconds=max(self._path_seconds.values(), default=0.0),
+        )
+        reporting_error = self._ingest(
+            event_type="playbook_execution",
+            target=self._plan.playbook.name,
+            status=status.value,
+            playbook_id=result.playbook_id,
+            elapsed_ms=round(result.elapsed_seconds * 1000, 3),
+            critical_path_ms=round(result.critical_path_seconds * 1000, 3),
+        )
+        if reporting_error is not None:
+            result = replace(result, reporting_error=reporting_error)
+        return result
+
+    def _dispatch(self, position: int) -> _InFlightStep | None:
+        """Evaluate, render and bind a ready step; ``None`` if it resolved inline."""
+        compiled = self._plan.steps[position]
+        step_id = compiled.step.step_id
+        try:
+            if compiled.condition is not None and not compiled.condition(self._variables):
+                self._resolve(
+                    position,
+                    StepExecutionRecord(step_id=step_id, status=StepExecutionStatus.SKIPPED),
+                )
+                return None
+            command, rollback = compiled.render(self._variables)
+        except PlaybookEngineError as exc:
+            self._resolve(
+                position,
+                StepExecutionRecord(step_id=step_id, status=StepExecutionStatus.FAILED, error=str(exc)),
+            )
+            return None
+        campaign_execution_id = None
+        if self._campaign is not None and step_id in self._campaign.step_ids:
+            try:
+                campaign_execution_id = self._start_campaign_execution(self._campaign, compiled)
+            except (CampaignEngineError, PlaybookEngineError) as exc:
+                self._resolve(
+                    position,
+                    StepExecutionRecord(
+                        step_id=step_id,
+                        status=StepExecutionStatus.FAILED,
+                        rendered_command=command,
+                        rendered_rollback=rollback,
+                        error=str(exc),
+                    ),
+                )
+                return None
+        return _InFlightStep(
+            position=position,
+            command=command,
+            rollback=rollback,
+            mark=self._writes,
+            campaign_execution_id=campaign_execution_id,
+        )
+
+    def _complete(
+        self,
+        dispatched: _InFlightStep,
+        result: WrapperCommandResult | None,
+        error: str | None,
+        duration: float,
+    ) -> None:
+        compiled = self._plan.steps[dispatched.position]
+        step = compiled.step
+        succeeded = error is None
+        reporting_error: str | None = None
+        if dispatched.campaign_execution_id is not None and self._campaign is not None:
+            try:
+                self._campaign.campaign_engine.stop_technique_execution(
+                    execution_id=dispatched.campaign_execution_id,
+                    status=ExecutionStatus.SUCCEEDED if succeeded else ExecutionStatus.FAILED,
+                    failure_reason=error,
+                )
+            except CampaignEngineError as exc:
+                reporting_error = f"campaign execution not stopped: {exc}"
+        if succeeded:
+            self._executed.append((compiled, dispatched.rollback, dispatched.mark))
+            for name, value in (
+                (f"step_{step.step_order}_status", "succeeded"),
+                (f"step_{step.step_order}_command", dispatched.command),
+            ):
+                self._variables[name] = value
+                self._assigned_at[name] = self._writes
+                self._writes += 1
+        self._resolve(
+            dispatched.position,
+            StepExecutionRecord(
+                step_id=step.step_id,
+                status=StepExecutionStatus.SUCCEEDED if succeeded else StepExecutionStatus.FAILED,
+                rendered_command=dispatched.command,
+                rendered_rollback=dispatched.rollback,
+                returncode=result.returncode if result is not None else None,
+                stdout=result.stdout if result is not None else "",
+                stderr=result.stderr if result is not None else "",
+                error=error,
+                duration_seconds=duration,
+                campaign_execution_id=dispatched.campaign_execution_id,
+                reporting_error=reporting_error,
+            ),
+        )
+
+    def _resolve(self, position: int, record: StepExecutionRecord) -> None:
+        """Record a finished step and release the steps waiting on it."""
+        pending = [(position, record)]
+        while pending:
+            position, record = pending.pop()
+            step = self._plan.steps[position].step
+            record = self._emit(step, record, event_type="playbook_step")
+            self._statuses[position] = record.status
+            self._step_results.append(record)
+            self._path_seconds[position] = record.duration_seconds + max(
+                (self._path_seconds[item] for item in self._graph.dependencies[position]),
+                default=0.0,
+            )
+            if record.status == StepExecutionStatus.FAILED:
+                if not step.next_on_failure:
+                    self._terminal_failure = True
+                    continue
+                target = self._graph.handlers[position]
+            elif position in self._not_run:
+                target = None
+            else:
+                target = self._graph.successors[position]
+            if target is not None and position in self._graph.branch_sources[target]:
+                self._taken.add(target)
+            for dependent in self._graph.dependents[position]:
+                self._waiting[dependent] -= 1
+                if not self._waiting[dependent]:
+                    skipped = self._release(dependent, defer=True)
+                    if skipped is not None:
+                        pending.append((dependent, skipped))
+
+    def _release(self, position: int, *, defer: bool = False) -> StepExecutionRecord | None:
+        """Queue a step whose dependencies resolved, or skip it if it cannot run.
+
+        With ``defer`` the skip record is returned for the caller to resolve.
+        """
+        reason = self._skip_reason(position)
+        if reason is None:
+            self._ready.append(position)
+            return None
+        record = self._not_run_record(position, reason)
+        if defer:
+            return record
+        self._resolve(position, record)
+        return None
+
+    def _skip_reason(self, position: int) -> str | None:
+        step_id = self._plan.steps[position].step.step_id
+        for dependency in self._graph.requires[position] or ():
+            status = self._statuses.get(dependency)
+            dependency_step = self._plan.steps[dependency].step
+            if status == StepExecutionStatus.SUCCEEDED or (
+                status == StepExecutionStatus.SKIPPED and dependency not in self._not_run
+            ):
+                continue
+            if status == StepExecutionStatus.FAILED:
+                if dependency_step.next_on_failure == step_id:
+                    continue
+                return f"dependency failed: {dependency_step.step_id}"
+            return f"dependency not run: {dependency_step.step_id}"
+        if self._graph.branch_sources[position] and position not in self._taken:
+            return "branch not taken"
+        return None
+
+    def _not_run_record(self, position: int, reason: str) -> StepExecutionRecord:
+        self._not_run.add(position)
+        return StepExecutionRecord(
+            step_id=self._plan.steps[position].step.step_id,
+            status=StepExecutionStatus.SKIPPED,
+            error=reason,
+        )
+
+    def _rollback(self) -> list[StepExecutionRecord]:
+        """Roll back succeeded steps in reverse completion order."""
+        results: list[StepExecutionRecord] = []
+        for compiled, rollback_command, mark in reversed(self._executed):
+            step = compiled.step
+            error: str | None = None
+            if any(self._assigned_at.get(name, -1) >= mark for name in compiled.rollback_names):
+                try:
+                    _, rollback_command = compiled.render(self._variables)
+                except PlaybookEngineError as exc:
+                    error = str(exc)
+            if error is None and not rollback_command:
+                continue
+            result: WrapperCommandResult | None = None
+            duration = 0.0
+            if error is None and rollback_command:
+                result, error, duration = self._invoke(rollback_command, self._timeout(step))
+            record = StepExecutionRecord(
+                step_id=step.step_id,
+                status=StepExecutionStatus.ROLLED_BACK if error is None else StepExecutionStatus.FAILED,
+                rendered_rollback=rollback_command,
+                returncode=result.returncode if result is not None else None,
+                stdout=result.stdout if result is not None else "",
+                stderr=result.stderr if result is not None else "",
+                error=error,
+                duration_seconds=duration,
+            )
+            results.append(self._emit(step, record, event_type="playbook_step_rollback"))
+        return results
+
+    def _invoke(self, command: str, timeout_seconds: float) -> _StepOutcome:
+        """Run one rendered command through the runner (worker thread)."""
+        started = time.perf_counter()
+        try:
+            result = self._runner(shlex.split(command), timeout_seconds)
+        except subprocess.TimeoutExpired:
+            return None, f"step timed out after {timeout_seconds:g}s", time.perf_counter() - started
+        except Exception as exc:
+            return None, str(exc) or type(exc).__name__, time.perf_counter() - started
+        duration = time.perf_counter() - started
+        if result.returncode != 0:
+            detail = result.stderr.strip().splitlines()
+            return result, detail[-1] if detail else f"exit code {result.returncode}", duration
+        return result, None, duration
+
+    def _start_campaign_execution(
+        self, binding: PlaybookCampaignBinding, compiled: _CompiledStep
+    ) -> str:
+        asset_id = compiled.lookup(self._variables)(binding.asset_variable)
+        execution = binding.campaign_engine.start_technique_execution(
+            campaign_id=binding.campaign_id,
+            step_id=binding.step_ids[compiled.step.step_id],
+            asset_id=str(asset_id),
+            correlation_group_id=binding.correlation_group_id or self._execution_id,
+        )
+        return execution.execution_id
+
+    def _emit(
+        self, step: PlaybookStepRecord, record: StepExecutionRecord, *, event_type: str
+    ) -> StepExecutionRecord:
+        """Stream a step result; returns it with any telemetry failure attached."""
+        error = self._ingest(
+            event_type=event_type,
+            target=step.name or step.step_id,
+            status=record.status.value,
+            playbook_id=step.playbook_id,
+            step_id=step.step_id,
+            step_order=step.step_order,
+            returncode=record.returncode,
+            duration_ms=round(record.duration_seconds * 1000, 3),
+            error=record.error,
+        )
+        if error is None:
+            return record
+        if record.reporting_error:
+            error = f"{record.reporting_error}; {error}"
+        return replace(record, reporting_error=error)
+
+    def _ingest(
+        self, *, event_type: str, target: str, status: str, **attributes: Any
+    ) -> str | None:
+        if self._telemetry is None:
+            return None
+        try:
+            self._telemetry.ingest(
+                event_type=event_type,
+                actor=self._actor,
+                target=target,
+                status=status,
+                tenant_id=self._tenant_id,
+                playbook_execution_id=self._execution_id,
+                **attributes,
+            )
+        except (ValueError, RuntimeError) as exc:
+            return f"telemetry not recorded: {exc}"
+        return None
+
+    def _timeout(self, step: PlaybookStepRecord) -> float:
+        return step.timeout_seconds or self._step_timeout_seconds
+
+
+_STORE_NAMESPACE = "playbook"
+# Wrapper templates and technique modules are shared by all playbooks and
+# always stay resident; they are stored under the empty partition id.
+_SHARED_PARTITION = ""
 
 
 class PlaybookEngine:
-    """Thread-safe playbook registry and deterministic simulation runtime."""
+    """Thread-safe playbook registry and deterministic simulation runtime.
+
+    With a ``store`` every registration is written through to durable
+    storage and playbooks are loaded on first access; ``max_resident_playbooks``
+    evicts the least recently used playbooks (and their steps) from memory.
+
+    Conditions and templates are compiled when a step is added, steps are
+    kept in ``step_order``, and each playbook's compiled steps are cached as
+    an immutable plan that simulations and executions share without holding
+    the lock.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        store: EngineStore | None = None,
+        *,
+        max_resident_playbooks: int | None = None,
+    ) -> None:
+        if max_resident_playbooks is not None and store is None:
+            raise PlaybookEngineError("max_resident_playbooks requires a store")
         self._playbook_table: dict[str, PlaybookRecord] = {}
         self._playbook_step_table: dict[str, PlaybookStepRecord] = {}
         self._wrapper_template_table: dict[str, WrapperTemplateRecord] = {}
         self._technique_module_table: dict[str, TechniqueModuleRecord] = {}
+        # Step ids per playbook, kept sorted by step_order.
+        self._playbook_step_ids: dict[str, list[str]] = {}
+        self._compiled_steps: dict[str, _CompiledStep] = {}
+        self._playbook_plans: dict[str, _PlaybookPlan] = {}
+        self._playbook_name_index: dict[str, str] = {}
         self._lock = Lock()
+        self._store = store
+        self._bounded = max_resident_playbooks is not None
+        self._resident = ResidentPartitions(max_resident_playbooks)
+        if store is not None:
+            for row in store.load_table(_STORE_NAMESPACE, "playbook"):
+                stored = decode_record(PlaybookRecord, row.payload)
+                self._playbook_name_index[stored.name] = stored.playbook_id
+            for row in store.load_table(_STORE_NAMESPACE, "wrapper_template"):
+                template = decode_record(WrapperTemplateRecord, row.payload)
+                self._wrapper_template_table[template.wrapper_template_id] = template
+            for row in store.load_table(_STORE_NAMESPACE, "technique_module"):
+                module = decode_record(TechniqueModuleRecord, row.payload)
+                self._technique_module_table[module.technique_module_id] = module
 
     def create_playbook(
         self,
@@ -210,9 +866,13 @@ class PlaybookEngine:
             default_variables=dict(default_variables or {}),
         )
         with self._lock:
-            if any(item.name == row.name for item in self._playbook_table.values()):
+            if row.name in self._playbook_name_index:
                 raise PlaybookEngineError("playbook name already exists")
+            self._playbook_name_index[row.name] = row.playbook_id
             self._playbook_table[row.playbook_id] = row
+            self._playbook_step_ids[row.playbook_id] = []
+            self._persist("playbook", row.playbook_id, row.playbook_id, row)
+            self._touch(row.playbook_id)
         return row
 
     def register_wrapper_template(
@@ -225,6 +885,9 @@ class PlaybookEngine:
     ) -> WrapperTemplateRecord:
         if not command_template.strip():
             raise PlaybookEngineError("wrapper command_template is required")
+        _compile_template(command_template.strip())
+        if rollback_template:
+            _compile_template(rollback_template.strip())
         row = WrapperTemplateRecord(
             wrapper_template_id=f"wtmp-{uuid4()}",
             name=name.strip(),
@@ -234,6 +897,7 @@ class PlaybookEngine:
         )
         with self._lock:
             self._wrapper_template_table[row.wrapper_template_id] = row
+            self._persist("wrapper_template", row.wrapper_template_id, _SHARED_PARTITION, row)
         return row
 
     def register_technique_module(
@@ -249,6 +913,9 @@ class PlaybookEngine:
             raise PlaybookEngineError("technique_id is required")
         if not default_command_template.strip():
             raise PlaybookEngineError("default_command_template is required")
+        _compile_template(default_command_template.strip())
+        if default_rollback_template:
+            _compile_template(default_rollback_template.strip())
         row = TechniqueModuleRecord(
             technique_module_id=f"tmod-{uuid4()}",
             name=name.strip(),
@@ -261,6 +928,7 @@ class PlaybookEngine:
         )
         with self._lock:
             self._technique_module_table[row.technique_module_id] = row
+            self._persist("technique_module", row.technique_module_id, _SHARED_PARTITION, row)
         return row
 
     def add_playbook_step(
@@ -277,20 +945,21 @@ class PlaybookEngine:
         condition_expression: str | None = None,
         next_on_success: str | None = None,
         next_on_failure: str | None = None,
+        depends_on: Iterable[str] | None = None,
+        timeout_seconds: float | None = None,
     ) -> PlaybookStepRecord:
+        if timeout_seconds is not None and timeout_seconds <= 0:
+            raise PlaybookEngineError("timeout_seconds must be > 0")
         with self._lock:
-            if playbook_id not in self._playbook_table:
+            if self._resident_playbook(playbook_id) is None:
                 raise PlaybookEngineError("playbook not found")
             if technique_module_id not in self._technique_module_table:
                 raise PlaybookEngineError("technique module not found")
             if wrapper_template_id and wrapper_template_id not in self._wrapper_template_table:
                 raise PlaybookEngineError("wrapper template not found")
-            existing_orders = [
-                step.step_order
-                for step in self._playbook_step_table.values()
-                if step.playbook_id == playbook_id
-            ]
-            if step_order in existing_orders:
+            step_ids = self._playbook_step_ids[playbook_id]
+            position = bisect_left(step_ids, step_order, key=self._step_order)
+            if position < len(step_ids) and self._step_order(step_ids[position]) == step_order:
                 raise PlaybookEngineError("duplicate step_order for playbook")
             row = PlaybookStepRecord(
                 step_id=f"pbs-{uuid4()}",
@@ -305,8 +974,15 @@ class PlaybookEngine:
                 condition_expression=condition_expression.strip() if condition_expression else None,
                 next_on_success=next_on_success,
                 next_on_failure=next_on_failure,
+                depends_on=tuple(depends_on) if depends_on is not None else None,
+                timeout_seconds=timeout_seconds,
             )
+            compiled = self._compile_step(row)
             self._playbook_step_table[row.step_id] = row
+            self._compiled_steps[row.step_id] = compiled
+            step_ids.insert(position, row.step_id)
+            self._playbook_plans.pop(playbook_id, None)
+            self._persist("step", row.step_id, playbook_id, row)
         return row
 
     def simulate_playbook(
@@ -316,43 +992,215 @@ class PlaybookEngine:
         runtime_variables: dict[str, Any] | None = None,
         fail_step_ids: set[str] | None = None,
     ) -> PlaybookSimulationResult:
-        playbook = self._playbook_table.get(playbook_id)
-        if playbook is None:
-            raise PlaybookEngineError("playbook not found")
-        ordered = self._ordered_steps(playbook_id=playbook_id)
-        if not ordered:
+        plan = self._plan(playbook_id)
+        return self._simulate(
+            plan,
+            runtime_variables=runtime_variables or {},
+            fail_step_ids=fail_step_ids or set(),
+            render=_CompiledStep.render,
+        )
+
+    def simulate_playbook_many(
+        self,
+        *,
+        playbook_id: str,
+        scenarios: Iterable[PlaybookScenario],
+    ) -> list[PlaybookSimulationResult]:
+        """Simulate many what-if scenarios against one snapshot of the playbook.
+
+        Rendered commands are memoised across the batch by the values of
+        the variables each step actually uses, so permutations that only
+        vary failures or unrelated variables reuse earlier renders.
+        """
+        plan = self._plan(playbook_id)
+        rendered: dict[tuple[Any, ...], tuple[str, str | None]] = {}
+
+        def render(compiled: _CompiledStep, variables: dict[str, Any]) -> tuple[str, str | None]:
+            try:
+                key = (compiled.step.step_id, *compiled.render_key(variables))
+                cached = rendered.get(key)
+            except (PlaybookEngineError, TypeError):
+                return compiled.render(variables)
+            if cached is None:
+                cached = rendered[key] = compiled.render(variables)
+            return cached
+
+        return [
+            self._simulate(
+                plan,
+                runtime_variables=scenario.runtime_variables,
+                fail_step_ids=scenario.fail_step_ids,
+                render=render,
+            )
+            for scenario in scenarios
+        ]
+
+    def execute_playbook(
+        self,
+        *,
+        playbook_id: str,
+        runner: Runner,
+        actor: str,
+        tenant_id: str = "",
+        runtime_variables: dict[str, Any] | None = None,
+        max_parallel: int = 4,
+        step_timeout_seconds: float = 300.0,
+        telemetry: TelemetryIngestionPipeline | None = None,
+        campaign: PlaybookCampaignBinding | None = None,
+    ) -> PlaybookExecutionResult:
+        """Execute a playbook, dispatching independent steps concurrently.
+
+        Steps form a dependency DAG. A step without ``depends_on`` follows
+        the same branch edges as ``simulate_playbook``: it waits for every
+        step that can fall through or branch to it and runs only if one of
+        them did, so steps a branch jumps over are skipped. A step with
+        ``depends_on`` waits for those steps instead of its predecessor and
+        is skipped if one of them failed or did not run, unless it is that
+        step's ``next_on_failure`` handler. Ready steps
+        run through ``runner`` on up to ``max_parallel`` threads with their
+        own ``timeout_seconds`` (default ``step_timeout_seconds``), so wall
+        time follows the critical path rather than the sum of all steps.
+
+        An unhandled failure stops dispatching; once in-flight steps finish,
+        succeeded steps are rolled back in reverse completion order, the
+        order ``simulate_playbook`` uses. Step results stream to
+        ``telemetry`` and, for steps mapped by ``campaign``, into campaign
+        technique executions.
+        """
+        if not actor.strip():
+            raise PlaybookEngineError("actor is required")
+        if max_parallel < 1:
+            raise PlaybookEngineError("max_parallel must be >= 1")
+        if step_timeout_seconds <= 0:
+            raise PlaybookEngineError("step_timeout_seconds must be > 0")
+        if telemetry is not None and not tenant_id.strip():
+            raise PlaybookEngineError("tenant_id is required for telemetry")
+        plan = self._plan(playbook_id)
+        return _PlaybookRun(
+            plan,
+            self._dependency_graph(plan),
+            runner=runner,
+            actor=actor.strip(),
+            tenant_id=tenant_id.strip(),
+            runtime_variables=runtime_variables or {},
+            max_parallel=max_parallel,
+            step_timeout_seconds=step_timeout_seconds,
+            telemetry=telemetry,
+            campaign=campaign,
+        ).run()
+
+    def flush(self) -> None:
+        """Persist buffered writes to the configured store."""
+        if self._store is not None:
+            self._store.flush()
+
+    def _step_order(self, step_id: str) -> int:
+        return self._playbook_step_table[step_id].step_order
+
+    def _compile_step(self, step: PlaybookStepRecord) -> _CompiledStep:
+        """Validate and compile a step's condition and templates (lock held)."""
+        module = self._technique_module_table[step.technique_module_id]
+        command = _compile_template(step.command_template or module.default_command_template)
+        rollback_source = step.rollback_template or module.default_rollback_template
+        rollback = _compile_template(rollback_source) if rollback_source else None
+        wrapper = (
+            self._wrapper_template_table[step.wrapper_template_id]
+            if step.wrapper_template_id
+            else None
+        )
+        wrapper_command = _compile_template(wrapper.command_template) if wrapper else None
+        wrapper_rollback = (
+            _compile_template(wrapper.rollback_template)
+            if wrapper and wrapper.rollback_template
+            else None
+        )
+        names: list[str] = []
+        rollback_names: set[str] = set()
+        for template, wraps, rolls_back in (
+            (command, False, False),
+            (rollback, False, True),
+            (wrapper_command, True, False),
+            (wrapper_rollback, True, True),
+        ):
+            if template is None:
+                continue
+            for name in template.names:
+                if wraps and name == "payload":
+                    continue
+                if name not in names:
+                    names.append(name)
+                if rolls_back:
+                    rollback_names.add(name)
+        return _CompiledStep(
+            step=step,
+            module_variables=module.default_variables,
+            condition=(
+                _compile_condition(step.condition_expression)
+                if step.condition_expression
+                else None
+            ),
+            command=command,
+            rollback=rollback,
+            wrapper_command=wrapper_command,
+            wrapper_rollback=wrapper_rollback,
+            names=tuple(names),
+            rollback_names=frozenset(rollback_names),
+        )
+
+    def _plan(self, playbook_id: str) -> _PlaybookPlan:
+        with self._lock:
+            playbook = self._resident_playbook(playbook_id)
+            if playbook is None:
+                raise PlaybookEngineError("playbook not found")
+            plan = self._playbook_plans.get(playbook_id)
+            if plan is None:
+                step_ids = self._playbook_step_ids[playbook_id]
+                plan = self._playbook_plans[playbook_id] = _PlaybookPlan(
+                    playbook=playbook,
+                    steps=tuple(self._compiled_steps[step_id] for step_id in step_ids),
+                    positions={step_id: index for index, step_id in enumerate(step_ids)},
+                )
+        if not plan.steps:
             raise PlaybookEngineError("playbook has no steps")
+        return plan
 
-        steps_by_id = {step.step_id: step for step in ordered}
-        order_index = {step.step_id: index for index, step in enumerate(ordered)}
-        fail_step_ids = set(fail_step_ids or set())
-        variables: dict[str, Any] = {**playbook.default_variables, **dict(runtime_variables or {})}
-        executed: list[PlaybookStepRecord] = []
+    @staticmethod
+    def _simulate(
+        plan: _PlaybookPlan,
+        *,
+        runtime_variables: dict[str, Any],
+        fail_step_ids: set[str] | frozenset[str],
+        render: Callable[[_CompiledStep, dict[str, Any]], tuple[str, str | None]],
+    ) -> PlaybookSimulationResult:
+        variables: dict[str, Any] = {**plan.playbook.default_variables, **runtime_variables}
+        # Executed steps with their rendered rollback and the write counter
+        # at render time; rollback reuses the render unless a variable it
+        # reads was assigned afterwards.
+        executed: list[tuple[_CompiledStep, str | None, int]] = []
+        assigned_at: dict[str, int] = {}
+        writes = 0
         step_results: list[StepSimulationRecord] = []
         rollback_results: list[StepSimulationRecord] = []
         terminal_failure = False
 
-        current_step_id = ordered[0].step_id
+        current: int | None = 0
         visited: set[str] = set()
-        while current_step_id:
-            if current_step_id in visited:
-                raise PlaybookEngineError("loop detected in playbook branch graph")
-            visited.add(current_step_id)
-            step = steps_by_id.get(current_step_id)
-            if step is None:
-                raise PlaybookEngineError("branch step target not found")
+        while current is not None:
+            compiled = plan.steps[current]
+            step = compiled.step
+            visited.add(step.step_id)
 
-            if not self._evaluate_condition(step.condition_expression, variables):
+            if compiled.condition is not None and not compiled.condition(variables):
                 step_results.append(
                     StepSimulationRecord(
                         step_id=step.step_id,
                         status=StepExecutionStatus.SKIPPED,
                     )
                 )
-                current_step_id = self._resolve_next_step_id(step, succeeded=True, ordered=ordered, order_index=order_index)
+                current = PlaybookEngine._next_position(plan, current, step.next_on_success, visited)
                 continue
 
-            command, rollback_command = self._render_step(step=step, variables=variables)
+            command, rollback_command = render(compiled, variables)
             if step.step_id in fail_step_ids:
                 step_results.append(
                     StepSimulationRecord(
@@ -364,12 +1212,12 @@ class PlaybookEngine:
                     )
                 )
                 if step.next_on_failure:
-                    current_step_id = step.next_on_failure
+                    current = PlaybookEngine._branch_position(plan, step.next_on_failure, visited)
                     continue
                 terminal_failure = True
                 break
 
-            executed.append(step)
+            executed.append((compiled, rollback_command, writes))
             step_results.append(
                 StepSimulationRecord(
                     step_id=step.step_id,
@@ -378,17 +1226,23 @@ class PlaybookEngine:
                     rendered_rollback=rollback_command,
                 )
             )
-            variables[f"step_{step.step_order}_status"] = "succeeded"
-            variables[f"step_{step.step_order}_command"] = command
-            current_step_id = self._resolve_next_step_id(step, succeeded=True, ordered=ordered, order_index=order_index)
+            for name, value in (
+                (f"step_{step.step_order}_status", "succeeded"),
+                (f"step_{step.step_order}_command", command),
+            ):
+                variables[name] = value
+                assigned_at[name] = writes
+                writes += 1
+            current = PlaybookEngine._next_position(plan, current, step.next_on_success, visited)
 
         if terminal_failure:
-            for step in reversed(executed):
-                _, rollback_command = self._render_step(step=step, variables=variables)
+            for compiled, rollback_command, mark in reversed(executed):
+                if any(assigned_at.get(name, -1) >= mark for name in compiled.rollback_names):
+                    _, rollback_command = render(compiled, variables)
                 if rollback_command:
                     rollback_results.append(
                         StepSimulationRecord(
-                            step_id=step.step_id,
+                            step_id=compiled.step.step_id,
                             status=StepExecutionStatus.ROLLED_BACK,
                             rendered_rollback=rollback_command,
                         )
@@ -398,69 +1252,169 @@ class PlaybookEngine:
             overall = StepExecutionStatus.SUCCEEDED
 
         return PlaybookSimulationResult(
-            playbook_id=playbook_id,
+            playbook_id=plan.playbook.playbook_id,
             status=overall,
             step_results=tuple(step_results),
             rollback_results=tuple(rollback_results),
             variables_final=variables,
         )
 
-    def _ordered_steps(self, *, playbook_id: str) -> list[PlaybookStepRecord]:
-        rows = [step for step in self._playbook_step_table.values() if step.playbook_id == playbook_id]
-        return sorted(rows, key=lambda item: item.step_order)
-
-    def _resolve_next_step_id(
-        self,
-        step: PlaybookStepRecord,
-        *,
-        succeeded: bool,
-        ordered: list[PlaybookStepRecord],
-        order_index: dict[str, int],
-    ) -> str | None:
-        branch = step.next_on_success if succeeded else step.next_on_failure
+    @staticmethod
+    def _next_position(
+        plan: _PlaybookPlan, position: int, branch: str | None, visited: set[str]
+    ) -> int | None:
         if branch:
-            return branch
-        idx = order_index[step.step_id]
-        next_idx = idx + 1
-        if next_idx >= len(ordered):
+            return PlaybookEngine._branch_position(plan, branch, visited)
+        position += 1
+        if position >= len(plan.steps):
             return None
-        return ordered[next_idx].step_id
+        if plan.steps[position].step.step_id in visited:
+            raise PlaybookEngineError("loop detected in playbook branch graph")
+        return position
 
-    def _render_step(self, *, step: PlaybookStepRecord, variables: dict[str, Any]) -> tuple[str, str | None]:
-        module = self._technique_module_table[step.technique_module_id]
-        context = {**module.default_variables, **variables, **step.variables}
-        base_command_template = step.command_template or module.default_command_template
-        base_rollback_template = step.rollback_template or module.default_rollback_template
-        command = self._format_template(base_command_template, context)
-        rollback_command = (
-            self._format_template(base_rollback_template, context)
-            if base_rollback_template
-            else None
+    @staticmethod
+    def _branch_position(plan: _PlaybookPlan, step_id: str, visited: set[str]) -> int:
+        if step_id in visited:
+            raise PlaybookEngineError("loop detected in playbook branch graph")
+        position = plan.positions.get(step_id)
+        if position is None:
+            raise PlaybookEngineError("branch step target not found")
+        return position
+
+    @staticmethod
+    def _dependency_graph(plan: _PlaybookPlan) -> _DependencyGraph:
+        count = len(plan.steps)
+
+        def branch_target(step_id: str) -> int:
+            position = plan.positions.get(step_id)
+            if position is None:
+                raise PlaybookEngineError("branch step target not found")
+            return position
+
+        successors: list[int | None] = []
+        handlers: list[int | None] = []
+        for position, compiled in enumerate(plan.steps):
+            step = compiled.step
+            if step.next_on_success:
+                successors.append(branch_target(step.next_on_success))
+            else:
+                successors.append(position + 1 if position + 1 < count else None)
+            handlers.append(branch_target(step.next_on_failure) if step.next_on_failure else None)
+
+        # Steps reachable from the first one along success or failure
+        # edges; anything a branch always jumps over never runs.
+        reachable = {0}
+        frontier = [0]
+        while frontier:
+            position = frontier.pop()
+            for target in (successors[position], handlers[position]):
+                if target is not None and target not in reachable:
+                    reachable.add(target)
+                    frontier.append(target)
+        flow_sources: dict[int, list[int]] = {}
+        for position in sorted(reachable):
+            for target in (successors[position], handlers[position]):
+                if target is not None:
+                    flow_sources.setdefault(target, []).append(position)
+
+        dependencies: list[tuple[int, ...]] = []
+        requires: list[tuple[int, ...] | None] = []
+        branch_sources: list[frozenset[int]] = []
+        for position, compiled in enumerate(plan.steps):
+            step = compiled.step
+            required: tuple[int, ...] | None = None
+            if step.depends_on is not None:
+                items: list[int] = []
+                for step_id in step.depends_on:
+                    dependency = plan.positions.get(step_id)
+                    if dependency is None:
+                        raise PlaybookEngineError("dependency step not found")
+                    items.append(dependency)
+                required = tuple(dict.fromkeys(items))
+            requires.append(required)
+            if position not in reachable:
+                dependencies.append(())
+                branch_sources.append(frozenset())
+                continue
+            sources = flow_sources.get(position, [])
+            if required is None:
+                wanted = list(sources)
+            else:
+                # Declared dependencies replace the implicit fall-through
+                # edge; explicit branches to the step still gate it.
+                sources = [
+                    source
+                    for source in sources
+                    if step.step_id in _branch_ids(plan.steps[source].step)
+                ]
+                wanted = [item for item in required if item in reachable] + sources
+            dependencies.append(tuple(dict.fromkeys(wanted)))
+            branch_sources.append(frozenset(sources))
+
+        dependents: list[list[int]] = [[] for _ in plan.steps]
+        for position, items in enumerate(dependencies):
+            for dependency in items:
+                dependents[dependency].append(position)
+        waiting = [len(items) for items in dependencies]
+        frontier = [position for position, pending in enumerate(waiting) if not pending]
+        ordered = 0
+        while frontier:
+            ordered += 1
+            for dependent in dependents[frontier.pop()]:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    frontier.append(dependent)
+        if ordered != len(dependencies):
+            raise PlaybookEngineError("loop detected in playbook dependency graph")
+        return _DependencyGraph(
+            dependencies=tuple(dependencies),
+            dependents=tuple(tuple(items) for items in dependents),
+            requires=tuple(requires),
+            branch_sources=tuple(branch_sources),
+            successors=tuple(successors),
+            handlers=tuple(handlers),
+            unreachable=frozenset(range(count)) - reachable,
         )
-        if step.wrapper_template_id:
-            wrapper = self._wrapper_template_table[step.wrapper_template_id]
-            command = self._format_template(
-                wrapper.command_template,
-                {**context, "payload": command},
-            )
-            if rollback_command and wrapper.rollback_template:
-                rollback_command = self._format_template(
-                    wrapper.rollback_template,
-                    {**context, "payload": rollback_command},
-                )
-        return command, rollback_command
 
-    def _format_template(self, template: str | None, context: dict[str, Any]) -> str:
-        if template is None:
-            raise PlaybookEngineError("template not defined")
-        try:
-            return template.format(**context)
-        except KeyError as exc:
-            raise PlaybookEngineError(f"missing template variable: {exc.args[0]}") from exc
+    def _persist(self, table: str, row_id: str, partition_id: str, record: Any) -> None:
+        if self._store is not None:
+            self._store.write(
+                _STORE_NAMESPACE,
+                [StoredRow(table, row_id, partition_id, encode_record(record))],
+            )
 
-    def _evaluate_condition(self, expression: str | None, variables: dict[str, Any]) -> bool:
-        if not expression:
-            return True
-        evaluator = _SafeConditionEvaluator(variables=variables)
-        return evaluator.evaluate(expression)
+    def _resident_playbook(self, playbook_id: str) -> PlaybookRecord | None:
+        """Return a playbook, loading it from the store if cold (lock held)."""
+        playbook = self._playbook_table.get(playbook_id)
+        if playbook is None and self._store is not None and playbook_id:
+            for row in self._store.load_partition(_STORE_NAMESPACE, playbook_id):
+                if row.table == "playbook":
+                    playbook = decode_record(PlaybookRecord, row.payload)
+                elif row.table == "step":
+                    step = decode_record(PlaybookStepRecord, row.payload)
+                    self._playbook_step_table[step.step_id] = step
+                    self._compiled_steps[step.step_id] = self._compile_step(step)
+                    insort(
+                        self._playbook_step_ids.setdefault(playbook_id, []),
+                        step.step_id,
+                        key=self._step_order,
+                    )
+            if playbook is None:
+                return None
+            self._playbook_table[playbook_id] = playbook
+            self._playbook_step_ids.setdefault(playbook_id, [])
+        if playbook is not None:
+            self._touch(playbook_id)
+        return playbook
 
+    def _touch(self, playbook_id: str) -> None:
+        if self._store is None or not self._bounded:
+            return
+        for cold_id in self._resident.touch(playbook_id):
+            self._store.flush()
+            self._resident.discard(cold_id)
+            self._playbook_table.pop(cold_id, None)
+            self._playbook_plans.pop(cold_id, None)
+            for step_id in self._playbook_step_ids.pop(cold_id, []):
+                self._playbook_step_table.pop(step_id, None)
+                self._compiled_steps.pop(step_id, None)
@@ -18,7 +18,10 @@ from __future__ import annotations
 
 import base64
 import os
-from dataclasses import dataclass
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any, Protocol
 from urllib.parse import urlparse
 
@@ -92,6 +95,41 @@ class VaultTransitConfig:
             raise ValueError("key_name must be a single path segment")
 
 
+@dataclass(slots=True, frozen=True)
+class VaultTransitMetrics:
+    """Request, batching and connection reuse counters for a transit signer."""
+
+    requests: int
+    sign_requests: int
+    signed_payloads: int
+    public_key_cache_hits: int
+    public_key_cache_misses: int
+    connections_opened: int
+
+    @property
+    def connections_reused(self) -> int:
+        """Return requests served over an already-open connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def payloads_per_sign_request(self) -> float:
+        """Return the mean number of payloads carried by one sign call."""
+        if self.sign_requests == 0:
+            return 0.0
+        return self.signed_payloads / self.sign_requests
+
+
+@dataclass(slots=True)
+class _PendingSignBatch:
+    """Sign requests coalesced into one transit ``batch_input`` call."""
+
+    payloads: list[bytes] = field(default_factory=list)
+    full: threading.Event = field(default_factory=threading.Event)
+    done: threading.Event = field(default_factory=threading.Event)
+    results: list[str | VaultTransitError] | None = None
+    error: BaseException | None = None
+
+
 class ManifestSigner(Protocol):
     """Abstract signer contract for future JWS manifest issuance."""
 
@@ -103,15 +141,43 @@ class ManifestSigner(Protocol):
 
 
 class VaultTransitSigner:
-    """HashiCorp Vault transit-backed signing service."""
+    """HashiCorp Vault transit-backed signing service.
+
+    With ``batch_window_seconds`` set, concurrent ``sign_payload`` calls that
+    share signing options are held for up to that window and sent as one
+    transit ``batch_input`` request of at most ``max_batch_size`` payloads.
+    Public keys are cached per key version; the latest-version pointer is
+    refreshed after ``public_key_ttl_seconds`` and on rotation.
+    """
 
     def __init__(
         self,
         config: VaultTransitConfig,
         session: requests.Session | None = None,
+        *,
+        batch_window_seconds: float = 0.0,
+        max_batch_size: int = 128,
+        public_key_ttl_seconds: float = 60.0,
     ) -> None:
+        if batch_window_seconds < 0:
+            raise ValueError("batch_window_seconds must be non-negative")
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be greater than zero")
         self._config = config
         self._session = session or requests.Session()
+        self._batch_window_seconds = batch_window_seconds
+        self._max_batch_size = max_batch_size
+        self._public_key_ttl_seconds = public_key_ttl_seconds
+        self._pending_batches: dict[tuple[Any, ...], _PendingSignBatch] = {}
+        self._public_keys: dict[int, str] = {}
+        self._latest_version: int | None = None
+        self._latest_version_read_at = 0.0
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._sign_requests = 0
+        self._signed_payloads = 0
+        self._public_key_cache_hits = 0
+        self._public_key_cache_misses = 0
 
         verify: bool | str = config.verify_tls
         if config.verify_tls and config.ca_cert_file:
@@ -143,20 +209,25 @@ class VaultTransitSigner:
                 "allow_plaintext_backup": False,
             },
         )
+        self.invalidate_public_key_cache()
 
     def rotate_signing_key(self) -> dict[str, Any]:
         """Rotate transit key version for orchestrator signature issuance."""
         endpoint = self._vault_endpoint(
             f"/v1/{self._config.mount_path}/keys/{self._config.key_name}/rotate"
         )
-        return self._request("POST", endpoint, {})
+        data = self._request("POST", endpoint, {})
+        self.invalidate_public_key_cache()
+        return data
 
     def read_signing_key_metadata(self) -> dict[str, Any]:
         """Read raw key metadata to support rotation workflow checks."""
         endpoint = self._vault_endpoint(
             f"/v1/{self._config.mount_path}/keys/{self._config.key_name}"
         )
-        return self._request("GET", endpoint)
+        data = self._request("GET", endpoint)
+        self._remember_public_keys(data)
+        return data
 
     def sign_payload(
         self,
@@ -171,30 +242,68 @@ class VaultTransitSigner:
         """Sign payload bytes with the configured transit key."""
         if not payload:
             raise ValueError("payload must not be empty")
+        options = (
+            hash_algorithm,
+            prehashed,
+            key_version,
+            signature_algorithm,
+            marshaling_algorithm,
+        )
+        if self._batch_window_seconds <= 0:
+            return self._sign(payload, options)
+        return self._sign_coalesced(payload, options)
 
-        endpoint = self._vault_endpoint(
-            f"/v1/{self._config.mount_path}/sign/{self._config.key_name}"
+    def sign_payloads(
+        self,
+        payloads: Sequence[bytes],
+        *,
+        hash_algorithm: str = "sha2-256",
+        prehashed: bool = False,
+        key_version: int | None = None,
+        signature_algorithm: str | None = None,
+        marshaling_algorithm: str | None = "jws",
+    ) -> list[str]:
+        """Sign many payloads using transit ``batch_input``; order is preserved."""
+        if any(not payload for payload in payloads):
+            raise ValueError("payload must not be empty")
+        options = (
+            hash_algorithm,
+            prehashed,
+            key_version,
+            signature_algorithm,
+            marshaling_algorithm,
         )
-        body: dict[str, Any] = {
-            "input": base64.b64encode(payload).decode("ascii"),
-            "prehashed": prehashed,
-            "hash_algorithm": hash_algorithm,
-        }
-        if key_version is not None:
-            body["key_version"] = key_version
-        if signature_algorithm:
-            body["signature_algorithm"] = signature_algorithm
-        if marshaling_algorithm:
-            body["marshaling_algorithm"] = marshaling_algorithm
+        signatures: list[str] = []
+        for start in range(0, len(payloads), self._max_batch_size):
+            signatures.extend(
+                self._sign_batch(payloads[start : start + self._max_batch_size], options)
+            )
+        return signatures
+
+    def metrics(self) -> VaultTransitMetrics:
+        """Return request, batching and connection reuse counters."""
+        with self._lock:
+            return VaultTransitMetrics(
+                requests=self._requests,
+                sign_requests=self._sign_requests,
+                signed_payloads=self._signed_payloads,
+                public_key_cache_hits=self._public_key_cache_hits,
+                public_key_cache_misses=self._public_key_cache_misses,
+                connections_opened=self._connections_opened(),
+            )
 
-        data = self._request("POST", endpoint, body)
-        signature = data.get("signature")
-        if not isinstance(signature, str) or not signature:
-            raise VaultTransitError("Vault transit response missing signature")
-        return signature
+    def invalidate_public_key_cache(self) -> None:
+        """Force the next ``read_public_key`` to re-read key metadata."""
+        with self._lock:
+            self._public_keys.clear()
+            self._latest_version = None
 
     def read_public_key(self, key_version: int | None = None) -> str:
         """Load PEM public key metadata from Vault transit key details."""
+        cached = self._cached_public_key(key_version)
+        if cached is not None:
+            return cached
+
         endpoint = self._vault_endpoint(
             f"/v1/{self._config.mount_path}/keys/{self._config.key_name}"
         )
@@ -221,14 +330,188 @@ class VaultTransitSigner:
             raise VaultTransitError(
                 "Vault transit response missing public key for requested version"
             )
+        self._remember_public_keys(data)
         return public_key
 
+    def _cached_public_key(self, key_version: int | None) -> str | None:
+        with self._lock:
+            if key_version is None and (
+                self._latest_version is None
+                or time.monotonic() - self._latest_version_read_at
+                >= self._public_key_ttl_seconds
+            ):
+                self._public_key_cache_misses += 1
+                return None
+            version = self._latest_version if key_version is None else key_version
+            public_key = self._public_keys.get(version) if version is not None else None
+            if public_key is None:
+                self._public_key_cache_misses += 1
+            else:
+                self._public_key_cache_hits += 1
+            return public_key
+
+    def _remember_public_keys(self, data: dict[str, Any]) -> None:
+        keys = data.get("keys")
+        if not isinstance(keys, dict):
+            return
+        with self._lock:
+            for version, key_meta in keys.items():
+                if not isinstance(key_meta, dict):
+                    continue
+                public_key = key_meta.get("public_key")
+                if isinstance(public_key, str) and public_key and str(version).isdigit():
+                    self._public_keys[int(version)] = public_key
+            latest = data.get("latest_version")
+            if isinstance(latest, int):
+                self._latest_version = latest
+                self._latest_version_read_at = time.monotonic()
+
+    def _sign(self, payload: bytes, options: tuple[Any, ...]) -> str:
+        body = self._sign_body(options)
+        body["input"] = base64.b64encode(payload).decode("ascii")
+        data = self._request("POST", self._sign_endpoint(), body)
+        with self._lock:
+            self._sign_requests += 1
+            self._signed_payloads += 1
+        signature = data.get("signature")
+        if not isinstance(signature, str) or not signature:
+            raise VaultTransitError("Vault transit response missing signature")
+        return signature
+
+    def _sign_batch(
+        self, payloads: Sequence[bytes], options: tuple[Any, ...]
+    ) -> list[str]:
+        signatures: list[str] = []
+        for result in self._sign_batch_results(payloads, options):
+            if isinstance(result, VaultTransitError):
+                raise result
+            signatures.append(result)
+        return signatures
+
+    def _sign_batch_results(
+        self, payloads: Sequence[bytes], options: tuple[Any, ...]
+    ) -> list[str | VaultTransitError]:
+        """Sign ``payloads`` in one request, keeping item failures per index."""
+        if not payloads:
+            return []
+        body = self._sign_body(options)
+        body["batch_input"] = [
+            {"input": base64.b64encode(payload).decode("ascii")} for payload in payloads
+        ]
+        data = self._request("POST", self._sign_endpoint(), body)
+        with self._lock:
+            self._sign_requests += 1
+            self._signed_payloads += len(payloads)
+        results = data.get("batch_results")
+        if not isinstance(results, list) or len(results) != len(payloads):
+            raise VaultTransitError("Vault transit response missing batch results")
+        items: list[str | VaultTransitError] = []
+        for result in results:
+            signature = result.get("signature") if isinstance(result, dict) else None
+            if not isinstance(signature, str) or not signature:
+                error = result.get("error") if isinstance(result, dict) else None
+                items.append(
+                    VaultTransitError(
+                        "Vault transit batch item failed: "
+                        f"{error or 'missing signature'}"
+                    )
+                )
+            else:
+                items.append(signature)
+        return items
+
+    def _sign_coalesced(self, payload: bytes, options: tuple[Any, ...]) -> str:
+        with self._lock:
+            batch = self._pending_batches.get(options)
+            leader = batch is None
+            if batch is None:
+                batch = _PendingSignBatch()
+                self._pending_batches[options] = batch
+            index = len(batch.payloads)
+            batch.payloads.append(payload)
+            if len(batch.payloads) >= self._max_batch_size:
+                del self._pending_batches[options]
+                batch.full.set()
+
+        if leader:
+            # The first caller waits out the window, then signs for everyone.
+            batch.full.wait(self._batch_window_seconds)
+            with self._lock:
+                if self._pending_batches.get(options) is batch:
+                    del self._pending_batches[options]
+            try:
+                if len(batch.payloads) == 1:
+                    batch.results = [self._sign(batch.payloads[0], options)]
+                else:
+                    batch.results = self._sign_batch_results(batch.payloads, options)
+            except BaseException as exc:
+                batch.error = exc
+                raise
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+            if batch.error is not None:
+                # Each waiter gets its own exception; sharing one instance
+                # would splice every caller's traceback into the same object.
+                raise VaultTransitError(
+                    f"coalesced Vault transit sign request failed: {batch.error}"
+                ) from batch.error
+
+        assert batch.results is not None
+        result = batch.results[index]
+        if isinstance(result, VaultTransitError):
+            raise result
+        return result
+
+    @staticmethod
+    def _sign_body(options: tuple[Any, ...]) -> dict[str, Any]:
+        (
+            hash_algorithm,
+            prehashed,
+            key_version,
+            signature_algorithm,
+            marshaling_algorithm,
+        ) = options
+        body: dict[str, Any] = {
+            "prehashed": prehashed,
+            "hash_algorithm": hash_algorithm,
+        }
+        if key_version is not None:
+            body["key_version"] = key_version
+        if signature_algorithm:
+            body["signature_algorithm"] = signature_algorithm
+        if marshaling_algorithm:
+            body["marshaling_algorithm"] = marshaling_algorithm
+        return body
+
+    def _sign_endpoint(self) -> str:
+        return self._vault_endpoint(
+            f"/v1/{self._config.mount_path}/sign/{self._config.key_name}"
+        )
+
+    def _connections_opened(self) -> int:
+        adapters = getattr(self._session, "adapters", None)
+        if not isinstance(adapters, dict):
+            return 0
+        opened = 0
+        for adapter in adapters.values():
+            pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+            if pools is None:
+                continue
+            for key in pools.keys():
+                pool = pools.get(key)
+                opened += getattr(pool, "num_connections", 0) if pool is not None else 0
+        return opened
+
     def _request(
         self,
         method: str,
         url: str,
         payload: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
+        with self._lock:
+            self._requests += 1
         try:
             response = self._session.request(
                 method=method,
@@ -16,10 +16,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from threading import Lock
-from typing import Any
+from threading import Condition, Lock, Thread
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from pkg.logging.framework import emit_audit_event, get_logger
@@ -31,8 +35,13 @@ from pkg.orchestrator.messaging import (
 )
 from pkg.orchestrator.telemetry_schema import TelemetrySchemaParser
 
+if TYPE_CHECKING:
+    from pkg.orchestrator.event_loop import AsyncEventLoop
+
 logger = get_logger("spectrastrike.orchestrator.telemetry")
 
+_MAX_RETRY_BACKOFF = 30.0
+
 
 @dataclass(slots=True)
 class TelemetryEvent:
@@ -49,23 +58,52 @@ class TelemetryEvent:
     stream_position: int = 0
 
 
+class TelemetryBackpressureError(RuntimeError):
+    """Raised when ingestion stays above the high-water mark past its timeout."""
+
+
 class TelemetryIngestionPipeline:
-    """Thread-safe telemetry ingestion with buffered batch flushing."""
+    """Thread-safe telemetry ingestion with buffered batch flushing.
+
+    Flushing is manual by default. ``start_flush_worker`` runs a background
+    worker that publishes full batches as they form, publishes partial batches
+    once the oldest buffered event has lingered for ``max_linger_seconds`` and
+    drains the buffer on shutdown. A batch whose publish raises is put back at
+    the head of the buffer and retried after a backoff. While the worker runs,
+    ``ingest`` blocks once ``high_water_mark`` events are buffered until the
+    worker catches up, and fails fast if the worker has died.
+    """
 
     def __init__(
         self,
         batch_size: int = 50,
         publisher: TelemetryPublisher | None = None,
         schema_parser: TelemetrySchemaParser | None = None,
+        *,
+        max_linger_seconds: float = 1.0,
+        high_water_mark: int | None = None,
+        backpressure_timeout: float | None = 5.0,
     ) -> None:
         if batch_size <= 0:
             raise ValueError("batch_size must be greater than zero")
+        if max_linger_seconds <= 0:
+            raise ValueError("max_linger_seconds must be greater than zero")
+        if high_water_mark is not None and high_water_mark < batch_size:
+            raise ValueError("high_water_mark must be at least batch_size")
         self._batch_size = batch_size
-        self._buffer: list[TelemetryEvent] = []
+        self._max_linger_seconds = max_linger_seconds
+        self._high_water_mark = high_water_mark
+        self._backpressure_timeout = backpressure_timeout
+        self._buffer: deque[TelemetryEvent] = deque()
+        self._enqueued_at: deque[float] = deque()
         self._lock = Lock()
+        self._flush_signal = Condition(self._lock)
+        self._not_full = Condition(self._lock)
         self._stream_position = 0
         self._publisher = publisher
         self._schema_parser = schema_parser or TelemetrySchemaParser()
+        self._worker: Future[None] | None = None
+        self._worker_stopping = False
 
     def ingest(
         self,
@@ -82,6 +120,7 @@ class TelemetryIngestionPipeline:
         normalized = dict(attributes)
         normalized["tenant_id"] = tenant_id
         with self._lock:
+            self._wait_below_high_water_mark()
             self._stream_position += 1
             stream_position = self._stream_position
             event = TelemetryEvent(
@@ -94,6 +133,9 @@ class TelemetryIngestionPipeline:
                 stream_position=stream_position,
             )
             self._buffer.append(event)
+            self._enqueued_at.append(time.monotonic())
+            if len(self._buffer) >= self._batch_size:
+                self._flush_signal.notify()
 
         logger.info("Telemetry event ingested: %s", event.event_id)
         emit_audit_event(
@@ -130,8 +172,7 @@ class TelemetryIngestionPipeline:
         with self._lock:
             if len(self._buffer) < self._batch_size:
                 return []
-            batch = self._buffer[: self._batch_size]
-            self._buffer = self._buffer[self._batch_size :]
+            batch = self._drain(self._batch_size)
 
         logger.info("Telemetry batch flushed: %s events", len(batch))
         return batch
@@ -139,8 +180,7 @@ class TelemetryIngestionPipeline:
     def flush_all(self) -> list[TelemetryEvent]:
         """Flush all buffered events regardless of batch size."""
         with self._lock:
-            batch = list(self._buffer)
-            self._buffer.clear()
+            batch = self._drain(len(self._buffer))
 
         if batch:
             logger.info("Telemetry full flush: %s events", len(batch))
@@ -154,6 +194,206 @@ class TelemetryIngestionPipeline:
         """Flush all events and publish through configured broker transport."""
         return await self._publish_batch(self.flush_all())
 
+    @property
+    def flush_worker_running(self) -> bool:
+        """Return whether the background flush worker is active."""
+        with self._lock:
+            return self._worker is not None
+
+    def start_flush_worker(
+        self, event_loop: AsyncEventLoop | None = None
+    ) -> Future[None]:
+        """Start the background flush worker.
+
+        The worker runs on ``event_loop`` when one is given and otherwise on a
+        dedicated daemon thread with its own asyncio loop.
+        """
+        if self._publisher is None:
+            raise RuntimeError("Telemetry publisher is not configured")
+        with self._lock:
+            if self._worker is not None:
+                return self._worker
+            self._worker_stopping = False
+            if event_loop is not None:
+                worker = event_loop.submit(self.run_flush_worker())
+            else:
+                worker = Future()
+                Thread(
+                    target=self._run_worker_thread,
+                    args=(worker,),
+                    name="spectrastrike-telemetry-flush",
+                    daemon=True,
+                ).start()
+            self._worker = worker
+        worker.add_done_callback(self._on_worker_done)
+        return worker
+
+    def stop_flush_worker(self, timeout: float | None = 5.0) -> None:
+        """Stop the flush worker after it drains and publishes the buffer.
+
+        If the worker is still draining after ``timeout`` the ``TimeoutError``
+        propagates and the worker stays registered, so a later call can wait
+        for it again.
+        """
+        with self._lock:
+            worker = self._worker
+            if worker is None:
+                return
+            self._worker_stopping = True
+            self._flush_signal.notify_all()
+            self._not_full.notify_all()
+        try:
+            worker.result(timeout=timeout)
+        finally:
+            if worker.done():
+                with self._lock:
+                    if self._worker is worker:
+                        self._worker = None
+
+    async def run_flush_worker(self) -> None:
+        """Publish batches on size and linger triggers until stopped.
+
+        Failed batches are requeued, never dropped. If the final drain on
+        shutdown fails, the error is raised with the events still buffered.
+        """
+        failures = 0
+        while True:
+            stopping = await asyncio.to_thread(self._wait_for_flush_trigger)
+            batches = self._drain_triggered(stopping)
+            failed = False
+            for position, batch in enumerate(batches):
+                try:
+                    result = await self._publish_batch(batch)
+                except Exception:  # noqa: BLE001 - worker must keep draining
+                    pending = [event for chunk in batches[position:] for event in chunk]
+                    self._requeue(pending)
+                    logger.exception(
+                        "Telemetry auto-flush failed: %s events requeued", len(pending)
+                    )
+                    if stopping:
+                        raise
+                    failures += 1
+                    failed = True
+                    break
+                failures = 0
+                logger.info(
+                    "Telemetry auto-flush published %s events (%s dead-lettered)",
+                    result.published,
+                    result.dead_lettered,
+                )
+            if failed:
+                backoff = min(self._max_linger_seconds * 2**failures, _MAX_RETRY_BACKOFF)
+                await asyncio.to_thread(self._wait_for_stop, backoff)
+                continue
+            if stopping:
+                return
+
+    def _run_worker_thread(self, worker: Future[None]) -> None:
+        if not worker.set_running_or_notify_cancel():
+            return
+        try:
+            asyncio.run(self.run_flush_worker())
+        except BaseException as exc:  # noqa: BLE001 - surfaced through future
+            worker.set_exception(exc)
+        else:
+            worker.set_result(None)
+
+    def _on_worker_done(self, worker: Future[None]) -> None:
+        """Wake producers blocked on backpressure once the worker exits."""
+        del worker
+        with self._lock:
+            self._not_full.notify_all()
+
+    def _wait_for_stop(self, timeout: float) -> None:
+        """Sleep up to ``timeout`` seconds, returning early when stopping."""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while not self._worker_stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._flush_signal.wait(remaining)
+
+    def _wait_for_flush_trigger(self) -> bool:
+        """Block until a batch is due; return whether the worker is stopping."""
+        with self._lock:
+            while not self._worker_stopping:
+                if len(self._buffer) >= self._batch_size:
+                    break
+                if self._enqueued_at:
+                    remaining = (
+                        self._enqueued_at[0]
+                        + self._max_linger_seconds
+                        - time.monotonic()
+                    )
+                    if remaining <= 0:
+                        break
+                    self._flush_signal.wait(remaining)
+                else:
+                    self._flush_signal.wait()
+            return self._worker_stopping
+
+    def _drain_triggered(self, stopping: bool) -> list[list[TelemetryEvent]]:
+        batches: list[list[TelemetryEvent]] = []
+        with self._lock:
+            while len(self._buffer) >= self._batch_size:
+                batches.append(self._drain(self._batch_size))
+            if self._buffer and (
+                stopping
+                or time.monotonic() - self._enqueued_at[0] >= self._max_linger_seconds
+            ):
+                batches.append(self._drain(len(self._buffer)))
+        return batches
+
+    def _requeue(self, events: list[TelemetryEvent]) -> None:
+        """Put unpublished events back at the buffer head in stream order."""
+        now = time.monotonic()
+        with self._lock:
+            self._buffer.extendleft(reversed(events))
+            self._enqueued_at.extendleft(now for _ in events)
+
+    def _drain(self, count: int) -> list[TelemetryEvent]:
+        """Pop ``count`` events from the buffer head; caller holds the lock."""
+        buffer = self._buffer
+        enqueued_at = self._enqueued_at
+        batch = [buffer.popleft() for _ in range(count)]
+        for _ in range(count):
+            enqueued_at.popleft()
+        if count:
+            self._not_full.notify_all()
+        return batch
+
+    def _wait_below_high_water_mark(self) -> None:
+        """Apply backpressure while the worker runs; caller holds the lock."""
+        if self._high_water_mark is None or self._worker is None:
+            return
+        deadline = (
+            None
+            if self._backpressure_timeout is None
+            else time.monotonic() + self._backpressure_timeout
+        )
+        while (
+            len(self._buffer) >= self._high_water_mark
+            and self._worker is not None
+            and not self._worker_stopping
+        ):
+            if self._worker.done():
+                raise TelemetryBackpressureError(
+                    "telemetry flush worker exited with "
+                    f"{len(self._buffer)} events buffered"
+                )
+            self._flush_signal.notify()
+            if deadline is None:
+                self._not_full.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TelemetryBackpressureError(
+                    "telemetry buffer above high-water mark "
+                    f"({self._high_water_mark} events)"
+                )
+            self._not_full.wait(remaining)
+
     async def _publish_batch(
         self, batch: list[TelemetryEvent]
     ) -> TelemetryPublishResult:
@@ -167,13 +407,19 @@ class TelemetryIngestionPipeline:
         if self._publisher is None:
             raise RuntimeError("Telemetry publisher is not configured")
 
+        envelopes = [self._to_envelope(event) for event in batch]
+        publish_many = getattr(self._publisher, "publish_many", None)
+        if publish_many is not None:
+            results = await publish_many(envelopes)
+        else:
+            results = [await self._publisher.publish(envelope) for envelope in envelopes]
+
         published = 0
         deduplicated = 0
         dead_lettered = 0
         retries = 0
 
-        for event in batch:
-            result = await self._publisher.publish(self._to_envelope(event))
+        for result in results:
             if result.status is PublishStatus.PUBLISHED:
                 published += 1
             elif result.status is PublishStatus.DEDUPLICATED:
@@ -24,6 +24,13 @@ from .aaa_framework import (
     PolicyAuthorizer,
     Principal,
 )
+from .ed25519_keys import (
+    Ed25519BackendUnavailableError,
+    Ed25519KeyError,
+    Ed25519KeyManager,
+    Ed25519KeyReadError,
+    default_key_manager,
+)
 from .high_assurance import (
     BreakGlassError,
     BreakGlassRecord,
@@ -34,6 +41,12 @@ from .high_assurance import (
     PrivilegedSessionRecorder,
     SessionRecordingEvent,
 )
+from .nonce_store import (
+    InMemoryNonceStore,
+    NonceStore,
+    NonceStoreCapacityError,
+    SQLiteNonceStore,
+)
 
 __all__ = [
     "AAAError",
@@ -52,4 +65,13 @@ __all__ = [
     "SessionRecordingEvent",
     "PrivilegeElevationService",
     "PrivilegedSessionRecorder",
+    "Ed25519KeyError",
+    "Ed25519KeyReadError",
+    "Ed25519BackendUnavailableError",
+    "Ed25519KeyManager",
+    "default_key_manager",
+    "NonceStore",
+    "NonceStoreCapacityError",
+    "InMemoryNonceStore",
+    "SQLiteNonceStore",
 ]
@@ -0,0 +1,213 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Cached Ed25519 private-key loading and batch signing."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+
+
+class Ed25519KeyError(RuntimeError):
+    """Raised when an Ed25519 signing key cannot be used."""
+
+
+class Ed25519KeyReadError(Ed25519KeyError):
+    """Raised when the signing key file cannot be read."""
+
+
+class Ed25519BackendUnavailableError(Ed25519KeyError):
+    """Raised when no Ed25519 signing backend is available."""
+
+
+@lru_cache(maxsize=1)
+def _crypto_backend() -> tuple[Any, Any] | None:
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+    except ImportError:
+        return None
+    return serialization, Ed25519PrivateKey
+
+
+def _parse_private_key(key_bytes: bytes) -> Any:
+    backend = _crypto_backend()
+    assert backend is not None
+    serialization, ed25519_private_key = backend
+    if len(key_bytes) == 32:
+        return ed25519_private_key.from_private_bytes(key_bytes)
+    try:
+        return serialization.load_pem_private_key(key_bytes, password=None)
+    except ValueError:
+        return serialization.load_ssh_private_key(key_bytes, password=None)
+
+
+@dataclass(slots=True)
+class _LoadedKey:
+    identity: tuple[int, int, int, int]
+    private_key: Any
+    checked_at: float
+
+
+class Ed25519KeyManager:
+    """Load each private key once and re-load it when the key file rotates.
+
+    The key file is re-stat'ed at most every ``rotation_check_interval``
+    seconds; a changed inode, size, mtime or ctime triggers a reload. When the
+    ``cryptography`` package is unavailable, callers may opt into an
+    ``openssl pkeyutl`` fallback that signs in-memory over pipes, without
+    temporary files.
+    """
+
+    def __init__(
+        self,
+        *,
+        rotation_check_interval: float = 1.0,
+        openssl_binary: str = "openssl",
+    ) -> None:
+        if rotation_check_interval < 0:
+            raise ValueError("rotation_check_interval must be non-negative")
+        self._rotation_check_interval = rotation_check_interval
+        self._openssl_binary = openssl_binary
+        self._keys: dict[str, _LoadedKey] = {}
+        self._lock = Lock()
+        self.loads = 0
+
+    def sign(
+        self,
+        key_path: str,
+        payload: bytes,
+        *,
+        allow_openssl_fallback: bool = False,
+    ) -> bytes:
+        """Return the raw Ed25519 signature of ``payload``."""
+        return self.sign_many(
+            key_path,
+            [payload],
+            allow_openssl_fallback=allow_openssl_fallback,
+        )[0]
+
+    def sign_many(
+        self,
+        key_path: str,
+        payloads: Sequence[bytes],
+        *,
+        allow_openssl_fallback: bool = False,
+    ) -> list[bytes]:
+        """Sign every payload with one key lookup; order is preserved."""
+        if _crypto_backend() is None:
+            if not allow_openssl_fallback:
+                raise Ed25519BackendUnavailableError(
+                    "cryptography dependency is required for Ed25519 signing"
+                )
+            self._identity(os.path.realpath(key_path), key_path)
+            return [self._sign_with_openssl(key_path, payload) for payload in payloads]
+        private_key = self._private_key(key_path)
+        return [private_key.sign(payload) for payload in payloads]
+
+    def invalidate(self, key_path: str | None = None) -> None:
+        """Forget one loaded key, or all of them when ``key_path`` is omitted."""
+        with self._lock:
+            if key_path is None:
+                self._keys.clear()
+            else:
+                self._keys.pop(os.path.realpath(key_path), None)
+
+    def _private_key(self, key_path: str) -> Any:
+        resolved = os.path.realpath(key_path)
+        now = time.monotonic()
+        with self._lock:
+            loaded = self._keys.get(resolved)
+            if loaded is not None and now - loaded.checked_at < self._rotation_check_interval:
+                return loaded.private_key
+
+        identity = self._identity(resolved, key_path)
+        if loaded is not None and loaded.identity == identity:
+            with self._lock:
+                loaded.checked_at = now
+            return loaded.private_key
+
+        try:
+            with open(resolved, "rb") as handle:
+                key_bytes = handle.read()
+        except OSError as exc:
+            raise Ed25519KeyReadError(f"unable to read signing key: {key_path}") from exc
+        private_key = _parse_private_key(key_bytes)
+        with self._lock:
+            self._keys[resolved] = _LoadedKey(
+                identity=identity,
+                private_key=private_key,
+                checked_at=now,
+            )
+            self.loads += 1
+        return private_key
+
+    @staticmethod
+    def _identity(resolved: str, key_path: str) -> tuple[int, int, int, int]:
+        try:
+            stat = os.stat(resolved)
+        except OSError as exc:
+            raise Ed25519KeyReadError(f"unable to read signing key: {key_path}") from exc
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
+    def _sign_with_openssl(self, key_path: str, payload: bytes) -> bytes:
+        command = [self._openssl_binary, "pkeyutl", "-sign", "-inkey", key_path, "-rawin"]
+        memfd: int | None = None
+        if hasattr(os, "memfd_create"):
+            # One-shot Ed25519 signing needs a sized input, which a plain stdin
+            # pipe does not provide before OpenSSL 3.2; an anonymous in-memory
+            # file keeps the message off disk either way.
+            memfd = os.memfd_create("spectrastrike-ed25519-message")
+            os.write(memfd, payload)
+            os.lseek(memfd, 0, os.SEEK_SET)
+            command.extend(["-in", f"/dev/fd/{memfd}"])
+        try:
+            completed = subprocess.run(
+                command,
+                input=None if memfd is not None else payload,
+                capture_output=True,
+                check=False,
+                pass_fds=(memfd,) if memfd is not None else (),
+            )
+        except OSError as exc:
+            raise Ed25519BackendUnavailableError(
+                f"openssl signing unavailable: {exc}"
+            ) from exc
+        finally:
+            if memfd is not None:
+                os.close(memfd)
+        if completed.returncode != 0:
+            detail = completed.stderr.decode("utf-8", errors="replace").strip()
+            raise Ed25519KeyError(f"openssl signing failed: {detail or 'unknown error'}")
+        return completed.stdout
+
+
+_default_manager: Ed25519KeyManager | None = None
+_default_manager_lock = Lock()
+
+
+def default_key_manager() -> Ed25519KeyManager:
+    """Return the process-wide Ed25519 key manager."""
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = Ed25519KeyManager()
+        return _default_manager
@@ -0,0 +1,231 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Shared replay-nonce stores with bucketed expiry."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Protocol
+
+
+class NonceStoreCapacityError(RuntimeError):
+    """Raised when a nonce store is full; callers must reject the request."""
+
+
+class NonceStore(Protocol):
+    """Atomic first-use check for replay nonces."""
+
+    def check_and_store(
+        self,
+        key: str,
+        *,
+        ttl_seconds: float,
+        now: float | None = None,
+        shard_hint: str | None = None,
+    ) -> bool:
+        """Record ``key`` until ``now + ttl_seconds``; return ``False`` on replay."""
+
+    def __len__(self) -> int:
+        """Return the number of retained, possibly expired, nonces."""
+
+
+class _NonceShard:
+    """One lock's worth of nonces, grouped into expiry buckets."""
+
+    __slots__ = ("lock", "expiries", "buckets", "bucket_heap")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.expiries: dict[str, float] = {}
+        self.buckets: dict[int, list[str]] = {}
+        self.bucket_heap: list[int] = []
+
+
+class InMemoryNonceStore:
+    """Process-local nonce store with O(1) amortised expiry.
+
+    Each nonce is filed under the bucket covering its expiry time; whole
+    buckets are dropped once they lapse, so a check never scans live entries.
+    ``shards`` stripes the store across independent locks, selected by
+    ``shard_hint`` (for example a tenant id) or the key itself. When
+    ``max_entries`` live nonces are held, new nonces are refused with
+    ``NonceStoreCapacityError`` rather than evicting unexpired ones.
+    """
+
+    def __init__(
+        self,
+        *,
+        bucket_seconds: float = 1.0,
+        shards: int = 1,
+        max_entries: int | None = None,
+    ) -> None:
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be greater than zero")
+        if shards <= 0:
+            raise ValueError("shards must be greater than zero")
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be greater than zero")
+        self._bucket_seconds = bucket_seconds
+        self._shards = [_NonceShard() for _ in range(shards)]
+        self._shard_capacity = (
+            None if max_entries is None else max(1, math.ceil(max_entries / shards))
+        )
+
+    def check_and_store(
+        self,
+        key: str,
+        *,
+        ttl_seconds: float,
+        now: float | None = None,
+        shard_hint: str | None = None,
+    ) -> bool:
+        """Record ``key`` until ``now + ttl_seconds``; return ``False`` on replay."""
+        current = time.time() if now is None else now
+        expires_at = current + ttl_seconds
+        shard = self._shards[hash(key if shard_hint is None else shard_hint) % len(self._shards)]
+        with shard.lock:
+            self._evict_lapsed_buckets(shard, current)
+            previous = shard.expiries.get(key)
+            if previous is not None and previous > current:
+                return False
+            if (
+                previous is None
+                and self._shard_capacity is not None
+                and len(shard.expiries) >= self._shard_capacity
+            ):
+                raise NonceStoreCapacityError("nonce store is at capacity")
+            shard.expiries[key] = expires_at
+            bucket = self._bucket_for(expires_at)
+            entries = shard.buckets.get(bucket)
+            if entries is None:
+                shard.buckets[bucket] = entries = []
+                heapq.heappush(shard.bucket_heap, bucket)
+            entries.append(key)
+            return True
+
+    def __len__(self) -> int:
+        return sum(len(shard.expiries) for shard in self._shards)
+
+    def _bucket_for(self, expires_at: float) -> int:
+        return math.ceil(expires_at / self._bucket_seconds)
+
+    def _evict_lapsed_buckets(self, shard: _NonceShard, now: float) -> None:
+        heap = shard.bucket_heap
+        while heap and heap[0] * self._bucket_seconds <= now:
+            bucket = heapq.heappop(heap)
+            for key in shard.buckets.pop(bucket, ()):
+                expires_at = shard.expiries.get(key)
+                # A re-used key may have moved to a later bucket.
+                if expires_at is not None and self._bucket_for(expires_at) == bucket:
+                    del shard.expiries[key]
+
+
+class SQLiteNonceStore:
+    """Nonce store in a SQLite file, shareable by replicas on the same host.
+
+    Inserts are atomic across processes; expired rows are purged in batches
+    every ``purge_interval`` writes. ``max_entries`` is enforced at purge
+    time and fails closed like the in-memory store.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int | None = None,
+        purge_interval: int = 256,
+        busy_timeout_seconds: float = 5.0,
+    ) -> None:
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be greater than zero")
+        if purge_interval <= 0:
+            raise ValueError("purge_interval must be greater than zero")
+        self._max_entries = max_entries
+        self._purge_interval = purge_interval
+        self._writes_since_purge = 0
+        self._at_capacity = False
+        self._lock = Lock()
+        self._connection = sqlite3.connect(
+            str(path),
+            timeout=busy_timeout_seconds,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS replay_nonces ("
+            "nonce_key TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS replay_nonces_expiry ON replay_nonces (expires_at)"
+        )
+
+    def check_and_store(
+        self,
+        key: str,
+        *,
+        ttl_seconds: float,
+        now: float | None = None,
+        shard_hint: str | None = None,
+    ) -> bool:
+        """Record ``key`` until ``now + ttl_seconds``; return ``False`` on replay."""
+        del shard_hint
+        current = time.time() if now is None else now
+        with self._lock:
+            if self._at_capacity or self._writes_since_purge >= self._purge_interval:
+                self._purge(current)
+            if self._at_capacity:
+                raise NonceStoreCapacityError("nonce store is at capacity")
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute(
+                    "DELETE FROM replay_nonces WHERE nonce_key = ? AND expires_at <= ?",
+                    (key, current),
+                )
+                cursor.execute(
+                    "INSERT OR IGNORE INTO replay_nonces (nonce_key, expires_at) VALUES (?, ?)",
+                    (key, current + ttl_seconds),
+                )
+                stored = cursor.rowcount == 1
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            if stored:
+                self._writes_since_purge += 1
+            return stored
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM replay_nonces").fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _purge(self, now: float) -> None:
+        self._connection.execute("DELETE FROM replay_nonces WHERE expires_at <= ?", (now,))
+        self._writes_since_purge = 0
+        if self._max_entries is not None:
+            row = self._connection.execute("SELECT COUNT(*) FROM replay_nonces").fetchone()
+            self._at_capacity = int(row[0]) >= self._max_entries
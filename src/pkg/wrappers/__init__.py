@@ -174,6 +174,12 @@ from pkg.wrappers.nmap import (
     NmapScanResult,
     NmapWrapper,
 )
+from pkg.wrappers.execution_pool import WrapperExecutionPool
+from pkg.wrappers.inventory import (
+    ToolInventoryRecord,
+    ToolInventoryService,
+    default_tool_inventory,
+)
 from pkg.wrappers.sliver import (
     SliverCommandRequest,
     SliverCommandResult,
@@ -294,4 +300,8 @@ __all__ = [
     "SliverCommandResult",
     "SliverExecutionError",
     "SliverWrapper",
+    "WrapperExecutionPool",
+    "ToolInventoryRecord",
+    "ToolInventoryService",
+    "default_tool_inventory",
 ]
@@ -17,23 +17,38 @@
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
 import json
 import os
-import re
 import subprocess
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Callable
+from typing import IO, Any, Callable, Iterator, Protocol
 
+from pkg.armory.digest import default_digest_cache
 from pkg.orchestrator.execution_fingerprint import (
     ExecutionFingerprintInput,
     generate_execution_fingerprint,
 )
 from pkg.orchestrator.telemetry_ingestion import TelemetryEvent, TelemetryIngestionPipeline
+from pkg.security.ed25519_keys import (
+    Ed25519BackendUnavailableError,
+    Ed25519KeyReadError,
+    default_key_manager,
+)
 from pkg.specs.validation_sdk import validate_telemetry_extension_v1
 from pkg.telemetry.sdk import build_internal_telemetry_event
+from pkg.wrappers.inventory import (
+    active_tool_inventory,
+    parse_version_text,
+    probe_tool_version,
+)
 
 
 class WrapperContractError(RuntimeError):
@@ -47,12 +62,60 @@ class WrapperCommandResult:
     returncode: int
     stdout: str
     stderr: str
+    truncated: bool = False
 
 
 Runner = Callable[[list[str], float], WrapperCommandResult]
 Signer = Callable[[bytes], str]
 
 
+@dataclass(slots=True, frozen=True)
+class WrapperExecutionScope:
+    """Tool and tenant attribution for commands issued by a wrapper call."""
+
+    tool_name: str | None = None
+    tenant_id: str | None = None
+    output_sink: OutputSinkFactory | None = None
+
+
+_EXECUTION_SCOPE: ContextVar[WrapperExecutionScope] = ContextVar(
+    "spectrastrike_wrapper_execution_scope",
+    default=WrapperExecutionScope(),
+)
+
+
+def current_execution_scope() -> WrapperExecutionScope:
+    """Return the tool/tenant scope bound to the current execution context."""
+    return _EXECUTION_SCOPE.get()
+
+
+@contextmanager
+def execution_scope(
+    *,
+    tool_name: str | None = None,
+    tenant_id: str | None = None,
+    output_sink: OutputSinkFactory | None = None,
+) -> Iterator[WrapperExecutionScope]:
+    """Bind tool/tenant attribution for runners invoked inside the block.
+
+    Runners keep the plain ``Runner`` signature; scheduling runners such as
+    ``WrapperExecutionPool`` read the scope to apply per-tool and per-tenant
+    concurrency limits, and streaming-capable runners feed stdout lines to
+    ``output_sink``. Unset fields inherit from any enclosing scope.
+    """
+    parent = _EXECUTION_SCOPE.get()
+    scope = WrapperExecutionScope(
+        tool_name=tool_name or parent.tool_name,
+        tenant_id=tenant_id or parent.tenant_id,
+        output_sink=output_sink or parent.output_sink,
+    )
+    token = _EXECUTION_SCOPE.set(scope)
+    try:
+        yield scope
+    finally:
+        _EXECUTION_SCOPE.reset(token)
+
+
 def default_command_runner(command: list[str], timeout_seconds: float) -> WrapperCommandResult:
     """Run command with subprocess and return normalized process output."""
     completed = subprocess.run(
@@ -69,6 +132,188 @@ def default_command_runner(command: list[str], timeout_seconds: float) -> Wrappe
     )
 
 
+class OutputStreamSink(Protocol):
+    """Consumer of tool stdout lines while the process is still running."""
+
+    def feed(self, line: str) -> None:
+        """Consume one stdout line without its trailing newline."""
+
+    def close(self, returncode: int) -> None:
+        """Finalize the stream once the process has exited."""
+
+
+OutputSinkFactory = Callable[[list[str]], OutputStreamSink | None]
+
+
+class _BoundedTail:
+    """Keep the most recent lines of a stream within a UTF-8 byte budget."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._lines: deque[tuple[str, int]] = deque()
+        self._size = 0
+        self.truncated = False
+
+    def append(self, line: str) -> None:
+        size = len(line.encode("utf-8", errors="replace"))
+        self._lines.append((line, size))
+        self._size += size
+        while self._size > self._max_bytes and len(self._lines) > 1:
+            self._size -= self._lines.popleft()[1]
+            self.truncated = True
+
+    def text(self) -> str:
+        return "".join(line for line, _ in self._lines)
+
+
+class StreamingCommandRunner:
+    """``Runner`` that streams stdout line by line with bounded retention.
+
+    Each stdout line is handed to the sink produced by ``sink_factory`` (or,
+    when unset, by the execution scope's ``output_sink``) as soon as the tool
+    writes it. Only the last ``max_retained_bytes`` of stdout and stderr are
+    kept for the returned result, which is flagged ``truncated`` when older
+    output was dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        sink_factory: OutputSinkFactory | None = None,
+        max_retained_bytes: int = 1 << 20,
+    ) -> None:
+        if max_retained_bytes <= 0:
+            raise ValueError("max_retained_bytes must be greater than zero")
+        self._sink_factory = sink_factory
+        self._max_retained_bytes = max_retained_bytes
+
+    def __call__(
+        self, command: list[str], timeout_seconds: float
+    ) -> WrapperCommandResult:
+        """Run ``command``, streaming stdout to the sink as lines arrive."""
+        sink_factory = self._sink_factory or current_execution_scope().output_sink
+        sink = sink_factory(command) if sink_factory is not None else None
+        stdout_tail = _BoundedTail(self._max_retained_bytes)
+        stderr_tail = _BoundedTail(self._max_retained_bytes)
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        assert process.stdout is not None and process.stderr is not None
+        timed_out = threading.Event()
+
+        def _on_timeout() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout_seconds, _on_timeout)
+        stderr_reader = threading.Thread(
+            target=self._drain,
+            args=(process.stderr, stderr_tail),
+            name="spectrastrike-wrapper-stderr",
+            daemon=True,
+        )
+        timer.start()
+        stderr_reader.start()
+        try:
+            for line in process.stdout:
+                stdout_tail.append(line)
+                if sink is not None:
+                    sink.feed(line.rstrip("\r\n"))
+            returncode = process.wait()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            timer.cancel()
+            stderr_reader.join()
+            process.stdout.close()
+            process.stderr.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(
+                command,
+                timeout_seconds,
+                output=stdout_tail.text(),
+                stderr=stderr_tail.text(),
+            )
+        if sink is not None:
+            sink.close(returncode)
+        return WrapperCommandResult(
+            returncode=returncode,
+            stdout=stdout_tail.text(),
+            stderr=stderr_tail.text(),
+            truncated=stdout_tail.truncated or stderr_tail.truncated,
+        )
+
+    @staticmethod
+    def _drain(stream: IO[str], tail: _BoundedTail) -> None:
+        for line in stream:
+            tail.append(line)
+
+
+class PartialTelemetrySink:
+    """Parse streamed tool output and emit partial telemetry batches."""
+
+    def __init__(
+        self,
+        *,
+        wrapper: BaseWrapper,
+        telemetry: TelemetryIngestionPipeline,
+        tenant_id: str,
+        batch_size: int = 50,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than zero")
+        self._wrapper = wrapper
+        self._telemetry = telemetry
+        self._tenant_id = tenant_id
+        self._batch_size = batch_size
+        self._records: list[dict[str, Any]] = []
+        self._lines_seen = 0
+        self._sequence = 0
+
+    def feed(self, line: str) -> None:
+        """Parse one line and emit a partial event once a batch is full."""
+        self._lines_seen += 1
+        record = self._wrapper.parse_output_line(line)
+        if record is None:
+            return
+        self._records.append(record)
+        if len(self._records) >= self._batch_size:
+            self._emit(status="running")
+
+    def close(self, returncode: int) -> None:
+        """Emit any remaining parsed records."""
+        if self._records:
+            self._emit(status="success" if returncode == 0 else "failed")
+
+    def _emit(self, *, status: str) -> None:
+        self._sequence += 1
+        tool_name = self._wrapper._tool_name
+        records, self._records = self._records, []
+        self._wrapper.emit_validated_telemetry(
+            telemetry=self._telemetry,
+            event_type=f"{tool_name}_output_partial",
+            actor=f"{tool_name}-wrapper",
+            status=status,
+            target="orchestrator",
+            tenant_id=self._tenant_id,
+            attributes={
+                "schema_version": "telemetry.ext.v1",
+                "adapter": tool_name,
+                "partial": True,
+                "sequence": self._sequence,
+                "lines_seen": self._lines_seen,
+                "records": records,
+            },
+        )
+
+
 def canonical_json_bytes(payload: dict[str, Any]) -> bytes:
     """Return canonical payload bytes for deterministic hashing/signing."""
     return json.dumps(
@@ -84,40 +329,59 @@ def _default_ed25519_signer(
     *,
     key_path: str,
 ) -> str:
+    return _default_ed25519_sign_many([payload], key_path=key_path)[0]
+
+
+def _default_ed25519_sign_many(
+    payloads: list[bytes],
+    *,
+    key_path: str,
+) -> list[str]:
     try:
-        from cryptography.hazmat.primitives import serialization
-        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-    except ImportError as exc:
+        signatures = default_key_manager().sign_many(key_path, payloads)
+    except Ed25519BackendUnavailableError as exc:
         raise WrapperContractError(
             "cryptography dependency is required for Ed25519 wrapper signing"
         ) from exc
-
-    try:
-        key_bytes = Path(key_path).read_bytes()
-    except OSError as exc:
+    except Ed25519KeyReadError as exc:
         raise WrapperContractError(f"unable to read signing key: {key_path}") from exc
+    return [base64.b64encode(signature).decode("utf-8") for signature in signatures]
 
-    private_key: Any
-    if len(key_bytes) == 32:
-        private_key = Ed25519PrivateKey.from_private_bytes(key_bytes)
-    else:
-        try:
-            private_key = serialization.load_pem_private_key(
-                key_bytes,
-                password=None,
-            )
-        except ValueError:
-            private_key = serialization.load_ssh_private_key(
-                key_bytes,
-                password=None,
-            )
-    signature = private_key.sign(payload)
-    return base64.b64encode(signature).decode("utf-8")
+
+def _runs_local_binary(runner: Runner) -> bool:
+    """Return whether ``runner`` executes the configured binary on this host."""
+    return (
+        runner is default_command_runner
+        or isinstance(runner, StreamingCommandRunner)
+        or bool(getattr(runner, "runs_local_binary", False))
+    )
+
+
+def _scoped_execute(execute: Callable[..., Any]) -> Callable[..., Any]:
+    """Run ``execute`` inside an execution scope for its tool and tenant."""
+
+    @functools.wraps(execute)
+    def _execute(self: BaseWrapper, *args: Any, **kwargs: Any) -> Any:
+        tenant_id = kwargs.get("tenant_id")
+        with execution_scope(
+            tool_name=self._tool_name,
+            tenant_id=tenant_id if isinstance(tenant_id, str) else None,
+            output_sink=self._output_sink_factory,
+        ):
+            return execute(self, *args, **kwargs)
+
+    return _execute
 
 
 class BaseWrapper:
     """Reusable wrapper contract helper for telemetry-safe tool integrations."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        execute = cls.__dict__.get("execute")
+        if execute is not None:
+            cls.execute = _scoped_execute(execute)  # type: ignore[method-assign]
+
     def __init__(
         self,
         *,
@@ -132,48 +396,117 @@ class BaseWrapper:
         self._tool_binary = tool_binary
         self._timeout_seconds = timeout_seconds
         self._runner = runner or default_command_runner
+        self._output_sink_factory: OutputSinkFactory | None = None
         self._signing_key_env = signing_key_env
         self._signer = signer
         self._version_cache: str | None = None
 
     def detect_tool_version(self, detection_args: list[list[str]]) -> str:
-        """Detect and cache tool version from command output."""
+        """Detect and cache tool version from command output.
+
+        Runners that execute the local binary share versions through the
+        process-wide tool inventory, keyed by binary digest; injected runners
+        are probed per instance because the local binary may not be what
+        they run.
+        """
         if self._version_cache:
             return self._version_cache
-        for args in detection_args:
-            command = [self._tool_binary, *args]
-            try:
-                result = self._runner(command, self._timeout_seconds)
-            except Exception:
-                continue
-            text = f"{result.stdout}\n{result.stderr}".strip()
-            parsed = self._parse_version_from_text(text)
-            if parsed:
-                self._version_cache = parsed
-                return parsed
-        self._version_cache = "unknown"
+        if _runs_local_binary(self._runner):
+            self._version_cache = active_tool_inventory().resolve_version(
+                tool_name=self._tool_name,
+                binary=self._tool_binary,
+                detection_args=detection_args,
+                runner=self._runner,
+                timeout_seconds=self._timeout_seconds,
+            )
+        else:
+            self._version_cache = probe_tool_version(
+                self._runner,
+                self._tool_binary,
+                detection_args,
+                self._timeout_seconds,
+            )
         return self._version_cache
 
+    def parse_output_line(self, line: str) -> dict[str, Any] | None:
+        """Incremental parser hook for one streamed stdout line.
+
+        The default accepts JSON-object lines, which covers the JSON-lines
+        output modes of most wrapped tools. Wrappers with plain-text output
+        override this; returning ``None`` skips the line.
+        """
+        stripped = line.strip()
+        if not stripped.startswith("{"):
+            return None
+        try:
+            record = json.loads(stripped)
+        except ValueError:
+            return None
+        return record if isinstance(record, dict) else None
+
+    def enable_output_streaming(
+        self,
+        *,
+        telemetry: TelemetryIngestionPipeline,
+        partial_batch_size: int = 50,
+        max_retained_bytes: int = 1 << 20,
+    ) -> None:
+        """Emit partial telemetry from stdout while the tool runs.
+
+        Parsed records are ingested in batches of ``partial_batch_size`` while
+        the tool runs, attributed to the tenant bound by ``execute``. The
+        default runner is swapped for a ``StreamingCommandRunner`` whose
+        retained stdout/stderr is capped at ``max_retained_bytes`` each; an
+        injected runner is kept and receives the sink through the execution
+        scope, so a shared ``WrapperExecutionPool`` still schedules the call.
+        """
+        if partial_batch_size <= 0:
+            raise ValueError("partial_batch_size must be greater than zero")
+
+        def _sink_factory(command: list[str]) -> OutputStreamSink | None:
+            del command
+            tenant_id = current_execution_scope().tenant_id
+            if not tenant_id:
+                return None
+            return PartialTelemetrySink(
+                wrapper=self,
+                telemetry=telemetry,
+                tenant_id=tenant_id,
+                batch_size=partial_batch_size,
+            )
+
+        self._output_sink_factory = _sink_factory
+        if self._runner is default_command_runner:
+            self._runner = StreamingCommandRunner(max_retained_bytes=max_retained_bytes)
+
     @staticmethod
     def _parse_version_from_text(text: str) -> str | None:
-        pattern = re.compile(r"(?:impacket\s+)?v?(\d+\.\d+(?:\.\d+)*)", re.I)
-        match = pattern.search(text)
-        if match:
-            return match.group(1)
-        cleaned = text.splitlines()[0].strip() if text.strip() else ""
-        return cleaned or None
+        return parse_version_text(text)
 
     def _tool_sha256(self) -> str:
         binary_path = Path(self._tool_binary)
-        if binary_path.exists() and binary_path.is_file():
-            data = binary_path.read_bytes()
-            return hashlib.sha256(data).hexdigest()
+        if binary_path.is_file():
+            return default_digest_cache().sha256_file(binary_path)
         return hashlib.sha256(self._tool_binary.encode("utf-8")).hexdigest()
 
     @staticmethod
     def _hash_text(value: str) -> str:
         return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def _live_raw_payload(completed: WrapperCommandResult) -> dict[str, Any]:
+        """Build the ``raw`` payload recorded for a live runner invocation.
+
+        Custom runners only have to provide ``returncode``, ``stdout`` and
+        ``stderr``; ``truncated`` defaults to ``False`` when they omit it.
+        """
+        return {
+            "mode": "live",
+            "stdout": completed.stdout,
+            "stderr": completed.stderr,
+            "truncated": getattr(completed, "truncated", False),
+        }
+
     def build_execution_context(
         self,
         *,
@@ -226,6 +559,18 @@ class BaseWrapper:
             )
         return _default_ed25519_signer(canonical, key_path=key_path)
 
+    def sign_payloads(self, payloads: list[dict[str, Any]]) -> list[str]:
+        """Sign a batch of payloads, loading the signing key at most once."""
+        canonical = [canonical_json_bytes(payload) for payload in payloads]
+        if self._signer is not None:
+            return [self._signer(item) for item in canonical]
+        key_path = os.getenv(self._signing_key_env, "").strip()
+        if not key_path:
+            raise WrapperContractError(
+                f"{self._signing_key_env} is required for wrapper payload signing"
+            )
+        return _default_ed25519_sign_many(canonical, key_path=key_path)
+
     def emit_validated_telemetry(
         self,
         *,
@@ -153,11 +153,7 @@ class BloodhoundCollectorWrapper(BaseWrapper):
             result_output = (completed.stdout or completed.stderr).strip()
             return_code = completed.returncode
             status = "success" if completed.returncode == 0 else "failed"
-            raw_payload = {
-                "mode": "live",
-                "stdout": completed.stdout,
-                "stderr": completed.stderr,
-            }
+            raw_payload = self._live_raw_payload(completed)
             if completed.returncode != 0:
                 raise BloodhoundCollectorError(
                     result_output or "bloodhound collector command failed"
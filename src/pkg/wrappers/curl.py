@@ -133,11 +133,7 @@ class CurlWrapper(BaseWrapper):
             result_output = (completed.stdout or completed.stderr).strip()
             return_code = completed.returncode
             status = "success" if completed.returncode == 0 else "failed"
-            raw_payload = {
-                "mode": "live",
-                "stdout": completed.stdout,
-                "stderr": completed.stderr,
-            }
+            raw_payload = self._live_raw_payload(completed)
             if completed.returncode != 0:
                 raise CurlExecutionError(result_output or "curl command failed")
 
@@ -0,0 +1,293 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: Jose Maria Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Shared async subprocess pool for wrapper tool invocations."""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import subprocess
+import threading
+from collections.abc import Mapping
+from concurrent.futures import Future
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+from pkg.logging.framework import get_logger
+from pkg.orchestrator.event_loop import AsyncEventLoop
+from pkg.wrappers.base import (
+    OutputStreamSink,
+    WrapperCommandResult,
+    WrapperContractError,
+    _BoundedTail,
+    current_execution_scope,
+)
+
+logger = get_logger("spectrastrike.wrappers.execution_pool")
+
+_STREAM_CHUNK_SIZE = 1 << 16
+_STREAM_LINE_LIMIT = 1 << 20
+
+
+class WrapperExecutionPool:
+    """Run wrapper commands as async subprocesses under concurrency caps.
+
+    An instance is a drop-in ``Runner``: pass it as ``runner=`` to any
+    ``BaseWrapper`` and concurrent ``execute`` calls from different threads
+    share one event loop instead of each blocking on ``subprocess.run``.
+    Commands queue until a slot for their tool, a slot for their tenant and a
+    global slot are free; the global slot is taken last so commands parked
+    behind a per-tool or per-tenant cap never hold shared capacity. Tool and
+    tenant come from the wrapper execution scope, with the tool falling back to
+    the command's binary name. When the scope carries an ``output_sink``
+    factory, stdout lines are fed to its sink as the tool writes them. Output
+    is read in chunks and only the last ``max_retained_bytes`` of stdout and
+    stderr are kept, with the result flagged ``truncated`` when older output
+    was dropped.
+    """
+
+    runs_local_binary = True
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 32,
+        tool_limits: Mapping[str, int] | None = None,
+        default_tool_limit: int = 4,
+        tenant_limits: Mapping[str, int] | None = None,
+        default_tenant_limit: int | None = None,
+        max_retained_bytes: int = 1 << 20,
+        event_loop: AsyncEventLoop | None = None,
+    ) -> None:
+        limits = [max_concurrency, default_tool_limit, *(tool_limits or {}).values()]
+        limits.extend((tenant_limits or {}).values())
+        if default_tenant_limit is not None:
+            limits.append(default_tenant_limit)
+        if any(limit <= 0 for limit in limits):
+            raise ValueError("concurrency limits must be greater than zero")
+        if max_retained_bytes <= 0:
+            raise ValueError("max_retained_bytes must be greater than zero")
+        self._max_concurrency = max_concurrency
+        self._tool_limits = dict(tool_limits or {})
+        self._default_tool_limit = default_tool_limit
+        self._tenant_limits = dict(tenant_limits or {})
+        self._default_tenant_limit = default_tenant_limit
+        self._max_retained_bytes = max_retained_bytes
+        self._owns_loop = event_loop is None
+        self._event_loop = event_loop or AsyncEventLoop()
+        self._global_slots: asyncio.Semaphore | None = None
+        self._tool_slots: dict[str, asyncio.Semaphore] = {}
+        self._tenant_slots: dict[str, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._running = 0
+
+    @property
+    def waiting(self) -> int:
+        """Return number of commands queued behind a concurrency cap."""
+        with self._lock:
+            return self._waiting
+
+    @property
+    def running(self) -> int:
+        """Return number of commands with a live subprocess."""
+        with self._lock:
+            return self._running
+
+    def __call__(
+        self, command: list[str], timeout_seconds: float
+    ) -> WrapperCommandResult:
+        """Run ``command`` through the pool, blocking the calling thread."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise WrapperContractError(
+                "blocking pool runner called from an event loop; await run() instead"
+            )
+        return self.submit(command, timeout_seconds).result()
+
+    def submit(
+        self,
+        command: list[str],
+        timeout_seconds: float,
+        *,
+        tool_name: str | None = None,
+        tenant_id: str | None = None,
+    ) -> Future[WrapperCommandResult]:
+        """Queue ``command`` and return a future; cancelling it kills the process."""
+        if not self._event_loop.is_running:
+            self._event_loop.start()
+        scope = current_execution_scope()
+        sink = scope.output_sink(command) if scope.output_sink is not None else None
+        return self._event_loop.submit(
+            self.run(
+                command,
+                timeout_seconds,
+                tool_name=tool_name or scope.tool_name,
+                tenant_id=tenant_id or scope.tenant_id,
+                sink=sink,
+            ),
+            name=f"wrapper:{tool_name or scope.tool_name or Path(command[0]).name}",
+        )
+
+    async def run(
+        self,
+        command: list[str],
+        timeout_seconds: float,
+        *,
+        tool_name: str | None = None,
+        tenant_id: str | None = None,
+        sink: OutputStreamSink | None = None,
+    ) -> WrapperCommandResult:
+        """Run ``command`` once its tool, tenant and global slots are free."""
+        if not command:
+            raise WrapperContractError("command must not be empty")
+        tool = tool_name or Path(command[0]).name
+        async with AsyncExitStack() as stack:
+            with self._lock:
+                self._waiting += 1
+            try:
+                for slot in self._slots_for(tool, tenant_id):
+                    await stack.enter_async_context(slot)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+            return await self._run_process(command, timeout_seconds, sink)
+
+    def _slots_for(self, tool: str, tenant_id: str | None) -> list[asyncio.Semaphore]:
+        tool_slot = self._tool_slots.get(tool)
+        if tool_slot is None:
+            tool_slot = asyncio.Semaphore(
+                self._tool_limits.get(tool, self._default_tool_limit)
+            )
+            self._tool_slots[tool] = tool_slot
+        slots = [tool_slot]
+        if tenant_id is not None:
+            limit = self._tenant_limits.get(tenant_id, self._default_tenant_limit)
+            if limit is not None:
+                tenant_slot = self._tenant_slots.get(tenant_id)
+                if tenant_slot is None:
+                    tenant_slot = asyncio.Semaphore(limit)
+                    self._tenant_slots[tenant_id] = tenant_slot
+                slots.append(tenant_slot)
+        if self._global_slots is None:
+            self._global_slots = asyncio.Semaphore(self._max_concurrency)
+        slots.append(self._global_slots)
+        return slots
+
+    async def _run_process(
+        self,
+        command: list[str],
+        timeout_seconds: float,
+        sink: OutputStreamSink | None = None,
+    ) -> WrapperCommandResult:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout = _BoundedTail(self._max_retained_bytes)
+        stderr = _BoundedTail(self._max_retained_bytes)
+        with self._lock:
+            self._running += 1
+        try:
+            await asyncio.wait_for(
+                self._communicate(process, stdout, stderr, sink),
+                timeout=timeout_seconds,
+            )
+        except TimeoutError as exc:
+            await self._kill(process)
+            logger.warning("Wrapper command timed out after %ss: %s", timeout_seconds, command[0])
+            raise subprocess.TimeoutExpired(
+                command, timeout_seconds, output=stdout.text(), stderr=stderr.text()
+            ) from exc
+        except BaseException:
+            await self._kill(process)
+            raise
+        finally:
+            with self._lock:
+                self._running -= 1
+        returncode = process.returncode if process.returncode is not None else -1
+        if sink is not None:
+            sink.close(returncode)
+        return WrapperCommandResult(
+            returncode=returncode,
+            stdout=stdout.text(),
+            stderr=stderr.text(),
+            truncated=stdout.truncated or stderr.truncated,
+        )
+
+    @classmethod
+    async def _communicate(
+        cls,
+        process: asyncio.subprocess.Process,
+        stdout: _BoundedTail,
+        stderr: _BoundedTail,
+        sink: OutputStreamSink | None,
+    ) -> None:
+        assert process.stdout is not None and process.stderr is not None
+        readers = [
+            asyncio.ensure_future(cls._read_lines(process.stdout, stdout, sink)),
+            asyncio.ensure_future(cls._read_lines(process.stderr, stderr, None)),
+        ]
+        try:
+            await asyncio.gather(*readers)
+            await process.wait()
+        finally:
+            for reader in readers:
+                reader.cancel()
+
+    @staticmethod
+    async def _read_lines(
+        stream: asyncio.StreamReader,
+        tail: _BoundedTail,
+        sink: OutputStreamSink | None,
+    ) -> None:
+        """Drain ``stream`` in chunks, splitting over-long lines at the limit."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        while True:
+            chunk = await stream.read(_STREAM_CHUNK_SIZE)
+            pending += decoder.decode(chunk, final=not chunk)
+            *lines, pending = pending.split("\n")
+            lines = [line + "\n" for line in lines]
+            if pending and (not chunk or len(pending) >= _STREAM_LINE_LIMIT):
+                lines.append(pending)
+                pending = ""
+            for line in lines:
+                tail.append(line)
+                if sink is not None:
+                    sink.feed(line.rstrip("\r\n"))
+            if not chunk:
+                return
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await process.wait()
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Stop the pool's event loop when the pool created it."""
+        if self._owns_loop:
+            self._event_loop.stop(timeout=timeout)
+        self._global_slots = None
+        self._tool_slots.clear()
+        self._tenant_slots.clear()
@@ -19,6 +19,7 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import re
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -26,6 +27,10 @@ from typing import Any
 from pkg.orchestrator.telemetry_ingestion import TelemetryEvent, TelemetryIngestionPipeline
 from pkg.wrappers.base import BaseWrapper, Runner, Signer, WrapperContractError
 
+_RESULT_LINE = re.compile(
+    r"^(?P<path>\S+)\s+\(Status:\s*(?P<status>\d+)\)(?:\s+\[Size:\s*(?P<size>\d+)\])?"
+)
+
 
 class GobusterExecutionError(RuntimeError):
     """Raised when gobuster execution fails."""
@@ -94,6 +99,18 @@ class GobusterWrapper(BaseWrapper):
     def _is_dry_run(request: GobusterScanRequest) -> bool:
         return any(arg.strip().lower() == "--dry-run" for arg in request.extra_args)
 
+    def parse_output_line(self, line: str) -> dict[str, Any] | None:
+        """Parse one gobuster result line such as ``/admin (Status: 301) [Size: 178]``."""
+        match = _RESULT_LINE.match(line.strip())
+        if match is None:
+            return None
+        size = match.group("size")
+        return {
+            "path": match.group("path"),
+            "status_code": int(match.group("status")),
+            "size": int(size) if size is not None else None,
+        }
+
     def build_command(self, request: GobusterScanRequest) -> list[str]:
         """Build deterministic gobuster command."""
         return [self._binary, *request.command.split(), *request.extra_args]
@@ -133,11 +150,7 @@ class GobusterWrapper(BaseWrapper):
             result_output = (completed.stdout or completed.stderr).strip()
             return_code = completed.returncode
             status = "success" if completed.returncode == 0 else "failed"
-            raw_payload = {
-                "mode": "live",
-                "stdout": completed.stdout,
-                "stderr": completed.stderr,
-            }
+            raw_payload = self._live_raw_payload(completed)
             if completed.returncode != 0:
                 raise GobusterExecutionError(result_output or "gobuster command failed")
 
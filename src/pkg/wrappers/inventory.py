@@ -0,0 +1,291 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: Jose Maria Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Shared tool inventory with digest-keyed version detection."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from pkg.armory.digest import ToolDigestCache, default_digest_cache
+from pkg.logging.framework import get_logger
+
+if TYPE_CHECKING:
+    from pkg.wrappers.base import BaseWrapper, Runner
+
+logger = get_logger("spectrastrike.wrappers.inventory")
+
+_VERSION_PATTERN = re.compile(r"(?:impacket\s+)?v?(\d+\.\d+(?:\.\d+)*)", re.I)
+
+
+def parse_version_text(text: str) -> str | None:
+    """Extract a dotted version, else the first output line, from probe text."""
+    match = _VERSION_PATTERN.search(text)
+    if match:
+        return match.group(1)
+    cleaned = text.splitlines()[0].strip() if text.strip() else ""
+    return cleaned or None
+
+
+def probe_tool_version(
+    runner: Runner,
+    binary: str,
+    detection_args: list[list[str]],
+    timeout_seconds: float,
+) -> str:
+    """Try each argument set in turn and return the first parseable version."""
+    for args in detection_args:
+        try:
+            result = runner([binary, *args], timeout_seconds)
+        except Exception:
+            continue
+        parsed = parse_version_text(f"{result.stdout}\n{result.stderr}".strip())
+        if parsed:
+            return parsed
+    return "unknown"
+
+
+@dataclass(slots=True, frozen=True)
+class ToolInventoryRecord:
+    """Detected version for one tool binary, keyed by its content digest."""
+
+    tool_name: str
+    binary_path: str
+    binary_sha256: str
+    version: str
+    probed_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    @property
+    def available(self) -> bool:
+        """Return whether the probe produced a usable version."""
+        return self.version != "unknown"
+
+
+class ToolInventoryService:
+    """Process-wide registry of installed tool binaries and their versions.
+
+    Versions are keyed on the binary's SHA-256, so every wrapper instance for
+    the same binary shares one probe, and an upgraded binary is re-probed
+    automatically. With ``storage_path`` set, records survive restarts.
+    Failed or timed-out probes (version ``"unknown"``) are never persisted and
+    are retried once ``unknown_ttl_seconds`` have passed.
+    """
+
+    def __init__(
+        self,
+        *,
+        storage_path: str | Path | None = None,
+        digest_cache: ToolDigestCache | None = None,
+        unknown_ttl_seconds: float = 60.0,
+    ) -> None:
+        if unknown_ttl_seconds < 0:
+            raise ValueError("unknown_ttl_seconds must be >= 0")
+        self._storage_path = Path(storage_path).expanduser() if storage_path else None
+        self._digest_cache = digest_cache or default_digest_cache()
+        self._unknown_ttl_seconds = unknown_ttl_seconds
+        self._by_digest: dict[str, ToolInventoryRecord] = {}
+        self._unknown_expires_at: dict[str, float] = {}
+        self._digest_by_tool: dict[str, str] = {}
+        self._probe_locks: dict[str, Lock] = {}
+        self._lock = Lock()
+        self.probes = 0
+        if self._storage_path is not None:
+            self._load()
+
+    def resolve_version(
+        self,
+        *,
+        tool_name: str,
+        binary: str,
+        detection_args: list[list[str]],
+        runner: Runner,
+        timeout_seconds: float,
+    ) -> str:
+        """Return the cached version for ``binary``, probing at most once per digest.
+
+        Binaries that cannot be located on disk are probed directly and not
+        recorded, since there is no digest to key them on.
+        """
+        binary_path = self._locate(binary)
+        if binary_path is None:
+            return probe_tool_version(runner, binary, detection_args, timeout_seconds)
+
+        digest = self._digest_cache.sha256_file(binary_path)
+        with self._lock:
+            record = self._cached_unlocked(digest)
+            if record is not None:
+                self._digest_by_tool[tool_name] = digest
+                return record.version
+            probe_lock = self._probe_locks.setdefault(digest, Lock())
+
+        with probe_lock:
+            with self._lock:
+                record = self._cached_unlocked(digest)
+            if record is None:
+                version = probe_tool_version(
+                    runner, binary, detection_args, timeout_seconds
+                )
+                record = ToolInventoryRecord(
+                    tool_name=tool_name,
+                    binary_path=binary_path,
+                    binary_sha256=digest,
+                    version=version,
+                )
+                with self._lock:
+                    self.probes += 1
+                    self._by_digest[digest] = record
+                    if record.available:
+                        self._unknown_expires_at.pop(digest, None)
+                        self._persist_unlocked()
+                    else:
+                        self._unknown_expires_at[digest] = (
+                            time.monotonic() + self._unknown_ttl_seconds
+                        )
+                logger.info("Tool inventory probed %s: %s", tool_name, version)
+        with self._lock:
+            self._digest_by_tool[tool_name] = digest
+            self._probe_locks.pop(digest, None)
+        return record.version
+
+    def warm(
+        self,
+        wrappers: Iterable[BaseWrapper],
+        *,
+        max_workers: int = 8,
+    ) -> list[ToolInventoryRecord]:
+        """Probe every wrapper's binary concurrently and return the inventory."""
+        targets = list(wrappers)
+        if targets:
+            with ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="spectrastrike-tool-inventory",
+            ) as executor:
+                list(executor.map(self._detect_with_self, targets))
+        return self.inventory()
+
+    def _detect_with_self(self, wrapper: BaseWrapper) -> str:
+        token = _ACTIVE_INVENTORY.set(self)
+        try:
+            return wrapper.detect_version()  # type: ignore[attr-defined]
+        finally:
+            _ACTIVE_INVENTORY.reset(token)
+
+    def record_for(self, tool_name: str) -> ToolInventoryRecord | None:
+        """Return the inventory record last resolved for ``tool_name``."""
+        with self._lock:
+            digest = self._digest_by_tool.get(tool_name)
+            return self._by_digest.get(digest) if digest is not None else None
+
+    def inventory(self) -> list[ToolInventoryRecord]:
+        """Return records for every tool resolved in this process, by name."""
+        with self._lock:
+            return [
+                self._by_digest[digest]
+                for _, digest in sorted(self._digest_by_tool.items())
+                if digest in self._by_digest
+            ]
+
+    def available_tools(self) -> set[str]:
+        """Return tool names whose binaries were found and reported a version."""
+        with self._lock:
+            return {
+                tool_name
+                for tool_name, digest in self._digest_by_tool.items()
+                if digest in self._by_digest and self._by_digest[digest].available
+            }
+
+    def _cached_unlocked(self, digest: str) -> ToolInventoryRecord | None:
+        record = self._by_digest.get(digest)
+        if record is None or record.available:
+            return record
+        if time.monotonic() < self._unknown_expires_at.get(digest, 0.0):
+            return record
+        return None
+
+    @staticmethod
+    def _locate(binary: str) -> str | None:
+        if os.sep in binary or (os.altsep and os.altsep in binary):
+            return os.path.realpath(binary) if Path(binary).is_file() else None
+        resolved = shutil.which(binary)
+        return os.path.realpath(resolved) if resolved else None
+
+    def _load(self) -> None:
+        assert self._storage_path is not None
+        try:
+            payload = json.loads(self._storage_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, list):
+            return
+        for item in payload:
+            if not isinstance(item, dict):
+                continue
+            try:
+                record = ToolInventoryRecord(**item)
+            except TypeError:
+                continue
+            if record.available:
+                self._by_digest[record.binary_sha256] = record
+
+    def _persist_unlocked(self) -> None:
+        if self._storage_path is None:
+            return
+        payload: list[dict[str, Any]] = [
+            asdict(record) for record in self._by_digest.values() if record.available
+        ]
+        self._storage_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = self._storage_path.with_name(
+            f"{self._storage_path.name}.{os.getpid()}.tmp"
+        )
+        staging.write_text(
+            json.dumps(payload, ensure_ascii=True, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(staging, self._storage_path)
+
+
+_default_inventory: ToolInventoryService | None = None
+_default_inventory_lock = Lock()
+_ACTIVE_INVENTORY: ContextVar[ToolInventoryService | None] = ContextVar(
+    "spectrastrike_active_tool_inventory",
+    default=None,
+)
+
+
+def default_tool_inventory() -> ToolInventoryService:
+    """Return the process-wide inventory, persisted when configured by env."""
+    global _default_inventory
+    with _default_inventory_lock:
+        if _default_inventory is None:
+            _default_inventory = ToolInventoryService(
+                storage_path=os.getenv("SPECTRASTRIKE_TOOL_INVENTORY_PATH") or None
+            )
+        return _default_inventory
+
+
+def active_tool_inventory() -> ToolInventoryService:
+    """Return the inventory warming the current context, else the default."""
+    return _ACTIVE_INVENTORY.get() or default_tool_inventory()
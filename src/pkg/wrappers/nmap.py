@@ -18,11 +18,12 @@ from __future__ import annotations
 
 import json
 import os
-import re
 from asyncio import run
 from asyncio.subprocess import PIPE, Process, create_subprocess_exec
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any, Literal
+from xml.parsers import expat
 
 from pkg.logging.framework import get_logger
 from pkg.orchestrator.telemetry_ingestion import (
@@ -30,6 +31,7 @@ from pkg.orchestrator.telemetry_ingestion import (
     TelemetryIngestionPipeline,
 )
 from pkg.telemetry.sdk import build_internal_telemetry_event
+from pkg.wrappers.base import Runner, StreamingCommandRunner, execution_scope
 
 logger = get_logger("spectrastrike.wrappers.nmap")
 
@@ -83,6 +85,183 @@ class NmapScanResult:
     raw_output: str
     hosts: list[NmapScanHost]
     summary: dict[str, Any]
+    parse_error: str | None = None
+
+
+class NmapXmlStreamParser:
+    """Incremental ``-oX`` parser that yields hosts as each ``</host>`` closes.
+
+    Built on expat callbacks rather than an element tree: only the fields the
+    wrapper normalizes are kept, so memory is bounded by one host block no
+    matter how large the sweep is.
+    """
+
+    def __init__(self) -> None:
+        self._parser = expat.ParserCreate()
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._ready: list[NmapScanHost] = []
+        self._complete = False
+        self._host_count = 0
+        self._host: NmapScanHost | None = None
+        self._address_seen = False
+        self._status_seen = False
+        self._port: tuple[int, str] | None = None
+        self._port_state: str | None = None
+        self._port_service: str | None = None
+
+    @property
+    def complete(self) -> bool:
+        """Return whether the closing ``</nmaprun>`` tag has been parsed."""
+        return self._complete
+
+    @property
+    def host_count(self) -> int:
+        """Return number of hosts yielded so far."""
+        return self._host_count
+
+    def feed(self, data: str | bytes) -> list[NmapScanHost]:
+        """Feed a chunk of XML and return hosts completed by it."""
+        self._parser.Parse(data, False)
+        return self._take_ready()
+
+    def close(self) -> list[NmapScanHost]:
+        """Signal end of input and return any trailing completed hosts."""
+        self._parser.Parse(b"", True)
+        return self._take_ready()
+
+    def _take_ready(self) -> list[NmapScanHost]:
+        ready, self._ready = self._ready, []
+        self._host_count += len(ready)
+        return ready
+
+    def _start(self, name: str, attrs: dict[str, str]) -> None:
+        if name == "host":
+            self._host = NmapScanHost(address="unknown", status="unknown")
+            self._address_seen = False
+            self._status_seen = False
+            return
+        host = self._host
+        if host is None:
+            return
+        if name == "port":
+            self._port = (int(attrs.get("portid", "0")), attrs.get("protocol", "unknown"))
+            self._port_state = None
+            self._port_service = None
+        elif name == "state" and self._port is not None:
+            if self._port_state is None:
+                self._port_state = attrs.get("state")
+        elif name == "service" and self._port is not None:
+            if self._port_service is None:
+                self._port_service = attrs.get("name", "unknown")
+        elif name == "address" and not self._address_seen:
+            self._address_seen = True
+            host.address = attrs.get("addr", "unknown")
+        elif name == "status" and not self._status_seen:
+            self._status_seen = True
+            host.status = attrs.get("state", "unknown")
+        elif name == "osmatch":
+            os_name = attrs.get("name")
+            if os_name:
+                host.os_matches.append(os_name)
+
+    def _end(self, name: str) -> None:
+        if name == "port":
+            host = self._host
+            if host is not None and self._port is not None and self._port_state == "open":
+                port_id, protocol = self._port
+                host.open_ports.append(port_id)
+                host.services.append(
+                    {
+                        "port": port_id,
+                        "protocol": protocol,
+                        "name": self._port_service or "unknown",
+                    }
+                )
+            self._port = None
+        elif name == "host":
+            if self._host is not None:
+                self._ready.append(self._host)
+            self._host = None
+        elif name == "nmaprun":
+            self._complete = True
+
+
+class _NmapSummaryBuilder:
+    """Accumulate the scan summary one host at a time."""
+
+    def __init__(self) -> None:
+        self.total_hosts = 0
+        self.up_hosts = 0
+        self.total_open_ports = 0
+        self.scanned_hosts: list[str] = []
+
+    def add(self, host: NmapScanHost) -> None:
+        self.total_hosts += 1
+        if host.status == "up":
+            self.up_hosts += 1
+        self.total_open_ports += len(host.open_ports)
+        self.scanned_hosts.append(host.address)
+
+    def build(self) -> dict[str, Any]:
+        return {
+            "total_hosts": self.total_hosts,
+            "up_hosts": self.up_hosts,
+            "total_open_ports": self.total_open_ports,
+            "scanned_hosts": list(self.scanned_hosts),
+        }
+
+
+class _NmapStreamSink:
+    """Output sink feeding streamed nmap stdout lines to the XML parser.
+
+    Malformed or truncated XML stops parsing but keeps every host that closed
+    before the error, so a scan cut short still reports what it found.
+    """
+
+    def __init__(
+        self,
+        *,
+        on_host: Callable[[NmapScanHost], None] | None,
+        retain_hosts: bool,
+    ) -> None:
+        self.parser = NmapXmlStreamParser()
+        self.summary = _NmapSummaryBuilder()
+        self.hosts: list[NmapScanHost] = []
+        self.error: expat.ExpatError | None = None
+        self.fed = False
+        self.closed = False
+        self._on_host = on_host
+        self._retain_hosts = retain_hosts
+
+    def feed(self, line: str) -> None:
+        self.fed = True
+        if self.error is None:
+            self._absorb(lambda: self.parser.feed(line + "\n"))
+
+    def close(self, returncode: int) -> None:
+        if not self.closed and self.error is None:
+            self._absorb(self.parser.close)
+        self.closed = True
+
+    def _absorb(self, parse: Callable[[], list[NmapScanHost]]) -> None:
+        try:
+            hosts = parse()
+        except expat.ExpatError as exc:
+            self.error = exc
+            hosts = self.parser._take_ready()
+        for host in hosts:
+            self.summary.add(host)
+            if self._on_host is not None:
+                self._on_host(host)
+            if self._retain_hosts:
+                self.hosts.append(host)
+
+
+def _without_timeout(runner: Callable[[list[str]], Any]) -> Runner:
+    """Adapt a single-argument nmap runner to the wrapper ``Runner`` signature."""
+    return lambda command, _timeout_seconds: runner(command)
 
 
 @dataclass(slots=True)
@@ -100,8 +279,13 @@ class NmapWrapper:
     def __init__(
         self,
         runner: Any | None = None,
+        *,
+        stream_runner: Runner | None = None,
     ) -> None:
         self._runner = runner or self._run_command
+        self._stream_runner = stream_runner or (
+            StreamingCommandRunner() if runner is None else _without_timeout(runner)
+        )
 
     @staticmethod
     def _run_command(command: list[str]) -> CommandResult:
@@ -190,6 +374,76 @@ class NmapWrapper:
             summary=summary,
         )
 
+    def stream_scan(
+        self,
+        options: NmapScanOptions,
+        *,
+        on_host: Callable[[NmapScanHost], None] | None = None,
+        retain_hosts: bool = True,
+        tenant_id: str | None = None,
+        timeout_seconds: float = 3600.0,
+    ) -> NmapScanResult:
+        """Run an XML scan, parsing hosts as the stream runner emits stdout lines.
+
+        The command goes through ``stream_runner`` under an ``nmap`` execution
+        scope, so a ``WrapperExecutionPool`` applies its tool and tenant caps.
+        ``on_host`` is called for every host as soon as its block closes. With
+        ``retain_hosts=False`` the result carries only the summary, keeping
+        memory flat for very large sweeps. ``raw_output`` is not retained.
+        Malformed or truncated XML yields the hosts parsed so far with
+        ``parse_error`` set instead of raising.
+        """
+        if options.output_format != "xml":
+            raise ValueError("stream_scan requires output_format='xml'")
+        command = self.build_command(options)
+        logger.info("Executing streaming nmap scan command: %s", " ".join(command))
+
+        sink = _NmapStreamSink(on_host=on_host, retain_hosts=retain_hosts)
+        with execution_scope(
+            tool_name="nmap", tenant_id=tenant_id, output_sink=lambda _command: sink
+        ):
+            completed = self._stream_runner(command, timeout_seconds)
+        if not sink.fed and completed.stdout:
+            # Runners that cannot stream hand back stdout once the scan ends.
+            sink.feed(completed.stdout)
+        sink.close(completed.returncode)
+
+        if completed.returncode != 0:
+            message = (completed.stderr or "").strip() or "nmap command failed"
+            recoverable = (
+                "Socket creation in sendOK: Operation not permitted" in message
+                and sink.parser.complete
+            )
+            if not recoverable:
+                raise NmapExecutionError(message)
+            logger.warning(
+                "Proceeding after recoverable nmap warning with parseable output: %s",
+                message,
+            )
+        parse_error = None
+        if sink.error is not None:
+            parse_error = f"failed to parse nmap XML output: {sink.error}"
+            logger.warning(
+                "Nmap XML stream truncated after %s hosts: %s",
+                sink.summary.total_hosts,
+                sink.error,
+            )
+
+        result_summary = sink.summary.build()
+        logger.info(
+            "Nmap streaming scan completed: hosts=%s open_ports=%s",
+            result_summary["total_hosts"],
+            result_summary["total_open_ports"],
+        )
+        return NmapScanResult(
+            command=command,
+            output_format="xml",
+            raw_output="",
+            hosts=sink.hosts,
+            summary=result_summary,
+            parse_error=parse_error,
+        )
+
     def send_to_orchestrator(
         self,
         result: NmapScanResult,
@@ -229,68 +483,28 @@ class NmapWrapper:
         return False
 
     def _parse_xml(self, xml_output: str) -> list[NmapScanHost]:
-        parsed_hosts: list[NmapScanHost] = []
-        host_blocks = re.findall(r"<host\b[^>]*>(.*?)</host>", xml_output, flags=re.S)
-        if not host_blocks:
-            if "<nmaprun" in xml_output and "</nmaprun>" in xml_output:
-                return []
+        parser = NmapXmlStreamParser()
+        hosts: list[NmapScanHost] = []
+        try:
+            hosts.extend(parser.feed(xml_output))
+            hosts.extend(parser.close())
+        except expat.ExpatError as exc:
+            # Hosts whose ``</host>`` closed before the error are still queued
+            # on the parser; a raising ``feed`` never got to hand them back.
+            hosts.extend(parser._take_ready())
+            if not hosts:
+                raise NmapExecutionError(
+                    f"failed to parse nmap XML output: {exc}"
+                ) from exc
+            logger.warning(
+                "Nmap XML output truncated after %s hosts: %s", len(hosts), exc
+            )
+            return hosts
+        if not hosts and not parser.complete:
             raise NmapExecutionError(
                 "failed to parse nmap XML output: no <host> blocks"
             )
-
-        for host_block in host_blocks:
-            address_match = re.search(r'<address\b[^>]*\baddr="([^"]+)"', host_block)
-            status_match = re.search(r'<status\b[^>]*\bstate="([^"]+)"', host_block)
-            address = address_match.group(1) if address_match else "unknown"
-            status = status_match.group(1) if status_match else "unknown"
-            services: list[dict[str, Any]] = []
-            open_ports: list[int] = []
-            port_matches = re.findall(
-                r"<port\b([^>]*)>(.*?)</port>",
-                host_block,
-                flags=re.S,
-            )
-            for port_attrs, port_block in port_matches:
-                state_match = re.search(
-                    r'<state\b[^>]*\bstate="([^"]+)"',
-                    port_block,
-                )
-                if not state_match or state_match.group(1) != "open":
-                    continue
-
-                port_id_match = re.search(r'\bportid="([^"]+)"', port_attrs)
-                protocol_match = re.search(r'\bprotocol="([^"]+)"', port_attrs)
-                service_match = re.search(
-                    r'<service\b[^>]*\bname="([^"]+)"',
-                    port_block,
-                )
-                port_id = int(port_id_match.group(1)) if port_id_match else 0
-                open_ports.append(port_id)
-                services.append(
-                    {
-                        "port": port_id,
-                        "protocol": (
-                            protocol_match.group(1) if protocol_match else "unknown"
-                        ),
-                        "name": service_match.group(1) if service_match else "unknown",
-                    }
-                )
-
-            os_matches: list[str] = []
-            for match in re.findall(r'<osmatch\b[^>]*\bname="([^"]+)"', host_block):
-                if match:
-                    os_matches.append(match)
-
-            parsed_hosts.append(
-                NmapScanHost(
-                    address=address,
-                    status=status,
-                    open_ports=open_ports,
-                    services=services,
-                    os_matches=os_matches,
-                )
-            )
-        return parsed_hosts
+        return hosts
 
     def _parse_json(self, json_output: str) -> list[NmapScanHost]:
         try:
@@ -346,10 +560,7 @@ class NmapWrapper:
         return parsed_hosts
 
     def _build_summary(self, hosts: list[NmapScanHost]) -> dict[str, Any]:
-        total_open_ports = sum(len(host.open_ports) for host in hosts)
-        return {
-            "total_hosts": len(hosts),
-            "up_hosts": sum(1 for host in hosts if host.status == "up"),
-            "total_open_ports": total_open_ports,
-            "scanned_hosts": [host.address for host in hosts],
-        }
+        summary = _NmapSummaryBuilder()
+        for host in hosts:
+            summary.add(host)
+        return summary.build()
@@ -0,0 +1,72 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""QA benchmark for bounded attack-path queries on a synthetic AD-scale graph."""
+
+from __future__ import annotations
+
+import random
+import time
+
+from pkg.orchestrator.attack_paths import LateralGraphIndex
+
+NODES = 10_000
+EDGES = 100_000
+
+
+def _synthetic_edges() -> list[tuple[str, str, str]]:
+    rng = random.Random(1337)
+    return [
+        (f"edge-{index}", f"host-{rng.randrange(NODES)}", f"host-{rng.randrange(NODES)}")
+        for index in range(EDGES)
+    ]
+
+
+def test_qa_attack_path_index_answers_bounded_queries_on_10k_node_graph() -> None:
+    edges = _synthetic_edges()
+
+    started = time.perf_counter()
+    index = LateralGraphIndex()
+    assert index.add_edges(edges) == EDGES
+    build_seconds = time.perf_counter() - started
+    assert index.node_count <= NODES
+
+    started = time.perf_counter()
+    shortest = index.k_shortest_paths("host-0", "host-1", k=10, max_depth=6)
+    shortest_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    riskiest = index.top_paths_by_risk(
+        "host-0",
+        "host-1",
+        k=10,
+        max_depth=6,
+        risk=lambda hops: min(1.0, hops * 0.18),
+        max_expansions=50_000,
+    )
+    risk_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    csr = index.to_csr()
+    csr_seconds = time.perf_counter() - started
+
+    assert len(shortest) == 10
+    assert [path.hops for path in shortest] == sorted(path.hops for path in shortest)
+    assert len(riskiest) == 10
+    assert all(path.hops <= 6 for _, path in riskiest)
+    assert len(csr.indices) == EDGES
+    assert build_seconds < 10.0
+    assert shortest_seconds < 10.0
+    assert risk_seconds < 10.0
+    assert csr_seconds < 10.0
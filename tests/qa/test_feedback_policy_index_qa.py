@@ -0,0 +1,111 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""QA benchmark for indexed feedback policy lookups and columnar metrics."""
+
+from __future__ import annotations
+
+import random
+import time
+
+from pkg.orchestrator.cognitive_feedback import (
+    CognitiveFeedbackLoopService,
+    DefensiveEventColumns,
+    FeedbackAdjustment,
+    FeedbackPolicyEngine,
+)
+
+TENANTS = 20
+EXACT_PER_TENANT = 2_000
+PREFIXES_PER_TENANT = 200
+LOOKUPS = 200_000
+EVENTS = 1_000_000
+
+
+def _adjustment(tenant_id: str, target_urn: str, ttl_seconds: int) -> FeedbackAdjustment:
+    return FeedbackAdjustment(
+        tenant_id=tenant_id,
+        execution_fingerprint="a" * 64,
+        target_urn=target_urn,
+        action="deny",
+        confidence=0.9,
+        rationale="qa",
+        attestation_measurement_hash="a" * 64,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+def test_qa_feedback_policy_lookups_and_expiry_scale() -> None:
+    rng = random.Random(31)
+    adjustments = [
+        _adjustment(
+            f"tenant-{tenant}",
+            f"urn:target:ip:10.{tenant}.{index // 250}.{index % 250}",
+            60 + index % 600,
+        )
+        for tenant in range(TENANTS)
+        for index in range(EXACT_PER_TENANT)
+    ] + [
+        _adjustment(f"tenant-{tenant}", f"urn:target:ip:172.{tenant}.{index}.*", 300)
+        for tenant in range(TENANTS)
+        for index in range(PREFIXES_PER_TENANT)
+    ]
+    policy = FeedbackPolicyEngine()
+
+    started = time.perf_counter()
+    assert policy.apply_adjustments(adjustments, now=0.0) == len(adjustments)
+    apply_seconds = time.perf_counter() - started
+
+    queries = [
+        (
+            f"tenant-{rng.randrange(TENANTS)}",
+            f"urn:target:ip:{rng.choice((10, 172, 192))}.{rng.randrange(TENANTS)}."
+            f"{rng.randrange(PREFIXES_PER_TENANT)}.{rng.randrange(250)}",
+        )
+        for _ in range(LOOKUPS)
+    ]
+    started = time.perf_counter()
+    denied = sum(
+        not policy.evaluate_allow(tenant_id, target_urn, True, now=30.0)
+        for tenant_id, target_urn in queries
+    )
+    lookup_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    assert policy.evaluate_allow("tenant-0", "urn:target:ip:172.0.1.9", True, now=301.0) is True
+    expire_seconds = time.perf_counter() - started
+
+    assert 0 < denied < LOOKUPS
+    assert policy.active_adjustments("tenant-0", now=1_000.0) == []
+    assert apply_seconds < 10.0
+    assert lookup_seconds < 10.0
+    assert expire_seconds < 10.0
+
+
+def test_qa_columnar_defensive_metrics_over_a_million_events() -> None:
+    rng = random.Random(7)
+    statuses = rng.choices(("success", "blocked", "failed"), k=EVENTS)
+    detected = [status == "blocked" for status in statuses]
+
+    started = time.perf_counter()
+    metrics = CognitiveFeedbackLoopService.compute_defensive_effectiveness_metrics(
+        events=DefensiveEventColumns(statuses=statuses, threat_detected=detected),
+        adjustments=[],
+    )
+    metrics_seconds = time.perf_counter() - started
+
+    assert metrics.total_events == EVENTS
+    assert metrics.blocked_events == statuses.count("blocked")
+    assert metrics.detection_rate == metrics.prevention_rate
+    assert metrics_seconds < 10.0
@@ -16,7 +16,11 @@
 
 from __future__ import annotations
 
+import re
 import subprocess
+import time
+import tracemalloc
+from typing import Any
 
 import pytest
 
@@ -25,7 +29,13 @@ from pkg.orchestrator.engine import OrchestratorEngine, TaskSubmissionRequest
 from pkg.orchestrator.task_scheduler import TaskScheduler
 from pkg.orchestrator.telemetry_ingestion import TelemetryIngestionPipeline
 from pkg.security.aaa_framework import AAAService, AuthorizationError
-from pkg.wrappers.nmap import NmapScanOptions, NmapWrapper
+from pkg.wrappers.nmap import (
+    NmapExecutionError,
+    NmapScanHost,
+    NmapScanOptions,
+    NmapWrapper,
+    NmapXmlStreamParser,
+)
 
 
 def test_qa_nmap_scan_accuracy_multi_host_xml() -> None:
@@ -115,3 +125,143 @@ def test_qa_nmap_aaa_enforcement_denies_unauthorized_submit() -> None:
 
     with pytest.raises(AuthorizationError):
         engine.submit_task(nmap_task, secret="pw")
+
+
+def _synthetic_host_xml(index: int) -> str:
+    address = f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}"
+    return (
+        '<host starttime="1" endtime="2"><status state="up" reason="syn-ack"/>'
+        f'<address addr="{address}" addrtype="ipv4"/><hostnames/><ports>'
+        '<extraports state="closed" count="997"/>'
+        '<port protocol="tcp" portid="22"><state state="open" reason="syn-ack"/>'
+        '<service name="ssh" product="OpenSSH" method="probed" conf="10"/></port>'
+        '<port protocol="tcp" portid="80"><state state="filtered" reason="no-response"/>'
+        '<service name="http" method="table" conf="3"/></port>'
+        '<port protocol="tcp" portid="443"><state state="open" reason="syn-ack"/>'
+        '<service name="https" method="probed" conf="10"/></port>'
+        '</ports><os><osmatch name="Linux 5.x" accuracy="98"/></os></host>\n'
+    )
+
+
+def _synthetic_sweep_chunks(host_count: int, hosts_per_chunk: int = 500):
+    yield '<?xml version="1.0"?>\n<nmaprun scanner="nmap">\n'
+    for start in range(0, host_count, hosts_per_chunk):
+        stop = min(start + hosts_per_chunk, host_count)
+        yield "".join(_synthetic_host_xml(index) for index in range(start, stop))
+    yield "</nmaprun>\n"
+
+
+def _parse_xml_regex(xml_output: str) -> list[NmapScanHost]:
+    """Previous regex-based XML parser, kept as the benchmark baseline."""
+    parsed_hosts: list[NmapScanHost] = []
+    host_blocks = re.findall(r"<host\b[^>]*>(.*?)</host>", xml_output, flags=re.S)
+    if not host_blocks:
+        if "<nmaprun" in xml_output and "</nmaprun>" in xml_output:
+            return []
+        raise NmapExecutionError(
+            "failed to parse nmap XML output: no <host> blocks"
+        )
+
+    for host_block in host_blocks:
+        address_match = re.search(r'<address\b[^>]*\baddr="([^"]+)"', host_block)
+        status_match = re.search(r'<status\b[^>]*\bstate="([^"]+)"', host_block)
+        address = address_match.group(1) if address_match else "unknown"
+        status = status_match.group(1) if status_match else "unknown"
+        services: list[dict[str, Any]] = []
+        open_ports: list[int] = []
+        port_matches = re.findall(
+            r"<port\b([^>]*)>(.*?)</port>",
+            host_block,
+            flags=re.S,
+        )
+        for port_attrs, port_block in port_matches:
+            state_match = re.search(
+                r'<state\b[^>]*\bstate="([^"]+)"',
+                port_block,
+            )
+            if not state_match or state_match.group(1) != "open":
+                continue
+
+            port_id_match = re.search(r'\bportid="([^"]+)"', port_attrs)
+            protocol_match = re.search(r'\bprotocol="([^"]+)"', port_attrs)
+            service_match = re.search(
+                r'<service\b[^>]*\bname="([^"]+)"',
+                port_block,
+            )
+            port_id = int(port_id_match.group(1)) if port_id_match else 0
+            open_ports.append(port_id)
+            services.append(
+                {
+                    "port": port_id,
+                    "protocol": (
+                        protocol_match.group(1) if protocol_match else "unknown"
+                    ),
+                    "name": service_match.group(1) if service_match else "unknown",
+                }
+            )
+
+        os_matches: list[str] = []
+        for match in re.findall(r'<osmatch\b[^>]*\bname="([^"]+)"', host_block):
+            if match:
+                os_matches.append(match)
+
+        parsed_hosts.append(
+            NmapScanHost(
+                address=address,
+                status=status,
+                open_ports=open_ports,
+                services=services,
+                os_matches=os_matches,
+            )
+        )
+    return parsed_hosts
+
+
+def test_qa_nmap_streaming_parser_benchmark_against_regex_path() -> None:
+    xml_output = "".join(_synthetic_sweep_chunks(10_000))
+    wrapper = NmapWrapper()
+
+    started = time.perf_counter()
+    regex_hosts = _parse_xml_regex(xml_output)
+    regex_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    stream_hosts = wrapper._parse_xml(xml_output)
+    stream_seconds = time.perf_counter() - started
+
+    assert stream_hosts == regex_hosts
+    assert len(stream_hosts) == 10_000
+    assert stream_seconds <= regex_seconds * 1.5
+
+
+def test_qa_nmap_streaming_parser_handles_100k_host_sweep() -> None:
+    parser = NmapXmlStreamParser()
+    hosts = 0
+    open_ports = 0
+
+    for chunk in _synthetic_sweep_chunks(100_000):
+        for host in parser.feed(chunk):
+            hosts += 1
+            open_ports += len(host.open_ports)
+    hosts += len(parser.close())
+
+    assert parser.complete
+    assert hosts == parser.host_count == 100_000
+    assert open_ports == 200_000
+
+
+def test_qa_nmap_streaming_parser_memory_is_bounded_by_chunk_not_scan() -> None:
+    parser = NmapXmlStreamParser()
+
+    tracemalloc.start()
+    try:
+        for chunk in _synthetic_sweep_chunks(5_000, hosts_per_chunk=50):
+            parser.feed(chunk)
+        parser.close()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    full_document_bytes = len("".join(_synthetic_sweep_chunks(5_000)))
+    assert parser.host_count == 5_000
+    assert peak < full_document_bytes // 4
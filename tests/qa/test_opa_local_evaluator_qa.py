@@ -0,0 +1,50 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: Jose Maria Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""QA latency check for in-process capability policy evaluation."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from pkg.orchestrator.opa import OPAConfig, OPAExecutionAuthorizer
+from pkg.orchestrator.opa_local import LocalPolicyEvaluator
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_qa_local_policy_evaluation_stays_in_microseconds() -> None:
+    authorizer = OPAExecutionAuthorizer(
+        OPAConfig(url="http://opa:8181"),
+        local_evaluator=LocalPolicyEvaluator(REPO_ROOT / "config/opa/policies"),
+    )
+    payloads = [
+        {
+            "operator_id": "operator-a",
+            "tenant_id": "tenant-a",
+            "tool_sha256": "sha256:" + "a" * 64,
+            "target_urn": f"urn:target:ip:10.0.0.{index % 250}",
+            "action": "scan" if index % 2 else "execute",
+        }
+        for index in range(20000)
+    ]
+
+    started = time.perf_counter()
+    for payload in payloads:
+        authorizer.authorize(payload)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed / len(payloads) < 100e-6
+    assert authorizer.metrics().queries == 0
@@ -0,0 +1,77 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""QA benchmark for DAG-scheduled parallel playbook execution."""
+
+from __future__ import annotations
+
+import time
+
+from pkg.orchestrator.playbook_engine import PlaybookEngine, StepExecutionStatus
+from pkg.wrappers.base import WrapperCommandResult
+
+HOSTS = 8
+STAGES = ("recon", "enumerate", "exploit")
+STEP_SECONDS = 0.05
+
+
+def _sleeping_runner(command: list[str], timeout_seconds: float) -> WrapperCommandResult:
+    time.sleep(STEP_SECONDS)
+    return WrapperCommandResult(returncode=0, stdout=" ".join(command), stderr="")
+
+
+def test_qa_independent_host_chains_finish_within_critical_path() -> None:
+    engine = PlaybookEngine()
+    playbook = engine.create_playbook(
+        name="Per-Host Chains",
+        description="Independent recon/enumerate/exploit chain per host",
+        created_by="alice",
+    )
+    module = engine.register_technique_module(
+        name="Stage",
+        technique_id="T1046",
+        default_command_template="{stage} --target {target_host}",
+        default_rollback_template="cleanup --target {target_host}",
+    )
+    order = 0
+    for host in range(HOSTS):
+        previous: tuple[str, ...] = ()
+        for stage in STAGES:
+            order += 1
+            previous = (
+                engine.add_playbook_step(
+                    playbook_id=playbook.playbook_id,
+                    step_order=order,
+                    name=f"{stage}-{host:02d}",
+                    technique_module_id=module.technique_module_id,
+                    variables={"stage": stage, "target_host": f"srv-{host:02d}"},
+                    depends_on=previous,
+                ).step_id,
+            )
+
+    started = time.perf_counter()
+    result = engine.execute_playbook(
+        playbook_id=playbook.playbook_id,
+        runner=_sleeping_runner,
+        actor="alice",
+        max_parallel=HOSTS,
+    )
+    elapsed = time.perf_counter() - started
+
+    serial_seconds = HOSTS * len(STAGES) * STEP_SECONDS
+    assert result.status == StepExecutionStatus.SUCCEEDED
+    assert len(result.step_results) == HOSTS * len(STAGES)
+    assert result.critical_path_seconds < serial_seconds / 2
+    assert elapsed < serial_seconds / 2
+    assert elapsed < 10.0
@@ -0,0 +1,89 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""QA benchmark for batched what-if playbook simulation."""
+
+from __future__ import annotations
+
+import time
+
+from pkg.orchestrator.playbook_engine import PlaybookEngine, PlaybookScenario, StepExecutionStatus
+
+STEPS = 25
+HOSTS = 8
+
+
+def test_qa_bulk_what_if_simulation_reuses_compiled_plan() -> None:
+    engine = PlaybookEngine()
+    playbook = engine.create_playbook(
+        name="What-If Chain",
+        description="Batched permutation benchmark",
+        created_by="alice",
+        default_variables={"target_host": "srv-00", "domain": "corp.local", "tier": 1},
+    )
+    wrapper = engine.register_wrapper_template(
+        name="shell",
+        command_template="sh -c '{payload}' # {domain}",
+        rollback_template="sh -c '{payload}'",
+    )
+    module = engine.register_technique_module(
+        name="Generic Step",
+        technique_id="T1059",
+        default_command_template="run --target {target_host} --domain {domain}",
+        default_rollback_template="undo --target {target_host}",
+    )
+    step_ids = [
+        engine.add_playbook_step(
+            playbook_id=playbook.playbook_id,
+            step_order=order,
+            name=f"step-{order}",
+            technique_module_id=module.technique_module_id,
+            wrapper_template_id=wrapper.wrapper_template_id,
+            condition_expression="tier >= 1 and target_host != 'quarantined'" if order % 3 == 0 else None,
+        ).step_id
+        for order in range(1, STEPS + 1)
+    ]
+    scenarios = [
+        PlaybookScenario(
+            runtime_variables={"target_host": f"srv-{host:02d}", "tier": tier},
+            fail_step_ids=frozenset({failed}) if failed else frozenset(),
+        )
+        for host in range(HOSTS)
+        for tier in (0, 1)
+        for failed in (None, *step_ids)
+    ]
+
+    started = time.perf_counter()
+    batched = engine.simulate_playbook_many(playbook_id=playbook.playbook_id, scenarios=scenarios)
+    batched_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    individual = [
+        engine.simulate_playbook(
+            playbook_id=playbook.playbook_id,
+            runtime_variables=dict(scenario.runtime_variables),
+            fail_step_ids=set(scenario.fail_step_ids),
+        )
+        for scenario in scenarios
+    ]
+    individual_seconds = time.perf_counter() - started
+
+    assert len(scenarios) == HOSTS * 2 * (STEPS + 1)
+    assert batched == individual
+    # With tier 0 the conditional steps are skipped and cannot fail.
+    assert sum(row.status == StepExecutionStatus.FAILED for row in batched) == HOSTS * (
+        2 * STEPS - STEPS // 3
+    )
+    assert batched_seconds < 10.0
+    assert individual_seconds < 10.0
@@ -0,0 +1,50 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""QA benchmark for cached Ed25519 payload signing throughput."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from pkg.security.ed25519_keys import Ed25519KeyManager, _parse_private_key
+
+
+def test_qa_cached_key_signing_outpaces_per_call_key_loading(tmp_path: Path) -> None:
+    key_path = tmp_path / "bench.pem"
+    key_path.write_bytes(
+        Ed25519PrivateKey.generate().private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    payloads = [f'{{"event":{index}}}'.encode() for index in range(2000)]
+
+    started = time.perf_counter()
+    uncached = [_parse_private_key(key_path.read_bytes()).sign(item) for item in payloads]
+    uncached_seconds = time.perf_counter() - started
+
+    manager = Ed25519KeyManager()
+    started = time.perf_counter()
+    batched = manager.sign_many(str(key_path), payloads)
+    batched_seconds = time.perf_counter() - started
+
+    assert batched == uncached
+    assert manager.loads == 1
+    assert batched_seconds < uncached_seconds
@@ -18,8 +18,14 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
+from unittest.mock import patch
 
-from pkg.orchestrator.messaging import InMemoryKafkaBroker, KafkaTelemetryPublisher
+from pkg.orchestrator.messaging import (
+    InMemoryKafkaBroker,
+    InMemoryRabbitBroker,
+    KafkaTelemetryPublisher,
+    RabbitMQTelemetryPublisher,
+)
 from pkg.orchestrator.telemetry_ingestion import TelemetryIngestionPipeline
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -80,3 +86,32 @@ def test_sprint30_high_volume_throughput_kafka_path() -> None:
     assert len(messages) == 2000
     assert messages[0].stream_position == 1
     assert messages[-1].stream_position == 2000
+
+
+def test_sprint30_batched_publish_throughput_rabbit_path() -> None:
+    broker = InMemoryRabbitBroker()
+    publisher = RabbitMQTelemetryPublisher(broker=broker)
+    pipeline = TelemetryIngestionPipeline(batch_size=20000, publisher=publisher)
+
+    with patch("pkg.orchestrator.telemetry_ingestion.emit_audit_event"), patch(
+        "pkg.orchestrator.telemetry_ingestion.logger"
+    ):
+        for index in range(20000):
+            pipeline.ingest(
+                event_type="com.nyxeralabs.runner.execution.v1",
+                actor="operator-1",
+                target=f"urn:target:ip:10.0.2.{index % 255}",
+                status="success",
+                tenant_id="tenant-a",
+                event_index=index,
+            )
+
+    with patch.object(broker, "publish", wraps=broker.publish) as publish_one, patch.object(
+        broker, "publish_many", wraps=broker.publish_many
+    ) as publish_many:
+        result = asyncio.run(pipeline.flush_all_async())
+
+    assert result.published == 20000
+    assert broker.queue_size("telemetry.events") == 20000
+    assert publish_one.call_count == 0
+    assert publish_many.call_count == 1
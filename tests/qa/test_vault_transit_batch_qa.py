@@ -0,0 +1,233 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""QA checks for batched Vault transit signing against a local transit stand-in."""
+
+from __future__ import annotations
+
+import base64
+import json
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    decode_dss_signature,
+    encode_dss_signature,
+)
+
+from pkg.orchestrator.dual_signature import HighRiskManifestDualSigner
+from pkg.orchestrator.jws import CompactJWSGenerator, JWSConfig
+from pkg.orchestrator.signing import VaultTransitConfig, VaultTransitSigner
+
+
+class _TransitStandIn:
+    """Minimal transit engine: ECDSA P-256 keys, rotation and batch signing."""
+
+    def __init__(self) -> None:
+        self.keys: dict[str, list[ec.EllipticCurvePrivateKey]] = {}
+        self.sign_calls = 0
+        self.key_reads = 0
+        self.lock = threading.Lock()
+
+    def key(self, name: str) -> list[ec.EllipticCurvePrivateKey]:
+        return self.keys.setdefault(name, [ec.generate_private_key(ec.SECP256R1())])
+
+    def sign(self, name: str, body: dict[str, Any]) -> dict[str, Any]:
+        with self.lock:
+            self.sign_calls += 1
+            versions = self.key(name)
+        version = int(body.get("key_version") or len(versions))
+        private_key = versions[version - 1]
+
+        def one(encoded: str) -> dict[str, str]:
+            der = private_key.sign(base64.b64decode(encoded), ec.ECDSA(hashes.SHA256()))
+            r, s = decode_dss_signature(der)
+            raw = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+            marshaled = base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+            return {"signature": f"vault:v{version}:{marshaled}"}
+
+        if "batch_input" in body:
+            return {"batch_results": [one(item["input"]) for item in body["batch_input"]]}
+        return one(body["input"])
+
+    def metadata(self, name: str) -> dict[str, Any]:
+        with self.lock:
+            self.key_reads += 1
+            versions = self.key(name)
+        return {
+            "name": name,
+            "latest_version": len(versions),
+            "keys": {
+                str(index + 1): {
+                    "public_key": key.public_key()
+                    .public_bytes(
+                        serialization.Encoding.PEM,
+                        serialization.PublicFormat.SubjectPublicKeyInfo,
+                    )
+                    .decode("ascii")
+                }
+                for index, key in enumerate(versions)
+            },
+        }
+
+    def rotate(self, name: str) -> dict[str, Any]:
+        with self.lock:
+            self.key(name).append(ec.generate_private_key(ec.SECP256R1()))
+        return self.metadata(name)
+
+
+def _handler(transit: _TransitStandIn) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            del format, args
+
+        def _reply(self, data: dict[str, Any]) -> None:
+            encoded = json.dumps({"data": data}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def do_GET(self) -> None:
+            self._reply(transit.metadata(self.path.rsplit("/", 1)[-1]))
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", "0"))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            parts = self.path.strip("/").split("/")
+            if parts[2] == "sign":
+                self._reply(transit.sign(parts[3], body))
+            elif parts[-1] == "rotate":
+                self._reply(transit.rotate(parts[3]))
+            else:
+                self._reply({})
+
+    return Handler
+
+
+@pytest.fixture()
+def transit() -> Iterator[tuple[_TransitStandIn, str]]:
+    stand_in = _TransitStandIn()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(stand_in))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield stand_in, f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _signer(address: str, key_name: str, **kwargs: Any) -> VaultTransitSigner:
+    return VaultTransitSigner(
+        VaultTransitConfig(
+            address=address,
+            token="qa-token",
+            key_name=key_name,
+            require_https=False,
+        ),
+        **kwargs,
+    )
+
+
+def _verify_jws(token: str, public_key_pem: str) -> None:
+    signing_input, signature_segment = token.rsplit(".", 1)
+    raw = base64.urlsafe_b64decode(signature_segment + "=" * (-len(signature_segment) % 4))
+    der = encode_dss_signature(
+        int.from_bytes(raw[:32], "big"), int.from_bytes(raw[32:], "big")
+    )
+    public_key = serialization.load_pem_public_key(public_key_pem.encode("ascii"))
+    assert isinstance(public_key, ec.EllipticCurvePublicKey)
+    public_key.verify(der, signing_input.encode("ascii"), ec.ECDSA(hashes.SHA256()))
+
+
+def test_qa_dual_signer_batches_hundreds_of_manifests(
+    transit: tuple[_TransitStandIn, str],
+) -> None:
+    stand_in, address = transit
+    primary = _signer(address, "primary-signing", max_batch_size=128)
+    secondary = _signer(address, "secondary-signing", max_batch_size=128)
+    dual = HighRiskManifestDualSigner(
+        primary=CompactJWSGenerator(primary, JWSConfig(key_id="primary")),
+        secondary=CompactJWSGenerator(secondary, JWSConfig(key_id="secondary")),
+        primary_signer_id="sig-a",
+        secondary_signer_id="sig-b",
+    )
+    manifests = [
+        ({"task_id": f"task-{index}"}, "high" if index % 2 else "low")
+        for index in range(500)
+    ]
+
+    started = time.perf_counter()
+    bundles = dual.sign_many(manifests)
+    elapsed = time.perf_counter() - started
+
+    assert len(bundles) == 500
+    assert len(manifests) / elapsed > 200
+    assert stand_in.sign_calls == 4 + 2
+    _verify_jws(bundles[1].primary_jws, primary.read_public_key())
+    _verify_jws(bundles[1].secondary_jws or "", secondary.read_public_key())
+    metrics = primary.metrics()
+    assert metrics.payloads_per_sign_request == 125.0
+    assert metrics.connections_opened == 1
+    assert metrics.connections_reused == metrics.requests - 1
+
+
+def test_qa_concurrent_jws_generation_coalesces_transit_calls(
+    transit: tuple[_TransitStandIn, str],
+) -> None:
+    stand_in, address = transit
+    signer = _signer(address, "coalesced-signing", batch_window_seconds=0.02)
+    generator = CompactJWSGenerator(signer)
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        tokens = list(
+            executor.map(lambda index: generator.generate({"task_id": index}), range(320))
+        )
+
+    public_key = signer.read_public_key()
+    for token in tokens[:: 40]:
+        _verify_jws(token, public_key)
+    assert stand_in.sign_calls < 320 / 4
+    assert signer.metrics().signed_payloads == 320
+
+
+def test_qa_public_key_cache_follows_rotation(
+    transit: tuple[_TransitStandIn, str],
+) -> None:
+    stand_in, address = transit
+    signer = _signer(address, "rotating-signing")
+    generator = CompactJWSGenerator(signer)
+
+    first_key = signer.read_public_key()
+    for _ in range(50):
+        assert signer.read_public_key() == first_key
+    assert stand_in.key_reads == 1
+
+    signer.rotate_signing_key()
+    token = generator.generate({"task_id": "after-rotation"})
+
+    _verify_jws(token, signer.read_public_key())
+    assert signer.read_public_key(1) == first_key
+    assert signer.read_public_key() != first_key
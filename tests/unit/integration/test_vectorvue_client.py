@@ -485,6 +485,90 @@ def test_fetch_feedback_adjustments_rejects_replayed_nonce(
         client.fetch_feedback_adjustments(tenant_id, limit=10)
 
 
+def test_forged_feedback_response_does_not_consume_nonce(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_id = "10000000-0000-0000-0000-000000000001"
+    signed_at = 1700000000
+    nonce = "feedback-nonce-forged"
+    private_key = Ed25519PrivateKey.generate()
+    kid = "default"
+    monkeypatch.setenv(
+        "VECTORVUE_FEEDBACK_VERIFY_KEYS_JSON",
+        json.dumps(
+            {kid: base64.b64encode(private_key.public_key().public_bytes_raw()).decode("utf-8")}
+        ),
+    )
+    data = [
+        {
+            "tenant_id": tenant_id,
+            "execution_fingerprint": "e" * 64,
+            "target_urn": "urn:target:ip:10.0.0.5",
+            "action": "tighten",
+            "confidence": 0.91,
+            "rationale": "risk cluster",
+            "timestamp": 1760000000,
+            "schema_version": "feedback.adjustment.v1",
+            "attestation_measurement_hash": "c" * 64,
+        }
+    ]
+    signature = _feedback_signature(
+        tenant_id=tenant_id,
+        signed_at=signed_at,
+        nonce=nonce,
+        schema_version="feedback.response.v1",
+        kid=kid,
+        data=data,
+        private_key=private_key,
+    )
+
+    def _response(request_id: str, signature: str) -> FakeResponse:
+        return FakeResponse(
+            200,
+            {
+                "request_id": request_id,
+                "status": "accepted",
+                "data": data,
+                "errors": [],
+                "signed_at": signed_at,
+                "nonce": nonce,
+                "kid": kid,
+                "schema_version": "feedback.response.v1",
+                "signature_algorithm": "Ed25519",
+                "signature": signature,
+            },
+        )
+
+    session = FakeSession(
+        [
+            _response("fb-forged", base64.b64encode(b"\x00" * 64).decode("utf-8")),
+            _response("fb-genuine", signature),
+        ]
+    )
+    client = VectorVueClient(_config_with_creds(token="jwt"), session=session)
+    monkeypatch.setattr(
+        client,
+        "_build_federation_headers",
+        lambda **_: {
+            "X-Service-Identity": "spectrastrike-producer",
+            "X-Client-Cert-Sha256": "a" * 64,
+            "X-Telemetry-Timestamp": "1760000000",
+            "X-Telemetry-Nonce": "nonce-feedback",
+            "X-Telemetry-Signature": "sig",
+        },
+    )
+    monkeypatch.setattr("pkg.integration.vectorvue.client.time.time", lambda: signed_at)
+
+    with pytest.raises(
+        VectorVueSerializationError,
+        match="feedback response signature verification failed",
+    ):
+        client.fetch_feedback_adjustments(tenant_id, limit=10)
+
+    genuine = client.fetch_feedback_adjustments(tenant_id, limit=10)
+    assert genuine.verified is True
+
+
 def test_fetch_feedback_adjustments_supports_key_rotation(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -153,3 +153,48 @@ def test_graph_traversal_engine_finds_path() -> None:
     )
     assert len(paths) == 1
     assert paths[0].node_path == ("a", "b", "c")
+
+
+def test_incremental_reconstruction_applies_deltas_and_matches_full_rebuild() -> None:
+    campaign_engine, campaign_id = _seed_campaign()
+    graph = AdversaryGraphEngine()
+    first = graph.reconstruct_campaign_graph(campaign_engine=campaign_engine, campaign_id=campaign_id)
+
+    polled = graph.reconstruct_campaign_graph(campaign_engine=campaign_engine, campaign_id=campaign_id)
+    assert polled.attack_paths == first.attack_paths
+    assert polled.technique_links == first.technique_links
+
+    identity = first.identity_chains[0]
+    execution = campaign_engine.list_campaign_executions(campaign_id=campaign_id)[-1]
+    campaign_engine.add_lateral_movement_edge(
+        campaign_id=campaign_id,
+        identity_id=identity.identity_id,
+        source_asset_id="host-c",
+        target_asset_id="host-d",
+        execution_id=execution.execution_id,
+    )
+    incremental = graph.reconstruct_campaign_graph(
+        campaign_engine=campaign_engine, campaign_id=campaign_id
+    )
+    added = incremental.attack_paths[len(first.attack_paths) :]
+    assert {row.path_type for row in added} == {"identity_pivot", "lateral_movement"}
+    assert incremental.identity_chains[0].pivot_assets == ("host-a", "host-b", "host-c", "host-d")
+
+    rebuilt = graph.reconstruct_campaign_graph(
+        campaign_engine=campaign_engine, campaign_id=campaign_id, full_rebuild=True
+    )
+    assert rebuilt.attack_paths == incremental.attack_paths
+    assert rebuilt.technique_links == incremental.technique_links
+    assert rebuilt.identity_chains == incremental.identity_chains
+
+    fresh = AdversaryGraphEngine().reconstruct_campaign_graph(
+        campaign_engine=campaign_engine, campaign_id=campaign_id
+    )
+    assert fresh.identity_chains == incremental.identity_chains
+    assert {
+        (row.source_technique_id, row.target_technique_id, row.relation)
+        for row in fresh.technique_links
+    } == {
+        (row.source_technique_id, row.target_technique_id, row.relation)
+        for row in incremental.technique_links
+    }
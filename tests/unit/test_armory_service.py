@@ -18,7 +18,7 @@ from pathlib import Path
 
 import pytest
 
-from pkg.armory.service import ArmoryService
+from pkg.armory.service import ArmoryService, FileToolScanner, LocalScanner
 
 
 def test_ingest_pipeline_persists_registry_entry(tmp_path: Path) -> None:
@@ -78,3 +78,90 @@ def test_duplicate_approver_rejected_under_dual_control(tmp_path: Path) -> None:
     service.approve_tool(tool_sha256=result.tool_sha256, approver="secops-1")
     with pytest.raises(ValueError, match="already submitted"):
         service.approve_tool(tool_sha256=result.tool_sha256, approver="secops-1")
+
+
+def test_ingest_tool_from_path_matches_in_memory_digest(tmp_path: Path) -> None:
+    artifact = b"container-bytes" * 100_000
+    artifact_path = tmp_path / "tool.tar"
+    artifact_path.write_bytes(artifact)
+    service = ArmoryService(registry_path=str(tmp_path / "armory.json"))
+
+    from_path = service.ingest_tool(
+        tool_name="nmap-secure",
+        image_ref="registry.internal/security/nmap:1.0.0",
+        artifact_path=artifact_path,
+    )
+    in_memory = service.ingest_tool(
+        tool_name="nmap-secure",
+        image_ref="registry.internal/security/nmap:1.0.0",
+        artifact=artifact,
+    )
+
+    assert from_path.tool_sha256 == in_memory.tool_sha256
+    tools = service.list_tools()
+    assert len(tools) == 1
+    assert tools[0].sbom_digest == LocalScanner().generate_sbom(
+        image_ref="registry.internal/security/nmap:1.0.0", artifact=artifact
+    )[1]
+
+
+def test_ingest_tool_from_path_falls_back_to_in_memory_scanner(tmp_path: Path) -> None:
+    class _BytesOnlyScanner:
+        def __init__(self) -> None:
+            self.sizes: list[int] = []
+
+        def generate_sbom(self, *, image_ref: str, artifact: bytes) -> tuple[str, str]:
+            self.sizes.append(len(artifact))
+            return LocalScanner().generate_sbom(image_ref=image_ref, artifact=artifact)
+
+        def scan_vulnerabilities(self, *, sbom_digest: str) -> dict[str, int]:
+            return LocalScanner().scan_vulnerabilities(sbom_digest=sbom_digest)
+
+    artifact_path = tmp_path / "tool.tar"
+    artifact_path.write_bytes(b"container-bytes")
+    scanner = _BytesOnlyScanner()
+    service = ArmoryService(registry_path=str(tmp_path / "armory.json"), scanner=scanner)
+
+    service.ingest_tool(
+        tool_name="nmap-secure",
+        image_ref="registry.internal/security/nmap:1.0.0",
+        artifact_path=artifact_path,
+    )
+
+    assert isinstance(LocalScanner(), FileToolScanner)
+    assert not isinstance(scanner, FileToolScanner)
+    assert scanner.sizes == [len(b"container-bytes")]
+
+
+def test_ingest_tool_rejects_artifact_modified_during_scan(tmp_path: Path) -> None:
+    class _SwappingScanner(LocalScanner):
+        def generate_sbom_from_file(
+            self, *, image_ref: str, artifact_path: Path
+        ) -> tuple[str, str]:
+            artifact_path.write_bytes(b"swapped-container-bytes")
+            return super().generate_sbom_from_file(
+                image_ref=image_ref, artifact_path=artifact_path
+            )
+
+    artifact_path = tmp_path / "tool.tar"
+    artifact_path.write_bytes(b"container-bytes")
+    service = ArmoryService(
+        registry_path=str(tmp_path / "armory.json"), scanner=_SwappingScanner()
+    )
+
+    with pytest.raises(ValueError, match="changed during ingest"):
+        service.ingest_tool(
+            tool_name="nmap-secure",
+            image_ref="registry.internal/security/nmap:1.0.0",
+            artifact_path=artifact_path,
+        )
+    assert service.list_tools() == []
+
+
+def test_ingest_tool_requires_exactly_one_artifact_source(tmp_path: Path) -> None:
+    service = ArmoryService(registry_path=str(tmp_path / "armory.json"))
+    with pytest.raises(ValueError, match="exactly one"):
+        service.ingest_tool(
+            tool_name="scanner",
+            image_ref="registry.internal/tools/scanner:2.0.0",
+        )
@@ -0,0 +1,222 @@
+# Copyright (c) 2026 NyxeraLabs
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+
+"""Unit tests for the incremental lateral attack-path index."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from pkg.orchestrator.adversary_graph import AdversaryGraphEngine, AdversaryGraphError
+from pkg.orchestrator.attack_paths import AttackPathQueryError, LateralGraphIndex
+
+
+def _diamond() -> LateralGraphIndex:
+    index = LateralGraphIndex()
+    index.add_edges(
+        [
+            ("e1", "a", "b"),
+            ("e2", "b", "d"),
+            ("e3", "a", "c"),
+            ("e4", "c", "d"),
+            ("e5", "a", "d"),
+            ("e6", "b", "c"),
+            ("e7", "d", "a"),
+        ]
+    )
+    return index
+
+
+def test_add_edge_deduplicates_by_edge_id() -> None:
+    index = LateralGraphIndex()
+    assert index.add_edge("e1", "a", "b") is True
+    assert index.add_edge("e1", "a", "b") is False
+    assert index.add_edges([("e1", "a", "b"), ("e2", "b", "c")]) == 1
+    assert index.node_count == 3
+    assert index.edge_count == 2
+
+
+def test_k_shortest_paths_are_loop_free_and_ordered_by_hops() -> None:
+    paths = _diamond().k_shortest_paths("a", "d", k=10, max_depth=6)
+
+    assert [path.edge_path for path in paths] == [
+        ("e5",),
+        ("e1", "e2"),
+        ("e3", "e4"),
+        ("e1", "e6", "e4"),
+    ]
+    assert all(len(set(path.node_path)) == len(path.node_path) for path in paths)
+    assert _diamond().k_shortest_paths("a", "d", k=2, max_depth=6)[1].hops == 2
+    assert _diamond().k_shortest_paths("a", "d", k=10, max_depth=2)[-1].hops == 2
+
+
+def test_k_shortest_paths_keeps_parallel_edges_distinct() -> None:
+    index = LateralGraphIndex()
+    index.add_edges([("smb", "a", "b"), ("winrm", "a", "b")])
+
+    paths = index.k_shortest_paths("a", "b", k=5, max_depth=3)
+
+    assert sorted(path.edge_path for path in paths) == [("smb",), ("winrm",)]
+
+
+def test_index_sees_edges_added_after_earlier_queries() -> None:
+    index = LateralGraphIndex()
+    index.add_edge("e1", "a", "b")
+    assert index.k_shortest_paths("a", "c", k=3, max_depth=4) == []
+
+    index.add_edge("e2", "b", "c")
+
+    assert [path.node_path for path in index.k_shortest_paths("a", "c", k=3, max_depth=4)] == [
+        ("a", "b", "c")
+    ]
+
+
+def _simple_paths(
+    edges: list[tuple[str, str, str]], start: str, target: str, max_depth: int
+) -> set[tuple[str, ...]]:
+    found: set[tuple[str, ...]] = set()
+
+    def walk(node: str, visited: tuple[str, ...], path: tuple[str, ...]) -> None:
+        if node == target:
+            found.add(path)
+            return
+        if len(path) == max_depth:
+            return
+        for edge_id, source, successor in edges:
+            if source == node and successor not in visited:
+                walk(successor, (*visited, successor), (*path, edge_id))
+
+    walk(start, (start,), ())
+    return found
+
+
+def test_k_shortest_paths_on_parallel_edge_multigraph() -> None:
+    index_edges = [
+        *((f"a{lane}", "n0", "n2") for lane in range(4)),
+        *((f"b{lane}", "n2", "n1") for lane in range(2)),
+        ("c0", "n0", "n3"),
+        ("c1", "n3", "n1"),
+    ]
+    index = LateralGraphIndex()
+    index.add_edges(index_edges)
+
+    paths = index.k_shortest_paths("n0", "n1", k=16, max_depth=4)
+
+    assert len(paths) == 9
+    assert {path.edge_path for path in paths} == _simple_paths(
+        index_edges, "n0", "n1", 4
+    )
+
+
+def test_k_shortest_paths_matches_brute_force_on_random_multigraphs() -> None:
+    rng = random.Random(2026)
+    for _ in range(300):
+        nodes = [f"n{index}" for index in range(rng.randint(3, 6))]
+        edges = [
+            (f"e{index}", rng.choice(nodes), rng.choice(nodes))
+            for index in range(rng.randint(3, 14))
+        ]
+        max_depth = rng.randint(1, 4)
+        index = LateralGraphIndex()
+        index.add_edges(edges)
+        expected = _simple_paths(edges, "n0", "n1", max_depth)
+
+        paths = index.k_shortest_paths("n0", "n1", k=1_000, max_depth=max_depth)
+
+        assert {path.edge_path for path in paths} == expected
+        assert [path.hops for path in paths] == sorted(path.hops for path in paths)
+        prefix = index.k_shortest_paths("n0", "n1", k=3, max_depth=max_depth)
+        assert [path.hops for path in prefix] == sorted(len(path) for path in expected)[:3]
+
+
+def test_top_paths_by_risk_prefers_longer_paths_and_caps_results() -> None:
+    ranked = _diamond().top_paths_by_risk(
+        "a",
+        "d",
+        k=2,
+        max_depth=6,
+        risk=lambda hops: hops / 10,
+    )
+
+    assert [score for score, _ in ranked] == [0.3, 0.2]
+    assert ranked[0][1].edge_path == ("e1", "e6", "e4")
+
+
+def test_top_paths_by_risk_honours_expansion_cap() -> None:
+    index = LateralGraphIndex()
+    for layer in range(6):
+        for left in range(4):
+            for right in range(4):
+                index.add_edge(f"e{layer}-{left}-{right}", f"n{layer}-{left}", f"n{layer + 1}-{right}")
+    for right in range(4):
+        index.add_edge(f"s-{right}", "start", f"n0-{right}")
+        index.add_edge(f"t-{right}", f"n6-{right}", "target")
+
+    capped = index.top_paths_by_risk(
+        "start", "target", k=100, max_depth=10, risk=float, max_expansions=50
+    )
+    full = index.top_paths_by_risk("start", "target", k=100, max_depth=10, risk=float)
+
+    assert 0 < len(capped) < len(full) == 100
+
+
+def test_queries_validate_arguments() -> None:
+    index = _diamond()
+    with pytest.raises(AttackPathQueryError):
+        index.k_shortest_paths("a", "d", k=0, max_depth=3)
+    with pytest.raises(AttackPathQueryError):
+        index.top_paths_by_risk("a", "d", k=1, max_depth=0, risk=float)
+    with pytest.raises(AttackPathQueryError):
+        index.top_paths_by_risk("a", "d", k=1, max_depth=3, risk=float, max_expansions=0)
+    assert index.k_shortest_paths("a", "missing", k=3, max_depth=3) == []
+
+
+def test_to_csr_layout_matches_adjacency() -> None:
+    csr = _diamond().to_csr()
+
+    assert csr.node_ids == ("a", "b", "d", "c")
+    assert list(csr.indptr) == [0, 3, 5, 6, 7]
+    assert list(csr.indices) == [1, 3, 2, 2, 3, 0, 2]
+    assert csr.edge_ids == ("e1", "e3", "e5", "e2", "e6", "e7", "e4")
+
+
+def test_traverse_lateral_paths_caps_recorded_paths_and_reuses_index() -> None:
+    graph = AdversaryGraphEngine()
+    edges = [(f"e{hop}-{lane}", f"h{hop}", f"h{hop + 1}") for hop in range(5) for lane in range(3)]
+
+    recorded = graph.traverse_lateral_paths(
+        campaign_id="cmp-dense",
+        lateral_edges=edges,
+        start_asset_id="h0",
+        target_asset_id="h5",
+        max_paths=10,
+    )
+    assert len(recorded) == 10
+    assert all(row.risk_score == pytest.approx(0.9) for row in recorded)
+
+    assert graph.index_lateral_edges(campaign_id="cmp-dense", lateral_edges=[("jump", "h0", "h5")]) == 1
+    shortest = graph.query_lateral_paths(
+        campaign_id="cmp-dense",
+        start_asset_id="h0",
+        target_asset_id="h5",
+        max_paths=1,
+    )
+    assert shortest[0].edge_path == ("jump",)
+    riskiest = graph.query_lateral_paths(
+        campaign_id="cmp-dense",
+        start_asset_id="h0",
+        target_asset_id="h5",
+        max_paths=1,
+        order="risk",
+    )
+    assert riskiest[0].hops == 5
+    with pytest.raises(AdversaryGraphError):
+        graph.query_lateral_paths(
+            campaign_id="cmp-dense",
+            start_asset_id="h0",
+            target_asset_id="h5",
+            order="widest",
+        )
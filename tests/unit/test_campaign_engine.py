@@ -26,6 +26,7 @@ from pkg.orchestrator.campaign_engine import (
     CampaignEngineError,
     CampaignStatus,
     ExecutionStatus,
+    PrivilegeLevel,
     StepStatus,
 )
 
@@ -167,3 +168,137 @@ def test_invalid_status_transition_is_rejected() -> None:
             campaign_id=campaign.campaign_id,
             status=CampaignStatus.COMPLETED,
         )
+
+
+def test_list_queries_use_per_campaign_indexes_in_order() -> None:
+    engine = CampaignEngine()
+    first = engine.create_campaign(name="Indexed-A", created_by="alice", configuration=_config())
+    second = engine.create_campaign(name="Indexed-B", created_by="alice", configuration=_config())
+    for campaign in (first, second):
+        engine.set_campaign_status(campaign_id=campaign.campaign_id, status=CampaignStatus.RUNNING)
+    for order in (3, 1, 2):
+        engine.add_campaign_step(
+            campaign_id=first.campaign_id,
+            step_order=order,
+            name=f"step-{order}",
+            technique_id="T1021",
+            asset_selector=("host-01",),
+        )
+    engine.add_campaign_step(
+        campaign_id=second.campaign_id,
+        step_order=1,
+        name="other",
+        technique_id="T1021",
+        asset_selector=("host-09",),
+    )
+
+    steps = engine.list_campaign_steps(campaign_id=first.campaign_id)
+    assert [step.step_order for step in steps] == [1, 2, 3]
+    executions = [
+        engine.start_technique_execution(
+            campaign_id=first.campaign_id,
+            step_id=steps[0].step_id,
+            asset_id=f"host-{index}",
+            correlation_group_id="corr-indexed",
+        )
+        for index in range(3)
+    ]
+    engine.stop_technique_execution(
+        execution_id=executions[0].execution_id,
+        status=ExecutionStatus.SUCCEEDED,
+    )
+
+    listed = engine.list_campaign_executions(campaign_id=first.campaign_id)
+    assert [row.execution_id for row in listed] == [row.execution_id for row in executions]
+    assert listed[0].status == ExecutionStatus.SUCCEEDED
+    assert engine.list_campaign_executions(campaign_id=second.campaign_id) == []
+    assert engine.list_campaign_steps(campaign_id="cmp-missing") == []
+    with pytest.raises(CampaignEngineError, match="campaign step_order must be unique"):
+        engine.add_campaign_step(
+            campaign_id=first.campaign_id,
+            step_order=2,
+            name="dup",
+            technique_id="T1021",
+            asset_selector=("host-01",),
+        )
+
+
+def test_campaign_name_index_rejects_duplicates() -> None:
+    engine = CampaignEngine()
+    engine.create_campaign(name="Named", created_by="alice", configuration=_config())
+
+    with pytest.raises(CampaignEngineError, match="campaign name already exists"):
+        engine.create_campaign(name="  Named ", created_by="bob", configuration=_config())
+
+
+def test_campaigns_do_not_serialise_each_other() -> None:
+    engine = CampaignEngine()
+    blocked = engine.create_campaign(name="Blocked", created_by="alice", configuration=_config())
+    free = engine.create_campaign(name="Free", created_by="alice", configuration=_config())
+
+    with engine._partitions[blocked.campaign_id].lock:
+        step = engine.add_campaign_step(
+            campaign_id=free.campaign_id,
+            step_order=1,
+            name="independent",
+            technique_id="T1021",
+            asset_selector=("host-01",),
+        )
+        assert engine.list_campaign_steps(campaign_id=free.campaign_id) == [step]
+
+
+def test_campaign_identities_are_listed_by_principal() -> None:
+    engine = CampaignEngine()
+    campaign = engine.create_campaign(name="Identities", created_by="alice", configuration=_config())
+    for principal in ("svc-zeta", "CORP\\admin", "svc-alpha"):
+        engine.add_identity(
+            campaign_id=campaign.campaign_id,
+            principal=principal,
+            source_asset_id="host-01",
+            privilege_level=PrivilegeLevel.USER,
+        )
+
+    listed = engine.list_campaign_identities(campaign_id=campaign.campaign_id)
+
+    assert [row.principal for row in listed] == ["CORP\\admin", "svc-alpha", "svc-zeta"]
+
+
+def test_change_log_returns_deltas_after_cursor() -> None:
+    engine = CampaignEngine(change_log_limit=3)
+    campaign = engine.create_campaign(name="Changes", created_by="alice", configuration=_config())
+    cursor = engine.campaign_change_sequence(campaign_id=campaign.campaign_id)
+    assert cursor == 1
+
+    step = engine.add_campaign_step(
+        campaign_id=campaign.campaign_id,
+        step_order=1,
+        name="discovery",
+        technique_id="T1087",
+        asset_selector=("host-01",),
+    )
+    identity = engine.add_identity(
+        campaign_id=campaign.campaign_id,
+        principal="svc-sql",
+        source_asset_id="host-01",
+        privilege_level=PrivilegeLevel.USER,
+    )
+
+    delta = engine.list_campaign_changes(campaign_id=campaign.campaign_id, since=cursor)
+    assert delta.truncated is False
+    assert delta.sequence == 3
+    assert [(change.sequence, change.table) for change in delta.changes] == [
+        (2, "step"),
+        (3, "identity"),
+    ]
+    assert [change.record for change in delta.changes] == [step, identity]
+    assert engine.list_campaign_changes(campaign_id=campaign.campaign_id, since=3).changes == tuple()
+
+    engine.set_campaign_status(campaign_id=campaign.campaign_id, status=CampaignStatus.RUNNING)
+    engine.set_campaign_status(campaign_id=campaign.campaign_id, status=CampaignStatus.COMPLETED)
+
+    assert engine.list_campaign_changes(campaign_id=campaign.campaign_id, since=cursor).truncated
+    assert [
+        change.sequence
+        for change in engine.list_campaign_changes(campaign_id=campaign.campaign_id, since=2).changes
+    ] == [3, 4, 5]
+    assert engine.list_campaign_changes(campaign_id=campaign.campaign_id, since=9).truncated
@@ -19,9 +19,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+import pytest
+
 from pkg.integration.vectorvue.models import ResponseEnvelope
 from pkg.orchestrator.cognitive_feedback import (
     CognitiveFeedbackLoopService,
+    DefensiveEventColumns,
     FeedbackAdjustment,
     FeedbackPolicyEngine,
 )
@@ -242,3 +245,123 @@ def test_run_cognitive_loop_rejects_mismatched_attestation_hash() -> None:
 
     assert result.feedback_items == 0
     assert result.applied_adjustments == 0
+
+
+def _adjustment(target_urn: str, action: str = "deny", ttl_seconds: int = 60) -> FeedbackAdjustment:
+    return FeedbackAdjustment(
+        tenant_id="tenant-a",
+        execution_fingerprint="a" * 64,
+        target_urn=target_urn,
+        action=action,
+        confidence=0.95,
+        rationale="feedback",
+        attestation_measurement_hash="a" * 64,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+def test_feedback_adjustments_expire_after_ttl() -> None:
+    policy = FeedbackPolicyEngine()
+    target = "urn:target:ip:10.0.0.5"
+
+    assert policy.apply_adjustments([_adjustment(target, ttl_seconds=30)], now=100.0) == 1
+    assert policy.evaluate_allow("tenant-a", target, base_allow=True, now=129.0) is False
+    assert policy.evaluate_allow("tenant-a", target, base_allow=True, now=130.0) is True
+    assert policy.policy_context("tenant-a", target, now=130.0) == {"feedback_bound": False}
+
+    # Re-applying extends the binding; the earlier deadline must not evict it.
+    policy.apply_adjustments([_adjustment(target, ttl_seconds=30)], now=200.0)
+    policy.apply_adjustments([_adjustment(target, ttl_seconds=60)], now=210.0)
+    assert policy.evaluate_allow("tenant-a", target, base_allow=True, now=250.0) is False
+    assert policy.active_adjustments("tenant-a", now=271.0) == []
+    assert policy.apply_adjustments([_adjustment(target, ttl_seconds=0)], now=300.0) == 0
+
+
+def test_feedback_prefix_and_wildcard_targets_prefer_most_specific() -> None:
+    policy = FeedbackPolicyEngine()
+    policy.apply_adjustments(
+        [
+            _adjustment("*", action="observe"),
+            _adjustment("urn:target:ip:10.0.*"),
+            _adjustment("urn:target:ip:10.0.0.7", action="allow"),
+        ],
+        now=0.0,
+    )
+
+    assert policy.evaluate_allow("tenant-a", "urn:target:ip:10.0.3.1", True, now=1.0) is False
+    assert policy.evaluate_allow("tenant-a", "urn:target:ip:10.0.0.7", True, now=1.0) is True
+    context = policy.policy_context("tenant-a", "urn:target:host:dc-01", now=1.0)
+    assert context["feedback_action"] == "observe"
+    assert context["feedback_target_urn"] == "*"
+    assert policy.evaluate_allow("tenant-b", "urn:target:ip:10.0.3.1", True, now=1.0) is True
+    assert len(policy.active_adjustments("tenant-a", now=1.0)) == 3
+
+    policy.apply_adjustments([_adjustment("urn:target:ip:10.1.*", ttl_seconds=10)], now=50.0)
+    assert policy.evaluate_allow("tenant-a", "urn:target:ip:10.1.3.1", True, now=59.0) is False
+    assert policy.evaluate_allow("tenant-a", "urn:target:ip:10.0.3.1", True, now=61.0) is True
+    assert policy.evaluate_allow("tenant-a", "urn:target:ip:10.1.3.1", True, now=61.0) is True
+
+
+def test_defensive_metrics_accept_event_columns() -> None:
+    events = [
+        {"status": "success", "threat_detected": True},
+        {"status": "blocked", "threat_detected": True},
+        {"status": "blocked"},
+        {"status": None, "threat_detected": 0},
+    ]
+
+    from_dicts = CognitiveFeedbackLoopService.compute_defensive_effectiveness_metrics(
+        events=events, adjustments=[]
+    )
+    from_columns = CognitiveFeedbackLoopService.compute_defensive_effectiveness_metrics(
+        events=DefensiveEventColumns(
+            statuses=("success", "blocked", "blocked", "None"),
+            threat_detected=(True, True, False, False),
+        ),
+        adjustments=[],
+    )
+
+    assert from_dicts == from_columns
+    assert from_columns.blocked_events == 2
+    assert from_columns.detection_rate == 0.5
+    with pytest.raises(ValueError, match="same length"):
+        DefensiveEventColumns(statuses=("success",), threat_detected=())
+
+
+def test_defensive_metrics_count_event_dicts_without_building_columns(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _fail(events):  # type: ignore[no-untyped-def]
+        raise AssertionError("event dicts should be counted directly")
+
+    monkeypatch.setattr(DefensiveEventColumns, "from_events", classmethod(_fail))
+    events = [
+        {"status": "success", "threat_detected": True},
+        {"status": "blocked"},
+        {"status": "failed", "threat_detected": 1},
+    ]
+
+    metrics = CognitiveFeedbackLoopService.compute_defensive_effectiveness_metrics(
+        events=events, adjustments=[]
+    )
+
+    assert metrics.total_events == 3
+    assert metrics.blocked_events == 1
+    assert metrics.successful_events == 1
+    assert metrics.detection_rate == round(2 / 3, 4)
+
+
+def test_defensive_metrics_count_numpy_columns() -> None:
+    np = pytest.importorskip("numpy")
+
+    metrics = CognitiveFeedbackLoopService.compute_defensive_effectiveness_metrics(
+        events=DefensiveEventColumns(
+            statuses=np.array(["success", "blocked", "blocked", "error"]),
+            threat_detected=np.array([True, False, True, False]),
+        ),
+        adjustments=[],
+    )
+
+    assert metrics.blocked_events == 2
+    assert metrics.successful_events == 1
+    assert metrics.detection_rate == 0.5
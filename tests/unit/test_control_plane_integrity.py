@@ -29,6 +29,7 @@ from pkg.orchestrator.control_plane_integrity import (
     ControlPlaneIntegrityEnforcer,
     ImmutableConfigurationHistory,
     ImmutableConfigurationHistoryError,
+    PolicyChangeListenerError,
     PolicyHashMismatchError,
     RuntimeBinaryHashMismatchError,
     SignedConfigurationEnvelope,
@@ -219,3 +220,72 @@ def test_immutable_history_rejects_duplicate_versions() -> None:
 
     with pytest.raises(ImmutableConfigurationHistoryError):
         history.append(envelope)
+
+
+def test_enforce_startup_notifies_policy_change_listeners_once() -> None:
+    policy_hash = _sha256_hex(b"package spectrastrike.v2")
+    secret = "startup-secret"
+    seen: list[str] = []
+    enforcer = ControlPlaneIntegrityEnforcer(
+        StartupIntegrityConfig(
+            pinned_policy_sha256=policy_hash,
+            enforce_binary_hash=False,
+        ),
+        policy_change_listeners=[seen.append],
+    )
+
+    for version in ("19.1.0", "19.1.1"):
+        enforcer.enforce_startup(
+            _envelope(
+                version=version,
+                config={"mode": "strict"},
+                policy_sha256=policy_hash,
+                runtime_binary_sha256=_sha256_hex(b"unused"),
+                secret=secret,
+            ),
+            hmac_secret=secret,
+        )
+
+    assert seen == [policy_hash]
+    assert enforcer.active_policy_sha256 == policy_hash
+
+
+def test_enforce_startup_fails_closed_when_policy_listener_raises() -> None:
+    policy_hash = _sha256_hex(b"package spectrastrike.v2")
+    secret = "startup-secret"
+    seen: list[str] = []
+    attempts: list[str] = []
+
+    def _flaky_listener(policy_sha256: str) -> None:
+        attempts.append(policy_sha256)
+        if len(attempts) == 1:
+            raise RuntimeError("bundle reload failed")
+
+    history = ImmutableConfigurationHistory()
+    enforcer = ControlPlaneIntegrityEnforcer(
+        StartupIntegrityConfig(
+            pinned_policy_sha256=policy_hash,
+            enforce_binary_hash=False,
+        ),
+        history=history,
+        policy_change_listeners=[_flaky_listener, seen.append],
+    )
+    envelope = _envelope(
+        version="19.2.0",
+        config={"mode": "strict"},
+        policy_sha256=policy_hash,
+        runtime_binary_sha256=_sha256_hex(b"unused"),
+        secret=secret,
+    )
+
+    with pytest.raises(PolicyChangeListenerError, match="_flaky_listener"):
+        enforcer.enforce_startup(envelope, hmac_secret=secret)
+    assert seen == [policy_hash]
+    assert enforcer.active_policy_sha256 is None
+    assert history.records == []
+
+    enforcer.enforce_startup(envelope, hmac_secret=secret)
+    assert attempts == [policy_hash, policy_hash]
+    assert seen == [policy_hash, policy_hash]
+    assert enforcer.active_policy_sha256 == policy_hash
+    assert len(history.records) == 1
@@ -0,0 +1,180 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Unit tests for the cached Ed25519 key manager."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from pkg.security import ed25519_keys
+from pkg.security.ed25519_keys import (
+    Ed25519BackendUnavailableError,
+    Ed25519KeyManager,
+    Ed25519KeyReadError,
+)
+from pkg.wrappers.base import BaseWrapper, WrapperContractError
+
+
+def _write_raw_key(path: Path) -> Ed25519PrivateKey:
+    key = Ed25519PrivateKey.generate()
+    path.write_bytes(
+        key.private_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PrivateFormat.Raw,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    return key
+
+
+def _write_pem_key(path: Path) -> Ed25519PrivateKey:
+    key = Ed25519PrivateKey.generate()
+    path.write_bytes(
+        key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    return key
+
+
+def test_sign_loads_key_once_and_verifies(tmp_path: Path) -> None:
+    key_path = tmp_path / "raw.key"
+    key = _write_raw_key(key_path)
+    manager = Ed25519KeyManager(rotation_check_interval=60.0)
+
+    first = manager.sign(str(key_path), b"alpha")
+    second = manager.sign(str(key_path), b"beta")
+
+    key.public_key().verify(first, b"alpha")
+    key.public_key().verify(second, b"beta")
+    assert manager.loads == 1
+
+
+def test_sign_many_preserves_order(tmp_path: Path) -> None:
+    key_path = tmp_path / "pem.key"
+    key = _write_pem_key(key_path)
+    manager = Ed25519KeyManager()
+    payloads = [f"event-{index}".encode() for index in range(20)]
+
+    signatures = manager.sign_many(str(key_path), payloads)
+
+    assert len(signatures) == len(payloads)
+    for payload, signature in zip(payloads, signatures):
+        key.public_key().verify(signature, payload)
+    assert manager.loads == 1
+
+
+def test_rotated_key_file_is_reloaded(tmp_path: Path) -> None:
+    key_path = tmp_path / "rotating.key"
+    _write_raw_key(key_path)
+    manager = Ed25519KeyManager(rotation_check_interval=0.0)
+    manager.sign(str(key_path), b"before")
+
+    staged = tmp_path / "rotating.key.new"
+    rotated = _write_pem_key(staged)
+    os.replace(staged, key_path)
+
+    signature = manager.sign(str(key_path), b"after")
+
+    rotated.public_key().verify(signature, b"after")
+    assert manager.loads == 2
+
+
+def test_rotation_is_not_checked_within_interval(tmp_path: Path) -> None:
+    key_path = tmp_path / "stable.key"
+    original = _write_raw_key(key_path)
+    manager = Ed25519KeyManager(rotation_check_interval=3600.0)
+    manager.sign(str(key_path), b"warm")
+
+    _write_pem_key(key_path)
+    signature = manager.sign(str(key_path), b"cached")
+
+    original.public_key().verify(signature, b"cached")
+    manager.invalidate(str(key_path))
+    manager.sign(str(key_path), b"reloaded")
+    assert manager.loads == 2
+
+
+def test_missing_key_raises_read_error(tmp_path: Path) -> None:
+    manager = Ed25519KeyManager()
+    with pytest.raises(Ed25519KeyReadError, match="unable to read signing key"):
+        manager.sign(str(tmp_path / "missing.key"), b"payload")
+
+
+def test_missing_backend_requires_explicit_openssl_fallback(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    key_path = tmp_path / "pem.key"
+    _write_pem_key(key_path)
+    monkeypatch.setattr(ed25519_keys, "_crypto_backend", lambda: None)
+
+    with pytest.raises(Ed25519BackendUnavailableError):
+        Ed25519KeyManager().sign(str(key_path), b"payload")
+
+
+@pytest.mark.skipif(shutil.which("openssl") is None, reason="openssl not installed")
+def test_openssl_fallback_signs_over_pipe(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    key_path = tmp_path / "pem.key"
+    key = _write_pem_key(key_path)
+    monkeypatch.setattr(ed25519_keys, "_crypto_backend", lambda: None)
+
+    signatures = Ed25519KeyManager().sign_many(
+        str(key_path), [b"one", b"two"], allow_openssl_fallback=True
+    )
+
+    key.public_key().verify(signatures[0], b"one")
+    key.public_key().verify(signatures[1], b"two")
+
+
+class _SigningWrapper(BaseWrapper):
+    def __init__(self) -> None:
+        super().__init__(
+            tool_name="signing-probe",
+            tool_binary="true",
+            signing_key_env="SPECTRASTRIKE_TEST_SIGNING_KEY_PATH",
+        )
+
+
+def test_wrapper_sign_payloads_batches_with_default_signer(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    key_path = tmp_path / "wrapper.key"
+    _write_raw_key(key_path)
+    monkeypatch.setenv("SPECTRASTRIKE_TEST_SIGNING_KEY_PATH", str(key_path))
+    wrapper = _SigningWrapper()
+
+    batch = wrapper.sign_payloads([{"n": 1}, {"n": 2}])
+
+    assert batch == [wrapper.sign_payload({"n": 1}), wrapper.sign_payload({"n": 2})]
+
+
+def test_wrapper_sign_payloads_maps_read_errors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(
+        "SPECTRASTRIKE_TEST_SIGNING_KEY_PATH", str(tmp_path / "missing.key")
+    )
+    with pytest.raises(WrapperContractError, match="unable to read signing key"):
+        _SigningWrapper().sign_payloads([{"n": 1}])
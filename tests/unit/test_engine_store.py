@@ -0,0 +1,378 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Unit tests for durable engine storage, restarts and cold-partition eviction."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from pkg.orchestrator import engine_store
+from pkg.orchestrator.adversary_graph import AdversaryGraphEngine, AttackPathRecord
+from pkg.orchestrator.campaign_engine import (
+    CampaignConfiguration,
+    CampaignEngine,
+    CampaignEngineError,
+    CampaignRecord,
+    CampaignStatus,
+    CredentialMaterialType,
+    ExecutionStatus,
+    PrivilegeLevel,
+    StepStatus,
+)
+from pkg.orchestrator.engine_store import (
+    EngineStoreError,
+    PostgresEngineStore,
+    SQLiteEngineStore,
+    StoredRow,
+    decode_record,
+    encode_record,
+)
+from pkg.orchestrator.playbook_engine import (
+    PlaybookEngine,
+    PlaybookEngineError,
+    StepExecutionStatus,
+)
+
+
+def _config() -> CampaignConfiguration:
+    now = datetime.now(UTC)
+    return CampaignConfiguration(
+        objective="durable campaign state",
+        target_scope=("host-a", "host-b"),
+        execution_window_start=now + timedelta(minutes=5),
+        execution_window_end=now + timedelta(hours=1),
+        metadata={"ticket": "OPS-1"},
+    )
+
+
+def _populate(engine: CampaignEngine, name: str) -> dict[str, str]:
+    campaign = engine.create_campaign(name=name, created_by="alice", configuration=_config())
+    engine.set_campaign_status(campaign_id=campaign.campaign_id, status=CampaignStatus.RUNNING)
+    step = engine.add_campaign_step(
+        campaign_id=campaign.campaign_id,
+        step_order=1,
+        name="credential replay",
+        technique_id="T1078",
+        asset_selector=("host-a", "host-b"),
+    )
+    execution = engine.start_technique_execution(
+        campaign_id=campaign.campaign_id,
+        step_id=step.step_id,
+        asset_id="host-a",
+        correlation_group_id=f"corr-{name}",
+    )
+    identity = engine.add_identity(
+        campaign_id=campaign.campaign_id,
+        principal="CORP\\svc-backup",
+        source_asset_id="host-a",
+        privilege_level=PrivilegeLevel.USER,
+    )
+    engine.record_credential_material(
+        campaign_id=campaign.campaign_id,
+        identity_id=identity.identity_id,
+        material_type=CredentialMaterialType.HASH,
+        material_ref="vault://loot/hash-1",
+        source_execution_id=execution.execution_id,
+    )
+    engine.record_privilege_escalation(
+        campaign_id=campaign.campaign_id,
+        identity_id=identity.identity_id,
+        to_level=PrivilegeLevel.LOCAL_ADMIN,
+        execution_id=execution.execution_id,
+        asset_id="host-a",
+    )
+    engine.add_lateral_movement_edge(
+        campaign_id=campaign.campaign_id,
+        identity_id=identity.identity_id,
+        source_asset_id="host-a",
+        target_asset_id="host-b",
+        execution_id=execution.execution_id,
+    )
+    return {
+        "campaign_id": campaign.campaign_id,
+        "step_id": step.step_id,
+        "execution_id": execution.execution_id,
+        "identity_id": identity.identity_id,
+    }
+
+
+def test_record_codec_round_trips_nested_dataclasses() -> None:
+    campaign = CampaignRecord(
+        campaign_id="cmp-1",
+        name="codec",
+        created_by="alice",
+        created_at=datetime(2026, 3, 1, tzinfo=UTC),
+        configuration=_config(),
+        status=CampaignStatus.SCHEDULED,
+        scheduled_for=datetime(2026, 3, 2, tzinfo=UTC),
+    )
+    path = AttackPathRecord(
+        attack_path_id="apth-1",
+        campaign_id="cmp-1",
+        path_type="lateral_movement",
+        node_path=("host-a", "host-b"),
+        edge_path=("lme-1",),
+        risk_score=1,
+        created_at=datetime(2026, 3, 1, tzinfo=UTC),
+    )
+
+    assert decode_record(CampaignRecord, encode_record(campaign)) == campaign
+    assert decode_record(AttackPathRecord, encode_record(path)) == path
+    with pytest.raises(EngineStoreError, match="cannot be decoded"):
+        decode_record(CampaignRecord, '{"campaign_id": "cmp-1"}')
+
+
+def test_sqlite_store_batches_writes_and_migrates_schema(tmp_path: Path) -> None:
+    path = tmp_path / "engines.sqlite3"
+    store = SQLiteEngineStore(path, batch_size=3, flush_interval_seconds=3600)
+    reader = SQLiteEngineStore(path)
+
+    store.write("ns", [StoredRow("t", "r1", "p1", "{}"), StoredRow("t", "r1", "p1", '{"v":2}')])
+    assert reader.load_partition("ns", "p1") == []
+    store.write("ns", [StoredRow("t", "r2", "p1", "{}"), StoredRow("t", "r3", "p2", "{}", "k")])
+
+    assert [row.payload for row in reader.load_partition("ns", "p1")] == ['{"v":2}', "{}"]
+    assert reader.find_partition("ns", "t", "r3") == "p2"
+    assert reader.find_partitions_by_lookup("ns", "t", "k") == ["p2"]
+    assert store.schema_version == engine_store.SCHEMA_VERSION
+    store.close()
+    reader.close()
+
+
+def test_sqlite_store_flushes_idle_writes_after_interval(tmp_path: Path) -> None:
+    path = tmp_path / "engines.sqlite3"
+    store = SQLiteEngineStore(path, batch_size=100, flush_interval_seconds=0.1)
+    reader = SQLiteEngineStore(path)
+
+    store.write("ns", [StoredRow("t", "r1", "p1", "{}")])
+    assert reader.load_partition("ns", "p1") == []
+    time.sleep(0.4)
+
+    assert [row.row_id for row in reader.load_partition("ns", "p1")] == ["r1"]
+    store.close()
+    reader.close()
+
+
+def test_sqlite_store_rejects_newer_schema(tmp_path: Path) -> None:
+    path = tmp_path / "engines.sqlite3"
+    SQLiteEngineStore(path).close()
+    connection = sqlite3.connect(path)
+    connection.execute("INSERT INTO engine_store_schema (version) VALUES (99)")
+    connection.commit()
+    connection.close()
+
+    with pytest.raises(EngineStoreError, match="newer than supported"):
+        SQLiteEngineStore(path)
+
+
+def test_campaign_engine_state_survives_restart(tmp_path: Path) -> None:
+    path = tmp_path / "engines.sqlite3"
+    first = CampaignEngine(SQLiteEngineStore(path))
+    ids = _populate(first, "restart")
+    expected_steps = first.list_campaign_steps(campaign_id=ids["campaign_id"])
+    expected_pivot = first.reconstruct_pivot_chain(
+        campaign_id=ids["campaign_id"], identity_id=ids["identity_id"]
+    )
+    first.flush()
+
+    second = CampaignEngine(SQLiteEngineStore(path))
+
+    assert second.get_campaign(campaign_id=ids["campaign_id"]) == first.get_campaign(
+        campaign_id=ids["campaign_id"]
+    )
+    assert second.list_campaign_steps(campaign_id=ids["campaign_id"]) == expected_steps
+    assert (
+        second.reconstruct_pivot_chain(
+            campaign_id=ids["campaign_id"], identity_id=ids["identity_id"]
+        )
+        == expected_pivot
+    )
+    identity = second.list_campaign_identities(campaign_id=ids["campaign_id"])[0]
+    assert identity.privilege_level == PrivilegeLevel.LOCAL_ADMIN
+    assert second.correlate_executions(correlation_group_id="corr-restart").execution_ids == (
+        ids["execution_id"],
+    )
+    with pytest.raises(CampaignEngineError, match="campaign name already exists"):
+        second.create_campaign(name="restart", created_by="bob", configuration=_config())
+
+
+def test_campaign_engine_evicts_cold_campaigns_and_reloads_on_access(tmp_path: Path) -> None:
+    engine = CampaignEngine(
+        SQLiteEngineStore(tmp_path / "engines.sqlite3"),
+        max_resident_campaigns=2,
+    )
+    created = [_populate(engine, f"cold-{index}") for index in range(5)]
+
+    assert len(engine._partitions) <= 2
+    assert len(engine._technique_execution_table) <= 2
+    oldest = created[0]
+    stopped = engine.stop_technique_execution(
+        execution_id=oldest["execution_id"],
+        status=ExecutionStatus.SUCCEEDED,
+    )
+    assert stopped.status == ExecutionStatus.SUCCEEDED
+    for ids in created:
+        steps = engine.list_campaign_steps(campaign_id=ids["campaign_id"])
+        assert [step.step_id for step in steps] == [ids["step_id"]]
+        credentials = engine.list_identity_credentials(
+            campaign_id=ids["campaign_id"], identity_id=ids["identity_id"]
+        )
+        assert len(credentials) == 1
+    assert engine.list_campaign_steps(campaign_id=oldest["campaign_id"])[0].status == (
+        StepStatus.SUCCEEDED
+    )
+    assert len(engine._partitions) <= 2
+    assert engine.list_campaign_steps(campaign_id="cmp-missing") == []
+
+
+def test_bounded_residency_requires_store() -> None:
+    with pytest.raises(CampaignEngineError, match="requires a store"):
+        CampaignEngine(max_resident_campaigns=1)
+
+
+def test_playbook_engine_reloads_evicted_playbooks(tmp_path: Path) -> None:
+    path = tmp_path / "engines.sqlite3"
+    engine = PlaybookEngine(SQLiteEngineStore(path), max_resident_playbooks=1)
+    module = engine.register_technique_module(
+        name="whoami",
+        technique_id="t1033",
+        default_command_template="whoami /host:{host}",
+    )
+    playbooks = []
+    for index in range(3):
+        playbook = engine.create_playbook(
+            name=f"playbook-{index}",
+            description="durable",
+            created_by="alice",
+            default_variables={"host": f"host-{index}"},
+        )
+        engine.add_playbook_step(
+            playbook_id=playbook.playbook_id,
+            step_order=1,
+            name="discover",
+            technique_module_id=module.technique_module_id,
+        )
+        playbooks.append(playbook)
+    engine.flush()
+
+    assert len(engine._playbook_table) == 1
+    restarted = PlaybookEngine(SQLiteEngineStore(path))
+    for index, playbook in enumerate(playbooks):
+        result = restarted.simulate_playbook(playbook_id=playbook.playbook_id)
+        assert result.status == StepExecutionStatus.SUCCEEDED
+        assert result.step_results[0].rendered_command == f"whoami /host:host-{index}"
+    with pytest.raises(PlaybookEngineError, match="playbook name already exists"):
+        restarted.create_playbook(name="playbook-0", description="", created_by="bob")
+
+
+def test_adversary_graph_state_survives_restart(tmp_path: Path) -> None:
+    path = tmp_path / "engines.sqlite3"
+    campaigns = CampaignEngine(SQLiteEngineStore(path))
+    ids = _populate(campaigns, "graph")
+    graph = AdversaryGraphEngine(SQLiteEngineStore(path))
+    reconstruction = graph.reconstruct_campaign_graph(
+        campaign_engine=campaigns, campaign_id=ids["campaign_id"]
+    )
+    graph.flush()
+
+    restarted = AdversaryGraphEngine(SQLiteEngineStore(path), max_resident_campaigns=1)
+    link = reconstruction.technique_links[0]
+    again = restarted.add_technique_link(
+        campaign_id=ids["campaign_id"],
+        source_technique_id=link.source_technique_id,
+        target_technique_id=link.target_technique_id,
+        relation=link.relation,
+    )
+
+    assert again == link
+    restarted.add_attack_path(
+        campaign_id="cmp-other", path_type="probe", node_path=("host-z",), risk_score=0.1
+    )
+    assert ids["campaign_id"] not in restarted._campaign_attack_paths
+    restored = restarted.reconstruct_campaign_graph(
+        campaign_engine=campaigns, campaign_id=ids["campaign_id"]
+    )
+    restored_ids = {row.attack_path_id for row in restored.attack_paths}
+    assert {row.attack_path_id for row in reconstruction.attack_paths} <= restored_ids
+
+
+def test_adversary_graph_rebuilds_lateral_index_after_eviction(tmp_path: Path) -> None:
+    graph = AdversaryGraphEngine(
+        SQLiteEngineStore(tmp_path / "engines.sqlite3"), max_resident_campaigns=1
+    )
+    graph.index_lateral_edges(
+        campaign_id="cmp-a",
+        lateral_edges=[("e1", "host-a", "host-b"), ("e2", "host-b", "host-c")],
+    )
+    graph.index_lateral_edges(campaign_id="cmp-b", lateral_edges=[("e9", "x", "y")])
+    assert "cmp-a" not in graph._lateral_indexes
+
+    paths = graph.query_lateral_paths(
+        campaign_id="cmp-a", start_asset_id="host-a", target_asset_id="host-c"
+    )
+
+    assert [path.edge_path for path in paths] == [("e1", "e2")]
+    assert graph.index_lateral_edges(
+        campaign_id="cmp-a", lateral_edges=[("e1", "host-a", "host-b")]
+    ) == 0
+
+
+def test_postgres_store_requires_psycopg(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(engine_store, "psycopg", None)
+
+    with pytest.raises(EngineStoreError, match="psycopg package is required"):
+        PostgresEngineStore()
+
+
+def test_postgres_config_reads_compose_secret_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    user_file = tmp_path / "postgres_user"
+    user_file.write_text("spectra-app\n", encoding="utf-8")
+    monkeypatch.setenv("POSTGRES_HOST", "db.internal")
+    monkeypatch.setenv("POSTGRES_USER_FILE", str(user_file))
+    monkeypatch.setenv("POSTGRES_PASSWORD", "pw")
+    monkeypatch.setenv("POSTGRES_SSL", "false")
+
+    config = engine_store.PostgresConnectionConfig.from_env()
+
+    assert config.host == "db.internal"
+    assert config.user == "spectra-app"
+    assert config.password == "pw"
+    assert config.sslmode == "disable"
+
+
+def test_change_sequence_survives_restart_and_truncates_old_cursors(tmp_path: Path) -> None:
+    path = tmp_path / "engines.sqlite3"
+    first = CampaignEngine(SQLiteEngineStore(path))
+    ids = _populate(first, "sequence")
+    sequence = first.campaign_change_sequence(campaign_id=ids["campaign_id"])
+    first.flush()
+
+    second = CampaignEngine(SQLiteEngineStore(path))
+
+    assert second.campaign_change_sequence(campaign_id=ids["campaign_id"]) == sequence
+    assert second.list_campaign_changes(campaign_id=ids["campaign_id"], since=1).truncated
+    current = second.list_campaign_changes(campaign_id=ids["campaign_id"], since=sequence)
+    assert current.truncated is False
+    assert current.changes == tuple()
+    second.set_campaign_status(campaign_id=ids["campaign_id"], status=CampaignStatus.COMPLETED)
+    delta = second.list_campaign_changes(campaign_id=ids["campaign_id"], since=sequence)
+    assert [change.sequence for change in delta.changes] == [sequence + 1]
@@ -20,6 +20,7 @@ import pytest
 
 from pkg.orchestrator.ledger_model import (
     AppendOnlyInsertionOrder,
+    ConsistencyProofStructure,
     DeterministicTreeGrowthRules,
     InclusionProofNode,
     InclusionProofStructure,
@@ -111,3 +112,34 @@ def test_inclusion_proof_structure_requires_audit_path() -> None:
             audit_path=(),
             root_signature="jws-signature",
         )
+
+
+def test_consistency_proof_structure_requires_frontier_per_subtree() -> None:
+    proof = ConsistencyProofStructure(
+        old_leaf_count=5,
+        new_leaf_count=9,
+        old_root="root-" + ("a" * 59),
+        new_root="root-" + ("b" * 59),
+        old_frontier=("f" * 64, "e" * 64),
+        proof_hashes=("d" * 64,),
+    )
+    assert proof.new_leaf_count == 9
+
+    with pytest.raises(LedgerModelError, match="old_frontier"):
+        ConsistencyProofStructure(
+            old_leaf_count=5,
+            new_leaf_count=9,
+            old_root="root-" + ("a" * 59),
+            new_root="root-" + ("b" * 59),
+            old_frontier=("f" * 64,),
+            proof_hashes=(),
+        )
+    with pytest.raises(LedgerModelError, match="new_leaf_count"):
+        ConsistencyProofStructure(
+            old_leaf_count=5,
+            new_leaf_count=4,
+            old_root="root-" + ("a" * 59),
+            new_root="root-" + ("b" * 59),
+            old_frontier=("f" * 64, "e" * 64),
+            proof_hashes=(),
+        )
@@ -16,16 +16,25 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from datetime import UTC, datetime
 
+import pytest
+
 from pkg.orchestrator.ledger_model import RootGenerationCadence
 from pkg.orchestrator.merkle_ledger import (
     AppendOnlyMerkleLedger,
     HMACRootSigningAuthority,
     ImmutableExecutionLeafStore,
+    IncrementalMerkleFrontier,
     MerkleLedgerError,
+    MerkleLevelIndex,
     ReadOnlyMerkleVerifierNode,
+    SegmentedLeafLog,
+    _SnapshotStreamReader,
+    _decode_frames,
+    _encode_frame,
 )
 
 
@@ -179,3 +188,447 @@ def test_read_only_verifier_detects_root_mismatch_tampering(tmp_path) -> None:
         signer=signer,
     )
     assert tampered_verifier.validate_db_tampering_detection() is True
+
+
+def test_incremental_frontier_matches_reference_root_rebuild() -> None:
+    signer = HMACRootSigningAuthority(secret=b"frontier-secret")
+    ledger = AppendOnlyMerkleLedger(store=ImmutableExecutionLeafStore(), signer=signer)
+    frontier = IncrementalMerkleFrontier()
+
+    for idx in range(1, 70):
+        _append_sample(ledger, idx=idx)
+        leaf_hashes = [record.leaf_hash for record in ledger._store.records]
+        frontier.append(leaf_hashes[-1])
+        expected = ledger._compute_root_from_hashes(leaf_hashes)
+        assert frontier.root() == expected
+        assert ledger.merkle_root() == expected
+
+    assert ledger.merkle_root(leaf_count=37) == ledger._compute_root_from_hashes(
+        ledger._store.leaf_hashes(stop=37)
+    )
+
+
+def test_incremental_frontier_absorbs_reloaded_store(tmp_path) -> None:
+    path = tmp_path / "execution_leaves.jsonl"
+    signer = HMACRootSigningAuthority(secret=b"reload-secret")
+    ledger = AppendOnlyMerkleLedger(
+        store=ImmutableExecutionLeafStore(storage_path=path),
+        signer=signer,
+    )
+    for idx in range(1, 12):
+        _append_sample(ledger, idx=idx)
+
+    reloaded = AppendOnlyMerkleLedger(
+        store=ImmutableExecutionLeafStore(storage_path=path),
+        signer=signer,
+    )
+    assert reloaded.merkle_root() == ledger.merkle_root()
+    _append_sample(reloaded, idx=12)
+    assert reloaded.merkle_root() == reloaded.deterministic_rebuild_root(leaf_count=12)
+
+
+def _reference_audit_path(
+    ledger: AppendOnlyMerkleLedger, *, leaf_index: int, leaf_count: int
+) -> list[tuple[str, str]]:
+    levels = ledger._compute_levels_from_hashes(ledger._store.leaf_hashes(stop=leaf_count))
+    index = leaf_index - 1
+    path: list[tuple[str, str]] = []
+    for level in levels[:-1]:
+        if len(level) % 2 == 1:
+            level = level + [level[-1]]
+        if index % 2 == 0:
+            path.append(("right", level[index + 1]))
+        else:
+            path.append(("left", level[index - 1]))
+        index //= 2
+    return path
+
+
+def test_level_index_serves_prefix_roots_and_batch_proofs() -> None:
+    signer = HMACRootSigningAuthority(secret=b"level-secret")
+    ledger = AppendOnlyMerkleLedger(
+        store=ImmutableExecutionLeafStore(),
+        signer=signer,
+        root_cadence=RootGenerationCadence(every_n_leaves=7),
+    )
+    for idx in range(1, 44):
+        _append_sample(ledger, idx=idx)
+
+    for signed in ledger.signed_roots:
+        assert ledger.merkle_root(leaf_count=signed.leaf_count) == signed.root_hash
+        assert signed.root_hash == ledger.deterministic_rebuild_root(leaf_count=signed.leaf_count)
+        indices = list(range(1, signed.leaf_count + 1))
+        proofs = ledger.build_inclusion_proofs(leaf_indices=indices, root=signed)
+        for proof in proofs:
+            expected = _reference_audit_path(
+                ledger,
+                leaf_index=proof.leaf_index,
+                leaf_count=signed.leaf_count,
+            )
+            assert [(n.direction, n.sibling_hash) for n in proof.audit_path] == expected
+            assert proof.merkle_root == signed.root_hash
+
+
+def test_persisted_level_index_reloads_and_repairs(tmp_path) -> None:
+    path = tmp_path / "execution_leaves.jsonl"
+    signer = HMACRootSigningAuthority(secret=b"level-persist-secret")
+    ledger = AppendOnlyMerkleLedger(
+        store=ImmutableExecutionLeafStore(storage_path=path),
+        signer=signer,
+        root_cadence=RootGenerationCadence(every_n_leaves=5),
+    )
+    for idx in range(1, 21):
+        _append_sample(ledger, idx=idx)
+    signed = ledger.signed_roots[1]
+    expected_proof = ledger.build_inclusion_proof(leaf_index=3, root=signed)
+    ledger._levels.close()
+
+    level_dir = tmp_path / "execution_leaves.jsonl.levels"
+    assert (level_dir / "level-00.bin").stat().st_size == 20 * 32
+    (level_dir / "level-02.bin").write_bytes(b"")
+
+    index = MerkleLevelIndex(storage_dir=level_dir)
+    assert index.size == 20
+    assert index.prefix_root(signed.leaf_count) == signed.root_hash
+
+    reloaded = AppendOnlyMerkleLedger(
+        store=ImmutableExecutionLeafStore(storage_path=path),
+        signer=signer,
+        level_index=index,
+    )
+    assert reloaded.build_inclusion_proof(leaf_index=3, root=signed) == expected_proof
+    _append_sample(reloaded, idx=21)
+    assert reloaded.merkle_root() == reloaded.deterministic_rebuild_root(leaf_count=21)
+
+
+def _segmented_store(directory, **kwargs) -> ImmutableExecutionLeafStore:
+    return ImmutableExecutionLeafStore(
+        segment_log=SegmentedLeafLog(directory=directory, segment_max_records=4, **kwargs)
+    )
+
+
+def test_segmented_leaf_log_round_trip_seals_segments(tmp_path) -> None:
+    signer = HMACRootSigningAuthority(secret=b"segment-secret")
+    store = _segmented_store(tmp_path / "ledger")
+    ledger = AppendOnlyMerkleLedger(store=store, signer=signer)
+    for idx in range(1, 11):
+        _append_sample(ledger, idx=idx)
+    root = ledger.merkle_root()
+    store.close()
+
+    segments = sorted((tmp_path / "ledger").glob("segment-*.log"))
+    assert len(segments) == 3
+
+    reloaded = _segmented_store(tmp_path / "ledger")
+    assert reloaded.records == store.records
+    reloaded_ledger = AppendOnlyMerkleLedger(store=reloaded, signer=signer)
+    assert reloaded_ledger.merkle_root() == root
+    _append_sample(reloaded_ledger, idx=11)
+    assert reloaded.segment_log.verify_full_chain(max_workers=2) == 11
+
+
+def test_segmented_leaf_log_truncates_torn_tail_frame(tmp_path) -> None:
+    store = _segmented_store(tmp_path / "ledger")
+    ledger = AppendOnlyMerkleLedger(
+        store=store,
+        signer=HMACRootSigningAuthority(secret=b"torn-secret"),
+    )
+    for idx in range(1, 7):
+        _append_sample(ledger, idx=idx)
+    store.close()
+
+    tail = sorted((tmp_path / "ledger").glob("segment-*.log"))[-1]
+    with tail.open("ab") as handle:
+        handle.write(b"SSLF\x01\x00\x00")
+
+    reloaded = _segmented_store(tmp_path / "ledger")
+    assert reloaded.leaf_count == 6
+
+
+def test_segmented_leaf_log_truncates_final_frame_with_bad_crc(tmp_path) -> None:
+    store = _segmented_store(tmp_path / "ledger")
+    ledger = AppendOnlyMerkleLedger(
+        store=store,
+        signer=HMACRootSigningAuthority(secret=b"torn-secret"),
+    )
+    for idx in range(1, 7):
+        _append_sample(ledger, idx=idx)
+    store.close()
+
+    tail = sorted((tmp_path / "ledger").glob("segment-*.log"))[-1]
+    data = bytearray(tail.read_bytes())
+    data[-1] ^= 0xFF
+    tail.write_bytes(bytes(data))
+
+    reloaded = _segmented_store(tmp_path / "ledger")
+    assert reloaded.leaf_count == 5
+
+
+def test_segmented_leaf_log_rejects_bad_frame_before_tail(tmp_path) -> None:
+    store = _segmented_store(tmp_path / "ledger")
+    ledger = AppendOnlyMerkleLedger(
+        store=store,
+        signer=HMACRootSigningAuthority(secret=b"torn-secret"),
+    )
+    for idx in range(1, 7):
+        _append_sample(ledger, idx=idx)
+    store.close()
+
+    tail = sorted((tmp_path / "ledger").glob("segment-*.log"))[-1]
+    original = tail.read_bytes()
+    tail.write_bytes(original.replace(b"tenant-a", b"tenant-b", 1))
+
+    with pytest.raises(MerkleLedgerError, match="corrupted before tail"):
+        _segmented_store(tmp_path / "ledger")
+    assert tail.read_bytes() == original.replace(b"tenant-a", b"tenant-b", 1)
+
+
+def test_segmented_leaf_log_rejects_corrupted_frame_length(tmp_path) -> None:
+    store = _segmented_store(tmp_path / "ledger")
+    ledger = AppendOnlyMerkleLedger(
+        store=store,
+        signer=HMACRootSigningAuthority(secret=b"torn-secret"),
+    )
+    for idx in range(1, 7):
+        _append_sample(ledger, idx=idx)
+    store.close()
+
+    tail = sorted((tmp_path / "ledger").glob("segment-*.log"))[-1]
+    original = tail.read_bytes()
+    frames, _ = _decode_frames(original)
+    middle = frames[len(frames) // 2][2]
+    corrupted = bytearray(original)
+    corrupted[middle + 5 : middle + 9] = (len(original) * 4).to_bytes(4, "big")
+    tail.write_bytes(bytes(corrupted))
+
+    with pytest.raises(MerkleLedgerError, match="corrupted before tail"):
+        _segmented_store(tmp_path / "ledger")
+    assert tail.read_bytes() == bytes(corrupted)
+
+
+def test_segmented_leaf_log_detects_sealed_and_deep_tampering(tmp_path) -> None:
+    store = _segmented_store(tmp_path / "ledger")
+    ledger = AppendOnlyMerkleLedger(
+        store=store,
+        signer=HMACRootSigningAuthority(secret=b"seal-secret"),
+    )
+    for idx in range(1, 9):
+        _append_sample(ledger, idx=idx)
+    store.close()
+
+    sealed = sorted((tmp_path / "ledger").glob("segment-*.log"))[0]
+    original = sealed.read_bytes()
+    tampered = original.replace(b"tenant-a", b"tenant-b", 1)
+    sealed.write_bytes(tampered)
+    with pytest.raises(MerkleLedgerError, match="segment"):
+        _segmented_store(tmp_path / "ledger")
+
+    # Re-frame the tampered record and footer so only a full re-hash can tell.
+    frames, _ = _decode_frames(original)
+    rows = [json.loads(payload) for kind, payload, _ in frames if kind == 1]
+    rows[1]["leaf"]["tenant_id"] = "tenant-b"
+    body = b"".join(
+        _encode_frame(
+            1,
+            json.dumps(row, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode(),
+        )
+        for row in rows
+    )
+    footer = json.loads(frames[-1][1])
+    footer["frames_sha256"] = hashlib.sha256(body).hexdigest()
+    sealed.write_bytes(
+        body + _encode_frame(2, json.dumps(footer, sort_keys=True).encode("utf-8"))
+    )
+    reframed = _segmented_store(tmp_path / "ledger")
+    future = reframed.segment_log.start_full_verification(max_workers=2)
+    with pytest.raises(MerkleLedgerError, match="mismatch"):
+        future.result(timeout=30)
+
+
+def test_streaming_verifier_checks_all_roots_in_one_pass(tmp_path) -> None:
+    signer = HMACRootSigningAuthority(secret=b"stream-secret")
+    ledger = AppendOnlyMerkleLedger(
+        store=ImmutableExecutionLeafStore(),
+        signer=signer,
+        root_cadence=RootGenerationCadence(every_n_leaves=9),
+    )
+    for idx in range(1, 60):
+        _append_sample(ledger, idx=idx)
+    snapshot = ledger.export_snapshot(output_path=tmp_path / "snapshot.json")
+
+    in_memory = ReadOnlyMerkleVerifierNode(
+        records=ledger._store.records,
+        signed_roots=ledger.signed_roots,
+        signer=signer,
+    )
+    streamed = ReadOnlyMerkleVerifierNode.from_snapshot_file(
+        snapshot_path=snapshot,
+        signer=signer,
+        max_workers=2,
+        index_dir=tmp_path / "verifier-index",
+        chunk_records=8,
+    )
+    assert streamed.leaf_count == 59
+    assert streamed.validate_db_tampering_detection() is False
+    assert in_memory.validate_db_tampering_detection() is False
+    for root in ledger.signed_roots:
+        assert streamed.deterministic_rebuild_root(leaf_count=root.leaf_count) == root.root_hash
+        assert streamed.verify_signed_root(root) is True
+
+    tampered_payload = json.loads(snapshot.read_text(encoding="utf-8"))
+    tampered_payload["records"][33]["leaf"]["tenant_id"] = "tampered-tenant"
+    snapshot.write_text(json.dumps(tampered_payload, indent=1), encoding="utf-8")
+    tampered = ReadOnlyMerkleVerifierNode.from_snapshot_file(
+        snapshot_path=snapshot,
+        signer=signer,
+        max_workers=1,
+        chunk_records=8,
+    )
+    assert tampered.verify_immutable_chain() is False
+    assert tampered.validate_db_tampering_detection() is True
+
+
+def test_streaming_verifier_resets_reused_index_dir(tmp_path) -> None:
+    signer = HMACRootSigningAuthority(secret=b"reuse-secret")
+    ledger = AppendOnlyMerkleLedger(
+        store=ImmutableExecutionLeafStore(),
+        signer=signer,
+        root_cadence=RootGenerationCadence(every_n_leaves=4),
+    )
+    for idx in range(1, 13):
+        _append_sample(ledger, idx=idx)
+    snapshot = ledger.export_snapshot(output_path=tmp_path / "snapshot.json")
+    index_dir = tmp_path / "verifier-index"
+
+    clean = ReadOnlyMerkleVerifierNode.from_snapshot_file(
+        snapshot_path=snapshot,
+        signer=signer,
+        max_workers=1,
+        index_dir=index_dir,
+        chunk_records=5,
+    )
+    assert clean.leaf_count == 12
+    assert clean.validate_db_tampering_detection() is False
+
+    tampered_payload = json.loads(snapshot.read_text(encoding="utf-8"))
+    tampered_payload["records"][6]["leaf"]["tenant_id"] = "tampered-tenant"
+    snapshot.write_text(json.dumps(tampered_payload), encoding="utf-8")
+    tampered = ReadOnlyMerkleVerifierNode.from_snapshot_file(
+        snapshot_path=snapshot,
+        signer=signer,
+        max_workers=1,
+        index_dir=index_dir,
+        chunk_records=5,
+    )
+    assert tampered.leaf_count == 12
+    assert tampered.validate_db_tampering_detection() is True
+
+    reloaded = ReadOnlyMerkleVerifierNode.from_snapshot_file(
+        snapshot_path=ledger.export_snapshot(output_path=tmp_path / "again.json"),
+        signer=signer,
+        max_workers=1,
+        index_dir=index_dir,
+    )
+    assert reloaded.leaf_count == 12
+    for root in ledger.signed_roots:
+        assert reloaded.deterministic_rebuild_root(leaf_count=root.leaf_count) == root.root_hash
+
+
+def test_snapshot_stream_reader_handles_split_reads(tmp_path) -> None:
+    signer = HMACRootSigningAuthority(secret=b"reader-secret")
+    ledger = AppendOnlyMerkleLedger(
+        store=ImmutableExecutionLeafStore(),
+        signer=signer,
+        root_cadence=RootGenerationCadence(every_n_leaves=3),
+    )
+    for idx in range(1, 8):
+        _append_sample(ledger, idx=idx)
+    snapshot = ledger.export_snapshot(output_path=tmp_path / "snapshot.json")
+
+    with snapshot.open("r", encoding="utf-8") as handle:
+        entries = list(_SnapshotStreamReader(handle, read_size=5).entries())
+    expected = json.loads(snapshot.read_text(encoding="utf-8"))
+    assert [value for key, value in entries if key == "records"] == expected["records"]
+    assert [value for key, value in entries if key == "signed_roots"] == expected["signed_roots"]
+    assert ("schema", expected["schema"]) in entries
+
+
+def test_consistency_proofs_link_every_pair_of_roots() -> None:
+    signer = HMACRootSigningAuthority(secret=b"consistency-secret")
+    ledger = AppendOnlyMerkleLedger(
+        store=ImmutableExecutionLeafStore(),
+        signer=signer,
+        root_cadence=RootGenerationCadence(every_n_leaves=1),
+    )
+    for idx in range(1, 34):
+        _append_sample(ledger, idx=idx)
+    verifier = ReadOnlyMerkleVerifierNode(records=[], signed_roots=[], signer=signer)
+    roots = ledger.signed_roots
+
+    for old in roots:
+        for new in roots[old.leaf_count - 1 :]:
+            proof = ledger.build_consistency_proof(old_root=old, new_root=new)
+            assert len(proof.proof_hashes) <= 2 * new.leaf_count.bit_length()
+            assert verifier.verify_consistency_proof(
+                trusted_root=old,
+                new_root=new,
+                proof=proof,
+            )
+
+    proof = ledger.build_consistency_proof(old_root=roots[4], new_root=roots[20])
+    forged = proof.__class__(
+        old_leaf_count=proof.old_leaf_count,
+        new_leaf_count=proof.new_leaf_count,
+        old_root=proof.old_root,
+        new_root=proof.new_root,
+        old_frontier=proof.old_frontier,
+        proof_hashes=proof.proof_hashes[:-1] + ("0" * 64,),
+    )
+    assert not verifier.verify_consistency_proof(
+        trusted_root=roots[4],
+        new_root=roots[20],
+        proof=forged,
+    )
+    assert not verifier.verify_consistency_proof(
+        trusted_root=roots[5],
+        new_root=roots[20],
+        proof=proof,
+    )
+
+
+def test_incremental_snapshot_extends_verifier_node(tmp_path) -> None:
+    signer = HMACRootSigningAuthority(secret=b"incremental-secret")
+    ledger = AppendOnlyMerkleLedger(
+        store=ImmutableExecutionLeafStore(),
+        signer=signer,
+        root_cadence=RootGenerationCadence(every_n_leaves=6),
+    )
+    for idx in range(1, 13):
+        _append_sample(ledger, idx=idx)
+    base = ledger.signed_roots[-1]
+    verifier = ReadOnlyMerkleVerifierNode.from_snapshot_file(
+        snapshot_path=ledger.export_snapshot(output_path=tmp_path / "full.json"),
+        signer=signer,
+        max_workers=1,
+    )
+    for idx in range(13, 31):
+        _append_sample(ledger, idx=idx)
+
+    incremental = ledger.export_incremental_snapshot(
+        output_path=tmp_path / "incremental.json",
+        since_root=base,
+    )
+    payload = json.loads(incremental.read_text(encoding="utf-8"))
+    assert len(payload["records"]) == 18
+    assert [root["leaf_count"] for root in payload["signed_roots"]] == [18, 24, 30]
+
+    payload["records"][4]["leaf"]["tenant_id"] = "tampered-tenant"
+    tampered = tmp_path / "tampered.json"
+    tampered.write_text(json.dumps(payload), encoding="utf-8")
+    assert verifier.apply_incremental_snapshot(snapshot_path=tampered) is False
+    assert verifier.leaf_count == 12
+
+    assert verifier.apply_incremental_snapshot(snapshot_path=incremental) is True
+    assert verifier.leaf_count == 30
+    assert verifier.validate_db_tampering_detection() is False
+    assert verifier.deterministic_rebuild_root(leaf_count=30) == ledger.merkle_root()
@@ -17,12 +17,20 @@
 from __future__ import annotations
 
 import subprocess
+import sys
 from types import SimpleNamespace
 
 import pytest
 
 from pkg.orchestrator.telemetry_ingestion import TelemetryIngestionPipeline
-from pkg.wrappers.nmap import NmapExecutionError, NmapScanOptions, NmapWrapper
+from pkg.wrappers.base import current_execution_scope
+from pkg.wrappers.execution_pool import WrapperExecutionPool
+from pkg.wrappers.nmap import (
+    NmapExecutionError,
+    NmapScanOptions,
+    NmapWrapper,
+    NmapXmlStreamParser,
+)
 
 
 def test_build_command_includes_tcp_udp_os_flags() -> None:
@@ -292,3 +300,157 @@ def test_send_to_orchestrator_uses_sdk_payload_ingest_path() -> None:
 
     assert captured
     assert captured[0]["tenant_id"] == "tenant-a"
+
+
+_STREAM_XML = """<?xml version="1.0"?>
+<nmaprun scanner="nmap">
+  <host><status state="up" reason="arp-response"/>
+    <address addr="10.0.0.1" addrtype="ipv4"/>
+    <address addr="00:11:22:33:44:55" addrtype="mac"/>
+    <ports>
+      <port protocol="tcp" portid="22"><state state="open"/>
+        <service product="OpenSSH" name="ssh"/></port>
+      <port protocol="tcp" portid="23"><state state="closed"/></port>
+    </ports>
+  </host>
+  <host><status state="down"/><address addr="10.0.0.2"/></host>
+</nmaprun>
+"""
+
+
+def test_stream_parser_yields_hosts_across_arbitrary_chunk_boundaries() -> None:
+    parser = NmapXmlStreamParser()
+    hosts = []
+    encoded = _STREAM_XML.encode("utf-8")
+    for offset in range(0, len(encoded), 7):
+        hosts.extend(parser.feed(encoded[offset : offset + 7]))
+    hosts.extend(parser.close())
+
+    assert parser.complete
+    assert [host.address for host in hosts] == ["10.0.0.1", "10.0.0.2"]
+    assert hosts[0].services == [{"port": 22, "protocol": "tcp", "name": "ssh"}]
+    assert hosts[1].status == "down"
+
+
+def test_run_scan_keeps_hosts_parsed_before_truncated_xml() -> None:
+    truncated = _STREAM_XML.split("<host><status state=\"down\"/>")[0] + "<host><status"
+
+    hosts = NmapWrapper()._parse_xml(truncated)
+
+    assert [host.address for host in hosts] == ["10.0.0.1"]
+
+
+def test_run_scan_keeps_hosts_parsed_before_malformed_xml() -> None:
+    first, second = _STREAM_XML.split("<host><status state=\"down\"/>")
+    malformed = first + "<host><status state=\"up\"></host>" + second
+
+    hosts = NmapWrapper()._parse_xml(malformed)
+
+    assert [host.address for host in hosts] == ["10.0.0.1"]
+
+
+def _python_nmap(monkeypatch: pytest.MonkeyPatch, wrapper: NmapWrapper, script: str) -> None:
+    monkeypatch.setattr(
+        wrapper,
+        "build_command",
+        lambda options: [sys.executable, "-c", script],
+    )
+
+
+def test_stream_scan_reads_hosts_from_process_pipe(monkeypatch: pytest.MonkeyPatch) -> None:
+    wrapper = NmapWrapper()
+    _python_nmap(
+        monkeypatch,
+        wrapper,
+        f"import sys; sys.stdout.write({_STREAM_XML!r})",
+    )
+    seen: list[str] = []
+
+    result = wrapper.stream_scan(
+        NmapScanOptions(targets=["10.0.0.0/30"]),
+        on_host=lambda host: seen.append(host.address),
+        retain_hosts=False,
+    )
+
+    assert seen == ["10.0.0.1", "10.0.0.2"]
+    assert result.hosts == []
+    assert result.raw_output == ""
+    assert result.summary == {
+        "total_hosts": 2,
+        "up_hosts": 1,
+        "total_open_ports": 1,
+        "scanned_hosts": ["10.0.0.1", "10.0.0.2"],
+    }
+
+
+def test_stream_scan_raises_on_command_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    wrapper = NmapWrapper()
+    _python_nmap(
+        monkeypatch,
+        wrapper,
+        "import sys; sys.stderr.write('nmap: bad target'); sys.exit(1)",
+    )
+
+    with pytest.raises(NmapExecutionError, match="bad target"):
+        wrapper.stream_scan(NmapScanOptions(targets=["bad"]))
+
+
+def test_stream_scan_returns_partial_hosts_on_truncated_xml(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    truncated = _STREAM_XML.split("<host><status state=\"down\"/>")[0] + "<host><status"
+    wrapper = NmapWrapper()
+    _python_nmap(monkeypatch, wrapper, f"import sys; sys.stdout.write({truncated!r})")
+
+    result = wrapper.stream_scan(NmapScanOptions(targets=["10.0.0.0/30"]))
+
+    assert [host.address for host in result.hosts] == ["10.0.0.1"]
+    assert result.summary["total_hosts"] == 1
+    assert result.parse_error is not None
+    assert result.parse_error.startswith("failed to parse nmap XML output")
+
+
+def test_stream_scan_runs_through_execution_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = WrapperExecutionPool(tool_limits={"nmap": 1})
+    seen: list[tuple[str | None, str | None]] = []
+    submit = pool.submit
+
+    def recording_submit(command, timeout_seconds, **kwargs):  # type: ignore[no-untyped-def]
+        scope = current_execution_scope()
+        seen.append((scope.tool_name, scope.tenant_id))
+        return submit(command, timeout_seconds, **kwargs)
+
+    monkeypatch.setattr(pool, "submit", recording_submit)
+    wrapper = NmapWrapper(stream_runner=pool)
+    _python_nmap(monkeypatch, wrapper, f"import sys; sys.stdout.write({_STREAM_XML!r})")
+    streamed: list[str] = []
+    try:
+        result = wrapper.stream_scan(
+            NmapScanOptions(targets=["10.0.0.0/30"]),
+            on_host=lambda host: streamed.append(host.address),
+            tenant_id="tenant-a",
+        )
+    finally:
+        pool.close()
+
+    assert seen == [("nmap", "tenant-a")]
+    assert streamed == ["10.0.0.1", "10.0.0.2"]
+    assert result.parse_error is None
+    assert result.summary["up_hosts"] == 1
+
+
+def test_stream_scan_parses_output_of_non_streaming_runner() -> None:
+    def fake_runner(command: list[str]) -> SimpleNamespace:
+        return SimpleNamespace(returncode=0, stdout=_STREAM_XML, stderr="")
+
+    result = NmapWrapper(runner=fake_runner).stream_scan(
+        NmapScanOptions(targets=["10.0.0.0/30"])
+    )
+
+    assert [host.address for host in result.hosts] == ["10.0.0.1", "10.0.0.2"]
+    assert result.parse_error is None
+
+
+def test_stream_scan_requires_xml_output() -> None:
+    with pytest.raises(ValueError):
+        NmapWrapper().stream_scan(NmapScanOptions(targets=["x"], output_format="json"))
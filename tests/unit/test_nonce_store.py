@@ -0,0 +1,124 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Unit tests for shared replay-nonce stores."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from pkg.security.nonce_store import (
+    InMemoryNonceStore,
+    NonceStoreCapacityError,
+    SQLiteNonceStore,
+)
+
+
+def test_in_memory_store_rejects_replay_until_expiry() -> None:
+    store = InMemoryNonceStore()
+
+    assert store.check_and_store("n-1", ttl_seconds=10, now=100.0) is True
+    assert store.check_and_store("n-1", ttl_seconds=10, now=109.5) is False
+    assert store.check_and_store("n-1", ttl_seconds=10, now=110.0) is True
+
+
+def test_in_memory_store_drops_lapsed_buckets_without_scanning_live_entries() -> None:
+    store = InMemoryNonceStore(bucket_seconds=5.0)
+    for index in range(100):
+        store.check_and_store(f"old-{index}", ttl_seconds=10, now=100.0)
+    store.check_and_store("live", ttl_seconds=60, now=100.0)
+
+    store.check_and_store("trigger", ttl_seconds=60, now=111.0)
+
+    assert len(store) == 2
+    assert store.check_and_store("live", ttl_seconds=60, now=111.0) is False
+
+
+def test_in_memory_store_reused_key_survives_old_bucket_eviction() -> None:
+    store = InMemoryNonceStore(bucket_seconds=10.0)
+    store.check_and_store("n-1", ttl_seconds=5, now=100.0)
+    # Expired but still filed in its original bucket; re-use moves it forward.
+    assert store.check_and_store("n-1", ttl_seconds=100, now=106.0) is True
+
+    store.check_and_store("trigger", ttl_seconds=1, now=115.0)
+
+    assert store.check_and_store("n-1", ttl_seconds=100, now=115.0) is False
+
+
+def test_in_memory_store_fails_closed_at_capacity() -> None:
+    store = InMemoryNonceStore(max_entries=2)
+    store.check_and_store("a", ttl_seconds=10, now=0.0)
+    store.check_and_store("b", ttl_seconds=10, now=0.0)
+
+    with pytest.raises(NonceStoreCapacityError):
+        store.check_and_store("c", ttl_seconds=10, now=1.0)
+    assert store.check_and_store("a", ttl_seconds=10, now=1.0) is False
+    assert store.check_and_store("c", ttl_seconds=10, now=11.0) is True
+
+
+def test_sharded_store_detects_concurrent_replays_once() -> None:
+    store = InMemoryNonceStore(shards=8)
+    keys = [f"tenant-{index % 4}:nonce-{index % 50}" for index in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(
+            executor.map(
+                lambda key: store.check_and_store(
+                    key, ttl_seconds=60, now=0.0, shard_hint=key.split(":")[0]
+                ),
+                keys,
+            )
+        )
+
+    assert sum(results) == 100
+    assert len(store) == 100
+
+
+def test_in_memory_store_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError, match="bucket_seconds"):
+        InMemoryNonceStore(bucket_seconds=0)
+    with pytest.raises(ValueError, match="shards"):
+        InMemoryNonceStore(shards=0)
+    with pytest.raises(ValueError, match="max_entries"):
+        InMemoryNonceStore(max_entries=0)
+
+
+def test_sqlite_store_is_shared_between_connections(tmp_path: Path) -> None:
+    path = tmp_path / "nonces.sqlite3"
+    first = SQLiteNonceStore(path)
+    second = SQLiteNonceStore(path)
+
+    assert first.check_and_store("n-1", ttl_seconds=10, now=100.0) is True
+    assert second.check_and_store("n-1", ttl_seconds=10, now=105.0) is False
+    assert second.check_and_store("n-1", ttl_seconds=10, now=110.0) is True
+    first.close()
+    second.close()
+
+
+def test_sqlite_store_purges_expired_rows_and_fails_closed(tmp_path: Path) -> None:
+    store = SQLiteNonceStore(tmp_path / "nonces.sqlite3", max_entries=3, purge_interval=2)
+    store.check_and_store("a", ttl_seconds=1, now=0.0)
+    store.check_and_store("b", ttl_seconds=100, now=0.0)
+
+    store.check_and_store("c", ttl_seconds=100, now=5.0)
+    assert len(store) == 2
+    store.check_and_store("d", ttl_seconds=100, now=5.0)
+
+    with pytest.raises(NonceStoreCapacityError):
+        store.check_and_store("e", ttl_seconds=100, now=6.0)
+    assert store.check_and_store("e", ttl_seconds=100, now=200.0) is True
+    store.close()
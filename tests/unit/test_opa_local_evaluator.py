@@ -0,0 +1,362 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: Jose Maria Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Unit and differential tests for the in-process capability policy evaluator."""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pkg.orchestrator.opa import (
+    OPAClientError,
+    OPAAuthorizationError,
+    OPAConfig,
+    OPAExecutionAuthorizer,
+)
+from pkg.orchestrator.opa_local import (
+    LocalPolicyError,
+    LocalPolicyEvaluator,
+    policy_bundle_sha256,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+POLICY_DIR = REPO_ROOT / "config/opa/policies"
+_MISSING = object()
+
+_BINDINGS = [
+    {
+        "operator_id": "operator-a",
+        "tenant_id": "tenant-a",
+        "tool_sha256": "sha256:" + "a" * 64,
+        "target_urn_prefix": "urn:target:ip:10.0.0.",
+        "actions": ["execute", "scan"],
+    },
+    {
+        "operator_id": "operator-b",
+        "tenant_id": "tenant-b",
+        "tool_sha256": "sha256:" + "b" * 64,
+        "target_urn": "urn:target:ip:10.1.10.5",
+        "actions": ["execute"],
+    },
+]
+_PATTERNS = {
+    "id": r"^[A-Za-z0-9][A-Za-z0-9._:-]{2,127}\Z",
+    "tool_sha256": r"^sha256:[0-9a-f]{64}\Z",
+    "target_urn": r"^urn:[a-z0-9][a-z0-9-]{0,31}:[^\t\n\f\r ]+\Z",
+    "action": r"^[a-z][a-z0-9_.:-]{2,63}\Z",
+}
+
+
+def _reference_document(document: dict[str, Any]) -> dict[str, Any]:
+    """Literal, rule-by-rule transliteration of schema.rego and capabilities.rego."""
+
+    def regex_match(pattern: str, value: Any) -> bool:
+        return isinstance(value, str) and re.search(_PATTERNS[pattern], value) is not None
+
+    def lower(value: Any) -> Any:
+        if not isinstance(value, str):
+            return _MISSING
+        return "".join("i" if char == "İ" else char.lower() for char in value)
+
+    missing_fields = {
+        field
+        for field in ["operator_id", "tenant_id", "tool_sha256", "target_urn", "action"]
+        if document.get(field, "") == ""
+    }
+    valid_capability_input = (
+        len(missing_fields) == 0
+        and regex_match("id", document.get("operator_id"))
+        and regex_match("id", document.get("tenant_id"))
+        and regex_match("tool_sha256", document.get("tool_sha256"))
+        and regex_match("target_urn", document.get("target_urn"))
+        and lower(document.get("action")) is not _MISSING
+        and regex_match("action", lower(document.get("action")))
+    )
+
+    def action_allowed(actions: list[Any], action: Any) -> bool:
+        return any(
+            lower(item) is not _MISSING and lower(item) == lower(action) for item in actions
+        )
+
+    def target_allowed(binding: dict[str, Any], target_urn: Any) -> bool:
+        if "target_urn" in binding and binding["target_urn"] == target_urn:
+            return True
+        prefix = binding.get("target_urn_prefix")
+        return (
+            isinstance(prefix, str)
+            and isinstance(target_urn, str)
+            and target_urn.startswith(prefix)
+        )
+
+    allow = False
+    if valid_capability_input:
+        for binding in _BINDINGS:
+            if (
+                binding["operator_id"] == document.get("operator_id")
+                and binding["tenant_id"] == document.get("tenant_id")
+                and binding["tool_sha256"] == document.get("tool_sha256")
+                and action_allowed(binding["actions"], document.get("action"))
+                and target_allowed(binding, document.get("target_urn"))
+            ):
+                allow = True
+    result: dict[str, Any] = {"allow": allow}
+    if valid_capability_input:
+        result["input_contract_valid"] = True
+    return result
+
+
+_FIELD_POOLS: dict[str, list[Any]] = {
+    "operator_id": [
+        "operator-a", "operator-b", "Operator-A", "op", "operator-a\n", " operator-a",
+        "operator a", "x" * 128, "x" * 129, "", 7, None, ["operator-a"], _MISSING,
+    ],
+    "tenant_id": [
+        "tenant-a", "tenant-b", "tenant-c", "tenant-a\n", "-tenant", "", 0, _MISSING,
+    ],
+    "tool_sha256": [
+        "sha256:" + "a" * 64, "sha256:" + "b" * 64, "sha256:" + "A" * 64,
+        "sha256:" + "a" * 63, "sha256:" + "a" * 64 + "\n", "sha1:" + "a" * 40, "", _MISSING,
+    ],
+    "target_urn": [
+        "urn:target:ip:10.0.0.5", "urn:target:ip:10.0.0.", "urn:target:ip:10.0.0.55",
+        "urn:target:ip:10.0.01", "urn:target:ip:10.1.10.5", "urn:target:ip:10.1.10.50",
+        "urn:target:ip:10.0.0.5\n", "urn:target:ip:10.0.0.5 x",
+        "urn:target:ip:10.0.0.5\u000bx", "urn:target:ip:10.0.0.5 x", "urn:Target:ip:1",
+        "urn:" + "t" * 33 + ":x", "", 5, _MISSING,
+    ],
+    "action": [
+        "execute", "scan", "EXECUTE", "Scan", "İxecute", "exe", "ex", "execute\n",
+        "delete", "execute!", "", False, _MISSING,
+    ],
+}
+
+
+def _generated_inputs(count: int, seed: int = 1729) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    inputs: list[dict[str, Any]] = []
+    for _ in range(count):
+        document: dict[str, Any] = {}
+        binding = rng.choice(_BINDINGS)
+        for field, pool in _FIELD_POOLS.items():
+            if rng.random() < 0.6 and field in binding:
+                value: Any = binding[field]
+            elif field == "action" and rng.random() < 0.5:
+                value = rng.choice(binding["actions"])
+            else:
+                value = rng.choice(pool)
+            if value is not _MISSING:
+                document[field] = value
+        if rng.random() < 0.1:
+            document["extra"] = {"nested": rng.random()}
+        inputs.append(document)
+    return inputs
+
+
+def test_local_evaluator_matches_reference_on_generated_inputs() -> None:
+    evaluator = LocalPolicyEvaluator(POLICY_DIR)
+    inputs = _generated_inputs(5000)
+
+    mismatches = [
+        document
+        for document in inputs
+        if evaluator.evaluate(document) != _reference_document(document)
+    ]
+
+    assert mismatches == []
+    allowed = sum(evaluator.evaluate(document)["allow"] for document in inputs)
+    assert 0 < allowed < len(inputs)
+
+
+@pytest.mark.skipif(shutil.which("opa") is None, reason="opa binary not installed")
+def test_local_evaluator_matches_opa_binary_on_generated_inputs() -> None:
+    evaluator = LocalPolicyEvaluator(POLICY_DIR)
+    for document in _generated_inputs(150, seed=99):
+        completed = subprocess.run(
+            [
+                "opa", "eval", "--format", "json", "--stdin-input",
+                "-d", str(POLICY_DIR), "data.spectrastrike.capabilities",
+            ],
+            input=json.dumps(document),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        value = json.loads(completed.stdout)["result"][0]["expressions"][0]["value"]
+        expected = {"allow": value["allow"]}
+        if "input_contract_valid" in value:
+            expected["input_contract_valid"] = value["input_contract_valid"]
+        assert evaluator.evaluate(document) == expected, document
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("target_urn", "urn:target:ip:10.0.0.5\n"),
+        ("tool_sha256", "sha256:" + "a" * 64 + "\n"),
+        ("target_urn", "urn:target:ip:10.0.0.5\u000bx"),
+    ],
+)
+def test_local_evaluator_uses_go_regex_semantics(field: str, value: str) -> None:
+    evaluator = LocalPolicyEvaluator(POLICY_DIR)
+    document = {
+        "operator_id": "operator-a",
+        "tenant_id": "tenant-a",
+        "tool_sha256": "sha256:" + "a" * 64,
+        "target_urn": "urn:target:ip:10.0.0.5",
+        "action": "execute",
+        field: value,
+    }
+
+    result = evaluator.evaluate(document)
+
+    # RE2's "$" never matches before a trailing newline and its "\s" excludes
+    # vertical tab, unlike Python's defaults.
+    if value.endswith("\n"):
+        assert "input_contract_valid" not in result
+    else:
+        assert result == {"allow": True, "input_contract_valid": True}
+
+
+def _copy_policies(tmp_path: Path) -> Path:
+    policy_dir = tmp_path / "policies"
+    shutil.copytree(POLICY_DIR, policy_dir)
+    return policy_dir
+
+
+def _operator_c_input() -> dict[str, str]:
+    return {
+        "operator_id": "operator-c",
+        "tenant_id": "tenant-c",
+        "tool_sha256": "sha256:" + "c" * 64,
+        "target_urn": "urn:target:ip:10.2.0.1",
+        "action": "scan",
+    }
+
+
+def _add_operator_c(policy_dir: Path) -> None:
+    path = policy_dir / "capabilities.rego"
+    text = path.read_text(encoding="utf-8")
+    path.write_text(
+        text.replace(
+            "capability_bindings := [\n",
+            "capability_bindings := [\n"
+            '  {"operator_id": "operator-c", "tenant_id": "tenant-c", '
+            '"tool_sha256": "sha256:' + "c" * 64 + '", '
+            '"target_urn": "urn:target:ip:10.2.0.1", "actions": ["scan"]},\n',
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_hot_reload_picks_up_new_bindings_for_signed_hash(tmp_path: Path) -> None:
+    policy_dir = _copy_policies(tmp_path)
+    evaluator = LocalPolicyEvaluator(
+        policy_dir, expected_policy_sha256=policy_bundle_sha256(policy_dir)
+    )
+    assert evaluator.evaluate(_operator_c_input())["allow"] is False
+
+    _add_operator_c(policy_dir)
+    evaluator.on_policy_change(policy_bundle_sha256(policy_dir))
+
+    assert evaluator.evaluate(_operator_c_input())["allow"] is True
+
+
+def test_hot_reload_fails_closed_on_hash_mismatch(tmp_path: Path) -> None:
+    policy_dir = _copy_policies(tmp_path)
+    evaluator = LocalPolicyEvaluator(policy_dir)
+    _add_operator_c(policy_dir)
+
+    with pytest.raises(LocalPolicyError, match="does not match"):
+        evaluator.on_policy_change("f" * 64)
+
+    assert evaluator.policy_sha256 is None
+    with pytest.raises(LocalPolicyError, match="not loaded"):
+        evaluator.evaluate(_operator_c_input())
+
+
+def test_compile_rejects_changed_rule_logic(tmp_path: Path) -> None:
+    policy_dir = _copy_policies(tmp_path)
+    path = policy_dir / "capabilities.rego"
+    path.write_text(
+        path.read_text(encoding="utf-8").replace(
+            "  binding.tenant_id == input.tenant_id\n", ""
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(LocalPolicyError, match="rules differ"):
+        LocalPolicyEvaluator(policy_dir)
+
+
+def test_compile_ignores_comment_and_whitespace_edits(tmp_path: Path) -> None:
+    policy_dir = _copy_policies(tmp_path)
+    path = policy_dir / "schema.rego"
+    path.write_text(
+        "# reviewed\n" + path.read_text(encoding="utf-8").replace("\n\n", "\n\n\n"),
+        encoding="utf-8",
+    )
+
+    assert LocalPolicyEvaluator(policy_dir).policy_sha256 == policy_bundle_sha256(policy_dir)
+
+
+class _NoNetworkSession:
+    def post(self, url: str, json: dict[str, Any], timeout: float) -> Any:
+        raise AssertionError(f"unexpected OPA request to {url}")
+
+
+def test_authorizer_with_local_evaluator_skips_network() -> None:
+    authorizer = OPAExecutionAuthorizer(
+        OPAConfig(url="http://opa:8181"),
+        session=_NoNetworkSession(),
+        local_evaluator=LocalPolicyEvaluator(POLICY_DIR),
+    )
+    allowed = {
+        "operator_id": "operator-b",
+        "tenant_id": "tenant-b",
+        "tool_sha256": "sha256:" + "b" * 64,
+        "target_urn": "urn:target:ip:10.1.10.5",
+        "action": "execute",
+    }
+
+    authorizer.authorize(allowed)
+    with pytest.raises(OPAAuthorizationError, match="not authorized"):
+        authorizer.authorize({**allowed, "action": "scan"})
+    # OPA leaves input_contract_valid undefined for invalid input.
+    with pytest.raises(OPAClientError, match="boolean result"):
+        authorizer.authorize({**allowed, "action": ""})
+
+
+def test_authorizer_policy_change_reloads_local_evaluator(tmp_path: Path) -> None:
+    policy_dir = _copy_policies(tmp_path)
+    authorizer = OPAExecutionAuthorizer(
+        OPAConfig(url="http://opa:8181", decision_cache_ttl_seconds=60.0),
+        session=_NoNetworkSession(),
+        policy_revision=policy_bundle_sha256(policy_dir),
+        local_evaluator=LocalPolicyEvaluator(policy_dir),
+    )
+    with pytest.raises(OPAAuthorizationError):
+        authorizer.authorize(_operator_c_input())
+
+    _add_operator_c(policy_dir)
+    authorizer.on_policy_change(policy_bundle_sha256(policy_dir))
+
+    authorizer.authorize(_operator_c_input())
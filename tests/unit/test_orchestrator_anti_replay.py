@@ -26,6 +26,7 @@ from pkg.orchestrator.anti_replay import (
     AntiReplayValidationError,
 )
 from pkg.orchestrator.manifest import ExecutionManifest, ExecutionTaskContext
+from pkg.security.nonce_store import InMemoryNonceStore, SQLiteNonceStore
 
 
 def _manifest(
@@ -120,3 +121,30 @@ def test_guard_rejects_future_timestamp_beyond_skew() -> None:
             _manifest(nonce="nonce-future", issued_at="2026-02-25T00:01:10+00:00"),
             now=now,
         )
+
+
+def test_guards_sharing_sqlite_store_reject_cross_replica_replay(tmp_path) -> None:
+    path = tmp_path / "nonces.sqlite3"
+    replica_a = AntiReplayGuard(nonce_store=SQLiteNonceStore(path))
+    replica_b = AntiReplayGuard(nonce_store=SQLiteNonceStore(path))
+    now = datetime(2026, 2, 25, 0, 1, 0, tzinfo=UTC)
+    manifest = _manifest(nonce="nonce-shared", issued_at="2026-02-25T00:00:30+00:00")
+
+    replica_a.validate_manifest(manifest, now=now)
+    with pytest.raises(AntiReplayValidationError, match="replayed nonce"):
+        replica_b.validate_manifest(manifest, now=now + timedelta(seconds=1))
+
+
+def test_guard_fails_closed_when_nonce_store_is_full() -> None:
+    guard = AntiReplayGuard(nonce_store=InMemoryNonceStore(max_entries=1))
+    now = datetime(2026, 2, 25, 0, 1, 0, tzinfo=UTC)
+
+    guard.validate_manifest(
+        _manifest(nonce="nonce-first", issued_at="2026-02-25T00:00:30+00:00"),
+        now=now,
+    )
+    with pytest.raises(AntiReplayValidationError, match="capacity"):
+        guard.validate_manifest(
+            _manifest(nonce="nonce-second", issued_at="2026-02-25T00:00:30+00:00"),
+            now=now,
+        )
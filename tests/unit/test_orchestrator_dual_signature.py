@@ -76,3 +76,48 @@ def test_high_risk_manifest_rejects_same_signer_identity() -> None:
 
     with pytest.raises(DualSignatureError, match="must differ"):
         signer.sign({"task_id": "t3"}, risk_level="high")
+
+
+class _FakeBatchGenerator(_FakeGenerator):
+    def __init__(self, value: str) -> None:
+        super().__init__(value)
+        self.batches: list[list[dict[str, Any]]] = []
+
+    def generate_many(self, payloads: list[dict[str, Any]]) -> list[str]:
+        self.batches.append(list(payloads))
+        return [f"{self.value}:{payload['task_id']}" for payload in payloads]
+
+
+def test_sign_many_batches_primary_and_high_risk_secondary() -> None:
+    primary = _FakeBatchGenerator("jws-primary")
+    secondary = _FakeBatchGenerator("jws-secondary")
+    signer = HighRiskManifestDualSigner(
+        primary=primary,  # type: ignore[arg-type]
+        secondary=secondary,  # type: ignore[arg-type]
+        primary_signer_id="sig-a",
+        secondary_signer_id="sig-b",
+    )
+
+    bundles = signer.sign_many(
+        [({"task_id": "t1"}, "low"), ({"task_id": "t2"}, "high")]
+    )
+
+    assert len(primary.batches) == 1 and len(secondary.batches) == 1
+    assert secondary.batches[0] == [{"task_id": "t2"}]
+    assert bundles[0].secondary_jws is None
+    assert bundles[1].secondary_jws == "jws-secondary:t2"
+    assert [bundle.dual_signature_required for bundle in bundles] == [False, True]
+
+
+def test_sign_many_rejects_high_risk_without_secondary_before_signing() -> None:
+    primary = _FakeBatchGenerator("jws-primary")
+    signer = HighRiskManifestDualSigner(
+        primary=primary,  # type: ignore[arg-type]
+        secondary=None,
+        primary_signer_id="sig-a",
+        secondary_signer_id=None,
+    )
+
+    with pytest.raises(DualSignatureError, match="secondary signer is required"):
+        signer.sign_many([({"task_id": "t1"}, "critical")])
+    assert primary.batches == []
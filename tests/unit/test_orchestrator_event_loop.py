@@ -50,3 +50,72 @@ def test_event_loop_context_manager() -> None:
     with AsyncEventLoop() as runtime:
         result = runtime.submit(_sample_task(3)).result(timeout=2)
         assert result == 3
+
+
+def test_event_loop_persists_loop_across_submissions() -> None:
+    async def _current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    with AsyncEventLoop() as runtime:
+        first = runtime.submit(_current_loop()).result(timeout=2)
+        second = runtime.submit(_current_loop()).result(timeout=2)
+
+    assert first is second
+
+
+def test_event_loop_runs_submissions_concurrently_within_limit() -> None:
+    active = 0
+    peak = 0
+
+    async def _tracked() -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+
+    with AsyncEventLoop(max_concurrency=2) as runtime:
+        futures = [runtime.submit(_tracked(), name="tracked") for _ in range(6)]
+        for future in futures:
+            future.result(timeout=2)
+        metrics = runtime.metrics()
+        samples = runtime.latency_samples()
+
+    assert peak == 2
+    assert metrics.submitted == 6
+    assert metrics.completed == 6
+    assert metrics.in_flight == 0
+    assert metrics.max_queue_delay_seconds >= 0.02
+    assert metrics.mean_run_seconds >= 0.02
+    assert len(samples) == 6
+    assert {sample.name for sample in samples} == {"tracked"}
+
+
+def test_event_loop_records_failures() -> None:
+    async def _boom() -> None:
+        raise ValueError("boom")
+
+    with AsyncEventLoop() as runtime:
+        with pytest.raises(ValueError):
+            runtime.submit(_boom()).result(timeout=2)
+        assert runtime.metrics().failed == 1
+
+
+def test_event_loop_stop_drains_then_cancels_after_timeout() -> None:
+    runtime = AsyncEventLoop()
+    runtime.start()
+    quick = runtime.submit(_sample_task(5))
+    slow = runtime.submit(asyncio.sleep(30))
+
+    runtime.stop(timeout=0.2)
+
+    assert quick.result(timeout=0) == 5
+    assert slow.cancelled()
+    assert runtime.metrics().cancelled == 1
+    with pytest.raises(RuntimeError):
+        runtime.submit(_sample_task(1))
+
+
+def test_invalid_max_concurrency_raises() -> None:
+    with pytest.raises(ValueError):
+        AsyncEventLoop(max_concurrency=0)
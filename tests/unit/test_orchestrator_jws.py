@@ -117,3 +117,36 @@ def test_generate_raises_when_pre_execution_authorizer_denies() -> None:
 
     with pytest.raises(PermissionError, match="denied"):
         generator.generate({"target_urn": "urn:target:ip:10.0.0.5", "tool": "nmap"})
+
+
+class BatchFakeSigner(FakeSigner):
+    def __init__(self, signer_value: str) -> None:
+        super().__init__(signer_value)
+        self.batches: list[list[bytes]] = []
+
+    def sign_payloads(self, payloads: list[bytes]) -> list[str]:
+        self.batches.append(list(payloads))
+        return [self.signer_value for _ in payloads]
+
+
+def test_generate_many_uses_batch_signer_once() -> None:
+    signer = BatchFakeSigner("vault:v1:AQI")
+    generator = CompactJWSGenerator(signer=signer)
+
+    tokens = generator.generate_many([{"task_id": "t1"}, {"task_id": "t2"}])
+
+    assert len(signer.batches) == 1
+    assert tokens == [
+        generator.generate({"task_id": "t1"}),
+        generator.generate({"task_id": "t2"}),
+    ]
+
+
+def test_generate_many_falls_back_to_per_payload_signing() -> None:
+    signer = FakeSigner("AQI")
+    generator = CompactJWSGenerator(signer=signer)
+
+    tokens = generator.generate_many([{"task_id": "t1"}, {"task_id": "t2"}])
+
+    assert [token.split(".")[2] for token in tokens] == ["AQI", "AQI"]
+    assert signer.last_input == tokens[1].rsplit(".", 1)[0].encode("ascii")
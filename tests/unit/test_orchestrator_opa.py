@@ -144,3 +144,164 @@ def test_opa_aaa_policy_adapter_maps_principal_and_context() -> None:
     assert payload["tenant_id"] == "tenant-a"
     assert payload["tool_sha256"].startswith("sha256:")
     assert payload["target_urn"] == "urn:target:ip:10.0.0.5"
+
+
+class DecisionSession:
+    """Answer OPA queries from a fixed decision document, counting posts."""
+
+    def __init__(self, *, allow: bool = True, contract: bool = True) -> None:
+        self.allow = allow
+        self.contract = contract
+        self.calls: list[dict[str, Any]] = []
+
+    def post(self, url: str, json: dict[str, Any], timeout: float) -> FakeResponse:
+        self.calls.append({"url": url, "json": json, "timeout": timeout})
+        if url.endswith("/allow"):
+            return FakeResponse(200, {"result": self.allow})
+        if url.endswith("/input_contract_valid"):
+            return FakeResponse(200, {"result": self.contract})
+        return FakeResponse(
+            200,
+            {"result": {"allow": self.allow, "input_contract_valid": self.contract}},
+        )
+
+
+def _cached_config(**overrides: Any) -> OPAConfig:
+    values: dict[str, Any] = {
+        "url": "http://opa:8181",
+        "timeout_seconds": 1.0,
+        "decision_cache_ttl_seconds": 60.0,
+    }
+    values.update(overrides)
+    return OPAConfig(**values)
+
+
+def test_opa_config_rejects_unknown_query_mode() -> None:
+    with pytest.raises(ValueError, match="query_mode"):
+        OPAConfig(query_mode="parallel")
+
+
+def test_opa_decision_cache_serves_identical_inputs() -> None:
+    session = DecisionSession()
+    authorizer = OPAExecutionAuthorizer(_cached_config(), session=session)
+
+    authorizer.authorize(_payload())
+    reordered = dict(reversed(list(_payload().items())))
+    decision = authorizer.decide(reordered)
+
+    assert decision.cached is True
+    assert len(session.calls) == 2
+    metrics = authorizer.metrics()
+    assert (metrics.cache_hits, metrics.cache_misses) == (1, 1)
+    assert metrics.queries == 2
+    assert metrics.latency_count == 2
+    assert metrics.latency_buckets[-1] == (float("inf"), 2)
+
+
+def test_opa_decision_cache_caches_denials() -> None:
+    session = DecisionSession(allow=False)
+    authorizer = OPAExecutionAuthorizer(_cached_config(), session=session)
+
+    for _ in range(3):
+        with pytest.raises(OPAAuthorizationError, match="not authorized"):
+            authorizer.authorize(_payload())
+
+    assert len(session.calls) == 2
+
+
+def test_opa_decision_cache_is_disabled_by_default() -> None:
+    session = DecisionSession()
+    authorizer = OPAExecutionAuthorizer(_config(), session=session)
+
+    authorizer.authorize(_payload())
+    authorizer.authorize(_payload())
+
+    assert len(session.calls) == 4
+
+
+def test_opa_decision_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = DecisionSession()
+    authorizer = OPAExecutionAuthorizer(
+        _cached_config(decision_cache_ttl_seconds=5.0), session=session
+    )
+    clock = [100.0]
+    monkeypatch.setattr("pkg.orchestrator.opa.time.monotonic", lambda: clock[0])
+
+    authorizer.authorize(_payload())
+    clock[0] += 6.0
+    authorizer.authorize(_payload())
+
+    assert len(session.calls) == 4
+
+
+def test_opa_decision_cache_evicts_least_recently_used() -> None:
+    session = DecisionSession()
+    authorizer = OPAExecutionAuthorizer(
+        _cached_config(decision_cache_size=2, query_mode="combined"), session=session
+    )
+    first, second, third = (
+        {**_payload(), "target_urn": f"urn:target:ip:10.0.0.{index}"} for index in range(3)
+    )
+
+    authorizer.decide(first)
+    authorizer.decide(second)
+    authorizer.decide(first)
+    authorizer.decide(third)
+
+    assert authorizer.decide(first).cached is True
+    assert authorizer.decide(second).cached is False
+    assert authorizer.metrics().cache_size == 2
+
+
+def test_opa_policy_change_invalidates_decisions() -> None:
+    session = DecisionSession()
+    authorizer = OPAExecutionAuthorizer(
+        _cached_config(), session=session, policy_revision="rev-1"
+    )
+    authorizer.authorize(_payload())
+
+    authorizer.on_policy_change("rev-1")
+    assert authorizer.decide(_payload()).cached is True
+
+    authorizer.on_policy_change("rev-2")
+    assert authorizer.decide(_payload()).cached is False
+    assert authorizer.policy_revision == "rev-2"
+
+
+def test_opa_combined_mode_uses_single_round_trip() -> None:
+    session = DecisionSession(contract=False)
+    authorizer = OPAExecutionAuthorizer(
+        OPAConfig(url="http://opa:8181", query_mode="combined"), session=session
+    )
+
+    with pytest.raises(OPAAuthorizationError, match="invalid input contract"):
+        authorizer.authorize(_payload())
+
+    assert len(session.calls) == 1
+    assert session.calls[0]["url"] == "http://opa:8181/v1/data/spectrastrike/capabilities"
+
+
+def test_opa_combined_mode_requires_boolean_rules() -> None:
+    session = FakeSession([FakeResponse(200, {"result": {"allow": True}})])
+    authorizer = OPAExecutionAuthorizer(
+        OPAConfig(url="http://opa:8181", query_mode="combined"), session=session
+    )
+
+    with pytest.raises(OPAClientError, match="boolean result"):
+        authorizer.authorize(_payload())
+
+
+def test_opa_authorize_many_deduplicates_inputs() -> None:
+    session = DecisionSession()
+    authorizer = OPAExecutionAuthorizer(
+        _cached_config(query_mode="combined"), session=session
+    )
+    other = {**_payload(), "target_urn": "urn:target:ip:10.0.0.9"}
+    authorizer.decide(other)
+
+    decisions = authorizer.authorize_many([_payload(), other, _payload()] * 5)
+
+    assert len(decisions) == 15
+    assert all(decision.authorized for decision in decisions)
+    assert decisions[1].cached is True
+    assert len(session.calls) == 2
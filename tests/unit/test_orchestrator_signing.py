@@ -17,6 +17,8 @@
 from __future__ import annotations
 
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -181,3 +183,197 @@ def test_rotate_signing_key_calls_rotate_endpoint() -> None:
     assert session.calls[0]["url"].endswith(
         "/v1/transit/keys/orchestrator-signing/rotate"
     )
+
+
+def test_sign_payloads_uses_batch_input_in_chunks() -> None:
+    session = FakeSession(
+        [
+            FakeResponse(
+                200,
+                {"data": {"batch_results": [{"signature": "vault:v1:a"}, {"signature": "vault:v1:b"}]}},
+            ),
+            FakeResponse(200, {"data": {"batch_results": [{"signature": "vault:v1:c"}]}}),
+        ]
+    )
+    signer = VaultTransitSigner(
+        _config(), session=session, max_batch_size=2  # type: ignore[arg-type]
+    )
+
+    signatures = signer.sign_payloads([b"a", b"b", b"c"])
+
+    assert signatures == ["vault:v1:a", "vault:v1:b", "vault:v1:c"]
+    assert len(session.calls) == 2
+    assert session.calls[0]["json"]["batch_input"] == [
+        {"input": base64.b64encode(b"a").decode("ascii")},
+        {"input": base64.b64encode(b"b").decode("ascii")},
+    ]
+    assert "input" not in session.calls[0]["json"]
+    metrics = signer.metrics()
+    assert metrics.sign_requests == 2
+    assert metrics.signed_payloads == 3
+
+
+def test_sign_payloads_raises_on_batch_item_error() -> None:
+    session = FakeSession(
+        [
+            FakeResponse(
+                200,
+                {"data": {"batch_results": [{"signature": "vault:v1:a"}, {"error": "bad input"}]}},
+            )
+        ]
+    )
+    signer = VaultTransitSigner(_config(), session=session)  # type: ignore[arg-type]
+
+    with pytest.raises(VaultTransitError, match="bad input"):
+        signer.sign_payloads([b"a", b"b"])
+
+
+class BatchEchoSession:
+    """Answer transit sign calls by echoing inputs back as signatures."""
+
+    def __init__(self, *, reject: bytes | None = None, down: bool = False) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._reject = base64.b64encode(reject).decode("ascii") if reject else None
+        self._down = down
+
+    def request(self, **kwargs: Any) -> FakeResponse:
+        with self._lock:
+            self.calls.append(kwargs)
+        if self._down:
+            return FakeResponse(503, {"errors": ["vault sealed"]})
+        body = kwargs["json"]
+        if "batch_input" in body:
+            results = [
+                {"error": "bad input"}
+                if item["input"] == self._reject
+                else {"signature": f"vault:v1:{item['input']}"}
+                for item in body["batch_input"]
+            ]
+            return FakeResponse(200, {"data": {"batch_results": results}})
+        return FakeResponse(200, {"data": {"signature": f"vault:v1:{body['input']}"}})
+
+
+def test_concurrent_sign_payload_calls_coalesce_into_one_request() -> None:
+    session = BatchEchoSession()
+    signer = VaultTransitSigner(
+        _config(),
+        session=session,  # type: ignore[arg-type]
+        batch_window_seconds=0.5,
+        max_batch_size=8,
+    )
+    payloads = [f"manifest-{index}".encode() for index in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        signatures = list(executor.map(signer.sign_payload, payloads))
+
+    assert signatures == [
+        f"vault:v1:{base64.b64encode(payload).decode('ascii')}" for payload in payloads
+    ]
+    assert len(session.calls) == 1
+    assert signer.metrics().payloads_per_sign_request == 8.0
+
+
+def test_coalesced_batch_item_failure_only_fails_its_caller() -> None:
+    session = BatchEchoSession(reject=b"manifest-3")
+    signer = VaultTransitSigner(
+        _config(),
+        session=session,  # type: ignore[arg-type]
+        batch_window_seconds=0.5,
+        max_batch_size=6,
+    )
+    payloads = [f"manifest-{index}".encode() for index in range(6)]
+
+    def _sign(payload: bytes) -> str | Exception:
+        try:
+            return signer.sign_payload(payload)
+        except VaultTransitError as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        outcomes = list(executor.map(_sign, payloads))
+
+    assert len(session.calls) == 1
+    assert isinstance(outcomes[3], VaultTransitError)
+    assert "bad input" in str(outcomes[3])
+    assert [outcome for index, outcome in enumerate(outcomes) if index != 3] == [
+        f"vault:v1:{base64.b64encode(payload).decode('ascii')}"
+        for index, payload in enumerate(payloads)
+        if index != 3
+    ]
+
+
+def test_coalesced_request_failure_raises_fresh_error_per_caller() -> None:
+    session = BatchEchoSession(down=True)
+    signer = VaultTransitSigner(
+        _config(),
+        session=session,  # type: ignore[arg-type]
+        batch_window_seconds=0.5,
+        max_batch_size=4,
+    )
+
+    def _sign(payload: bytes) -> Exception:
+        with pytest.raises(VaultTransitError) as excinfo:
+            signer.sign_payload(payload)
+        return excinfo.value
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        errors = list(executor.map(_sign, [f"m-{index}".encode() for index in range(4)]))
+
+    assert len(session.calls) == 1
+    assert len({id(error) for error in errors}) == 4
+    assert all("vault sealed" in str(error) for error in errors)
+
+
+def test_coalesced_sign_payload_alone_uses_single_input() -> None:
+    session = BatchEchoSession()
+    signer = VaultTransitSigner(
+        _config(),
+        session=session,  # type: ignore[arg-type]
+        batch_window_seconds=0.01,
+    )
+
+    signature = signer.sign_payload(b"solo")
+
+    assert signature == f"vault:v1:{base64.b64encode(b'solo').decode('ascii')}"
+    assert "input" in session.calls[0]["json"]
+
+
+def _key_metadata(latest: int) -> FakeResponse:
+    return FakeResponse(
+        200,
+        {
+            "data": {
+                "latest_version": latest,
+                "keys": {
+                    str(version): {"public_key": f"pem-v{version}"}
+                    for version in range(1, latest + 1)
+                },
+            }
+        },
+    )
+
+
+def test_read_public_key_is_cached_per_version_until_rotation() -> None:
+    session = FakeSession(
+        [
+            _key_metadata(1),
+            FakeResponse(200, {"data": {}}),
+            _key_metadata(2),
+        ]
+    )
+    signer = VaultTransitSigner(_config(), session=session)  # type: ignore[arg-type]
+
+    assert signer.read_public_key() == "pem-v1"
+    assert signer.read_public_key() == "pem-v1"
+    assert signer.read_public_key(1) == "pem-v1"
+    assert len(session.calls) == 1
+
+    signer.rotate_signing_key()
+
+    assert signer.read_public_key() == "pem-v2"
+    assert signer.read_public_key(1) == "pem-v1"
+    assert len(session.calls) == 3
+    metrics = signer.metrics()
+    assert metrics.public_key_cache_hits == 3
+    assert metrics.public_key_cache_misses == 2
@@ -6,13 +6,28 @@
 
 from __future__ import annotations
 
+import subprocess
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+
 import pytest
 
+from pkg.orchestrator.campaign_engine import (
+    CampaignConfiguration,
+    CampaignEngine,
+    CampaignStatus,
+    ExecutionStatus,
+)
 from pkg.orchestrator.playbook_engine import (
+    PlaybookCampaignBinding,
     PlaybookEngine,
     PlaybookEngineError,
+    PlaybookScenario,
     StepExecutionStatus,
 )
+from pkg.orchestrator.telemetry_ingestion import TelemetryIngestionPipeline
+from pkg.wrappers.base import WrapperCommandResult
 
 
 def test_playbook_tables_and_step_ordering() -> None:
@@ -171,3 +186,452 @@ def test_branching_next_on_failure_continues_without_terminal_rollback() -> None
     )
     assert result.status == StepExecutionStatus.SUCCEEDED
     assert len(result.rollback_results) == 0
+
+
+def _chain_engine() -> tuple[PlaybookEngine, str, list[str]]:
+    engine = PlaybookEngine()
+    playbook = engine.create_playbook(
+        name="Compiled Chain",
+        description="Compiled condition and template coverage",
+        created_by="alice",
+        default_variables={"target_host": "srv-01", "tier": 1},
+    )
+    module = engine.register_technique_module(
+        name="Generic Step",
+        technique_id="T1059",
+        default_command_template="run --target {target_host} --tier {tier:>3}",
+        default_rollback_template="undo --target {target_host} --after {step_2_status}",
+        default_variables={"step_2_status": "pending"},
+    )
+    step_ids = [
+        engine.add_playbook_step(
+            playbook_id=playbook.playbook_id,
+            step_order=order,
+            name=f"step-{order}",
+            technique_module_id=module.technique_module_id,
+            condition_expression="tier >= 1 and target_host != 'dc-01'" if order == 2 else None,
+        ).step_id
+        for order in (3, 1, 2)
+    ]
+    return engine, playbook.playbook_id, step_ids
+
+
+def test_add_playbook_step_compiles_conditions_and_templates() -> None:
+    engine, playbook_id, _ = _chain_engine()
+    module = engine.register_technique_module(
+        name="Compiled", technique_id="T1059", default_command_template="run {target_host}"
+    )
+    with pytest.raises(PlaybookEngineError, match="invalid condition expression"):
+        engine.add_playbook_step(
+            playbook_id=playbook_id,
+            step_order=4,
+            name="broken",
+            technique_module_id=module.technique_module_id,
+            condition_expression="tier >=",
+        )
+    with pytest.raises(PlaybookEngineError, match="unsupported expression node: Call"):
+        engine.add_playbook_step(
+            playbook_id=playbook_id,
+            step_order=4,
+            name="call",
+            technique_module_id=module.technique_module_id,
+            condition_expression="len(target_host) > 1",
+        )
+    with pytest.raises(PlaybookEngineError, match="positional template fields"):
+        engine.register_technique_module(
+            name="Positional", technique_id="T1059", default_command_template="run {0}"
+        )
+    with pytest.raises(PlaybookEngineError, match="invalid template"):
+        engine.add_playbook_step(
+            playbook_id=playbook_id,
+            step_order=4,
+            name="unclosed",
+            technique_module_id=module.technique_module_id,
+            command_template="run {target_host",
+        )
+
+    result = engine.simulate_playbook(playbook_id=playbook_id)
+
+    assert [row.rendered_command for row in result.step_results] == [
+        "run --target srv-01 --tier   1"
+    ] * 3
+    guarded = engine.create_playbook(name="No Tier", description="", created_by="alice")
+    engine.add_playbook_step(
+        playbook_id=guarded.playbook_id,
+        step_order=1,
+        name="guarded",
+        technique_module_id=module.technique_module_id,
+        condition_expression="target_host or tier > 0",
+    )
+    with pytest.raises(PlaybookEngineError, match="unknown variable in condition: target_host"):
+        engine.simulate_playbook(playbook_id=guarded.playbook_id)
+
+
+def test_rollback_reuses_renders_unless_later_variables_change_them() -> None:
+    engine, playbook_id, step_ids = _chain_engine()
+    third, first, second = step_ids
+
+    result = engine.simulate_playbook(playbook_id=playbook_id, fail_step_ids={third})
+
+    assert [row.step_id for row in result.step_results] == [first, second, third]
+    assert [row.step_id for row in result.rollback_results] == [second, first]
+    # Both rollbacks read step_2_status, which only became "succeeded" after
+    # step 2 ran; the rollback pass must see the final value.
+    assert [row.rendered_rollback for row in result.rollback_results] == [
+        "undo --target srv-01 --after succeeded"
+    ] * 2
+    assert result.step_results[0].rendered_rollback == "undo --target srv-01 --after pending"
+
+
+def test_simulate_playbook_many_matches_individual_runs() -> None:
+    engine, playbook_id, step_ids = _chain_engine()
+    scenarios = [
+        PlaybookScenario(
+            runtime_variables={"target_host": host, "tier": tier},
+            fail_step_ids=frozenset(failed),
+        )
+        for host in ("srv-01", "dc-01")
+        for tier in (0, 2)
+        for failed in ((), (step_ids[0],), (step_ids[2],))
+    ]
+
+    batched = engine.simulate_playbook_many(playbook_id=playbook_id, scenarios=scenarios)
+
+    assert batched == [
+        engine.simulate_playbook(
+            playbook_id=playbook_id,
+            runtime_variables=dict(scenario.runtime_variables),
+            fail_step_ids=set(scenario.fail_step_ids),
+        )
+        for scenario in scenarios
+    ]
+    assert {row.status for row in batched} == {
+        StepExecutionStatus.SUCCEEDED,
+        StepExecutionStatus.FAILED,
+    }
+
+
+def test_simulate_playbook_many_distinguishes_equal_values_of_other_types() -> None:
+    engine, playbook_id, _ = _chain_engine()
+    scenarios = [
+        PlaybookScenario(runtime_variables={"tier": tier})
+        for tier in (1, True, 1.0, 0.0, -0.0)
+    ]
+
+    batched = engine.simulate_playbook_many(playbook_id=playbook_id, scenarios=scenarios)
+
+    individual = [
+        engine.simulate_playbook(
+            playbook_id=playbook_id, runtime_variables=dict(scenario.runtime_variables)
+        )
+        for scenario in scenarios
+    ]
+    assert batched == individual
+    assert [result.step_results[0].rendered_command for result in batched] == [
+        f"run --target srv-01 --tier {tier:>3}" for tier in (1, True, 1.0, 0.0, -0.0)
+    ]
+
+
+def _recording_runner(
+    *, delay: float = 0.0, fail_call: int | None = None
+) -> tuple[list[list[str]], object]:
+    calls: list[list[str]] = []
+    lock = threading.Lock()
+
+    def runner(command: list[str], timeout_seconds: float) -> WrapperCommandResult:
+        with lock:
+            calls.append(command)
+            call = len(calls)
+        time.sleep(delay)
+        if call == fail_call:
+            return WrapperCommandResult(returncode=2, stdout="", stderr="access denied\n")
+        return WrapperCommandResult(returncode=0, stdout="ok", stderr="")
+
+    return calls, runner
+
+
+def _fan_out_engine() -> tuple[PlaybookEngine, str, list[str]]:
+    engine = PlaybookEngine()
+    playbook = engine.create_playbook(
+        name="Recon Fan-Out",
+        description="Independent recon feeding one pivot",
+        created_by="alice",
+        default_variables={"domain": "corp.local"},
+    )
+    module = engine.register_technique_module(
+        name="Recon",
+        technique_id="T1046",
+        default_command_template="scan --target {target_host}",
+        default_rollback_template="cleanup --target {target_host}",
+    )
+    recon_ids = [
+        engine.add_playbook_step(
+            playbook_id=playbook.playbook_id,
+            step_order=order,
+            name=f"recon-{host}",
+            technique_module_id=module.technique_module_id,
+            variables={"target_host": host},
+            depends_on=(),
+        ).step_id
+        for order, host in enumerate(("srv-01", "srv-02", "srv-03"), start=1)
+    ]
+    pivot = engine.add_playbook_step(
+        playbook_id=playbook.playbook_id,
+        step_order=4,
+        name="pivot",
+        technique_module_id=module.technique_module_id,
+        variables={"target_host": "dc-01"},
+        command_template="pivot --target {target_host} --after {step_3_status}",
+        depends_on=recon_ids,
+    )
+    return engine, playbook.playbook_id, [*recon_ids, pivot.step_id]
+
+
+def test_execute_playbook_runs_independent_steps_concurrently() -> None:
+    engine, playbook_id, step_ids = _fan_out_engine()
+    calls, runner = _recording_runner(delay=0.2)
+    now = datetime.now(UTC)
+    campaigns = CampaignEngine()
+    campaign = campaigns.create_campaign(
+        name="Fan-Out Campaign",
+        created_by="alice",
+        configuration=CampaignConfiguration(
+            objective="parallel recon",
+            target_scope=("srv-01", "srv-02", "srv-03", "dc-01"),
+            execution_window_start=now + timedelta(minutes=5),
+            execution_window_end=now + timedelta(hours=2),
+        ),
+    )
+    campaigns.set_campaign_status(campaign_id=campaign.campaign_id, status=CampaignStatus.RUNNING)
+    campaign_step = campaigns.add_campaign_step(
+        campaign_id=campaign.campaign_id,
+        step_order=1,
+        name="recon",
+        technique_id="T1046",
+        asset_selector=("srv-01", "srv-02", "srv-03"),
+    )
+    telemetry = TelemetryIngestionPipeline(batch_size=1)
+
+    result = engine.execute_playbook(
+        playbook_id=playbook_id,
+        runner=runner,
+        actor="alice",
+        tenant_id="tenant-a",
+        telemetry=telemetry,
+        campaign=PlaybookCampaignBinding(
+            campaign_engine=campaigns,
+            campaign_id=campaign.campaign_id,
+            step_ids={step_id: campaign_step.step_id for step_id in step_ids[:3]},
+        ),
+    )
+
+    assert result.status == StepExecutionStatus.SUCCEEDED
+    assert [row.step_id for row in result.step_results][-1] == step_ids[3]
+    assert result.step_results[-1].rendered_command == "pivot --target dc-01 --after succeeded"
+    assert calls[-1] == ["pivot", "--target", "dc-01", "--after", "succeeded"]
+    # Three 0.2 s recon steps overlap; only recon + pivot is on the critical path.
+    assert result.critical_path_seconds < 0.6
+    assert result.elapsed_seconds < 0.7
+    executions = campaigns.list_campaign_executions(campaign_id=campaign.campaign_id)
+    assert sorted(row.asset_id for row in executions) == ["srv-01", "srv-02", "srv-03"]
+    assert {row.status for row in executions} == {ExecutionStatus.SUCCEEDED}
+    assert {row.correlation_group_id for row in executions} == {result.execution_id}
+    events = telemetry.flush_all()
+    assert [event.event_type for event in events].count("playbook_step") == 4
+    assert events[-1].event_type == "playbook_execution"
+    assert events[-1].attributes["playbook_execution_id"] == result.execution_id
+
+
+def test_execute_playbook_rolls_back_in_reverse_completion_order() -> None:
+    engine, playbook_id, step_ids = _chain_engine()
+    calls, runner = _recording_runner(fail_call=3)
+
+    result = engine.execute_playbook(
+        playbook_id=playbook_id,
+        runner=runner,
+        actor="alice",
+        runtime_variables={"target_host": "srv-01", "tier": 2},
+    )
+    simulated = engine.simulate_playbook(
+        playbook_id=playbook_id,
+        runtime_variables={"target_host": "srv-01", "tier": 2},
+        fail_step_ids={step_ids[0]},
+    )
+
+    assert result.status == StepExecutionStatus.FAILED
+    assert [row.step_id for row in result.step_results] == [row.step_id for row in simulated.step_results]
+    assert result.step_results[-1].error == "access denied"
+    assert [row.rendered_rollback for row in result.rollback_results] == [
+        row.rendered_rollback for row in simulated.rollback_results
+    ]
+    assert {row.status for row in result.rollback_results} == {StepExecutionStatus.ROLLED_BACK}
+    assert calls[-len(result.rollback_results):] == [
+        row.rendered_rollback.split() for row in result.rollback_results
+    ]
+
+
+def test_execute_playbook_failure_handler_skips_dependents_and_times_out_steps() -> None:
+    engine = PlaybookEngine()
+    playbook = engine.create_playbook(name="Handled", description="", created_by="alice")
+    module = engine.register_technique_module(
+        name="Generic",
+        technique_id="T1059",
+        default_command_template="run {label}",
+    )
+
+    def add(order: int, label: str, **options: object) -> str:
+        return engine.add_playbook_step(
+            playbook_id=playbook.playbook_id,
+            step_order=order,
+            name=label,
+            technique_module_id=module.technique_module_id,
+            variables={"label": label},
+            **options,
+        ).step_id
+
+    remediate = add(4, "remediate")
+    exploit = add(1, "exploit", next_on_failure=remediate, timeout_seconds=0.05)
+    follow_up = add(2, "follow-up", depends_on=(exploit,))
+    independent = add(3, "independent", depends_on=())
+
+    def runner(command: list[str], timeout_seconds: float) -> WrapperCommandResult:
+        if command == ["run", "exploit"]:
+            raise subprocess.TimeoutExpired(command, timeout_seconds)
+        return WrapperCommandResult(returncode=0, stdout="", stderr="")
+
+    result = engine.execute_playbook(playbook_id=playbook.playbook_id, runner=runner, actor="alice")
+
+    statuses = {row.step_id: row for row in result.step_results}
+    assert result.status == StepExecutionStatus.SUCCEEDED
+    assert statuses[exploit].status == StepExecutionStatus.FAILED
+    assert statuses[exploit].error == "step timed out after 0.05s"
+    assert statuses[follow_up].status == StepExecutionStatus.SKIPPED
+    assert statuses[follow_up].error == f"dependency failed: {exploit}"
+    assert statuses[independent].status == StepExecutionStatus.SUCCEEDED
+    assert statuses[remediate].status == StepExecutionStatus.SUCCEEDED
+    assert result.rollback_results == ()
+
+    add(5, "loop", depends_on=(remediate,), next_on_success=remediate)
+    with pytest.raises(PlaybookEngineError, match="loop detected"):
+        engine.execute_playbook(playbook_id=playbook.playbook_id, runner=runner, actor="alice")
+    with pytest.raises(PlaybookEngineError, match="tenant_id is required"):
+        engine.execute_playbook(
+            playbook_id=playbook.playbook_id,
+            runner=runner,
+            actor="alice",
+            telemetry=TelemetryIngestionPipeline(),
+        )
+
+
+def test_execute_playbook_follows_branches_like_simulation() -> None:
+    engine = PlaybookEngine()
+    playbook = engine.create_playbook(name="Branches", description="", created_by="alice")
+    module = engine.register_technique_module(
+        name="Generic",
+        technique_id="T1059",
+        default_command_template="run {label}",
+        default_rollback_template="undo {label}",
+    )
+    # recon jumps over noisy to exploit; exploit fails over to handler;
+    # lateral jumps over handler to cleanup.
+    labels = ("recon", "noisy", "exploit", "lateral", "handler", "cleanup")
+    jumps = {"recon": "exploit", "lateral": "cleanup"}
+    step_ids: dict[str, str] = {}
+    for order, label in reversed(list(enumerate(labels, start=1))):
+        step_ids[label] = engine.add_playbook_step(
+            playbook_id=playbook.playbook_id,
+            step_order=order,
+            name=label,
+            technique_module_id=module.technique_module_id,
+            variables={"label": label},
+            next_on_success=step_ids.get(jumps.get(label, "")),
+            next_on_failure=step_ids["handler"] if label == "exploit" else None,
+        ).step_id
+
+    for failing in (None, "recon", "exploit", "lateral", "handler"):
+        calls: list[list[str]] = []
+
+        def runner(command: list[str], timeout_seconds: float) -> WrapperCommandResult:
+            calls.append(command)
+            failed = command == ["run", failing]
+            return WrapperCommandResult(returncode=1 if failed else 0, stdout="", stderr="")
+
+        executed = engine.execute_playbook(
+            playbook_id=playbook.playbook_id, runner=runner, actor="alice", max_parallel=1
+        )
+        simulated = engine.simulate_playbook(
+            playbook_id=playbook.playbook_id,
+            fail_step_ids={step_ids[failing]} if failing else set(),
+        )
+
+        ran = [row for row in executed.step_results if row.error != "branch not taken"]
+        assert [(row.step_id, row.status) for row in ran] == [
+            (row.step_id, row.status) for row in simulated.step_results
+        ]
+        assert [row.step_id for row in executed.rollback_results] == [
+            row.step_id for row in simulated.rollback_results
+        ]
+        assert ["run", "noisy"] not in calls
+        assert executed.status == simulated.status
+
+
+def test_execute_playbook_reporting_failures_do_not_skip_rollback() -> None:
+    engine, playbook_id, step_ids = _chain_engine()
+    now = datetime.now(UTC)
+    campaigns = CampaignEngine()
+    campaign = campaigns.create_campaign(
+        name="Flaky Reporting",
+        created_by="alice",
+        configuration=CampaignConfiguration(
+            objective="reporting failures",
+            target_scope=("srv-01",),
+            execution_window_start=now + timedelta(minutes=5),
+            execution_window_end=now + timedelta(hours=2),
+        ),
+    )
+    campaigns.set_campaign_status(campaign_id=campaign.campaign_id, status=CampaignStatus.RUNNING)
+    campaign_step = campaigns.add_campaign_step(
+        campaign_id=campaign.campaign_id,
+        step_order=1,
+        name="chain",
+        technique_id="T1059",
+        asset_selector=("srv-01",),
+    )
+    calls: list[list[str]] = []
+
+    def runner(command: list[str], timeout_seconds: float) -> WrapperCommandResult:
+        calls.append(command)
+        # Something else closes the campaign executions under the playbook.
+        for execution in campaigns.list_campaign_executions(campaign_id=campaign.campaign_id):
+            if execution.status == ExecutionStatus.RUNNING:
+                campaigns.stop_technique_execution(
+                    execution_id=execution.execution_id, status=ExecutionStatus.CANCELED
+                )
+        return WrapperCommandResult(returncode=1 if len(calls) == 3 else 0, stdout="", stderr="")
+
+    class _FailingTelemetry(TelemetryIngestionPipeline):
+        def ingest(self, event_type: str, *args: object, **kwargs: object) -> object:
+            raise RuntimeError("telemetry sink offline")
+
+    result = engine.execute_playbook(
+        playbook_id=playbook_id,
+        runner=runner,
+        actor="alice",
+        tenant_id="tenant-a",
+        runtime_variables={"tier": 2},
+        telemetry=_FailingTelemetry(),
+        campaign=PlaybookCampaignBinding(
+            campaign_engine=campaigns,
+            campaign_id=campaign.campaign_id,
+            step_ids={step_id: campaign_step.step_id for step_id in step_ids},
+        ),
+    )
+
+    assert result.status == StepExecutionStatus.FAILED
+    assert len(result.rollback_results) == 2
+    assert {row.status for row in result.rollback_results} == {StepExecutionStatus.ROLLED_BACK}
+    for row in result.step_results:
+        assert row.reporting_error is not None
+        assert row.reporting_error.startswith("campaign execution not stopped:")
+        assert row.reporting_error.endswith("telemetry not recorded: telemetry sink offline")
+    assert result.reporting_error == "telemetry not recorded: telemetry sink offline"
@@ -17,11 +17,17 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
 
 import pytest
 
+from pkg.orchestrator.event_loop import AsyncEventLoop
 from pkg.orchestrator.messaging import InMemoryRabbitBroker, RabbitMQTelemetryPublisher
-from pkg.orchestrator.telemetry_ingestion import TelemetryIngestionPipeline
+from pkg.orchestrator.telemetry_ingestion import (
+    TelemetryBackpressureError,
+    TelemetryIngestionPipeline,
+)
 
 
 def test_ingest_increments_buffer() -> None:
@@ -149,3 +155,208 @@ def test_flush_embeds_ml_normalized_payload() -> None:
     assert isinstance(ml_record, dict)
     assert ml_record["schema_version"] == "telemetry.ml.v1"
     assert ml_record["status_code"] == 1
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.005)
+
+
+def test_flush_worker_publishes_full_batches_and_drains_on_stop() -> None:
+    broker = InMemoryRabbitBroker()
+    pipeline = TelemetryIngestionPipeline(
+        batch_size=4,
+        publisher=RabbitMQTelemetryPublisher(broker=broker),
+        max_linger_seconds=60.0,
+    )
+    pipeline.start_flush_worker()
+    assert pipeline.flush_worker_running
+
+    for index in range(10):
+        pipeline.ingest(f"event_{index}", "alice", "nmap", "success", tenant_id="t")
+    _wait_until(lambda: broker.queue_size("telemetry.events") == 8)
+    assert pipeline.buffered_count == 2
+
+    pipeline.stop_flush_worker()
+
+    assert not pipeline.flush_worker_running
+    assert pipeline.buffered_count == 0
+    positions = [item.stream_position for item in broker.consume("telemetry.events")]
+    assert positions == list(range(1, 11))
+
+
+def test_flush_worker_publishes_partial_batch_after_linger() -> None:
+    broker = InMemoryRabbitBroker()
+    pipeline = TelemetryIngestionPipeline(
+        batch_size=100,
+        publisher=RabbitMQTelemetryPublisher(broker=broker),
+        max_linger_seconds=0.05,
+    )
+    with AsyncEventLoop() as event_loop:
+        pipeline.start_flush_worker(event_loop)
+        pipeline.ingest("event_a", "alice", "nmap", "success", tenant_id="t")
+        _wait_until(lambda: broker.queue_size("telemetry.events") == 1)
+        pipeline.stop_flush_worker()
+
+
+def test_ingest_applies_backpressure_at_high_water_mark() -> None:
+    class _StalledPublisher:
+        def __init__(self) -> None:
+            self.release = asyncio.Event()
+            self.loop: asyncio.AbstractEventLoop | None = None
+            self.published = 0
+
+        async def publish(self, envelope):
+            raise AssertionError("publish_many expected")
+
+        async def publish_many(self, envelopes):
+            self.loop = asyncio.get_running_loop()
+            await self.release.wait()
+            self.published += len(envelopes)
+            return []
+
+    publisher = _StalledPublisher()
+    pipeline = TelemetryIngestionPipeline(
+        batch_size=2,
+        publisher=publisher,
+        high_water_mark=3,
+        backpressure_timeout=0.05,
+    )
+    pipeline.start_flush_worker()
+    pipeline.ingest("event_a", "alice", "nmap", "success", tenant_id="t")
+    pipeline.ingest("event_b", "alice", "nmap", "success", tenant_id="t")
+    _wait_until(lambda: publisher.loop is not None)
+    for name in ("event_c", "event_d", "event_e"):
+        pipeline.ingest(name, "alice", "nmap", "success", tenant_id="t")
+
+    with pytest.raises(TelemetryBackpressureError):
+        pipeline.ingest("event_f", "alice", "nmap", "success", tenant_id="t")
+    assert pipeline.buffered_count == 3
+
+    assert publisher.loop is not None
+    publisher.loop.call_soon_threadsafe(publisher.release.set)
+    pipeline.stop_flush_worker()
+    assert publisher.published == 5
+
+
+def test_stop_flush_worker_timeout_keeps_worker_registered() -> None:
+    class _SlowPublisher:
+        def __init__(self) -> None:
+            self.release = threading.Event()
+            self.published = 0
+
+        async def publish(self, envelope):
+            raise AssertionError("publish_many expected")
+
+        async def publish_many(self, envelopes):
+            await asyncio.to_thread(self.release.wait)
+            self.published += len(envelopes)
+            return []
+
+    publisher = _SlowPublisher()
+    pipeline = TelemetryIngestionPipeline(
+        batch_size=10,
+        publisher=publisher,
+        max_linger_seconds=60.0,
+    )
+    worker = pipeline.start_flush_worker()
+    pipeline.ingest("event_a", "alice", "nmap", "success", tenant_id="t")
+
+    try:
+        with pytest.raises(TimeoutError):
+            pipeline.stop_flush_worker(timeout=0.05)
+        assert pipeline.flush_worker_running
+        assert pipeline.start_flush_worker() is worker
+    finally:
+        publisher.release.set()
+    pipeline.stop_flush_worker()
+
+    assert not pipeline.flush_worker_running
+    assert publisher.published == 1
+
+
+def test_flush_worker_requeues_batch_when_publish_raises() -> None:
+    broker = InMemoryRabbitBroker()
+    delegate = RabbitMQTelemetryPublisher(broker=broker)
+
+    class _FlakyPublisher:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def publish(self, envelope):
+            raise AssertionError("publish_many expected")
+
+        async def publish_many(self, envelopes):
+            self.calls += 1
+            if self.calls <= 2:
+                raise ConnectionError("broker unavailable")
+            return await delegate.publish_many(envelopes)
+
+    publisher = _FlakyPublisher()
+    pipeline = TelemetryIngestionPipeline(
+        batch_size=2,
+        publisher=publisher,
+        max_linger_seconds=0.01,
+    )
+    pipeline.start_flush_worker()
+    for index in range(5):
+        pipeline.ingest(f"event_{index}", "alice", "nmap", "success", tenant_id="t")
+    _wait_until(lambda: broker.queue_size("telemetry.events") == 5)
+    pipeline.stop_flush_worker()
+
+    assert publisher.calls >= 3
+    positions = [item.stream_position for item in broker.consume("telemetry.events")]
+    assert positions == list(range(1, 6))
+
+
+def test_flush_worker_keeps_events_buffered_when_final_drain_fails() -> None:
+    class _DownPublisher:
+        async def publish(self, envelope):
+            raise ConnectionError("broker unavailable")
+
+    pipeline = TelemetryIngestionPipeline(
+        batch_size=10,
+        publisher=_DownPublisher(),
+        max_linger_seconds=60.0,
+    )
+    pipeline.start_flush_worker()
+    for index in range(3):
+        pipeline.ingest(f"event_{index}", "alice", "nmap", "success", tenant_id="t")
+
+    with pytest.raises(ConnectionError):
+        pipeline.stop_flush_worker()
+    assert [event.stream_position for event in pipeline.flush_all()] == [1, 2, 3]
+
+
+def test_ingest_fails_fast_when_flush_worker_died() -> None:
+    pipeline = TelemetryIngestionPipeline(
+        batch_size=2,
+        publisher=RabbitMQTelemetryPublisher(broker=InMemoryRabbitBroker()),
+        high_water_mark=2,
+        backpressure_timeout=None,
+    )
+
+    async def _crash() -> None:
+        raise RuntimeError("worker crashed")
+
+    pipeline.run_flush_worker = _crash  # type: ignore[method-assign]
+    worker = pipeline.start_flush_worker()
+    _wait_until(worker.done)
+    pipeline.ingest("event_a", "alice", "nmap", "success", tenant_id="t")
+    pipeline.ingest("event_b", "alice", "nmap", "success", tenant_id="t")
+
+    with pytest.raises(TelemetryBackpressureError, match="worker exited"):
+        pipeline.ingest("event_c", "alice", "nmap", "success", tenant_id="t")
+
+
+def test_flush_worker_requires_publisher() -> None:
+    pipeline = TelemetryIngestionPipeline(batch_size=2)
+    with pytest.raises(RuntimeError, match="publisher"):
+        pipeline.start_flush_worker()
+
+
+def test_invalid_high_water_mark_raises() -> None:
+    with pytest.raises(ValueError, match="high_water_mark"):
+        TelemetryIngestionPipeline(batch_size=10, high_water_mark=5)
@@ -17,15 +17,22 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from dataclasses import replace
 
+import pytest
+
+from pkg.orchestrator import messaging
 from pkg.orchestrator.messaging import (
     BrokerEnvelope,
     InMemoryKafkaBroker,
     InMemoryRabbitBroker,
     KafkaRoutingModel,
     KafkaTelemetryPublisher,
+    PikaChannelPool,
+    PikaRabbitMQTelemetryPublisher,
     PublishStatus,
+    RabbitMQConnectionConfig,
     RabbitMQTelemetryPublisher,
     RabbitRoutingModel,
 )
@@ -192,3 +199,197 @@ def test_kafka_publisher_dead_letters_on_retry_exhaustion() -> None:
     assert result.status is PublishStatus.DEAD_LETTERED
     assert broker.topic_size("spectrastrike.telemetry.events") == 0
     assert broker.topic_size("spectrastrike.telemetry.dlq") == 1
+
+
+def test_rabbit_publish_many_preserves_per_envelope_policy() -> None:
+    broker = InMemoryRabbitBroker()
+    publisher = RabbitMQTelemetryPublisher(
+        broker=broker,
+        max_retries=1,
+        transient_failures={"idem-retry": 1, "idem-fail": 5},
+    )
+    batch = [
+        replace(_envelope(event_id="evt-1", key="idem-1"), ordering_key="t", stream_position=1),
+        replace(_envelope(event_id="evt-2", key="idem-1"), ordering_key="t", stream_position=2),
+        replace(_envelope(event_id="evt-3", key="idem-retry"), ordering_key="t", stream_position=3),
+        replace(_envelope(event_id="evt-4", key="idem-old"), ordering_key="t", stream_position=2),
+        replace(_envelope(event_id="evt-5", key="idem-fail"), ordering_key="t", stream_position=5),
+    ]
+
+    results = asyncio.run(publisher.publish_many(batch))
+
+    assert [result.status for result in results] == [
+        PublishStatus.PUBLISHED,
+        PublishStatus.DEDUPLICATED,
+        PublishStatus.PUBLISHED,
+        PublishStatus.DEAD_LETTERED,
+        PublishStatus.DEAD_LETTERED,
+    ]
+    assert results[2].attempts == 2
+    consumed = broker.consume("telemetry.events")
+    assert [item.event_id for item in consumed] == ["evt-1", "evt-3"]
+    assert [item.event_id for item in broker.consume("telemetry.events.dlq")] == [
+        "evt-4",
+        "evt-5",
+    ]
+
+
+def test_rabbit_publisher_retries_batch_after_broker_write_fails() -> None:
+    class _FlakyBroker(InMemoryRabbitBroker):
+        def __init__(self) -> None:
+            super().__init__()
+            self.fail_next = True
+
+        def publish_many(self, exchange, routing_key, envelopes) -> None:
+            if self.fail_next:
+                self.fail_next = False
+                raise ConnectionError("broker write failed")
+            super().publish_many(exchange, routing_key, envelopes)
+
+    broker = _FlakyBroker()
+    publisher = RabbitMQTelemetryPublisher(broker=broker)
+    batch = [
+        replace(_envelope(event_id=f"evt-{index}"), ordering_key="t", stream_position=index)
+        for index in range(1, 4)
+    ]
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(publisher.publish_many(batch))
+    results = asyncio.run(publisher.publish_many(batch))
+
+    assert [result.status for result in results] == [PublishStatus.PUBLISHED] * 3
+    assert broker.queue_size("telemetry.events") == 3
+
+
+class _FakePikaChannel:
+    def __init__(self, published: list[dict[str, object]]) -> None:
+        self.is_open = True
+        self.confirming = False
+        self._published = published
+
+    def confirm_delivery(self) -> None:
+        self.confirming = True
+
+    def exchange_declare(self, **kwargs: object) -> None:
+        return None
+
+    def queue_declare(self, **kwargs: object) -> None:
+        return None
+
+    def queue_bind(self, **kwargs: object) -> None:
+        return None
+
+    def basic_publish(self, **kwargs: object) -> None:
+        assert self.confirming
+        self._published.append(kwargs)
+
+
+class _FakePikaModule:
+    def __init__(self) -> None:
+        self.connections = 0
+        self.published: list[dict[str, object]] = []
+
+    def PlainCredentials(self, username: str, password: str) -> tuple[str, str]:
+        return (username, password)
+
+    def ConnectionParameters(self, **kwargs: object) -> dict[str, object]:
+        return kwargs
+
+    def BasicProperties(self, **kwargs: object) -> dict[str, object]:
+        return kwargs
+
+    def BlockingConnection(self, parameters: object) -> object:
+        self.connections += 1
+        module = self
+
+        class _Connection:
+            is_open = True
+
+            def channel(self) -> _FakePikaChannel:
+                return _FakePikaChannel(module.published)
+
+            def close(self) -> None:
+                self.is_open = False
+
+        return _Connection()
+
+
+def test_pika_publisher_reuses_pooled_confirm_channel(monkeypatch) -> None:
+    fake_pika = _FakePikaModule()
+    monkeypatch.setattr(messaging, "pika", fake_pika)
+    publisher = PikaRabbitMQTelemetryPublisher(
+        connection=RabbitMQConnectionConfig(ssl_enabled=False),
+    )
+
+    async def _run() -> list:
+        first = await publisher.publish_many(
+            [_envelope(event_id=f"evt-{index}") for index in range(200)]
+        )
+        second = await publisher.publish(_envelope(event_id="evt-0"))
+        return [*first, second]
+
+    results = asyncio.run(_run())
+    publisher.close()
+
+    assert fake_pika.connections == 1
+    assert len(fake_pika.published) == 200
+    assert all(result.status is PublishStatus.PUBLISHED for result in results[:-1])
+    assert results[-1].status is PublishStatus.DEDUPLICATED
+    assert publisher.pool.connections_opened == 1
+
+
+def test_pika_publisher_dead_letters_in_batch_duplicate_of_failed_copy(monkeypatch) -> None:
+    fake_pika = _FakePikaModule()
+
+    def _basic_publish(self, **kwargs: object) -> None:
+        if kwargs["exchange"]:
+            raise ConnectionError("channel closed by broker")
+        self._published.append(kwargs)
+
+    monkeypatch.setattr(_FakePikaChannel, "basic_publish", _basic_publish)
+    monkeypatch.setattr(messaging, "pika", fake_pika)
+    publisher = PikaRabbitMQTelemetryPublisher(
+        connection=RabbitMQConnectionConfig(ssl_enabled=False),
+        max_retries=1,
+    )
+
+    results = asyncio.run(
+        publisher.publish_many([_envelope(event_id="evt-1"), _envelope(event_id="evt-1")])
+    )
+    publisher.close()
+
+    assert [result.status for result in results] == [PublishStatus.DEAD_LETTERED] * 2
+    assert results[1].error == "channel closed by broker"
+    assert len(fake_pika.published) == 1
+
+
+def test_pika_channel_pool_wakes_waiter_when_holder_fails() -> None:
+    fake_pika = _FakePikaModule()
+    pool = PikaChannelPool(lambda: fake_pika.BlockingConnection(None), max_size=1)
+    holding = threading.Event()
+    release = threading.Event()
+    acquired: list[object] = []
+
+    def fail_while_holding() -> None:
+        with pytest.raises(RuntimeError):
+            with pool.channel():
+                holding.set()
+                release.wait(5)
+                raise RuntimeError("publish failed")
+
+    def wait_for_channel() -> None:
+        with pool.channel() as channel:
+            acquired.append(channel)
+
+    holder = threading.Thread(target=fail_while_holding, daemon=True)
+    holder.start()
+    assert holding.wait(5)
+    waiter = threading.Thread(target=wait_for_channel, daemon=True)
+    waiter.start()
+    release.set()
+    holder.join(5)
+    waiter.join(5)
+
+    assert not waiter.is_alive()
+    assert len(acquired) == 1
+    assert pool.connections_opened == 2
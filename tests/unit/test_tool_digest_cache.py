@@ -0,0 +1,86 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Unit tests for the content-addressed tool digest cache."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from pkg.armory.digest import ToolDigestCache, default_digest_cache
+from pkg.wrappers.nuclei import NucleiWrapper
+
+
+def test_digest_cache_hashes_once_until_file_changes(tmp_path: Path) -> None:
+    binary = tmp_path / "tool"
+    binary.write_bytes(b"a" * 300_000)
+    cache = ToolDigestCache(chunk_size=4096)
+
+    first = cache.sha256_file(binary)
+    second = cache.sha256_file(binary)
+
+    assert first == second == hashlib.sha256(b"a" * 300_000).hexdigest()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    binary.write_bytes(b"b" * 300_000)
+    stat = binary.stat()
+    os.utime(binary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.sha256_file(binary) == hashlib.sha256(b"b" * 300_000).hexdigest()
+    assert cache.misses == 2
+
+
+def test_digest_cache_persists_across_instances(tmp_path: Path) -> None:
+    binary = tmp_path / "tool"
+    binary.write_bytes(b"payload")
+    cache_path = tmp_path / "cache" / "digests.json"
+
+    expected = ToolDigestCache(cache_path=cache_path).sha256_file(binary)
+    restarted = ToolDigestCache(cache_path=cache_path)
+
+    assert restarted.sha256_file(binary) == expected
+    assert (restarted.hits, restarted.misses) == (1, 0)
+
+
+def test_digest_cache_ignores_corrupt_cache_file(tmp_path: Path) -> None:
+    binary = tmp_path / "tool"
+    binary.write_bytes(b"payload")
+    cache_path = tmp_path / "digests.json"
+    cache_path.write_text("{not json", encoding="utf-8")
+
+    cache = ToolDigestCache(cache_path=cache_path)
+
+    assert cache.sha256_file(binary) == hashlib.sha256(b"payload").hexdigest()
+    assert cache.misses == 1
+
+
+def test_digest_cache_missing_file_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        ToolDigestCache().sha256_file(tmp_path / "missing")
+
+
+def test_wrapper_tool_hash_uses_shared_cache(tmp_path: Path) -> None:
+    binary = tmp_path / "nuclei"
+    binary.write_bytes(b"nuclei-binary")
+    wrapper = NucleiWrapper(binary=str(binary), signer=lambda _payload: "sig")
+    cache = default_digest_cache()
+    hits_before = cache.hits
+
+    assert wrapper._tool_sha256() == hashlib.sha256(b"nuclei-binary").hexdigest()
+    assert wrapper._tool_sha256() == hashlib.sha256(b"nuclei-binary").hexdigest()
+    assert cache.hits == hits_before + 1
@@ -0,0 +1,207 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Unit tests for the shared tool version inventory."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from pkg.armory.digest import ToolDigestCache
+from pkg.wrappers.base import WrapperCommandResult
+from pkg.wrappers.inventory import ToolInventoryService, parse_version_text
+
+
+class _CountingRunner:
+    def __init__(self, output: str = "tool v1.2.3", delay: float = 0.0) -> None:
+        self.calls: list[list[str]] = []
+        self._output = output
+        self._delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, command: list[str], timeout_seconds: float) -> WrapperCommandResult:
+        with self._lock:
+            self.calls.append(command)
+        time.sleep(self._delay)
+        return WrapperCommandResult(returncode=0, stdout=self._output, stderr="")
+
+
+def _binary(tmp_path: Path, name: str, content: bytes = b"binary") -> str:
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def _service(tmp_path: Path, **kwargs) -> ToolInventoryService:
+    return ToolInventoryService(digest_cache=ToolDigestCache(), **kwargs)
+
+
+def test_parse_version_text_prefers_dotted_version() -> None:
+    assert parse_version_text("Impacket v0.12.0 - Copyright") == "0.12.0"
+    assert parse_version_text("custom-build\nmore") == "custom-build"
+    assert parse_version_text("   ") is None
+
+
+def test_inventory_probes_each_binary_digest_once(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    runner = _CountingRunner()
+    binary = _binary(tmp_path, "nuclei")
+
+    versions = {
+        service.resolve_version(
+            tool_name="nuclei",
+            binary=binary,
+            detection_args=[["-version"]],
+            runner=runner,
+            timeout_seconds=5.0,
+        )
+        for _ in range(5)
+    }
+
+    assert versions == {"1.2.3"}
+    assert len(runner.calls) == 1
+    assert service.probes == 1
+    record = service.record_for("nuclei")
+    assert record is not None and record.available
+    assert service.available_tools() == {"nuclei"}
+
+
+def test_inventory_reprobes_after_binary_upgrade(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    binary = _binary(tmp_path, "ffuf", b"v1")
+    kwargs = {"tool_name": "ffuf", "binary": binary, "detection_args": [["-V"]], "timeout_seconds": 5.0}
+
+    assert service.resolve_version(runner=_CountingRunner("ffuf 2.0.0"), **kwargs) == "2.0.0"
+    Path(binary).write_bytes(b"v2-upgraded")
+    assert service.resolve_version(runner=_CountingRunner("ffuf 2.1.0"), **kwargs) == "2.1.0"
+    assert service.probes == 2
+
+
+def test_inventory_deduplicates_concurrent_probes(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    runner = _CountingRunner(delay=0.05)
+    binary = _binary(tmp_path, "amass")
+    results: list[str] = []
+
+    def _resolve() -> None:
+        results.append(
+            service.resolve_version(
+                tool_name="amass",
+                binary=binary,
+                detection_args=[["-version"]],
+                runner=runner,
+                timeout_seconds=5.0,
+            )
+        )
+
+    threads = [threading.Thread(target=_resolve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["1.2.3"] * 8
+    assert len(runner.calls) == 1
+
+
+def test_inventory_persists_records_across_restarts(tmp_path: Path) -> None:
+    storage = tmp_path / "inventory.json"
+    binary = _binary(tmp_path, "dnsx")
+    kwargs = {"tool_name": "dnsx", "binary": binary, "detection_args": [["-version"]], "timeout_seconds": 5.0}
+    _service(tmp_path, storage_path=storage).resolve_version(runner=_CountingRunner(), **kwargs)
+
+    restarted = _service(tmp_path, storage_path=storage)
+    runner = _CountingRunner("should not run")
+
+    assert restarted.resolve_version(runner=runner, **kwargs) == "1.2.3"
+    assert runner.calls == []
+    assert [record.tool_name for record in restarted.inventory()] == ["dnsx"]
+
+
+def test_inventory_retries_unknown_versions_without_persisting(tmp_path: Path) -> None:
+    storage = tmp_path / "inventory.json"
+    binary = _binary(tmp_path, "subfinder")
+    kwargs = {
+        "tool_name": "subfinder",
+        "binary": binary,
+        "detection_args": [["-version"]],
+        "timeout_seconds": 5.0,
+    }
+    service = _service(tmp_path, storage_path=storage, unknown_ttl_seconds=0.2)
+
+    assert service.resolve_version(runner=_CountingRunner(""), **kwargs) == "unknown"
+    assert service.resolve_version(runner=_CountingRunner("v9.9.9"), **kwargs) == "unknown"
+    assert not storage.exists()
+    time.sleep(0.25)
+    assert service.resolve_version(runner=_CountingRunner("v2.6.0"), **kwargs) == "2.6.0"
+    assert service.probes == 2
+    assert service.available_tools() == {"subfinder"}
+
+    restarted = _service(tmp_path, storage_path=storage)
+    runner = _CountingRunner("should not run")
+    assert restarted.resolve_version(runner=runner, **kwargs) == "2.6.0"
+    assert runner.calls == []
+
+
+def test_inventory_does_not_record_unlocatable_binaries(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    runner = _CountingRunner()
+
+    version = service.resolve_version(
+        tool_name="ghost",
+        binary="spectrastrike-definitely-missing-tool",
+        detection_args=[["--version"]],
+        runner=runner,
+        timeout_seconds=5.0,
+    )
+
+    assert version == "1.2.3"
+    assert service.inventory() == []
+
+
+def test_injected_runner_keeps_per_instance_version_probe() -> None:
+    from pkg.wrappers.nuclei import NucleiWrapper
+
+    first = NucleiWrapper(runner=_CountingRunner("nuclei v3.3.0"), signer=lambda _p: "sig")
+    second = NucleiWrapper(runner=_CountingRunner("nuclei v3.4.0"), signer=lambda _p: "sig")
+
+    assert first.detect_version() == "3.3.0"
+    assert second.detect_version() == "3.4.0"
+
+
+def test_warm_probes_wrappers_concurrently_into_service(tmp_path: Path) -> None:
+    from pkg.wrappers.curl import CurlWrapper
+    from pkg.wrappers.nuclei import NucleiWrapper
+
+    def _script(name: str, version: str) -> str:
+        path = tmp_path / name
+        path.write_text(f"#!/bin/sh\necho '{name} v{version}'\n", encoding="utf-8")
+        path.chmod(0o755)
+        return str(path)
+
+    service = _service(tmp_path)
+    records = service.warm(
+        [
+            NucleiWrapper(binary=_script("nuclei", "3.3.0"), signer=lambda _p: "sig"),
+            CurlWrapper(binary=_script("curl", "8.5.0"), signer=lambda _p: "sig"),
+        ]
+    )
+
+    assert {(record.tool_name, record.version) for record in records} == {
+        ("nuclei", "3.3.0"),
+        ("curl", "8.5.0"),
+    }
+    assert service.available_tools() == {"nuclei", "curl"}
@@ -0,0 +1,242 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Unit tests for the shared wrapper execution pool."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pkg.wrappers.base import current_execution_scope, execution_scope
+from pkg.wrappers.execution_pool import WrapperExecutionPool
+from pkg.wrappers.nuclei import NucleiScanRequest, NucleiWrapper
+
+
+def _sleep_command(seconds: float) -> list[str]:
+    return [sys.executable, "-c", f"import time; time.sleep({seconds}); print('done')"]
+
+
+def test_pool_runs_command_with_runner_signature() -> None:
+    pool = WrapperExecutionPool()
+    try:
+        script = "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"
+        result = pool([sys.executable, "-c", script], 10.0)
+    finally:
+        pool.close()
+
+    assert result.returncode == 3
+    assert result.stdout.strip() == "out"
+    assert result.stderr.strip() == "err"
+
+
+def test_pool_runs_commands_in_parallel_up_to_tool_limit() -> None:
+    pool = WrapperExecutionPool(tool_limits={"sleepy": 2})
+    try:
+        started = time.monotonic()
+        futures = [
+            pool.submit(_sleep_command(0.3), 10.0, tool_name="sleepy") for _ in range(4)
+        ]
+        assert all(future.result(timeout=10).stdout.strip() == "done" for future in futures)
+        elapsed = time.monotonic() - started
+    finally:
+        pool.close()
+
+    assert 0.55 <= elapsed < 1.1
+
+
+def test_pool_applies_tenant_limit_across_tools() -> None:
+    pool = WrapperExecutionPool(default_tool_limit=8, tenant_limits={"tenant-a": 1})
+    try:
+        futures = [
+            pool.submit(_sleep_command(0.2), 10.0, tool_name=tool, tenant_id="tenant-a")
+            for tool in ("alpha", "beta")
+        ]
+        time.sleep(0.1)
+        assert pool.waiting == 1
+        for future in futures:
+            future.result(timeout=10)
+    finally:
+        pool.close()
+
+
+def test_pool_queued_tool_does_not_hold_global_slots() -> None:
+    pool = WrapperExecutionPool(max_concurrency=4, tool_limits={"nuclei": 1})
+    try:
+        nuclei = [
+            pool.submit(_sleep_command(0.4), 10.0, tool_name="nuclei") for _ in range(5)
+        ]
+        time.sleep(0.1)
+        started = time.monotonic()
+        dnsx = pool.submit(_sleep_command(0), 10.0, tool_name="dnsx")
+        assert dnsx.result(timeout=10).stdout.strip() == "done"
+        elapsed = time.monotonic() - started
+        assert not all(future.done() for future in nuclei)
+        for future in nuclei:
+            future.result(timeout=10)
+    finally:
+        pool.close()
+
+    assert elapsed < 0.8
+
+
+def test_pool_kills_process_on_timeout() -> None:
+    pool = WrapperExecutionPool()
+    try:
+        started = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool(_sleep_command(30), 0.2)
+        assert time.monotonic() - started < 5
+        assert pool.running == 0
+    finally:
+        pool.close()
+
+
+def test_pool_cancellation_kills_process() -> None:
+    pool = WrapperExecutionPool()
+    try:
+        future = pool.submit(_sleep_command(30), 60.0)
+        deadline = time.monotonic() + 5
+        while pool.running == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert future.cancel()
+        while pool.running:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        pool.close()
+
+
+def test_wrapper_execute_binds_tool_and_tenant_scope() -> None:
+    seen: list[tuple[str | None, str | None]] = []
+
+    def recording_runner(command: list[str], _timeout: float):
+        scope = current_execution_scope()
+        seen.append((scope.tool_name, scope.tenant_id))
+
+        class _R:
+            returncode = 0
+            stdout = "nuclei v3.3.0"
+            stderr = ""
+
+        return _R()
+
+    wrapper = NucleiWrapper(runner=recording_runner, signer=lambda _payload: "sig")  # type: ignore[arg-type]
+    wrapper.execute(
+        NucleiScanRequest(target="http://127.0.0.1"),
+        tenant_id="tenant-a",
+        operator_id="alice",
+    )
+
+    assert seen and set(seen) == {("nuclei", "tenant-a")}
+    assert current_execution_scope().tenant_id is None
+
+
+def test_pool_parallelises_blocking_wrapper_calls() -> None:
+    pool = WrapperExecutionPool()
+    command = _sleep_command(0.3)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            started = time.monotonic()
+
+            def _call(index: int) -> str:
+                with execution_scope(tool_name="sleepy", tenant_id=f"t{index}"):
+                    return pool(command, 10.0).stdout.strip()
+
+            outputs = list(executor.map(_call, range(4)))
+            elapsed = time.monotonic() - started
+    finally:
+        pool.close()
+
+    assert outputs == ["done"] * 4
+    assert elapsed < 1.0
+
+
+def test_invalid_pool_limits_raise() -> None:
+    with pytest.raises(ValueError):
+        WrapperExecutionPool(tool_limits={"nuclei": 0})
+
+
+class _RecordingSink:
+    def __init__(self, *, fail_after: int | None = None) -> None:
+        self.lines: list[str] = []
+        self.closed_with: int | None = None
+        self._fail_after = fail_after
+
+    def feed(self, line: str) -> None:
+        if self._fail_after is not None and len(self.lines) >= self._fail_after:
+            raise RuntimeError("sink rejected line")
+        self.lines.append(line)
+
+    def close(self, returncode: int) -> None:
+        self.closed_with = returncode
+
+
+def test_pool_streams_long_lines_with_bounded_retention() -> None:
+    sink = _RecordingSink()
+    script = (
+        "import sys; sys.stdout.write('x' * 3_000_000); print(); print('tail'); "
+        "sys.stderr.write('e' * 500_000)"
+    )
+    pool = WrapperExecutionPool(max_retained_bytes=4096)
+    try:
+        with execution_scope(output_sink=lambda _command: sink):
+            result = pool([sys.executable, "-c", script], 30.0)
+    finally:
+        pool.close()
+
+    assert result.returncode == 0
+    assert result.truncated is True
+    assert result.stdout.endswith("tail\n")
+    assert len(result.stdout) <= (1 << 20) + 4096
+    assert len(result.stderr) <= (1 << 20) + 4096
+    assert "".join(sink.lines[:-1]) == "x" * 3_000_000
+    assert sink.lines[-1] == "tail"
+    assert sink.closed_with == 0
+
+
+def test_pool_kills_process_when_sink_raises() -> None:
+    sink = _RecordingSink(fail_after=1)
+    script = (
+        "import os, time\n"
+        "print(os.getpid(), flush=True)\n"
+        "print('two', flush=True)\n"
+        "time.sleep(30)"
+    )
+    pool = WrapperExecutionPool()
+    try:
+        started = time.monotonic()
+        with execution_scope(output_sink=lambda _command: sink):
+            with pytest.raises(RuntimeError, match="sink rejected line"):
+                pool([sys.executable, "-c", script], 60.0)
+        assert time.monotonic() - started < 5
+        assert pool.running == 0
+    finally:
+        pool.close()
+
+    assert len(sink.lines) == 1
+    assert sink.closed_with is None
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(sink.lines[0]), 0)
+
+
+def test_invalid_pool_retention_raises() -> None:
+    with pytest.raises(ValueError):
+        WrapperExecutionPool(max_retained_bytes=0)
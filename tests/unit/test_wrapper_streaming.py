@@ -0,0 +1,192 @@
+# Copyright (c) 2026 NyxeraLabs
+# Author: José María Micoli
+# Licensed under BSL 1.1
+# Change Date: 2033-02-22 -> Apache-2.0
+#
+# You may:
+# Study
+# Modify
+# Use for internal security testing
+#
+# You may NOT:
+# Offer as a commercial service
+# Sell derived competing products
+
+"""Unit tests for streaming wrapper output and partial telemetry."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from pkg.orchestrator.telemetry_ingestion import TelemetryIngestionPipeline
+from pkg.wrappers.base import StreamingCommandRunner
+from pkg.wrappers.execution_pool import WrapperExecutionPool
+from pkg.wrappers.gobuster import GobusterWrapper
+from pkg.wrappers.nuclei import NucleiScanRequest, NucleiWrapper
+
+
+class _CollectingSink:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.returncode: int | None = None
+
+    def feed(self, line: str) -> None:
+        self.lines.append(line)
+
+    def close(self, returncode: int) -> None:
+        self.returncode = returncode
+
+
+def _python(script: str) -> list[str]:
+    return [sys.executable, "-c", script]
+
+
+def test_streaming_runner_feeds_lines_and_bounds_retained_output() -> None:
+    sink = _CollectingSink()
+    runner = StreamingCommandRunner(sink_factory=lambda _command: sink, max_retained_bytes=64)
+
+    result = runner(
+        _python("import sys\nfor i in range(200): print(f'line-{i:04d}')\nsys.stderr.write('warn')"),
+        10.0,
+    )
+
+    assert result.returncode == 0
+    assert len(sink.lines) == 200
+    assert sink.lines[0] == "line-0000"
+    assert sink.returncode == 0
+    assert result.truncated is True
+    assert len(result.stdout) <= 64
+    assert result.stdout.endswith("line-0199\n")
+    assert result.stderr == "warn"
+
+
+def test_streaming_runner_bounds_retained_output_in_bytes() -> None:
+    runner = StreamingCommandRunner(max_retained_bytes=64)
+
+    result = runner(_python("for i in range(50): print('\\u00e9' * 10)"), 10.0)
+
+    assert result.truncated is True
+    assert len(result.stdout.encode("utf-8")) <= 64
+
+
+def test_streaming_runner_kills_process_on_timeout() -> None:
+    runner = StreamingCommandRunner()
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner(_python("import time; print('start', flush=True); time.sleep(30)"), 0.3)
+
+
+def test_streaming_wrapper_emits_partial_telemetry_while_running() -> None:
+    telemetry = TelemetryIngestionPipeline(batch_size=100)
+    script = (
+        "import json\n"
+        "for i in range(5):\n"
+        "    print(json.dumps({'template-id': f't{i}', 'host': 'http://127.0.0.1'}))\n"
+        "print('not json')\n"
+    )
+    wrapper = NucleiWrapper(binary=sys.executable, signer=lambda _payload: "sig")
+    wrapper.enable_output_streaming(telemetry=telemetry, partial_batch_size=2)
+    wrapper.build_command = lambda request: _python(script)  # type: ignore[method-assign]
+
+    result = wrapper.execute(
+        NucleiScanRequest(target="http://127.0.0.1"),
+        tenant_id="tenant-a",
+        operator_id="alice",
+    )
+
+    assert result.status == "success"
+    events = [
+        event for event in telemetry.flush_all() if event.event_type == "nuclei_output_partial"
+    ]
+    assert [len(event.attributes["records"]) for event in events] == [2, 2, 1]
+    assert [event.attributes["sequence"] for event in events] == [1, 2, 3]
+    assert events[0].attributes["records"][0]["template-id"] == "t0"
+    assert {event.tenant_id for event in events} == {"tenant-a"}
+
+
+def test_streaming_wrapper_keeps_injected_pool_runner() -> None:
+    telemetry = TelemetryIngestionPipeline(batch_size=100)
+    script = (
+        "import json\n"
+        "for i in range(3):\n"
+        "    print(json.dumps({'template-id': f't{i}', 'host': 'http://127.0.0.1'}))\n"
+    )
+    pool = WrapperExecutionPool(tool_limits={"nuclei": 1})
+    try:
+        wrapper = NucleiWrapper(binary=sys.executable, runner=pool, signer=lambda _payload: "sig")
+        wrapper.enable_output_streaming(telemetry=telemetry, partial_batch_size=2)
+        wrapper.build_command = lambda request: _python(script)  # type: ignore[method-assign]
+
+        result = wrapper.execute(
+            NucleiScanRequest(target="http://127.0.0.1"),
+            tenant_id="tenant-a",
+            operator_id="alice",
+        )
+    finally:
+        pool.close()
+
+    assert wrapper._runner is pool
+    assert result.status == "success"
+    events = [
+        event for event in telemetry.flush_all() if event.event_type == "nuclei_output_partial"
+    ]
+    assert [len(event.attributes["records"]) for event in events] == [2, 1]
+    assert {event.tenant_id for event in events} == {"tenant-a"}
+
+
+def test_wrapper_result_flags_truncated_output() -> None:
+    wrapper = NucleiWrapper(
+        binary=sys.executable,
+        runner=StreamingCommandRunner(max_retained_bytes=32),
+        signer=lambda _payload: "sig",
+    )
+    wrapper.build_command = lambda request: _python(  # type: ignore[method-assign]
+        "for i in range(20): print(f'line-{i:04d}')"
+    )
+
+    result = wrapper.execute(
+        NucleiScanRequest(target="http://127.0.0.1"),
+        tenant_id="tenant-a",
+        operator_id="alice",
+    )
+
+    assert result.raw["truncated"] is True
+    assert result.output.endswith("line-0019")
+
+
+def test_wrapper_result_tolerates_runner_without_truncated_flag() -> None:
+    class _Completed:
+        returncode = 0
+        stdout = "line-0001"
+        stderr = ""
+
+    wrapper = NucleiWrapper(
+        runner=lambda command, timeout: _Completed(),  # type: ignore[arg-type,return-value]
+        signer=lambda _payload: "sig",
+    )
+
+    result = wrapper.execute(
+        NucleiScanRequest(target="http://127.0.0.1"),
+        tenant_id="tenant-a",
+        operator_id="alice",
+    )
+
+    assert result.raw == {
+        "mode": "live",
+        "stdout": "line-0001",
+        "stderr": "",
+        "truncated": False,
+    }
+
+
+def test_gobuster_parse_output_line_hook() -> None:
+    wrapper = GobusterWrapper(signer=lambda _payload: "sig")
+
+    assert wrapper.parse_output_line("/admin                (Status: 301) [Size: 178]") == {
+        "path": "/admin",
+        "status_code": 301,
+        "size": 178,
+    }
+    assert wrapper.parse_output_line("Progress: 100 / 4614") is None